@@ -1,6 +1,7 @@
 from . import client as raw
 from . import cache
 from . import helpers
+from . import middleware
 
 try:
     from . import events
@@ -0,0 +1,1059 @@
+"""
+Async primitives for the Kitsu API using aiohttp.
+
+Usage::
+
+    import gazu.aio
+
+    async with gazu.aio.create_session(host, email, password) as client:
+        data = await gazu.aio.get("data/projects", client=client)
+
+No default client is provided -- always pass an explicit ``client``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import copy
+import json
+import logging
+import os
+import time
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import aiohttp
+
+from ..__version__ import __version__
+from ..client import (
+    DownloadSink,
+    JSONStreamBody,
+    RetryPolicy,
+    TransferStats,
+    chunk_ids,
+    compress_request_body,
+    get_batch_retry_policy,
+    get_json_stream_headers,
+    new_request_infos,
+    url_path_join,
+    build_path_with_params,
+    get_message_from_response as _sync_get_message,
+)
+from .. import encoder
+from ..middleware import Middleware, run_middlewares
+from ..helpers import get_download_file_path
+from ..exception import (
+    DownloadFileException,
+    TooBigFileException,
+    NotAuthenticatedException,
+    NotAllowedException,
+    MethodNotAllowedException,
+    ParameterException,
+    RouteNotFoundException,
+    ServerErrorException,
+    ValidationException,
+    UploadFailedException,
+)
+
+try:
+    from aiohttp.compression_utils import HAS_BROTLI, HAS_ZSTD
+except ImportError:
+    HAS_BROTLI = HAS_ZSTD = False
+
+logger = logging.getLogger("gazu.aio")
+
+
+def get_accept_encoding() -> str:
+    """
+    Returns:
+        str: The content codings aiohttp can decode, for the Accept-Encoding
+        header. Brotli and zstd are listed only when the optional modules
+        decoding them are installed.
+    """
+    encodings = ["gzip", "deflate"]
+    if HAS_BROTLI:
+        encodings.append("br")
+    if HAS_ZSTD:
+        encodings.append("zstd")
+    return ", ".join(encodings)
+
+
+class AsyncKitsuClient:
+    """
+    Async HTTP client for the Kitsu API.
+
+    Example::
+
+        client = AsyncKitsuClient("https://kitsu.example/api")
+        async with client:
+            await gazu.aio.log_in("user@example.com", "pass", client=client)
+            projects = await gazu.aio.get("data/projects", client=client)
+    """
+
+    def __init__(
+        self,
+        host: str,
+        ssl_verify: bool = True,
+        use_refresh_token: bool = True,
+        callback_not_authenticated: Callable | None = None,
+        tokens: dict | None = None,
+        access_token: str | None = None,
+        refresh_token: str | None = None,
+        max_concurrency: int = 8,
+        retry_policy: RetryPolicy | None = None,
+        coalesce_requests: bool = True,
+        request_compression_threshold: int | None = None,
+        middlewares: list[Middleware] | None = None,
+    ) -> None:
+        if tokens is None:
+            tokens = {"access_token": None, "refresh_token": None}
+        self.tokens = tokens
+        if access_token:
+            self.tokens["access_token"] = access_token
+        if refresh_token:
+            self.tokens["refresh_token"] = refresh_token
+        self.use_refresh_token = use_refresh_token
+        self.callback_not_authenticated = callback_not_authenticated
+        self.host = host
+        self.event_host = host
+        self._ssl_verify = ssl_verify
+        self._session: aiohttp.ClientSession | None = None
+        self.max_concurrency = max_concurrency
+        self._concurrency_limiter: asyncio.Semaphore | None = None
+        self.retry_policy = retry_policy
+        self.coalesce_requests = coalesce_requests
+        self.in_flight_requests: dict[tuple, asyncio.Future] = {}
+        self.request_compression_threshold = request_compression_threshold
+        self.transfer_stats = TransferStats()
+        self.middlewares = list(middlewares or [])
+        self.unsupported_id_filters = set()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(ssl=self._ssl_verify)
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Accept-Encoding": get_accept_encoding()},
+            )
+        return self._session
+
+    @property
+    def concurrency_limiter(self) -> asyncio.Semaphore:
+        # Created lazily so the semaphore is bound to the running loop.
+        if self._concurrency_limiter is None:
+            self._concurrency_limiter = asyncio.Semaphore(self.max_concurrency)
+        return self._concurrency_limiter
+
+    @property
+    def access_token(self) -> str | None:
+        return self.tokens.get("access_token", None)
+
+    @access_token.setter
+    def access_token(self, token: str) -> None:
+        self.tokens["access_token"] = token
+
+    @property
+    def refresh_token(self) -> str | None:
+        return self.tokens.get("refresh_token", None)
+
+    @refresh_token.setter
+    def refresh_token(self, token: str) -> None:
+        self.tokens["refresh_token"] = token
+
+    def get_transfer_stats(self) -> dict:
+        return self.transfer_stats.get()
+
+    def add_middleware(self, middleware: Middleware) -> Middleware:
+        self.middlewares.append(middleware)
+        return middleware
+
+    def remove_middleware(self, middleware: Middleware) -> None:
+        self.middlewares.remove(middleware)
+
+    def make_auth_header(self) -> dict[str, str]:
+        headers = {"User-Agent": "CGWire Gazu " + __version__}
+        if self.access_token:
+            headers["Authorization"] = "Bearer " + self.access_token
+        return headers
+
+    async def refresh_access_token(self) -> dict[str, str]:
+        url = get_full_url("auth/refresh-token", client=self)
+        headers = {
+            "User-Agent": "CGWire Gazu " + __version__,
+            "Authorization": "Bearer " + self.refresh_token,
+        }
+        async with self.session.get(url, headers=headers) as response:
+            await check_status(response, "auth/refresh-token")
+            tokens = await response.json()
+        self.access_token = tokens["access_token"]
+        self.refresh_token = None
+        return tokens
+
+    async def __aenter__(self) -> "AsyncKitsuClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        try:
+            url = get_full_url("auth/logout", client=self)
+            async with self.session.get(url, headers=self.make_auth_header()):
+                pass
+        except Exception:
+            pass
+        self.tokens = {"access_token": None, "refresh_token": None}
+        await self.session.close()
+        return None
+
+
+def get_full_url(path: str, client: AsyncKitsuClient) -> str:
+    return url_path_join(client.host, path)
+
+
+async def check_status(
+    response: aiohttp.ClientResponse,
+    path: str,
+    client: AsyncKitsuClient | None = None,
+) -> tuple[int, bool]:
+    status_code = response.status
+    if status_code == 404:
+        raise RouteNotFoundException(path)
+    elif status_code == 403:
+        raise NotAllowedException(path)
+    elif status_code == 400:
+        data = await response.json()
+        message = "No additional information"
+        if isinstance(data, dict):
+            for key in ["error", "message"]:
+                if data.get(key):
+                    message = data[key]
+                    break
+        raise ParameterException(path, message)
+    elif status_code == 405:
+        raise MethodNotAllowedException(path)
+    elif status_code == 413:
+        raise TooBigFileException(
+            f"{path}: You send a too big file. "
+            "Change your proxy configuration to allow bigger files."
+        )
+    elif status_code == 422:
+        try:
+            data = await response.json()
+        except Exception:
+            data = {}
+        message = "No additional information"
+        if isinstance(data, dict):
+            for key in ["error", "message"]:
+                if data.get(key):
+                    message = data[key]
+                    break
+        jwt_expired = (
+            isinstance(data, dict)
+            and data.get("message") == "Signature has expired"
+        )
+        # flask-jwt-extended returns 422 with this message when the JWT
+        # signature has expired -- this is an auth case, not a validation one.
+        if jwt_expired:
+            try:
+                if (
+                    client
+                    and client.refresh_token
+                    and client.use_refresh_token
+                ):
+                    await client.refresh_access_token()
+                    return status_code, True
+                raise NotAuthenticatedException(path)
+            except NotAuthenticatedException:
+                if client and client.callback_not_authenticated:
+                    retry = client.callback_not_authenticated(client, path)
+                    if retry:
+                        return status_code, True
+                raise
+        raise ValidationException(path, message)
+    elif status_code == 401:
+        try:
+            data = await response.json()
+            if (
+                client
+                and client.refresh_token
+                and client.use_refresh_token
+                and data.get("message") == "Signature has expired"
+            ):
+                await client.refresh_access_token()
+                return status_code, True
+            else:
+                raise NotAuthenticatedException(path)
+        except NotAuthenticatedException:
+            if client and client.callback_not_authenticated:
+                retry = client.callback_not_authenticated(client, path)
+                if retry:
+                    return status_code, True
+            raise
+    elif status_code in [500, 502]:
+        try:
+            data = await response.json()
+            stacktrace = data.get(
+                "stacktrace", "No stacktrace sent by the server"
+            )
+            message = "No message sent by the server"
+            if isinstance(data, dict):
+                for key in ["error", "message"]:
+                    if data.get(key):
+                        message = data[key]
+                        break
+            logger.error(
+                "A server error occurred!\n"
+                "Server stacktrace:\n%s\n"
+                "Error message:\n%s",
+                stacktrace,
+                message,
+            )
+        except Exception:
+            text = await response.text()
+            logger.error("Server error response: %s", text)
+        raise ServerErrorException(path)
+    return status_code, False
+
+
+async def send_request(
+    method: str,
+    path: str,
+    read_response: Callable[[aiohttp.ClientResponse], Awaitable[Any]],
+    client: AsyncKitsuClient = None,
+    headers: dict | None = None,
+    retry_policy: RetryPolicy | None = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Send a request toward given path, check its status and return what
+    *read_response* reads from the response. The request is sent again after
+    a token refresh or, when the client (or given *retry_policy*) has a
+    retry policy, after a transient failure.
+    """
+    url = get_full_url(path, client)
+    policy = retry_policy or client.retry_policy
+    middlewares = client.middlewares
+    attempt = 1
+    while True:
+        request_headers = client.make_auth_header()
+        if headers:
+            request_headers.update(headers)
+        request = None
+        if middlewares:
+            request = new_request_infos(
+                method, path, url, request_headers, attempt, kwargs
+            )
+            run_middlewares(middlewares, "before_request", request)
+            start = time.perf_counter()
+        delay = None
+        try:
+            async with client.session.request(
+                method, url, headers=request_headers, **kwargs
+            ) as response:
+                received_size = await count_response_bytes(response, client)
+                if request is not None:
+                    request["duration"] = time.perf_counter() - start
+                    request["status_code"] = response.status
+                    request["bytes_received"] = received_size
+                    run_middlewares(
+                        middlewares, "after_response", request, response
+                    )
+                if policy is not None and policy.is_retryable(
+                    method, attempt, status_code=response.status
+                ):
+                    delay = policy.get_backoff(
+                        attempt, response.headers.get("Retry-After")
+                    )
+                    policy.record_retry(response.status)
+                else:
+                    try:
+                        _, retry = await check_status(
+                            response, path, client=client
+                        )
+                    except Exception as exception:
+                        if request is not None:
+                            run_middlewares(
+                                middlewares, "on_error", request, exception
+                            )
+                        raise
+                    if not retry:
+                        if request is None or read_response is not _read_json:
+                            return await read_response(response)
+                        start = time.perf_counter()
+                        result = await read_response(response)
+                        run_middlewares(
+                            middlewares,
+                            "after_decode",
+                            request,
+                            time.perf_counter() - start,
+                        )
+                        return result
+        except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+            if request is not None and "status_code" not in request:
+                run_middlewares(middlewares, "on_error", request, e)
+            if policy is None or not policy.is_retryable(
+                method, attempt, error=e
+            ):
+                raise
+            delay = policy.get_backoff(attempt)
+            policy.record_retry()
+        if delay is not None:
+            logger.debug("%s %s retrying in %.2fs", method, path, delay)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+async def count_response_bytes(
+    response: aiohttp.ClientResponse, client: AsyncKitsuClient
+) -> int:
+    # The body is read once here and kept by aiohttp for the readers.
+    size = len(await response.read())
+    received_size = response.content_length or size
+    client.transfer_stats.count_response(
+        size, received_size, response.headers.get("Content-Encoding")
+    )
+    return received_size
+
+
+async def _read_json(response: aiohttp.ClientResponse) -> Any:
+    try:
+        return encoder.loads(await response.read())
+    except Exception:
+        text = await response.text()
+        logger.error("Failed to decode JSON response: %s", text)
+        raise
+
+
+async def _read_text(response: aiohttp.ClientResponse) -> str:
+    return await response.text()
+
+
+async def get(
+    path: str,
+    json_response: bool = True,
+    params: dict | None = None,
+    client: AsyncKitsuClient = None,
+) -> Any:
+    logger.debug("GET %s", get_full_url(path, client))
+    path = build_path_with_params(path, params)
+    read_response = _read_json if json_response else _read_text
+    if not client.coalesce_requests:
+        return await send_request("GET", path, read_response, client=client)
+
+    # Identical requests running at the same time share the future of the
+    # first one, each waiter getting its own copy of the result.
+    key = (path, json_response, client.make_auth_header().get("Authorization"))
+    future = client.in_flight_requests.get(key)
+    if future is not None:
+        return copy.deepcopy(await asyncio.shield(future))
+
+    future = asyncio.get_event_loop().create_future()
+    client.in_flight_requests[key] = future
+    try:
+        result = await send_request("GET", path, read_response, client=client)
+        future.set_result(result)
+        return result
+    except Exception as exception:
+        future.set_exception(exception)
+        # Mark the exception as retrieved when nobody else waits for it.
+        future.exception()
+        raise
+    except BaseException:
+        future.cancel()
+        raise
+    finally:
+        del client.in_flight_requests[key]
+
+
+async def post(path: str, data: Any, client: AsyncKitsuClient = None) -> Any:
+    logger.debug("POST %s", get_full_url(path, client))
+    return await send_json_request("POST", path, data, client)
+
+
+async def put(path: str, data: dict, client: AsyncKitsuClient = None) -> Any:
+    logger.debug("PUT %s", get_full_url(path, client))
+    return await send_json_request("PUT", path, data, client)
+
+
+async def send_json_request(
+    method: str, path: str, data: Any, client: AsyncKitsuClient
+) -> Any:
+    """
+    Send given data as a JSON body, gzipped when it is bigger than the
+    client compression threshold, and return the decoded JSON response.
+    """
+    body = encoder.dumps(data)
+    headers = {"Content-Type": "application/json"}
+    sent_body, content_encoding = compress_request_body(
+        body, client.request_compression_threshold
+    )
+    if content_encoding is not None:
+        headers["Content-Encoding"] = content_encoding
+    client.transfer_stats.count_request(len(body), len(sent_body))
+    return await send_request(
+        method,
+        path,
+        _read_json,
+        client=client,
+        headers=headers,
+        data=sent_body,
+    )
+
+
+async def post_stream(
+    path: str,
+    items: list,
+    client: AsyncKitsuClient = None,
+    retry_policy: RetryPolicy | None = None,
+) -> Any:
+    """
+    Post given items as a JSON array encoded while it is sent, see
+    `gazu.client.post_stream`.
+    """
+    logger.debug("POST %s (%s items)", get_full_url(path, client), len(items))
+    headers = get_json_stream_headers(client)
+    body = JSONStreamBody(
+        items,
+        compress="Content-Encoding" in headers,
+        transfer_stats=client.transfer_stats,
+    )
+    return await send_request(
+        "POST",
+        path,
+        _read_json,
+        client=client,
+        headers=headers,
+        retry_policy=retry_policy,
+        data=body,
+    )
+
+
+async def post_batches(
+    path: str,
+    items: list,
+    batch_size: int = 1000,
+    max_workers: int = 1,
+    attempts: int = 3,
+    client: AsyncKitsuClient = None,
+) -> list:
+    """
+    Post given items in streamed batches, sent again on failure, see
+    `gazu.client.post_batches`. Batches are sent one after the other unless
+    *max_workers* is greater than one, in which case the order in which
+    they are applied is not guaranteed.
+    """
+    semaphore = asyncio.Semaphore(max_workers)
+    retry_policy = get_batch_retry_policy(client, attempts)
+
+    async def post_batch(batch: list) -> list:
+        async with semaphore, client.concurrency_limiter:
+            return await post_stream(
+                path, batch, client=client, retry_policy=retry_policy
+            )
+
+    results = await asyncio.gather(
+        *[
+            post_batch(items[index : index + batch_size])
+            for index in range(0, len(items), batch_size)
+        ]
+    )
+    return [result for batch_results in results for result in batch_results]
+
+
+async def delete(
+    path: str,
+    params: dict | None = None,
+    client: AsyncKitsuClient = None,
+) -> str:
+    logger.debug("DELETE %s", get_full_url(path, client))
+    path = build_path_with_params(path, params)
+    return await send_request("DELETE", path, _read_text, client=client)
+
+
+async def fetch_all(
+    path: str,
+    params: dict | None = None,
+    client: AsyncKitsuClient = None,
+    paginated: bool = False,
+    limit: int | None = None,
+    max_workers: int | None = None,
+) -> list[dict]:
+    """
+    Fetch all entries of a data route. In paginated mode, pages following
+    the first one are fetched concurrently, at most *max_workers* at a time
+    (and never more than the client concurrency limit), then merged back in
+    page order.
+    """
+    if paginated:
+        params = dict(params or {})
+        params["page"] = 1
+        if limit is not None:
+            params["limit"] = limit
+
+    url = url_path_join("data", path)
+    response = await get(url, params=params, client=client)
+
+    if not paginated:
+        return response
+
+    nb_pages = response.get("nb_pages", 1)
+    current_page = response.get("page", 1)
+    results = response.get("data", [])
+
+    if current_page != nb_pages:
+        semaphore = asyncio.Semaphore(max_workers or 1)
+
+        async def fetch_page(page: int) -> list[dict]:
+            async with semaphore, client.concurrency_limiter:
+                page_response = await get(
+                    url, params=dict(params, page=page), client=client
+                )
+            return page_response.get("data", [])
+
+        pages = await asyncio.gather(
+            *[fetch_page(page) for page in range(2, nb_pages + 1)]
+        )
+        for page_entries in pages:
+            results.extend(page_entries)
+
+    return results
+
+
+async def fetch_first(
+    path: str,
+    params: dict | None = None,
+    client: AsyncKitsuClient = None,
+) -> dict | None:
+    entries = await get(
+        url_path_join("data", path), params=params, client=client
+    )
+    return entries[0] if entries else None
+
+
+async def fetch_one(
+    model_name: str,
+    id: str,
+    params: dict | None = None,
+    client: AsyncKitsuClient = None,
+) -> dict:
+    return await get(
+        url_path_join("data", model_name, id),
+        params=params,
+        client=client,
+    )
+
+
+async def fetch_many(
+    model_name: str,
+    ids: list[str],
+    params: dict | None = None,
+    client: AsyncKitsuClient = None,
+    max_url_length: int = 2048,
+    max_workers: int | None = None,
+) -> dict[str, dict]:
+    """
+    Fetch many model instances in a few requests, see
+    `gazu.client.fetch_many`.
+    """
+    ids = list(dict.fromkeys(ids))
+    path = url_path_join("data", model_name)
+    if model_name not in client.unsupported_id_filters:
+        try:
+            results = {}
+            for chunk in chunk_ids(path, ids, params, client, max_url_length):
+                chunk_params = dict(
+                    params or {}, id=json.dumps(chunk, separators=(",", ":"))
+                )
+                entries = await get(path, params=chunk_params, client=client)
+                entries_by_id = {entry["id"]: entry for entry in entries}
+                if not set(entries_by_id).issubset(chunk):
+                    raise ParameterException(path, "id filter not supported")
+                results.update(entries_by_id)
+            return results
+        except ParameterException:
+            logger.debug("No id list filter on %s, fetching one by one", path)
+            client.unsupported_id_filters.add(model_name)
+
+    semaphore = asyncio.Semaphore(max_workers or client.max_concurrency)
+
+    async def fetch_instance(instance_id: str) -> dict | None:
+        async with semaphore, client.concurrency_limiter:
+            try:
+                return await fetch_one(
+                    model_name, instance_id, params=params, client=client
+                )
+            except RouteNotFoundException:
+                return None
+
+    entries = await asyncio.gather(*[fetch_instance(i) for i in ids])
+    return {
+        instance_id: entry
+        for instance_id, entry in zip(ids, entries)
+        if entry is not None
+    }
+
+
+async def iter_all(
+    path: str,
+    params: dict | None = None,
+    client: AsyncKitsuClient = None,
+    paginated: bool = False,
+    limit: int | None = None,
+    max_workers: int | None = None,
+) -> AsyncIterator[dict]:
+    """
+    Iterate over all entries of a data route. In paginated mode, entries are
+    yielded page by page as they are received, with up to *max_workers*
+    pages being fetched ahead.
+    """
+    url = url_path_join("data", path)
+    if not paginated:
+        for entry in await get(url, params=params, client=client):
+            yield entry
+        return
+
+    params = dict(params or {}, page=1)
+    if limit is not None:
+        params["limit"] = limit
+    response = await get(url, params=params, client=client)
+    for entry in response.get("data", []):
+        yield entry
+
+    async def fetch_page(page: int) -> list[dict]:
+        async with client.concurrency_limiter:
+            page_response = await get(
+                url, params=dict(params, page=page), client=client
+            )
+        return page_response.get("data", [])
+
+    pages = range(response.get("page", 1) + 1, response.get("nb_pages", 1) + 1)
+    window = max_workers or 1
+    tasks = [
+        asyncio.ensure_future(fetch_page(page)) for page in pages[:window]
+    ]
+    try:
+        for index in range(len(pages)):
+            entries = await tasks[index]
+            if index + window < len(pages):
+                tasks.append(
+                    asyncio.ensure_future(fetch_page(pages[index + window]))
+                )
+            for entry in entries:
+                yield entry
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def create(
+    model_name: str, data: dict, client: AsyncKitsuClient = None
+) -> dict:
+    return await post(url_path_join("data", model_name), data, client=client)
+
+
+async def update(
+    model_name: str,
+    model_id: str,
+    data: dict,
+    client: AsyncKitsuClient = None,
+) -> dict:
+    return await put(
+        url_path_join("data", model_name, model_id), data, client=client
+    )
+
+
+async def upload(
+    path: str,
+    file_path: str = None,
+    data: dict | None = None,
+    extra_files: list | None = None,
+    files: dict | None = None,
+    client: AsyncKitsuClient = None,
+    progress_callback: Callable | None = None,
+) -> Any:
+    """
+    Upload a file asynchronously. Like with the sync client, *files* can give
+    the multipart fields directly, as file objects or (filename, content,
+    content type) tuples.
+
+    Example::
+
+        await gazu.aio.upload(
+            "pictures/thumbnails/projects/project-id",
+            "/path/to/thumbnail.png",
+            client=client,
+        )
+    """
+    if data is None:
+        data = {}
+    if extra_files is None:
+        extra_files = []
+    url = get_full_url(path, client)
+
+    form = aiohttp.FormData()
+    for key, value in data.items():
+        form.add_field(key, str(value))
+
+    files_to_close = []
+    total_size = 0
+    sources = [] if file_path is None else [("file", file_path)]
+    sources += [
+        (f"file-{i}", extra_file)
+        for i, extra_file in enumerate(extra_files, start=1)
+    ]
+    for name, source in sources:
+        if isinstance(source, (str, os.PathLike)):
+            f = open(source, "rb")
+            files_to_close.append(f)
+            total_size += os.fstat(f.fileno()).st_size
+            form.add_field(name, f, filename=os.path.basename(source))
+        else:
+            # Buffer (bytes, memoryview, mmap...) or (file name, buffer).
+            if not isinstance(source, tuple):
+                source = (name, source)
+            content = memoryview(source[1]).cast("B")
+            total_size += len(content)
+            form.add_field(name, content, filename=source[0])
+    for name, value in (files or {}).items():
+        if isinstance(value, tuple):
+            filename, content, content_type = (value + (None, None))[:3]
+            form.add_field(
+                name, content, filename=filename, content_type=content_type
+            )
+        else:
+            form.add_field(
+                name,
+                value,
+                filename=os.path.basename(getattr(value, "name", name)),
+            )
+
+    try:
+        retry = True
+        while retry:
+            async with client.session.post(
+                url,
+                data=form,
+                headers=client.make_auth_header(),
+            ) as response:
+                _, retry = await check_status(response, path, client=client)
+                if not retry:
+                    try:
+                        result = encoder.loads(await response.read())
+                    except Exception:
+                        text = await response.text()
+                        logger.error(
+                            "Failed to decode JSON response: %s", text
+                        )
+                        raise
+    finally:
+        for f in files_to_close:
+            f.close()
+
+    message = ""
+    if isinstance(result, dict):
+        for key in ["error", "message"]:
+            if result.get(key):
+                message = result[key]
+                break
+    if message:
+        raise UploadFailedException(message)
+
+    return result
+
+
+async def download(
+    path: str,
+    file_path: str,
+    params: dict | None = None,
+    client: AsyncKitsuClient = None,
+    progress_callback: Callable | None = None,
+) -> None:
+    """
+    Download a file asynchronously.
+
+    Example::
+
+        await gazu.aio.download(
+            "movies/originals/preview-files/preview-id.mp4",
+            "/tmp/output.mp4",
+            client=client,
+        )
+    """
+    if not isinstance(file_path, (str, os.PathLike)):
+        await download_to(
+            path,
+            file_path,
+            params=params,
+            client=client,
+            progress_callback=progress_callback,
+        )
+        return
+    path = build_path_with_params(path, params)
+    async with client.session.get(
+        get_full_url(path, client),
+        headers=client.make_auth_header(),
+    ) as response:
+        total = int(response.headers.get("content-length", 0))
+        bytes_read = 0
+        with open(file_path, "wb") as target_file:
+            async for chunk in response.content.iter_chunked(8192):
+                target_file.write(chunk)
+                if progress_callback is not None:
+                    bytes_read += len(chunk)
+                    progress_callback(bytes_read, total)
+
+
+async def download_to(
+    path: str,
+    sink: Any,
+    params: dict | None = None,
+    chunk_size: int = 64 * 1024,
+    client: AsyncKitsuClient = None,
+    progress_callback: Callable | None = None,
+) -> int:
+    """
+    Stream a file into a buffer, a generator, a writable object or a
+    function, see `gazu.client.download_to`.
+
+    Returns:
+        int: Number of bytes written into the sink.
+    """
+    path = build_path_with_params(path, params)
+    writer = DownloadSink(sink)
+    try:
+        retry = True
+        while retry:
+            async with client.session.get(
+                get_full_url(path, client),
+                headers=client.make_auth_header(),
+            ) as response:
+                _, retry = await check_status(response, path, client=client)
+                if retry:
+                    continue
+                total = int(response.headers.get("content-length", 0))
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    writer.write(chunk)
+                    if progress_callback is not None:
+                        progress_callback(writer.size, total)
+    finally:
+        writer.close()
+    return writer.size
+
+
+async def download_file(
+    url: str, file_path: str | None = None, headers: dict | None = None
+) -> str:
+    """
+    Download the file located at given url, see
+    `gazu.helpers.download_file`.
+
+    Returns:
+        str: The location where the file is stored.
+    """
+    async with aiohttp.ClientSession() as session:
+        async with session.get(url, headers=headers or {}) as response:
+            if response.status >= 400:
+                raise DownloadFileException(
+                    f"File ({url}) can't be downloaded "
+                    f"({response.status} {response.reason})."
+                )
+            file_path = get_download_file_path(
+                url, file_path, response.headers.get("Content-Type")
+            )
+            with open(file_path, "wb") as target_file:
+                async for chunk in response.content.iter_chunked(65536):
+                    target_file.write(chunk)
+    return file_path
+
+
+async def log_in(
+    email: str,
+    password: str,
+    totp: str | None = None,
+    email_otp: str | None = None,
+    fido_authentication_response=None,
+    recovery_code: str | None = None,
+    client: AsyncKitsuClient = None,
+) -> dict:
+    from ..exception import AuthFailedException
+
+    tokens = {}
+    try:
+        tokens = await post(
+            "auth/login",
+            {
+                "email": email,
+                "password": password,
+                "totp": totp,
+                "email_otp": email_otp,
+                "fido_authentication_response": fido_authentication_response,
+                "recovery_code": recovery_code,
+            },
+            client=client,
+        )
+    except (NotAuthenticatedException, ParameterException):
+        pass
+
+    if not tokens or tokens.get("login") is False:
+        raise AuthFailedException
+    else:
+        client.tokens = tokens
+    return tokens
+
+
+async def log_out(client: AsyncKitsuClient) -> dict:
+    try:
+        await get("auth/logout", client=client)
+    except ParameterException:
+        pass
+    client.tokens = {"access_token": None, "refresh_token": None}
+    return client.tokens
+
+
+async def check_server_status(client: AsyncKitsuClient) -> bool:
+    try:
+        async with client.session.head(client.host) as response:
+            return response.status == 200
+    except Exception:
+        return False
+
+
+async def create_session(
+    host: str,
+    email: str,
+    password: str,
+    totp: str | None = None,
+    email_otp: str | None = None,
+    fido_authentication_response=None,
+    recovery_code: str | None = None,
+    ssl_verify: bool = True,
+    use_refresh_token: bool = False,
+    callback_not_authenticated: Callable | None = None,
+    retry_policy: RetryPolicy | None = None,
+) -> AsyncKitsuClient:
+    """
+    Create a logged-in AsyncKitsuClient for use as an async context manager.
+
+    Usage::
+
+        async with await gazu.aio.create_session(host, email, pwd) as client:
+            data = await gazu.aio.get("data/projects", client=client)
+
+    Returns:
+        AsyncKitsuClient: A logged-in async client.
+    """
+    client = AsyncKitsuClient(
+        host,
+        ssl_verify=ssl_verify,
+        use_refresh_token=use_refresh_token,
+        callback_not_authenticated=callback_not_authenticated,
+        retry_policy=retry_policy,
+    )
+    await log_in(
+        email,
+        password,
+        totp=totp,
+        email_otp=email_otp,
+        fido_authentication_response=fido_authentication_response,
+        recovery_code=recovery_code,
+        client=client,
+    )
+    return client
@@ -0,0 +1,184 @@
+# Generated from gazu/concept.py by `python -m gazu.aio.transform`,
+# do not edit.
+"""
+Async version of `gazu.concept`.
+"""
+
+from __future__ import annotations
+
+from .. import aio
+from .. import client as raw
+from ..concept import (
+    KitsuClient,
+    normalize_list_of_models_for_links,
+    normalize_model_parameter,
+    sort_by_name,
+)
+
+
+default = None
+
+
+__all__ = [
+    "all_concepts",
+    "all_concepts_for_project",
+    "all_previews_for_concept",
+    "get_concept",
+    "get_concept_by_name",
+    "new_concept",
+    "remove_concept",
+    "update_concept",
+]
+
+
+async def all_concepts(client: KitsuClient = default) -> list[dict]:
+    """
+    Returns:
+        list: All concepts from database.
+    """
+    concepts = await aio.fetch_all("concepts", client=client)
+    return sort_by_name(concepts)
+
+
+async def all_concepts_for_project(
+    project: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Args:
+        project (str / dict): The project dict or the project ID.
+
+    Returns:
+        list: Concepts from database for the given project.
+    """
+    project = normalize_model_parameter(project)
+    concepts = await aio.fetch_all(
+        f"projects/{project['id']}/concepts", client=client
+    )
+    return sort_by_name(concepts)
+
+
+async def all_previews_for_concept(
+    concept: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Args:
+        concept (str / dict): The concept dict or the concept ID.
+
+    Returns:
+        list: Previews from database for given concept.
+    """
+    concept = normalize_model_parameter(concept)
+    return await aio.fetch_all(
+        f"concepts/{concept['id']}/preview-files", client=client
+    )
+
+
+async def remove_concept(
+    concept: str | dict, force: bool = False, client: KitsuClient = default
+) -> str:
+    """
+    Remove the given Concept from the database.
+
+    If the Concept has tasks linked to it, this will by default mark the
+    Concept as canceled. Deletion can be forced regardless of task links
+    with the `force` parameter.
+
+    Args:
+        concept (dict / str): Concept to remove.
+        force (bool): Whether to force the deletion of the concept.
+    """
+    concept = normalize_model_parameter(concept)
+    path = f"data/concepts/{concept['id']}"
+    params = {}
+    if force:
+        params = {"force": True}
+    return await aio.delete(path, params, client=client)
+
+
+async def get_concept(concept_id: str, client: KitsuClient = default) -> dict:
+    """
+    Args:
+        concept_id (str): ID of claimed concept.
+
+    Returns:
+        dict: Concept corresponding to given concept ID.
+    """
+    return await aio.fetch_one("concepts", concept_id, client=client)
+
+
+async def get_concept_by_name(
+    project: str | dict, concept_name: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Args:
+        project (str / dict): The project dict or the project ID.
+        concept_name (str): Name of claimed concept.
+
+    Returns:
+        dict: Concept corresponding to given name and project.
+    """
+    project = normalize_model_parameter(project)
+    return await aio.fetch_first(
+        "concepts",
+        {"project_id": project["id"], "name": concept_name},
+        client=client,
+    )
+
+
+async def new_concept(
+    project: str | dict,
+    name: str,
+    description: str | None = None,
+    data: dict | None = None,
+    entity_concept_links: list[str | dict] | None = None,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create a concept for given project. Allow to set metadata too.
+
+    Args:
+        project (str / dict): The project dict or the project ID.
+        name (str): The name of the concept to create.
+        data (dict): Free field to set metadata of any kind.
+        entity_concept_links (list): List of entities to tag, as either
+            ID strings or model dicts.
+
+    Returns:
+        Created concept.
+    """
+    project = normalize_model_parameter(project)
+    if data is None:
+        data = {}
+    if entity_concept_links is None:
+        entity_concept_links = []
+    data = {
+        "name": name,
+        "data": data,
+        "entity_concept_links": normalize_list_of_models_for_links(
+            entity_concept_links
+        ),
+    }
+
+    if description is not None:
+        data["description"] = description
+
+    concept = await get_concept_by_name(project, name, client=client)
+    if concept is None:
+        path = f"data/projects/{project['id']}/concepts"
+        return await aio.post(path, data, client=client)
+    else:
+        return concept
+
+
+async def update_concept(concept: dict, client: KitsuClient = default) -> dict:
+    """
+    Save given concept data into the API. Metadata are fully replaced by the ones
+    set on given concept.
+
+    Args:
+        concept (dict): The concept dict to update.
+
+    Returns:
+        dict: Updated concept.
+    """
+    return await aio.put(f"data/entities/{concept['id']}", concept, client=client)
@@ -0,0 +1,237 @@
+# Generated from gazu/context.py by `python -m gazu.aio.transform`,
+# do not edit.
+"""
+Async version of `gazu.context`.
+"""
+
+from __future__ import annotations
+
+from .. import aio
+from ..context import KitsuClient
+from . import asset as gazu_asset
+from . import project as gazu_project
+from . import scene as gazu_scene
+from . import shot as gazu_shot
+from . import task as gazu_task
+from . import user as gazu_user
+
+
+default = None
+
+
+__all__ = [
+    "all_asset_types_for_project",
+    "all_assets_for_asset_type_and_project",
+    "all_assets_for_project",
+    "all_episodes_for_project",
+    "all_open_projects",
+    "all_scenes_for_project",
+    "all_scenes_for_sequence",
+    "all_sequences_for_episode",
+    "all_sequences_for_project",
+    "all_shots_for_sequence",
+    "all_task_types_for_asset",
+    "all_task_types_for_scene",
+    "all_task_types_for_sequence",
+    "all_task_types_for_shot",
+]
+
+
+async def all_open_projects(
+    user_context: bool = False, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Return the list of projects for which the user has a task.
+    """
+    if user_context:
+        return await gazu_user.all_open_projects(client=client)
+    else:
+        return await gazu_project.all_open_projects(client=client)
+
+
+async def all_assets_for_project(
+    project: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of assets for which the user has a task.
+    """
+    if user_context:
+        return gazu_user.all_assets_for_project(project, client=client)
+    else:
+        return await gazu_asset.all_assets_for_project(project, client=client)
+
+
+async def all_asset_types_for_project(
+    project: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of asset types for which the user has a task.
+    """
+    if user_context:
+        return await gazu_user.all_asset_types_for_project(project, client=client)
+    else:
+        return await gazu_asset.all_asset_types_for_project(project, client=client)
+
+
+async def all_assets_for_asset_type_and_project(
+    project: str | dict,
+    asset_type: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of assets for given project and asset_type and for which
+    the user has a task.
+    """
+    if user_context:
+        return await gazu_user.all_assets_for_asset_type_and_project(
+            project, asset_type, client=client
+        )
+    else:
+        return await gazu_asset.all_assets_for_project_and_type(
+            project, asset_type, client=client
+        )
+
+
+async def all_task_types_for_asset(
+    asset: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of tasks for given asset and current user.
+    """
+    if user_context:
+        return await gazu_user.all_task_types_for_asset(asset, client=client)
+    else:
+        return await gazu_task.all_task_types_for_asset(asset, client=client)
+
+
+async def all_task_types_for_shot(
+    shot: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of tasks for given shot and current user.
+    """
+    if user_context:
+        return await gazu_user.all_task_types_for_shot(shot, client=client)
+    else:
+        return await gazu_task.all_task_types_for_shot(shot, client=client)
+
+
+async def all_task_types_for_scene(
+    scene: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of tasks for given scene and current user.
+    """
+    if user_context:
+        return await gazu_user.all_task_types_for_scene(scene, client=client)
+    else:
+        return await gazu_task.all_task_types_for_scene(scene, client=client)
+
+
+async def all_task_types_for_sequence(
+    sequence: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of tasks for given sequence and current user.
+    """
+    if user_context:
+        return await gazu_user.all_task_types_for_sequence(sequence, client=client)
+    else:
+        return await gazu_task.all_task_types_for_sequence(sequence, client=client)
+
+
+async def all_sequences_for_project(
+    project: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of sequences for given project and current user.
+    """
+    if user_context:
+        return await gazu_user.all_sequences_for_project(project, client=client)
+    else:
+        return await gazu_shot.all_sequences_for_project(project, client=client)
+
+
+async def all_scenes_for_project(
+    project: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of scenes for given project and current user.
+    """
+    if user_context:
+        return gazu_user.all_scenes_for_project(project, client=client)
+    else:
+        return await gazu_scene.all_scenes(project, client=client)
+
+
+async def all_shots_for_sequence(
+    sequence: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of shots for given sequence and current user.
+    """
+    if user_context:
+        return await gazu_user.all_shots_for_sequence(sequence, client=client)
+    else:
+        return await gazu_shot.all_shots_for_sequence(sequence, client=client)
+
+
+async def all_scenes_for_sequence(
+    sequence: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of scenes for given sequence and current user.
+    """
+    if user_context:
+        return await gazu_user.all_scenes_for_sequence(sequence, client=client)
+    else:
+        return await gazu_scene.all_scenes_for_sequence(sequence, client=client)
+
+
+async def all_sequences_for_episode(
+    episode: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of sequences for given episode and current user.
+    """
+    if user_context:
+        return gazu_user.all_sequences_for_episode(episode, client=client)
+    else:
+        return await gazu_shot.all_sequences_for_episode(episode, client=client)
+
+
+async def all_episodes_for_project(
+    project: str | dict,
+    user_context: bool = False,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Return the list of episodes for given project and current user.
+    """
+    if user_context:
+        return await gazu_user.all_episodes_for_project(project, client=client)
+    else:
+        return await gazu_shot.all_episodes_for_project(project, client=client)
@@ -0,0 +1,211 @@
+# Generated from gazu/edit.py by `python -m gazu.aio.transform`,
+# do not edit.
+"""
+Async version of `gazu.edit`.
+"""
+
+from __future__ import annotations
+
+from .. import aio
+from .. import client as raw
+from ..edit import KitsuClient, normalize_model_parameter, sort_by_name
+
+
+default = None
+
+
+__all__ = [
+    "all_edits_for_project",
+    "all_previews_for_edit",
+    "get_edit",
+    "get_edit_by_name",
+    "get_edit_url",
+    "new_edit",
+    "remove_edit",
+    "update_edit",
+    "update_edit_data",
+]
+
+
+async def get_edit(edit_id: str, client: KitsuClient = default) -> dict:
+    """
+    Args:
+        edit_id (str): ID of claimed edit.
+
+    Returns:
+        dict: Edit corresponding to given edit ID.
+    """
+    return await aio.fetch_one("edits", edit_id, client=client)
+
+
+async def get_edit_by_name(
+    project: str | dict, edit_name: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Args:
+        project (str / dict): The project dict or the project ID.
+        edit_name (str): Name of claimed edit.
+
+    Returns:
+        dict: Edit corresponding to given name and sequence.
+    """
+    project = normalize_model_parameter(project)
+    return await aio.fetch_first(
+        "edits/all",
+        {"project_id": project["id"], "name": edit_name},
+        client=client,
+    )
+
+
+async def get_edit_url(edit: str | dict, client: KitsuClient = default) -> str:
+    """
+    Args:
+        edit (str / dict): The edit dict or the edit ID.
+
+    Returns:
+        url (str): Web url associated to the given edit
+    """
+    edit = normalize_model_parameter(edit)
+    edit = await get_edit(edit["id"], client=client)
+    host = raw.get_api_url_from_host(client=client)
+    project_id = edit["project_id"]
+    edit_id = edit["id"]
+    if edit["episode_id"] is None:
+        return f"{host}/productions/{project_id}/edits/{edit_id}/"
+    else:
+        episode_id = edit["episode_id"]
+        return f"{host}/productions/{project_id}/episodes/{episode_id}/edits/{edit_id}/"
+
+
+async def all_edits_for_project(
+    project: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Args:
+        project (str / dict): The project dict or the project ID.
+
+    Returns:
+        list: Edits from database or for given project.
+    """
+    project = normalize_model_parameter(project)
+    edits = await aio.fetch_all(f"projects/{project['id']}/edits", client=client)
+    return sort_by_name(edits)
+
+
+async def all_previews_for_edit(
+    edit: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Args:
+        edit (str / dict): The edit dict or the edit ID.
+
+    Returns:
+        list: Previews from database for given edit.
+    """
+    edit = normalize_model_parameter(edit)
+    return await aio.fetch_all(f"edits/{edit['id']}/preview-files", client=client)
+
+
+async def new_edit(
+    project: str | dict,
+    name: str,
+    description: str | None = None,
+    data: dict | None = None,
+    episode: str | dict | None = None,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create an edit for given project (and episode if given).
+    Allow to set metadata too.
+
+    Args:
+        project (str / dict): The project dict or the project ID.
+        name (str): The name of the edit to create.
+        description (str): The description of the edit to create.
+        data (dict): Free field to set metadata of any kind.
+        episode (str / dict): The episode dict or the episode ID.
+
+    Returns:
+        Created edit.
+    """
+    if data is None:
+        data = {}
+    project = normalize_model_parameter(project)
+    data = {"name": name, "data": data}
+
+    if episode is not None:
+        episode = normalize_model_parameter(episode)
+        data["parent_id"] = episode["id"]
+
+    if description is not None:
+        data["description"] = description
+
+    edit = await get_edit_by_name(project, name, client=client)
+    if edit is None:
+        path = f"data/projects/{project['id']}/edits"
+        return await aio.post(path, data, client=client)
+    else:
+        return edit
+
+
+async def remove_edit(
+    edit: str | dict, force: bool = False, client: KitsuClient = default
+) -> str:
+    """
+    Remove given edit from database.
+
+    If the Edit has tasks linked to it, this will by default mark the
+    Edit as canceled. Deletion can be forced regardless of task links
+    with the `force` parameter.
+
+    Args:
+        edit (str / dict): Edit to remove.
+        force (bool): Whether to force deletion of the edit regardless of
+            whether it has links to tasks.
+    """
+    edit = normalize_model_parameter(edit)
+    path = f"data/edits/{edit['id']}"
+    params = {}
+    if force:
+        params = {"force": True}
+    return await aio.delete(path, params, client=client)
+
+
+async def update_edit(edit: dict, client: KitsuClient = default) -> dict:
+    """
+    Save given edit data into the API. Metadata are fully replaced by the ones
+    set on given edit.
+
+    Args:
+        edit (dict): The edit dict to update.
+
+    Returns:
+        dict: Updated edit.
+    """
+    return await aio.put(f"data/entities/{edit['id']}", edit, client=client)
+
+
+async def update_edit_data(
+    edit: str | dict, data: dict | None = None, client: KitsuClient = default
+) -> dict:
+    """
+    Update the metadata for the provided edit. Keys that are not provided are
+    not changed.
+
+    Args:
+        edit (str / dict): The edit dict or ID to save in database.
+        data (dict): Free field to set metadata of any kind.
+
+    Returns:
+        dict: Updated edit.
+    """
+    if data is None:
+        data = {}
+    edit = normalize_model_parameter(edit)
+    current_edit = await get_edit(edit["id"], client=client)
+    current_data = current_edit["data"] or {}
+    updated_edit = {
+        "id": current_edit["id"],
+        "data": {**current_data, **data},
+    }
+    return await update_edit(updated_edit, client=client)
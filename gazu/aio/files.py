@@ -0,0 +1,1890 @@
+# Generated from gazu/files.py by `python -m gazu.aio.transform`,
+# do not edit.
+"""
+Async version of `gazu.files`. Functions without async version:
+`download_many`.
+"""
+
+from __future__ import annotations
+
+import requests
+
+from .. import aio
+from .. import client as raw
+from ..files import (
+    Iterator,
+    KitsuClient,
+    Literal,
+    get_attachment_thumbnail_url,
+    get_preview_file_download_url,
+    is_downloaded,
+    normalize_model_parameter,
+)
+
+
+default = None
+
+
+__all__ = [
+    "all_output_files_for_asset_instance",
+    "all_output_files_for_entity",
+    "all_output_files_for_project",
+    "all_output_types",
+    "all_output_types_for_asset_instance",
+    "all_output_types_for_entity",
+    "all_softwares",
+    "build_asset_instance_output_file_path",
+    "build_entity_output_file_path",
+    "build_working_file_path",
+    "download_attachment_file",
+    "download_attachment_thumbnail",
+    "download_organisation_avatar",
+    "download_person_avatar",
+    "download_preview_file",
+    "download_preview_file_cover",
+    "download_preview_file_thumbnail",
+    "download_preview_lowdef_movie",
+    "download_preview_movie",
+    "download_project_avatar",
+    "download_working_file",
+    "extract_frame_from_preview",
+    "extract_tile_from_preview",
+    "get_all_attachment_files_for_project",
+    "get_all_attachment_files_for_task",
+    "get_all_preview_files_for_task",
+    "get_all_working_files_for_entity",
+    "get_attachment_file",
+    "get_attachment_thumbnail_url",
+    "get_file_status",
+    "get_file_status_by_name",
+    "get_last_asset_instance_output_revision",
+    "get_last_entity_output_revision",
+    "get_last_output_files_for_asset_instance",
+    "get_last_output_files_for_entity",
+    "get_last_working_file_revision",
+    "get_last_working_files",
+    "get_next_asset_instance_output_revision",
+    "get_next_entity_output_revision",
+    "get_output_file",
+    "get_output_file_by_path",
+    "get_output_type",
+    "get_output_type_by_name",
+    "get_preview_file",
+    "get_preview_file_download_url",
+    "get_preview_file_url",
+    "get_preview_lowdef_movie_url",
+    "get_preview_movie_url",
+    "get_running_preview_files",
+    "get_software",
+    "get_software_by_name",
+    "get_working_file",
+    "get_working_files_for_task",
+    "is_downloaded",
+    "iter_output_files_for_project",
+    "new_asset_instance_output_file",
+    "new_entity_output_file",
+    "new_file_status",
+    "new_output_type",
+    "new_software",
+    "new_working_file",
+    "remove_preview_file",
+    "set_project_file_tree",
+    "update_comment",
+    "update_modification_date",
+    "update_output_file",
+    "update_preview",
+    "update_preview_annotations",
+    "update_preview_position",
+    "update_project_file_tree",
+    "update_software",
+    "upload_organisation_avatar",
+    "upload_person_avatar",
+    "upload_project_avatar",
+    "upload_working_file",
+]
+
+
+async def all_output_types(client: KitsuClient = default) -> list[dict]:
+    """
+    Returns:
+        list: Output types listed in database.
+    """
+    return await aio.fetch_all("output-types", client=client)
+
+
+async def all_output_types_for_entity(
+    entity: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Args:
+        entity (str / dict): The entity dict or the entity ID.
+
+    Returns:
+        list: All output types linked to output files for given entity.
+    """
+    entity = normalize_model_parameter(entity)
+    return await aio.fetch_all(
+        f"entities/{entity['id']}/output-types", client=client
+    )
+
+
+async def all_output_types_for_asset_instance(
+    asset_instance: dict, temporal_entity: dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Returns:
+        list: Output types for given asset instance and entity (shot or scene).
+    """
+    return await aio.fetch_all(
+        f"asset-instances/{asset_instance['id']}/entities/{temporal_entity['id']}/output-types",
+        client=client,
+    )
+
+
+async def get_output_type(
+    output_type_id: str, client: KitsuClient = default
+) -> dict:
+    """
+    Args:
+        output_type_id (str): ID of claimed output type.
+
+    Returns:
+        dict: Output type matching given ID.
+    """
+    return await aio.fetch_one("output-types", output_type_id, client=client)
+
+
+async def get_output_type_by_name(
+    output_type_name: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Args:
+        output_type_name (str): name of claimed output type.
+
+    Returns:
+        dict: Output type matching given name.
+    """
+    return await aio.fetch_first(
+        "output-types", {"name": output_type_name}, client=client
+    )
+
+
+async def new_output_type(
+    name: str, short_name: str, client: KitsuClient = default
+) -> dict:
+    """
+    Create a new output type in database.
+
+    Args:
+        name (str): Name of created output type.
+        short_name (str): Name shorten to represente the type in UIs.
+
+    Returns:
+        dict: Created output type.
+    """
+    data = {"name": name, "short_name": short_name}
+    output_type = await get_output_type_by_name(name, client=client)
+    if output_type is None:
+        return await aio.create("output-types", data, client=client)
+    else:
+        return output_type
+
+
+async def get_output_file(
+    output_file_id: str, client: KitsuClient = default
+) -> dict:
+    """
+    Args:
+        output_file_id (str): ID of claimed output file.
+
+    Returns:
+        dict: Output file matching given ID.
+    """
+    path = f"data/output-files/{output_file_id}"
+    return await aio.get(path, client=client)
+
+
+async def get_output_file_by_path(
+    path: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Args:
+        path (str): Path of claimed output file.
+
+    Returns:
+        dict: Output file matching given path, or None if there are no matches.
+    """
+    return await aio.fetch_first("output-files", {"path": path}, client=client)
+
+
+async def get_all_working_files_for_entity(
+    entity: str | dict,
+    task: str | dict | None = None,
+    name: str | None = None,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Retrieves all the working files of a given entity and specied parameters
+    """
+    entity = normalize_model_parameter(entity)
+    task = normalize_model_parameter(task)
+    path = f"entities/{entity['id']}/working-files"
+
+    params = {}
+    if task is not None:
+        params["task_id"] = task["id"]
+    if name is not None:
+        params["name"] = name
+
+    return await aio.fetch_all(path, params, client=client)
+
+
+async def get_preview_file(
+    preview_file_id: str, client: KitsuClient = default
+) -> dict:
+    """
+    Args:
+        preview_file_id (str): ID of claimed preview file.
+
+    Returns:
+        dict: Preview file corresponding to given ID.
+    """
+    return await aio.fetch_one("preview-files", preview_file_id, client=client)
+
+
+async def remove_preview_file(
+    preview_file: str | dict,
+    force: bool = False,
+    client: KitsuClient = default,
+) -> str:
+    """
+    Remove given preview file from database.
+
+    Depending on the configuration of the Kitsu server, the stored files linked
+    to the preview file may or may not be removed on deletion of a preview file.
+    The `force=True` parameter can be used to force deletion of the files
+    regardless of server config.
+
+    Args:
+        preview_file (str / dict): The preview_file dict or ID.
+        force (bool): Whether to force deletion of the files linked to the
+            preview file in storage.
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    params = {}
+    if force:
+        params = {"force": True}
+    return await aio.delete(
+        f"data/preview-files/{preview_file['id']}",
+        params=params,
+        client=client,
+    )
+
+
+async def get_all_preview_files_for_task(
+    task: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Retrieves all the preview files for a given task.
+
+    Args:
+        task (str / dict): Target task, as ID string or model dict.
+    """
+    task = normalize_model_parameter(task)
+    return await aio.fetch_all(
+        "preview-files", {"task_id": task["id"]}, client=client
+    )
+
+
+async def get_all_attachment_files_for_task(
+    task: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Retrieves all the attachment files for a given task.
+
+    Args:
+        task (str / dict): Target task, as ID string or model dict.
+    """
+    task = normalize_model_parameter(task)
+    return await aio.fetch_all(f"tasks/{task['id']}/attachment-files", client=client)
+
+
+async def get_all_attachment_files_for_project(
+    project: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Retrieves all the attachment files for a given project.
+
+    Args:
+        project (str / dict): Target project, as ID string or model dict.
+
+    Returns:
+        list: Attachment files for the project.
+    """
+    project = normalize_model_parameter(project)
+    return await aio.fetch_all(
+        f"projects/{project['id']}/attachment-files", client=client
+    )
+
+
+async def all_output_files_for_entity(
+    entity: str | dict,
+    output_type: str | dict | None = None,
+    task_type: str | dict | None = None,
+    name: str | None = None,
+    representation: str | None = None,
+    file_status: str | dict | None = None,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Args:
+        entity (str / dict): The entity dict or ID.
+        output_type (str / dict): The output type dict or ID.
+        task_type (str / dict): The task type dict or ID.
+        name (str): The file name
+        representation (str): The file representation
+        file_status (str / dict): The file status
+
+    Returns:
+        list:
+            Output files for a given entity (asset or shot), output type,
+            task_type, name and representation
+    """
+    entity = normalize_model_parameter(entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    file_status = normalize_model_parameter(file_status)
+    path = f"entities/{entity['id']}/output-files"
+
+    params = {}
+    if output_type:
+        params["output_type_id"] = output_type["id"]
+    if task_type:
+        params["task_type_id"] = task_type["id"]
+    if representation:
+        params["representation"] = representation
+    if name:
+        params["name"] = name
+    if file_status:
+        params["file_status_id"] = file_status["id"]
+
+    return await aio.fetch_all(path, params, client=client)
+
+
+async def all_output_files_for_asset_instance(
+    asset_instance: str | dict,
+    temporal_entity: str | dict | None = None,
+    task_type: str | dict | None = None,
+    output_type: str | dict | None = None,
+    name: str | None = None,
+    representation: str | None = None,
+    file_status: str | dict | None = None,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Args:
+        asset_instance (str / dict): The instance dict or ID.
+        temporal_entity (str / dict): Shot dict or ID (or scene or sequence).
+        task_type (str / dict): The task type dict or ID.
+        output_type (str / dict): The output_type dict or ID.
+        name (str): The file name
+        representation (str): The file representation
+        file_status (str / dict): The file status
+
+    Returns:
+        list: Output files for a given asset instance, temporal entity,
+        output type, task_type, name and representation
+    """
+    asset_instance = normalize_model_parameter(asset_instance)
+    temporal_entity = normalize_model_parameter(temporal_entity)
+    task_type = normalize_model_parameter(task_type)
+    output_type = normalize_model_parameter(output_type)
+    file_status = normalize_model_parameter(file_status)
+    path = f"asset-instances/{asset_instance['id']}/output-files"
+
+    params = {}
+    if temporal_entity:
+        params["temporal_entity_id"] = temporal_entity["id"]
+    if output_type:
+        params["output_type_id"] = output_type["id"]
+    if task_type:
+        params["task_type_id"] = task_type["id"]
+    if representation:
+        params["representation"] = representation
+    if name:
+        params["name"] = name
+    if file_status:
+        params["file_status_id"] = file_status["id"]
+
+    return await aio.fetch_all(path, params, client=client)
+
+
+async def all_output_files_for_project(
+    project: str | dict,
+    output_type: str | dict | None = None,
+    task_type: str | dict | None = None,
+    name: str | None = None,
+    representation: str | None = None,
+    file_status: str | dict | None = None,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Args:
+        project (str / dict): The project dict or ID.
+        output_type (str / dict): The output type dict or ID.
+        task_type (str / dict): The task type dict or ID.
+        name (str): The file name
+        representation (str): The file representation
+        file_status (str / dict): The file status
+
+    Returns:
+        list:
+            Output files for a given project (asset or shot), output type,
+            task_type, name and representation
+    """
+    project = normalize_model_parameter(project)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    file_status = normalize_model_parameter(file_status)
+    path = f"projects/{project['id']}/output-files"
+
+    params = {}
+    if output_type:
+        params["output_type_id"] = output_type["id"]
+    if task_type:
+        params["task_type_id"] = task_type["id"]
+    if representation:
+        params["representation"] = representation
+    if name:
+        params["name"] = name
+    if file_status:
+        params["file_status_id"] = file_status["id"]
+
+    return await aio.fetch_all(path, params, client=client)
+
+
+def iter_output_files_for_project(
+    project: str | dict,
+    output_type: str | dict | None = None,
+    task_type: str | dict | None = None,
+    name: str | None = None,
+    representation: str | None = None,
+    file_status: str | dict | None = None,
+    client: KitsuClient = default,
+) -> Iterator[dict]:
+    """
+    Same as `all_output_files_for_project` but yield output files while the
+    response is decoded, without holding the whole list in memory.
+
+    Args:
+        project (str / dict): The project dict or ID.
+        output_type (str / dict): The output type dict or ID.
+        task_type (str / dict): The task type dict or ID.
+        name (str): The file name
+        representation (str): The file representation
+        file_status (str / dict): The file status
+
+    Yields:
+        dict: Output files for given project and filters.
+    """
+    project = normalize_model_parameter(project)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    file_status = normalize_model_parameter(file_status)
+    path = f"projects/{project['id']}/output-files"
+
+    params = {}
+    if output_type:
+        params["output_type_id"] = output_type["id"]
+    if task_type:
+        params["task_type_id"] = task_type["id"]
+    if representation:
+        params["representation"] = representation
+    if name:
+        params["name"] = name
+    if file_status:
+        params["file_status_id"] = file_status["id"]
+
+    return aio.iter_all(path, params, client=client)
+
+
+async def all_softwares(client: KitsuClient = default) -> list[dict]:
+    """
+    Returns:
+        list[dict]: Software versions listed in database.
+    """
+    return await aio.fetch_all("softwares", client=client)
+
+
+async def get_software(software_id: str, client: KitsuClient = default) -> dict:
+    """
+    Args:
+        software_id (str): ID of claimed output type.
+
+    Returns:
+        dict: Software object corresponding to given ID.
+    """
+    return await aio.fetch_one("softwares", software_id, client=client)
+
+
+async def get_software_by_name(
+    software_name: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Args:
+        software_name (str): Name of claimed output type.
+
+    Returns:
+        dict: Software object corresponding to given name.
+    """
+    return await aio.fetch_first("softwares", {"name": software_name}, client=client)
+
+
+async def new_software(
+    name: str,
+    short_name: str,
+    file_extension: str,
+    secondary_extensions: list[str] | None = None,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create a new software in datatabase.
+
+    Args:
+        name (str): Name of created software.
+        short_name (str): Short representation of software name (for UIs).
+        file_extension (str): Main file extension generated by given software.
+        secondary_extensions (list[str] | None): Optional list of secondary
+            file extensions (e.g. ["ma", "mb"] for Maya).
+
+    Returns:
+        dict: Created software.
+    """
+    data = {
+        "name": name,
+        "short_name": short_name,
+        "file_extension": file_extension,
+    }
+    if secondary_extensions is not None:
+        data["secondary_extensions"] = secondary_extensions
+    software = await get_software_by_name(name, client=client)
+    if software is None:
+        return await aio.create("softwares", data, client=client)
+    else:
+        return software
+
+
+async def update_software(software: dict, client: KitsuClient = default) -> dict:
+    """
+    Save given software data into the API. Use this to set or change
+    secondary_extensions and other fields.
+
+    Args:
+        software (dict): The software dict to update (must include "id").
+
+    Returns:
+        dict: Updated software.
+    """
+    return await aio.put(f"data/softwares/{software['id']}", software, client=client)
+
+
+async def build_working_file_path(
+    task: str | dict,
+    name: str = "main",
+    mode: str = "working",
+    software: str | dict | None = None,
+    revision: int = 1,
+    sep: str = "/",
+    client: KitsuClient = default,
+) -> str:
+    """
+    From the file path template configured at the project level and arguments,
+    it builds a file path location where to store related DCC file.
+
+    Args:
+        task (str / dict): Task related to working file.
+        name (str): Additional suffix for the working file name.
+        mode (str): Allow to select a template inside the template.
+        software (str / dict): Software at the origin of the file.
+        revision (int): File revision.
+        sep (str): OS separator.
+
+    Returns:
+        Generated working file path for given task (without extension).
+    """
+    data = {"mode": mode, "name": name, "revision": revision}
+    task = normalize_model_parameter(task)
+    software = normalize_model_parameter(software)
+    if software is not None:
+        data["software_id"] = software["id"]
+    result = await aio.post(
+        f"data/tasks/{task['id']}/working-file-path", data, client=client
+    )
+    return f"{result['path'].replace(' ', '_')}{sep}{result['name'].replace(' ', '_')}"
+
+
+async def build_entity_output_file_path(
+    entity: str | dict,
+    output_type: str | dict,
+    task_type: str | dict,
+    name: str = "main",
+    mode: str = "output",
+    representation: str = "",
+    revision: int = 0,
+    nb_elements: int = 1,
+    sep: str = "/",
+    client: KitsuClient = default,
+) -> str:
+    """
+    From the file path template configured at the project level and arguments,
+    it builds a file path location where to store related DCC output file.
+
+    Args:
+        entity (str / dict): Entity for which an output file is needed.
+        output_type (str / dict): Output type of the generated file.
+        task_type (str / dict): Task type related to output file.
+        name (str): Additional suffix for the working file name.
+        mode (str): Allow to select a template inside the template.
+        representation (str): Allow to select a template inside the template.
+        revision (int): File revision.
+        nb_elements (int): To represent an image sequence, the amount of file is
+                           needed.
+        sep (str): OS separator.
+
+    Returns:
+        Generated output file path for given entity, task type and output type
+        (without extension).
+    """
+    entity = normalize_model_parameter(entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+
+    data = {
+        "task_type_id": task_type["id"],
+        "output_type_id": output_type["id"],
+        "mode": mode,
+        "name": name,
+        "representation": representation,
+        "revision": revision,
+        "nb_elements": nb_elements,
+        "separator": sep,
+    }
+    path = f"data/entities/{entity['id']}/output-file-path"
+    result = await aio.post(path, data, client=client)
+    return f"{result['folder_path'].replace(' ', '_')}{sep}{result['file_name'].replace(' ', '_')}"
+
+
+async def build_asset_instance_output_file_path(
+    asset_instance: str | dict,
+    temporal_entity: str | dict,
+    output_type: str | dict,
+    task_type: str | dict,
+    name: str = "main",
+    representation: str = "",
+    mode: str = "output",
+    revision: int = 0,
+    nb_elements: int = 1,
+    sep: str = "/",
+    client: KitsuClient = default,
+) -> str:
+    """
+    From the file path template configured at the project level and arguments,
+    it builds a file path location where to store related DCC output file.
+
+    Args:
+        asset_instance_id entity (str / dict): Asset instance for which a file
+        is required.
+        temporal entity (str / dict): Temporal entity scene or shot in which
+        the asset instance appeared.
+        output_type (str / dict): Output type of the generated file.
+        task_type (str / dict): Task type related to output file.
+        name (str): Additional suffix for the working file name.
+        representation (str): Allow to select a template inside the template.
+        mode (str): Allow to select a template inside the template.
+        revision (int): File revision.
+        nb_elements (str): To represent an image sequence, the amount of file is
+                           needed.
+        sep (str): OS separator.
+
+    Returns:
+        Generated output file path for given asset instance, task type and
+        output type (without extension).
+    """
+    asset_instance = normalize_model_parameter(asset_instance)
+    temporal_entity = normalize_model_parameter(temporal_entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    data = {
+        "task_type_id": task_type["id"],
+        "output_type_id": output_type["id"],
+        "mode": mode,
+        "name": name,
+        "representation": representation,
+        "revision": revision,
+        "nb_elements": nb_elements,
+        "separator": sep,
+    }
+    path = f"data/asset-instances/{asset_instance['id']}/entities/{temporal_entity['id']}/output-file-path"
+    result = await aio.post(path, data, client=client)
+    return f"{result['folder_path'].replace(' ', '_')}{sep}{result['file_name'].replace(' ', '_')}"
+
+
+async def new_working_file(
+    task: str | dict,
+    name: str = "main",
+    mode: str = "working",
+    software: str | dict | None = None,
+    comment: str = "",
+    person: str | dict | None = None,
+    revision: int = 0,
+    sep: str = "/",
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create a new working_file for given task. It generates and store the
+    expected path for given task and options. It sets a revision number
+    (last revision + 1).
+
+    Args:
+        task (str / dict): Task related to working file.
+        name (str): Additional suffix for the working file name.
+        mode (str): Allow to select a template inside the template.
+        software (str / dict): Software at the origin of the file.
+        comment (str): Comment related to created revision.
+        person (str / dict): Author of the file.
+        revision (int): File revision.
+        sep (str): OS separator.
+
+    Returns:
+        Created working file.
+    """
+    task = normalize_model_parameter(task)
+    software = normalize_model_parameter(software)
+    person = normalize_model_parameter(person)
+    data = {
+        "name": name,
+        "comment": comment,
+        "task_id": task["id"],
+        "revision": revision,
+        "mode": mode,
+    }
+    if person is not None:
+        data["person_id"] = person["id"]
+    if software is not None:
+        data["software_id"] = software["id"]
+
+    return await aio.post(
+        f"data/tasks/{task['id']}/working-files/new", data, client=client
+    )
+
+
+async def new_entity_output_file(
+    entity: str | dict,
+    output_type: str | dict,
+    task_type: str | dict,
+    comment: str,
+    working_file: str | dict | None = None,
+    person: str | dict | None = None,
+    name: str = "main",
+    mode: str = "output",
+    revision: int = 0,
+    nb_elements: int = 1,
+    representation: str = "",
+    sep: str = "/",
+    file_status_id: str | None = None,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create a new output file for given entity, task type and output type.
+    It generates and store the expected path and sets a revision number
+    (last revision + 1).
+
+    Args:
+        entity (str / dict): Entity for which an output file is needed.
+        output_type (str / dict): Output type of the generated file.
+        task_type (str / dict): Task type related to output file.
+        comment (str): Comment related to created revision.
+        working_file (str / dict): Working file which is the source of the
+        generated file.
+        person (str / dict): Author of the file.
+        name (str): Additional suffix for the working file name.
+        mode (str): Allow to select a template inside the template.
+        revision (int): File revision.
+        nb_elements (int): To represent an image sequence, the amount of file is
+                           needed.
+        representation (str): Differientate file extensions. It can be useful
+        to build folders based on extensions like abc, jpg, etc.
+        sep (str): OS separator.
+        file_status_id (id): The id of the file status to set at creation
+
+    Returns:
+        dict: Created output file.
+    """
+    entity = normalize_model_parameter(entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    working_file = normalize_model_parameter(working_file)
+    person = normalize_model_parameter(person)
+    path = f"data/entities/{entity['id']}/output-files/new"
+    data = {
+        "output_type_id": output_type["id"],
+        "task_type_id": task_type["id"],
+        "comment": comment,
+        "revision": revision,
+        "representation": representation,
+        "name": name,
+        "nb_elements": nb_elements,
+        "sep": sep,
+    }
+
+    if working_file is not None:
+        data["working_file_id"] = working_file["id"]
+
+    if person is not None:
+        data["person_id"] = person["id"]
+
+    if file_status_id is not None:
+        data["file_status_id"] = file_status_id
+
+    return await aio.post(path, data, client=client)
+
+
+async def new_asset_instance_output_file(
+    asset_instance: str | dict,
+    temporal_entity: str | dict,
+    output_type: str | dict,
+    task_type: str | dict,
+    comment: str,
+    name: str = "master",
+    mode: str = "output",
+    working_file: str | dict | None = None,
+    person: str | dict | None = None,
+    revision: int = 0,
+    nb_elements: int = 1,
+    representation: str = "",
+    sep: str = "/",
+    file_status_id: str | dict | None = None,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create a new output file for given asset instance, temporal entity, task
+    type and output type.  It generates and store the expected path and sets a
+    revision number (last revision + 1).
+
+    Args:
+        asset_instance (str / dict): Asset instance for which an output file
+            is needed.
+        temporal_entity (str / dict): Temporal entity for which an output file
+            is needed.
+        output_type (str / dict): Output type of the generated file.
+        task_type (str / dict): Task type related to output file.
+        comment (str): Comment related to created revision.
+        working_file (str / dict): Working file which is the source of the
+            generated file.
+        person (str / dict): Author of the file.
+        name (str): Additional suffix for the working file name.
+        mode (str): Allow to select a template inside the template.
+        revision (int): File revision.
+        nb_elements (int): To represent an image sequence, the amount of file
+            needed.
+        representation (str): Differentiate file extensions. It can be useful
+            to build folders based on extensions like abc, jpg, cetc.
+        sep (str): OS separator.
+        file_status_id (id): The id of the file status to set at creation
+
+    Returns:
+        Created output file.
+    """
+    asset_instance = normalize_model_parameter(asset_instance)
+    temporal_entity = normalize_model_parameter(temporal_entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    working_file = normalize_model_parameter(working_file)
+    person = normalize_model_parameter(person)
+    path = f"data/asset-instances/{asset_instance['id']}/entities/{temporal_entity['id']}/output-files/new"
+    data = {
+        "output_type_id": output_type["id"],
+        "task_type_id": task_type["id"],
+        "comment": comment,
+        "name": name,
+        "revision": revision,
+        "representation": representation,
+        "nb_elements": nb_elements,
+        "sep": sep,
+    }
+
+    if working_file is not None:
+        data["working_file_id"] = working_file["id"]
+
+    if person is not None:
+        data["person_id"] = person["id"]
+
+    if file_status_id is not None:
+        data["file_status_id"] = file_status_id
+
+    return await aio.post(path, data, client=client)
+
+
+async def get_next_entity_output_revision(
+    entity: str | dict,
+    output_type: str | dict,
+    task_type: str | dict,
+    name: str = "main",
+    client: KitsuClient = default,
+) -> int:
+    """
+    Args:
+        entity (str / dict): The entity dict or ID.
+        output_type (str / dict): The entity dict or ID.
+        task_type (str / dict): The entity dict or ID.
+        name (str): Get version for output file with the given name.
+
+    Returns:
+        int: Next revision of output files available for given entity, output
+        type and task type.
+    """
+    entity = normalize_model_parameter(entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    path = f"data/entities/{entity['id']}/output-files/next-revision"
+    data = {
+        "name": name,
+        "output_type_id": output_type["id"],
+        "task_type_id": task_type["id"],
+    }
+    return (await aio.post(path, data, client=client))["next_revision"]
+
+
+async def get_next_asset_instance_output_revision(
+    asset_instance: str | dict,
+    temporal_entity: str | dict,
+    output_type: str | dict,
+    task_type: str | dict,
+    name: str = "master",
+    client: KitsuClient = default,
+) -> int:
+    """
+    Args:
+        asset_instance (str / dict): The asset instance dict or ID.
+        temporal_entity (str / dict): The temporal entity dict or ID.
+        output_type (str / dict): The entity dict or ID.
+        task_type (str / dict): The entity dict or ID.
+
+    Returns:
+        int: Next revision of ouput files available for given asset insance
+        temporal entity, output type and task type.
+    """
+    asset_instance = normalize_model_parameter(asset_instance)
+    temporal_entity = normalize_model_parameter(temporal_entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    path = f"data/asset-instances/{asset_instance['id']}/entities/{temporal_entity['id']}/output-files/next-revision"
+    data = {
+        "name": name,
+        "output_type_id": output_type["id"],
+        "task_type_id": task_type["id"],
+    }
+    return (await aio.post(path, data, client=client))["next_revision"]
+
+
+async def get_last_entity_output_revision(
+    entity: str | dict,
+    output_type: str | dict,
+    task_type: str | dict,
+    name: str = "master",
+    client: KitsuClient = default,
+) -> int:
+    """
+    Args:
+        entity (str / dict): The entity dict or ID.
+        output_type (str / dict): The entity dict or ID.
+        task_type (str / dict): The entity dict or ID.
+        name (str): The output name
+
+    Returns:
+        int: Last revision of ouput files for given entity, output type and task
+        type.
+    """
+    entity = normalize_model_parameter(entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    revision = await get_next_entity_output_revision(
+        entity, output_type, task_type, name, client=client
+    )
+    if revision != 1:
+        revision -= 1
+    return revision
+
+
+async def get_last_asset_instance_output_revision(
+    asset_instance: str | dict,
+    temporal_entity: str | dict,
+    output_type: str | dict,
+    task_type: str | dict,
+    name: str = "master",
+    client: KitsuClient = default,
+) -> int:
+    """
+    Generate last output revision for given asset instance.
+    """
+    asset_instance = normalize_model_parameter(asset_instance)
+    temporal_entity = normalize_model_parameter(temporal_entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    revision = await get_next_asset_instance_output_revision(
+        asset_instance,
+        temporal_entity,
+        output_type,
+        task_type,
+        name=name,
+        client=client,
+    )
+    if revision != 1:
+        revision -= 1
+    return revision
+
+
+async def get_last_output_files_for_entity(
+    entity: str | dict,
+    output_type: str | dict | None = None,
+    task_type: str | dict | None = None,
+    name: str | None = None,
+    representation: str | None = None,
+    file_status: str | dict | None = None,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Args:
+        entity (str / dict): The entity dict or ID.
+        output_type (str / dict): The output type dict or ID.
+        task_type (str / dict): The task type dict or ID.
+        name (str): The file name
+        representation (str): The file representation
+        file_status (str / dict): The file status
+
+    Returns:
+        list:
+            Last output files for a given entity (asset or shot), output type,
+            task_type, name and representation
+    """
+    entity = normalize_model_parameter(entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    file_status = normalize_model_parameter(file_status)
+    path = f"entities/{entity['id']}/output-files/last-revisions"
+
+    params = {}
+    if output_type:
+        params["output_type_id"] = output_type["id"]
+    if task_type:
+        params["task_type_id"] = task_type["id"]
+    if representation:
+        params["representation"] = representation
+    if name:
+        params["name"] = name
+    if file_status:
+        params["file_status_id"] = file_status["id"]
+
+    return await aio.fetch_all(path, params, client=client)
+
+
+async def get_last_output_files_for_asset_instance(
+    asset_instance: str | dict,
+    temporal_entity: str | dict,
+    task_type: str | dict | None = None,
+    output_type: str | dict | None = None,
+    name: str | None = None,
+    representation: str | None = None,
+    file_status: str | dict | None = None,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Args:
+        asset_instance (str / dict): The asset instance dict or ID.
+        temporal_entity (str / dict): The temporal entity dict or ID.
+        output_type (str / dict): The output type dict or ID.
+        task_type (str / dict): The task type dict or ID.
+        name (str): The file name
+        representation (str): The file representation
+        file_status (str / dict): The file status
+
+    Returns:
+        list: last output files for given asset instance and
+        temporal entity where it appears.
+    """
+    asset_instance = normalize_model_parameter(asset_instance)
+    temporal_entity = normalize_model_parameter(temporal_entity)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    file_status = normalize_model_parameter(file_status)
+    path = f"asset-instances/{asset_instance['id']}/entities/{temporal_entity['id']}/output-files/last-revisions"
+
+    params = {}
+    if output_type:
+        params["output_type_id"] = output_type["id"]
+    if task_type:
+        params["task_type_id"] = task_type["id"]
+    if representation:
+        params["representation"] = representation
+    if name:
+        params["name"] = name
+    if file_status:
+        params["file_status_id"] = file_status["id"]
+
+    return await aio.fetch_all(path, params, client=client)
+
+
+async def get_working_files_for_task(
+    task: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Args:
+        task (str / dict): The task dict or the task ID.
+
+    Returns:
+        list: Working files related to given task.
+    """
+    task = normalize_model_parameter(task)
+    path = f"data/tasks/{task['id']}/working-files"
+    return await aio.get(path, client=client)
+
+
+async def get_last_working_files(
+    task: str | dict, client: KitsuClient = default
+) -> dict:
+    """
+    Args:
+        task (str / dict): The task dict or the task ID.
+
+    Returns:
+        dict: Keys are working file names and values are last working file
+        availbable for given name.
+    """
+    task = normalize_model_parameter(task)
+    path = f"data/tasks/{task['id']}/working-files/last-revisions"
+    return await aio.get(path, client=client)
+
+
+async def get_last_working_file_revision(
+    task: str | dict, name: str = "main", client: KitsuClient = default
+) -> dict:
+    """
+    Args:
+        task (str / dict): The task dict or the task ID.
+        name (str): File name suffix (optional)
+
+    Returns:
+        dict: Last revisions stored in the API for given task and given file
+        name suffix.
+    """
+    task = normalize_model_parameter(task)
+    path = f"data/tasks/{task['id']}/working-files/last-revisions"
+    working_files_dict = await aio.get(path, client=client)
+    return working_files_dict.get(name)
+
+
+async def get_working_file(
+    working_file_id: str, client: KitsuClient = default
+) -> dict:
+    """
+    Args:
+        working_file_id (str): ID of claimed working file.
+
+    Returns:
+        dict: Working file corresponding to given ID.
+    """
+    return await aio.fetch_one("working-files", working_file_id, client=client)
+
+
+async def update_comment(
+    working_file: str | dict, comment: str, client: KitsuClient = default
+) -> dict:
+    """
+    Update the file comment in database for given working file.
+
+    Args:
+        working_file (str / dict): The working file dict or ID.
+
+    Returns:
+        dict: Modified working file
+    """
+    working_file = normalize_model_parameter(working_file)
+    return await aio.put(
+        f"/actions/working-files/{working_file['id']}/comment",
+        {"comment": comment},
+        client=client,
+    )
+
+
+async def update_modification_date(
+    working_file: str | dict, client: KitsuClient = default
+) -> dict:
+    """
+    Update modification date of given working file with current time (now).
+
+    Args:
+        working_file (str / dict): The working file dict or ID.
+
+    Returns:
+        dict: Modified working file
+    """
+    working_file = normalize_model_parameter(working_file)
+    return await aio.put(
+        f"/actions/working-files/{working_file['id']}/modified",
+        {},
+        client=client,
+    )
+
+
+async def update_output_file(
+    output_file: str | dict, data: dict, client: KitsuClient = default
+) -> dict:
+    """
+    Update the data of given output file.
+
+    Args:
+        output_file (str / dict): The output file dict or ID.
+        data (dict): Data to update on the output file.
+
+    Returns:
+        dict: Modified output file
+    """
+    output_file = normalize_model_parameter(output_file)
+    path = f"/data/output-files/{output_file['id']}"
+    return await aio.put(path, data, client=client)
+
+
+async def set_project_file_tree(
+    project: str | dict, file_tree_name: str, client: KitsuClient = default
+) -> dict:
+    """
+    (Deprecated) Set given file tree template on given project. This template
+    will be used to generate file paths. The template is selected from sources.
+    It is found by using given name.
+
+    Args:
+        project (str / dict): The project file dict or ID.
+
+    Returns:
+        dict: Modified project.
+
+    """
+    project = normalize_model_parameter(project)
+    data = {"tree_name": file_tree_name}
+    path = f"actions/projects/{project['id']}/set-file-tree"
+    return await aio.post(path, data, client=client)
+
+
+async def update_project_file_tree(
+    project: str | dict, file_tree: dict, client: KitsuClient = default
+) -> dict:
+    """
+    Set given dict as file tree template on given project. This template
+    will be used to generate file paths.
+
+    Args:
+        project (str / dict): The project dict or ID.
+        file_tree (dict): The file tree template to set on project.
+
+    Returns:
+        dict: Modified project.
+    """
+    project = normalize_model_parameter(project)
+    data = {"file_tree": file_tree}
+    path = f"data/projects/{project['id']}"
+    return await aio.put(path, data, client=client)
+
+
+async def upload_working_file(
+    working_file: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> dict:
+    """
+    Save given file in working file storage.
+
+    Args:
+        working_file (str / dict): The working file dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+
+    Returns:
+        (dict): the working file model dictionary.
+    """
+    working_file = normalize_model_parameter(working_file)
+    url_path = f"/data/working-files/{working_file['id']}/file"
+    return await aio.upload(
+        url_path, file_path, client=client, progress_callback=progress_callback
+    )
+
+
+async def download_working_file(
+    working_file: str | dict,
+    file_path: str | None = None,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download given working file and save it at given location.
+
+    Args:
+        working_file (str / dict): The working file dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+    """
+    working_file = normalize_model_parameter(working_file)
+    if file_path is None:
+        working_file = await aio.fetch_one(
+            "working-files", working_file["id"], client=client
+        )
+        file_path = working_file["path"]
+    return await aio.download(
+        f"data/working-files/{working_file['id']}/file",
+        file_path,
+        client=client,
+        progress_callback=progress_callback,
+    )
+
+
+async def download_preview_file(
+    preview_file: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download given preview file and save it at given location.
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+    """
+    return await aio.download(
+        await get_preview_file_url(preview_file, client=client),
+        file_path,
+        client=client,
+        progress_callback=progress_callback,
+    )
+
+
+async def get_preview_file_url(
+    preview_file: str | dict, client: KitsuClient = default
+) -> str:
+    """
+    Return given preview file URL
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    preview_file = await aio.fetch_one(
+        "preview-files", preview_file["id"], client=client
+    )
+    file_type = "movies" if preview_file["extension"] == "mp4" else "pictures"
+    return f"{file_type}/originals/preview-files/{preview_file['id']}.{preview_file['extension']}"
+
+
+async def get_attachment_file(
+    attachment_file_id: str, client: KitsuClient = default
+) -> dict:
+    """
+    Return attachment file object corresponding to given ID.
+
+    Args:
+        attachment_file_id (str): The attachment file ID.
+    """
+    return await aio.fetch_one("attachment-files", attachment_file_id, client=client)
+
+
+async def download_attachment_file(
+    attachment_file: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download given attachment file and save it at given location.
+
+    Args:
+        attachment_file (str / dict): The attachment file dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+    """
+    attachment_file = normalize_model_parameter(attachment_file)
+    attachment_file = await get_attachment_file(attachment_file["id"], client=client)
+    return await aio.download(
+        f"data/attachment-files/{attachment_file['id']}/file/{attachment_file['name']}",
+        file_path,
+        client=client,
+        progress_callback=progress_callback,
+    )
+
+
+async def download_preview_file_thumbnail(
+    preview_file: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download given preview file thumbnail and save it at given location.
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    return await aio.download(
+        f"pictures/thumbnails/preview-files/{preview_file['id']}.png",
+        file_path,
+        client=client,
+        progress_callback=progress_callback,
+    )
+
+
+async def download_preview_file_cover(
+    preview_file: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download given preview file cover and save it at given location.
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    return await aio.download(
+        f"pictures/originals/preview-files/{preview_file['id']}.png",
+        file_path,
+        client=client,
+        progress_callback=progress_callback,
+    )
+
+
+async def download_person_avatar(
+    person: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download given person's avatar and save it at given location.
+
+    Args:
+        person (str / dict): The person dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.download(
+        f"pictures/thumbnails/persons/{person['id']}.png",
+        file_path,
+        client=client,
+        progress_callback=progress_callback,
+    )
+
+
+async def upload_person_avatar(
+    person: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> dict[Literal["thumbnail_path"], str]:
+    """
+    Upload given file as person avatar.
+
+    Args:
+        person (str / dict): The person dict or the person ID.
+        file_path (str): Path of the file to upload as avatar.
+
+    Returns:
+        dict: Dictionary with a key of 'thumbnail_path' and a value of the
+            path to the static image file, relative to the host url.
+    """
+    path = f"/pictures/thumbnails/persons/{normalize_model_parameter(person)['id']}"
+    return await aio.upload(
+        path, file_path, client=client, progress_callback=progress_callback
+    )
+
+
+async def download_project_avatar(
+    project: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download given project's avatar and save it at given location.
+
+    Args:
+        project (str / dict): The project dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+    """
+    project = normalize_model_parameter(project)
+    return await aio.download(
+        f"pictures/thumbnails/projects/{project['id']}.png",
+        file_path,
+        client=client,
+        progress_callback=progress_callback,
+    )
+
+
+async def upload_project_avatar(
+    project: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> dict[Literal["thumbnail_path"], str]:
+    """
+    Upload given file as project avatar.
+
+    Args:
+        project (str / dict): The project dict or ID.
+        file_path (str): Path of the file to upload as avatar.
+
+    Returns:
+        dict: Dictionary with a key of 'thumbnail_path' and a value of the
+            path to the static image file, relative to the host url.
+    """
+    path = f"/pictures/thumbnails/projects/{normalize_model_parameter(project)['id']}"
+    return await aio.upload(
+        path, file_path, client=client, progress_callback=progress_callback
+    )
+
+
+async def download_organisation_avatar(
+    organisation: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download given organisation's avatar and save it at given location.
+
+    Args:
+        organisation (str / dict): The organisation dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+    """
+    organisation = normalize_model_parameter(organisation)
+    return await aio.download(
+        f"pictures/thumbnails/organisations/{organisation['id']}.png",
+        file_path,
+        client=client,
+        progress_callback=progress_callback,
+    )
+
+
+async def upload_organisation_avatar(
+    organisation: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> dict[Literal["thumbnail_path"], str]:
+    """
+    Upload given file as organisation avatar.
+
+    Args:
+        organisation (str / dict): The organisation dict or ID.
+        file_path (str): Path of the file to upload as avatar.
+
+    Returns:
+        dict: Dictionary with a key of 'thumbnail_path' and a value of the
+            path to the static image file, relative to the host url.
+    """
+    path = f"/pictures/thumbnails/organisations/{normalize_model_parameter(organisation)['id']}"
+    return await aio.upload(
+        path, file_path, client=client, progress_callback=progress_callback
+    )
+
+
+async def update_preview(
+    preview_file: str | dict, data: dict, client: KitsuClient = default
+) -> dict:
+    """
+    Update the data of given preview file.
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        data (dict): Data to update on the prevew file.
+
+    Returns:
+        dict: Modified preview file
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    path = f"/data/preview-files/{preview_file['id']}"
+    return await aio.put(path, data, client=client)
+
+
+async def get_running_preview_files(client: KitsuClient = default) -> list[dict]:
+    """
+    Get all preview files currently being processed.
+
+    Returns:
+        list: Preview files that are currently running/processing.
+    """
+    return await aio.fetch_all("preview-files/running", client=client)
+
+
+async def get_preview_movie_url(
+    preview_file: str | dict,
+    lowdef: bool = False,
+    client: KitsuClient = default,
+) -> str:
+    """
+    Get the URL for the preview movie file.
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        lowdef (bool): If True, returns the low-definition version URL.
+                       If False, returns the original/high-definition version URL.
+
+    Returns:
+        str: URL to the preview movie file.
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    preview_file = await aio.fetch_one(
+        "preview-files", preview_file["id"], client=client
+    )
+    if lowdef:
+        path_prefix = "movies/lowdef"
+    else:
+        path_prefix = "movies/originals"
+    return f"{path_prefix}/preview-files/{preview_file['id']}.{preview_file['extension']}"
+
+
+async def download_preview_movie(
+    preview_file: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download the preview movie file.
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+
+    Returns:
+        requests.Response: Response object from the download request.
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    url = await get_preview_movie_url(preview_file, lowdef=False, client=client)
+    return await aio.download(
+        url, file_path, client=client, progress_callback=progress_callback
+    )
+
+
+async def get_preview_lowdef_movie_url(
+    preview_file: str | dict, client: KitsuClient = default
+) -> str:
+    """
+    Get the URL for the low-definition preview movie file.
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+
+    Returns:
+        str: URL to the low-definition preview movie file.
+    """
+    return await get_preview_movie_url(preview_file, lowdef=True, client=client)
+
+
+async def download_preview_lowdef_movie(
+    preview_file: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download the low-definition preview movie file.
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+
+    Returns:
+        requests.Response: Response object from the download request.
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    url = await get_preview_movie_url(preview_file, lowdef=True, client=client)
+    return await aio.download(
+        url, file_path, client=client, progress_callback=progress_callback
+    )
+
+
+async def download_attachment_thumbnail(
+    attachment_file: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Download the attachment file thumbnail.
+
+    Args:
+        attachment_file (str / dict): The attachment file dict or ID.
+        file_path (str): Location on hard drive where to save the file.
+
+    Returns:
+        requests.Response: Response object from the download request.
+    """
+    attachment_file = normalize_model_parameter(attachment_file)
+    url = get_attachment_thumbnail_url(attachment_file, client=client)
+    return await aio.download(
+        url, file_path, client=client, progress_callback=progress_callback
+    )
+
+
+async def extract_frame_from_preview(
+    preview_file: str | dict,
+    frame_number: int,
+    file_path: str | None = None,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Extract a specific frame from a preview file.
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        frame_number (int): The frame number to extract.
+        file_path (str): Optional location on hard drive where to save the frame.
+                        If not provided, returns the response without saving.
+
+    Returns:
+        requests.Response: Response object containing the extracted frame.
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    url = f"pictures/preview-files/{preview_file['id']}/extract-frame/{frame_number}"
+    return await aio.download(
+        url, file_path, client=client, progress_callback=progress_callback
+    )
+
+
+async def update_preview_position(
+    preview_file: str | dict,
+    position: float,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Update the position of a preview file (the displayed order for a single
+    revision).
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        position (float): The new position value.
+
+    Returns:
+        dict: Updated preview file.
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    path = f"data/preview-files/{preview_file['id']}/position"
+    return await aio.put(path, {"position": position}, client=client)
+
+
+async def update_preview_annotations(
+    preview_file: str | dict,
+    additions: list[dict] | None = None,
+    updates: list[dict] | None = None,
+    deletions: list[str] | None = None,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Update annotations on a preview file.
+
+    Allow to modify the annotations stored at the preview level. Modifications
+    are applied via three fields: additions to give all the annotations that
+    need to be added, updates that list annotations that need to be modified,
+    and deletions to list the IDs of annotations that need to be removed.
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        additions (list[dict]): Annotations to add. Each annotation should be
+            a dict with properties like 'x', 'y', 'type', etc.
+            Example: [{"x": 100, "y": 200, "type": "drawing"}]
+        updates (list[dict]): Annotations to update. Each annotation should
+            include an 'id' field along with the fields to update.
+            Example: [{"id": "uuid", "x": 150, "y": 250}]
+        deletions (list[str]): Annotation IDs to remove.
+            Example: ["a24a6ea4-ce75-4665-a070-57453082c25"]
+
+    Returns:
+        dict: Updated preview file with the updated annotations array.
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    path = f"actions/preview-files/{preview_file['id']}/update-annotations"
+    data = {}
+    if additions is not None:
+        data["additions"] = additions
+    if updates is not None:
+        data["updates"] = updates
+    if deletions is not None:
+        data["deletions"] = deletions
+    return await aio.put(path, data, client=client)
+
+
+async def extract_tile_from_preview(
+    preview_file: str | dict,
+    file_path: str | None = None,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> requests.Response:
+    """
+    Extract a tile from a preview file.
+
+    Args:
+        preview_file (str / dict): The preview file dict or ID.
+        file_path (str): Optional location on hard drive where to save the tile.
+                        If not provided, returns the response without saving.
+
+    Returns:
+        requests.Response: Response object containing the extracted tile.
+    """
+    preview_file = normalize_model_parameter(preview_file)
+    url = f"pictures/preview-files/{preview_file['id']}/extract-tile"
+    return await aio.download(
+        url, file_path, client=client, progress_callback=progress_callback
+    )
+
+
+async def new_file_status(
+    name: str, color: str, client: KitsuClient = default
+) -> dict:
+    """
+    Create a new file status if not existing yet.
+
+    If the file status already exists, the existing record will be returned.
+
+    Args:
+        name (str): the name of the status to create.
+        color (str): The color for the status as a Hex string, e.g "#00FF00".
+    """
+    data = {"name": name, "color": color}
+    status = await get_file_status_by_name(name, client=client)
+    if status is None:
+        return await aio.create("file-status", data, client=client)
+    else:
+        return status
+
+
+async def get_file_status(status_id: str, client: KitsuClient = default) -> dict:
+    """
+    Return file status object corresponding to given ID.
+
+    Args:
+        status_id (str): The files status ID.
+    """
+    return await aio.fetch_one("file-status", status_id, client=client)
+
+
+async def get_file_status_by_name(
+    name: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Return file status object corresponding to given name
+
+    Args:
+        name (str): The files status name.
+    """
+    return await aio.fetch_first("file-status", {"name": name}, client=client)
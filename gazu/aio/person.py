@@ -0,0 +1,861 @@
+# Generated from gazu/person.py by `python -m gazu.aio.transform`,
+# do not edit.
+"""
+Async version of `gazu.person`.
+"""
+
+from __future__ import annotations
+
+import datetime
+
+from .. import aio
+from .. import client as raw
+from ..person import (
+    KitsuClient,
+    Literal,
+    get_person_url,
+    normalize_list_of_models_for_links,
+    normalize_model_parameter,
+    sort_by_name,
+)
+
+
+default = None
+
+
+__all__ = [
+    "add_person_to_department",
+    "all_departments",
+    "all_organisations",
+    "all_persons",
+    "change_password_for_person",
+    "clear_person_avatar",
+    "disable_two_factor_authentication",
+    "get_all_month_time_spents",
+    "get_day_off",
+    "get_day_offs",
+    "get_department",
+    "get_department_by_name",
+    "get_month_day_offs",
+    "get_organisation",
+    "get_person",
+    "get_person_by_desktop_login",
+    "get_person_by_email",
+    "get_person_by_full_name",
+    "get_person_url",
+    "get_presence_log",
+    "get_time_spents_by_date",
+    "get_time_spents_range",
+    "get_week_day_offs",
+    "get_week_time_spents",
+    "get_year_day_offs",
+    "get_year_time_spents",
+    "invite_person",
+    "new_bot",
+    "new_day_off",
+    "new_department",
+    "new_person",
+    "remove_bot",
+    "remove_day_off",
+    "remove_department",
+    "remove_person",
+    "remove_person_from_department",
+    "set_avatar",
+    "update_bot",
+    "update_day_off",
+    "update_department",
+    "update_person",
+]
+
+
+async def all_organisations(client: KitsuClient = default) -> list[dict]:
+    """
+    Returns:
+        list: Organisations listed in database.
+    """
+    return sort_by_name(await aio.fetch_all("organisations", client=client))
+
+
+async def all_departments(client: KitsuClient = default) -> list[dict]:
+    """
+    Returns:
+        list: Departments listed in database.
+    """
+    return sort_by_name(await aio.fetch_all("departments", client=client))
+
+
+async def all_persons(client: KitsuClient = default) -> list[dict]:
+    """
+    Returns:
+        list: Persons listed in database.
+    """
+    return sort_by_name(await aio.fetch_all("persons", client=client))
+
+
+async def get_time_spents_range(
+    person_id: str,
+    start_date: str,
+    end_date: str,
+    client: KitsuClient = default,
+) -> list:
+    """
+    Gets the time spents of the current user for the given date range.
+
+    Args:
+        person_id (str): An uuid identifying a person.
+        start_date (str): The first day of the date range as a date string with
+                          the following format: YYYY-MM-DD
+        end_date (str): The last day of the date range as a date string with
+                        the following format: YYYY-MM-DD
+
+    Returns:
+        list: All of the person's time spents
+    """
+    date_range = {
+        "start_date": start_date,
+        "end_date": end_date,
+    }
+    return await aio.get(
+        f"/data/persons/{person_id}/time-spents",
+        params=date_range,
+        client=client,
+    )
+
+
+async def get_all_month_time_spents(
+    id: str, date: datetime.date, client: KitsuClient = default
+) -> list:
+    """
+    Args:
+        id (str): An uuid identifying a person.
+        date (datetime.date): The date of the month to query.
+
+    Returns:
+        list: All of the person's time spents for the given month.
+    """
+    date = date.strftime("%Y/%m")
+    return await aio.get(
+        f"data/persons/{id}/time-spents/month/all/{date}",
+        client=client,
+    )
+
+
+async def get_department_by_name(
+    name: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Args:
+        name (str): Department name.
+
+    Returns:
+        dict: Department corresponding to given name.
+    """
+    return await aio.fetch_first(
+        "departments",
+        {"name": name},
+        client=client,
+    )
+
+
+async def get_department(department_id: str, client: KitsuClient = default) -> dict:
+    """
+    Args:
+        department_id (str): An uuid identifying a department.
+
+    Returns:
+        dict: Department corresponding to given department_id.
+    """
+    return await aio.fetch_one("departments", department_id, client=client)
+
+
+async def get_person(
+    id: str, relations: bool = False, client: KitsuClient = default
+) -> dict | None:
+    """
+    Args:
+        id (str): An uuid identifying a person.
+        relations (bool): Whether to get the relations for the given person.
+
+    Returns:
+        dict: Person corresponding to given id, or None if no Person exists
+            with that ID.
+    """
+    params = {"id": id}
+    if relations:
+        params["relations"] = True
+
+    return await aio.fetch_first("persons", params=params, client=client)
+
+
+async def get_person_by_desktop_login(
+    desktop_login: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Args:
+        desktop_login (str): Login used to sign in on the desktop computer.
+
+    Returns:
+        dict: Person corresponding to given desktop computer login.
+    """
+    return await aio.fetch_first(
+        "persons",
+        {"desktop_login": desktop_login, "is_bot": False},
+        client=client,
+    )
+
+
+async def get_person_by_email(
+    email: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Args:
+        email (str): User's email.
+
+    Returns:
+        dict:  Person corresponding to given email.
+    """
+    return await aio.fetch_first(
+        "persons", {"email": email, "is_bot": False}, client=client
+    )
+
+
+async def get_person_by_full_name(
+    full_name: str,
+    first_name: str | None = None,
+    last_name: str | None = None,
+    client: KitsuClient = default,
+) -> dict | None:
+    """
+    Args:
+        full_name (str): User's full name
+        first_name (str): User's first name
+        last_name (str): User's last name
+
+    Returns:
+        dict: Person corresponding to given name, or None if not found.
+    """
+    if first_name is not None and last_name is not None:
+        return await aio.fetch_first(
+            "persons",
+            {
+                "first_name": first_name,
+                "last_name": last_name,
+                "is_bot": False,
+            },
+            client=client,
+        )
+    else:
+        return await aio.fetch_first(
+            "persons",
+            {"full_name": full_name, "is_bot": False},
+            client=client,
+        )
+
+
+async def get_organisation(client: KitsuClient = default) -> dict:
+    """
+    Returns:
+        dict: Database information for organisation linked to auth tokens.
+    """
+    return (await aio.get("auth/authenticated", client=client))["organisation"]
+
+
+async def new_department(
+    name: str,
+    color: str = "",
+    archived: bool = False,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create a new department based on given parameters.
+
+    Args:
+        name (str): the name of the department.
+        color (str): the color of the department as a Hex string, e.g "#00FF00".
+        archived (bool): Whether the department is archived or not.
+
+    Returns:
+        dict: Created department.
+    """
+    department = await get_department_by_name(name, client=client)
+    if department is None:
+        department = await aio.post(
+            "data/departments",
+            {"name": name, "color": color, "archived": archived},
+            client=client,
+        )
+    return department
+
+
+async def update_department(department, client=default):
+    """
+    Update a department.
+
+    Args:
+        department (dict): The department dict that needs to be updated.
+
+    Returns:
+        dict: The updated department.
+    """
+    department = normalize_model_parameter(department)
+    return await aio.put(
+        f"data/departments/{department['id']}",
+        department,
+        client=client,
+    )
+
+
+async def remove_department(department, force=False, client=default):
+    """
+    Remove given department from database.
+
+    Args:
+        department (dict / ID): Department to remove.
+        force (bool): Whether to force deletion of the department.
+    """
+    department = normalize_model_parameter(department)
+    path = f"data/departments/{department['id']}"
+    params = {}
+    if force:
+        params = {"force": True}
+    return await aio.delete(path, params, client=client)
+
+
+async def new_person(
+    first_name: str,
+    last_name: str,
+    email: str,
+    phone: str = "",
+    role: str = "user",
+    desktop_login: str = "",
+    departments: list[str | dict] | None = None,
+    password: str | None = None,
+    active: bool = True,
+    contract_type: str = "open-ended",
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create a new person based on given parameters. His/her password will is
+    set automatically to default.
+
+    Args:
+        first_name (str): the first name of the person.
+        last_name (str): the last name of the person.
+        email (str): the email of the person.
+        phone (str): the phone number of the person.
+        role (str): user, manager, admin (which match CG artist, Supervisor
+                    and studio manager)
+        desktop_login (str): The login the users uses to log on its computer.
+        departments (list): The departments for the person.
+        password (str): The password for the person.
+        active (bool): Whether the person is active or not.
+
+    Returns:
+        dict: Created person.
+    """
+    if departments is None:
+        departments = []
+    person = await get_person_by_email(email, client=client)
+    if person is None:
+        person = await aio.post(
+            "data/persons",
+            {
+                "first_name": first_name,
+                "last_name": last_name,
+                "email": email,
+                "phone": phone,
+                "role": role,
+                "desktop_login": desktop_login,
+                "departments": normalize_list_of_models_for_links(departments),
+                "password": password,
+                "active": active,
+                "contract_type": contract_type,
+            },
+            client=client,
+        )
+    return person
+
+
+async def update_person(person: dict, client: KitsuClient = default) -> dict:
+    """
+    Update a person.
+
+    Args:
+        person (dict): The person dict that needs to be upgraded.
+
+    Returns:
+        dict: The updated person.
+    """
+
+    if "departments" in person:
+        person["departments"] = normalize_list_of_models_for_links(
+            person["departments"]
+        )
+
+    person = normalize_model_parameter(person)
+    return await aio.put(
+        f"data/persons/{person['id']}",
+        person,
+        client=client,
+    )
+
+
+async def remove_person(
+    person: str | dict, force: bool = False, client: KitsuClient = default
+) -> str:
+    """
+    Remove given person from database.
+
+    Args:
+        person (str / dict): Person to remove.
+    """
+    person = normalize_model_parameter(person)
+    path = f"data/persons/{person['id']}"
+    params = {}
+    if force:
+        params = {"force": True}
+    return await aio.delete(path, params, client=client)
+
+
+async def new_bot(
+    name: str,
+    email: str,
+    role: str = "user",
+    departments: list[str | dict] | None = None,
+    active: bool = True,
+    expiration_date: str | None = None,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create a new bot based on given parameters. His access token will be in the
+    return dict.
+
+    Args:
+        name (str): the name of the bot.
+        email (str): the email of the bot.
+        role (str): user, manager, admin (which match CG artist, Supervisor
+                    and studio manager)
+        departments (list): The departments for the person.
+        active (bool): Whether the person is active or not.
+        expiration_date (str): The expiration date for the bot.
+
+    Returns:
+        dict: Created bot.
+    """
+    if departments is None:
+        departments = []
+    bot = await aio.post(
+        "data/persons",
+        {
+            "first_name": name,
+            "last_name": "",
+            "email": email,
+            "role": role,
+            "departments": normalize_list_of_models_for_links(departments),
+            "active": active,
+            "expiration_date": expiration_date,
+            "is_bot": True,
+        },
+        client=client,
+    )
+    return bot
+
+
+async def update_bot(bot: dict, client: KitsuClient = default) -> dict:
+    """
+    Update a bot.
+
+    Args:
+        bot (dict): The bot dict that needs to be upgraded.
+
+    Returns:
+        dict: The updated bot.
+    """
+    return await update_person(bot, client=client)
+
+
+async def remove_bot(
+    bot: dict, force: bool = False, client: KitsuClient = default
+) -> str:
+    """
+    Remove given bot from database.
+
+    Args:
+        bot (dict): Bot to remove.
+    """
+    return await remove_person(bot, force=force, client=client)
+
+
+async def set_avatar(
+    person: str | dict,
+    file_path: str,
+    client: KitsuClient = default,
+    progress_callback=None,
+) -> dict[Literal["thumbnail_path"], str]:
+    """
+    Upload picture and set it as avatar for given person.
+
+    Args:
+        person (str / dict): The person dict or the person ID.
+        file_path (str): Path where the avatar file is located on the hard
+                         drive.
+
+    Returns:
+        dict: Dictionary with a key of 'thumbnail_path' and a value of the
+            path to the static image file, relative to the host url.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.upload(
+        f"/pictures/thumbnails/persons/{person['id']}",
+        file_path,
+        client=client,
+        progress_callback=progress_callback,
+    )
+
+
+async def get_presence_log(
+    year: int, month: int, client: KitsuClient = default
+) -> str:
+    """
+    Args:
+        year (int): The number of the year to fetch logs during.
+        month (int): The index of the month to get presence logs for. Indexed
+            from 1, e.g 1 = January, 2 = February, ...
+
+    Returns:
+        str: The presence log table (in CSV) for given month and year.
+    """
+    path = f"data/persons/presence-logs/{year}-{str(month).zfill(2)}"
+    return await aio.get(path, json_response=False, client=client)
+
+
+async def change_password_for_person(
+    person: str | dict, password: str, client: KitsuClient = default
+) -> dict[Literal["success"], bool]:
+    """
+    Change the password for given person.
+
+    Args:
+        person (str / dict): The person dict or the person ID.
+        password (str): The new password.
+
+    Returns:
+        dict: success or not.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.post(
+        f"actions/persons/{person['id']}/change-password",
+        {"password": password, "password_2": password},
+        client=client,
+    )
+
+
+async def invite_person(
+    person: str | dict, client: KitsuClient = default
+) -> dict[str, str]:
+    """
+    Sends an email to given person to invite him/her to connect to Kitsu.
+
+    Args:
+        person (str / dict): The person to invite.
+
+    Returns:
+        dict: Response dict with 'success' and 'message' keys.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.get(
+        f"actions/persons/{person['id']}/invite",
+        client=client,
+    )
+
+
+async def get_time_spents_by_date(
+    person: str | dict, date: str, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Get time spents for a person on a specific date.
+
+    Args:
+        person (str / dict): The person dict or id.
+        date (str): Date in YYYY-MM-DD format.
+
+    Returns:
+        list: Time spents for the date.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.get(
+        f"data/persons/{person['id']}/time-spents/by-date",
+        params={"date": date},
+        client=client,
+    )
+
+
+async def get_week_time_spents(
+    person: str | dict, year: int, week: int, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Get time spents for a person for a specific week.
+
+    Args:
+        person (str / dict): The person dict or id.
+        year (int): Year.
+        week (int): Week number.
+
+    Returns:
+        list: Time spents for the week.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.get(
+        f"data/persons/{person['id']}/time-spents/week/{year}/{week}",
+        client=client,
+    )
+
+
+async def get_year_time_spents(
+    person: str | dict, year: int, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Get time spents for a person for a specific year.
+
+    Args:
+        person (str / dict): The person dict or id.
+        year (int): Year.
+
+    Returns:
+        list: Time spents for the year.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.get(
+        f"data/persons/{person['id']}/time-spents/year/{year}",
+        client=client,
+    )
+
+
+async def get_day_offs(
+    person: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Get day offs for a person.
+
+    Args:
+        person (str / dict): The person dict or id.
+
+    Returns:
+        list: Day offs for the person.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.fetch_all(f"persons/{person['id']}/day-offs", client=client)
+
+
+async def get_week_day_offs(
+    person: str | dict, year: int, week: int, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Get day offs for a person for a specific week.
+
+    Args:
+        person (str / dict): The person dict or id.
+        year (int): Year.
+        week (int): Week number.
+
+    Returns:
+        list: Day offs for the week.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.get(
+        f"data/persons/{person['id']}/day-offs/week/{year}/{week}",
+        client=client,
+    )
+
+
+async def get_month_day_offs(
+    person: str | dict, year: int, month: int, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Get day offs for a person for a specific month.
+
+    Args:
+        person (str / dict): The person dict or id.
+        year (int): Year.
+        month (int): Month number.
+
+    Returns:
+        list: Day offs for the month.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.get(
+        f"data/persons/{person['id']}/day-offs/month/{year}/{str(month).zfill(2)}",
+        client=client,
+    )
+
+
+async def get_year_day_offs(
+    person: str | dict, year: int, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Get day offs for a person for a specific year.
+
+    Args:
+        person (str / dict): The person dict or id.
+        year (int): Year.
+
+    Returns:
+        list: Day offs for the year.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.get(
+        f"data/persons/{person['id']}/day-offs/year/{year}",
+        client=client,
+    )
+
+
+async def get_day_off(day_off_id: str, client: KitsuClient = default) -> dict:
+    """
+    Get a day off by its ID.
+
+    Args:
+        day_off_id (str): ID of the day off.
+
+    Returns:
+        dict: Day off matching the given ID.
+    """
+    return await aio.fetch_one("day-offs", day_off_id, client=client)
+
+
+async def new_day_off(
+    person: str | dict,
+    date: str,
+    end_date: str,
+    description: str | None = None,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create a new day off for the given person. The server rejects the
+    request if the period overlaps with an existing day off. Time-spent
+    entries that fall within the period are automatically removed by zou.
+
+    Args:
+        person (str / dict): The person dict or id.
+        date (str): Start date (ISO format, e.g. ``"2026-04-10"``).
+        end_date (str): End date (ISO format, inclusive).
+        description (str): Optional description.
+
+    Returns:
+        dict: Created day off.
+    """
+    person = normalize_model_parameter(person)
+    data = {
+        "person_id": person["id"],
+        "date": date,
+        "end_date": end_date,
+    }
+    if description is not None:
+        data["description"] = description
+    return await aio.create("day-offs", data, client=client)
+
+
+async def update_day_off(day_off: dict, client: KitsuClient = default) -> dict:
+    """
+    Update a day off.
+
+    Args:
+        day_off (dict): The day off dict to update. Must include the
+            ``id`` key. Fields that can be changed: ``date``,
+            ``end_date``, ``description``, ``person_id``.
+
+    Returns:
+        dict: Updated day off.
+    """
+    return await aio.put(f"data/day-offs/{day_off['id']}", day_off, client=client)
+
+
+async def remove_day_off(day_off: str | dict, client: KitsuClient = default) -> str:
+    """
+    Delete a day off.
+
+    Args:
+        day_off (dict / ID): The day off dict or id.
+
+    Returns:
+        str: Empty response.
+    """
+    day_off = normalize_model_parameter(day_off)
+    return await aio.delete(f"data/day-offs/{day_off['id']}", client=client)
+
+
+async def add_person_to_department(
+    person: str | dict, department: str | dict, client: KitsuClient = default
+) -> dict:
+    """
+    Add a person to a department.
+
+    Args:
+        person (str / dict): The person dict or id.
+        department (str / dict): The department dict or id.
+
+    Returns:
+        dict: Response information.
+    """
+    person = normalize_model_parameter(person)
+    department = normalize_model_parameter(department)
+    return await aio.post(
+        f"actions/persons/{person['id']}/departments/add",
+        {"department_id": department["id"]},
+        client=client,
+    )
+
+
+async def remove_person_from_department(
+    person: str | dict, department: str | dict, client: KitsuClient = default
+) -> str:
+    """
+    Remove a person from a department.
+
+    Args:
+        person (str / dict): The person dict or id.
+        department (str / dict): The department dict or id.
+
+    Returns:
+        Response: Request response object.
+    """
+    person = normalize_model_parameter(person)
+    department = normalize_model_parameter(department)
+    return await aio.delete(
+        f"actions/persons/{person['id']}/departments/{department['id']}",
+        client=client,
+    )
+
+
+async def disable_two_factor_authentication(
+    person: str | dict, client: KitsuClient = default
+) -> str:
+    """
+    Disable two factor authentication for a person.
+
+    Args:
+        person (str / dict): The person dict or id.
+
+    Returns:
+        Response: Request response object.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.delete(
+        f"data/persons/{person['id']}/two-factor-authentication",
+        client=client,
+    )
+
+
+async def clear_person_avatar(
+    person: str | dict, client: KitsuClient = default
+) -> str:
+    """
+    Clear avatar for a person.
+
+    Args:
+        person (str / dict): The person dict or id.
+
+    Returns:
+        Response: Request response object.
+    """
+    person = normalize_model_parameter(person)
+    return await aio.delete(f"data/persons/{person['id']}/avatar", client=client)
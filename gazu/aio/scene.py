@@ -0,0 +1,246 @@
+# Generated from gazu/scene.py by `python -m gazu.aio.transform`,
+# do not edit.
+"""
+Async version of `gazu.scene`.
+"""
+
+from __future__ import annotations
+
+from .. import aio
+from .. import client as raw
+from ..scene import KitsuClient, normalize_model_parameter, sort_by_name
+from .shot import get_sequence
+
+
+default = None
+
+
+__all__ = [
+    "add_shot_to_scene",
+    "all_asset_instances_for_scene",
+    "all_camera_instances_for_scene",
+    "all_scenes",
+    "all_scenes_for_project",
+    "all_scenes_for_sequence",
+    "all_shots_for_scene",
+    "get_asset_instance_by_name",
+    "get_scene",
+    "get_scene_by_name",
+    "get_sequence_from_scene",
+    "new_scene",
+    "new_scene_asset_instance",
+    "remove_shot_from_scene",
+    "update_asset_instance_data",
+    "update_asset_instance_name",
+    "update_scene",
+]
+
+
+async def new_scene(
+    project: str | dict,
+    sequence: str | dict,
+    name: str,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Create a scene for given sequence.
+    """
+    project = normalize_model_parameter(project)
+    sequence = normalize_model_parameter(sequence)
+    scene = {"name": name, "sequence_id": sequence["id"]}
+    return await aio.post(
+        f"data/projects/{project['id']}/scenes", scene, client=client
+    )
+
+
+async def all_scenes(
+    project: str | dict | None = None, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Retrieve all scenes.
+    """
+    project = normalize_model_parameter(project)
+    if project is not None:
+        scenes = await aio.fetch_all(
+            f"projects/{project['id']}/scenes", client=client
+        )
+    else:
+        scenes = await aio.fetch_all("scenes", client=client)
+    return sort_by_name(scenes)
+
+
+async def all_scenes_for_project(
+    project: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Retrieve all scenes for given project.
+    """
+    project = normalize_model_parameter(project)
+    scenes = await aio.fetch_all(f"projects/{project['id']}/scenes", client=client)
+    return sort_by_name(scenes)
+
+
+async def all_scenes_for_sequence(
+    sequence: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Retrieve all scenes which are children from given sequence.
+    """
+    sequence = normalize_model_parameter(sequence)
+    return sort_by_name(
+        await aio.fetch_all(f"sequences/{sequence['id']}/scenes", client=client),
+    )
+
+
+async def get_scene(scene_id: str, client: KitsuClient = default) -> dict:
+    """
+    Return scene corresponding to given scene ID.
+    """
+    return await aio.fetch_one("scenes", scene_id, client=client)
+
+
+async def get_scene_by_name(
+    sequence: str | dict, scene_name: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Returns scene corresponding to given sequence and name.
+    """
+    sequence = normalize_model_parameter(sequence)
+    result = await aio.fetch_all(
+        "scenes/all",
+        {"parent_id": sequence["id"], "name": scene_name},
+        client=client,
+    )
+    return next(iter(result or []), None)
+
+
+async def update_scene(scene: dict, client: KitsuClient = default) -> dict:
+    """
+    Save given scene data into the API.
+    """
+    return await aio.put(f"data/entities/{scene['id']}", scene, client=client)
+
+
+async def new_scene_asset_instance(
+    scene: str | dict,
+    asset: str | dict,
+    description: str | None = None,
+    client: KitsuClient = default,
+) -> dict:
+    """
+    Creates a new asset instance on given scene. The instance number is
+    automatically generated (increment highest number).
+    """
+    scene = normalize_model_parameter(scene)
+    asset = normalize_model_parameter(asset)
+    data = {"asset_id": asset["id"]}
+
+    if description is not None:
+        data["description"] = description
+
+    return await aio.post(
+        f"data/scenes/{scene['id']}/asset-instances", data, client=client
+    )
+
+
+async def all_asset_instances_for_scene(
+    scene: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Return the list of asset instances listed in a scene.
+    """
+    scene = normalize_model_parameter(scene)
+    return await aio.get(f"data/scenes/{scene['id']}/asset-instances", client=client)
+
+
+async def get_asset_instance_by_name(
+    scene: str | dict, name: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Returns the asset instance of the scene that has the given name.
+    """
+    scene = normalize_model_parameter(scene)
+    return await aio.fetch_first(
+        "asset-instances",
+        {"name": name, "scene_id": scene["id"]},
+        client=client,
+    )
+
+
+async def all_camera_instances_for_scene(
+    scene: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Return the list of camera instances listed in a scene.
+    """
+    scene = normalize_model_parameter(scene)
+    return await aio.get(
+        f"data/scenes/{scene['id']}/camera-instances", client=client
+    )
+
+
+async def all_shots_for_scene(
+    scene: str | dict, client: KitsuClient = default
+) -> list[dict]:
+    """
+    Return the list of shots issued from given scene.
+    """
+    scene = normalize_model_parameter(scene)
+    return await aio.get(f"data/scenes/{scene['id']}/shots", client=client)
+
+
+async def add_shot_to_scene(
+    scene: str | dict, shot: str | dict, client: KitsuClient = default
+) -> dict:
+    """
+    Link a shot to a scene to mark the fact it was generated out from that
+    scene.
+    """
+    scene = normalize_model_parameter(scene)
+    shot = normalize_model_parameter(shot)
+    data = {"shot_id": shot["id"]}
+    return await aio.post(f"data/scenes/{scene['id']}/shots", data, client=client)
+
+
+async def remove_shot_from_scene(
+    scene: str | dict, shot: str | dict, client: KitsuClient = default
+) -> str:
+    """
+    Remove link between a shot and a scene.
+    """
+    scene = normalize_model_parameter(scene)
+    shot = normalize_model_parameter(shot)
+    return await aio.delete(
+        f"data/scenes/{scene['id']}/shots/{shot['id']}", client=client
+    )
+
+
+async def update_asset_instance_name(
+    asset_instance: dict, name: str, client: KitsuClient = default
+) -> dict:
+    """
+    Update the name of given asset instance.
+    """
+    path = f"/data/asset-instances/{asset_instance['id']}"
+    return await aio.put(path, {"name": name}, client=client)
+
+
+async def update_asset_instance_data(
+    asset_instance: str | dict, data: dict, client: KitsuClient = default
+) -> dict:
+    """
+    Update the extra data of given asset instance.
+    """
+    asset_instance = normalize_model_parameter(asset_instance)
+    path = f"/data/asset-instances/{asset_instance['id']}"
+    return await aio.put(path, {"data": data}, client=client)
+
+
+async def get_sequence_from_scene(
+    scene: str | dict, client: KitsuClient = default
+) -> dict:
+    """
+    Return sequence which is parent of given scene.
+    """
+    scene = normalize_model_parameter(scene)
+    return await get_sequence(scene["parent_id"], client=client)
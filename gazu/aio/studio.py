@@ -0,0 +1,85 @@
+# Generated from gazu/studio.py by `python -m gazu.aio.transform`,
+# do not edit.
+"""
+Async version of `gazu.studio`.
+"""
+
+from __future__ import annotations
+
+from .. import aio
+from .. import client as raw
+from ..studio import KitsuClient, normalize_model_parameter, sort_by_name
+
+
+default = None
+
+
+__all__ = [
+    "all_studios",
+    "get_studio",
+    "get_studio_by_name",
+    "remove_studio",
+    "update_studio",
+]
+
+
+async def all_studios(client: KitsuClient = default) -> list[dict]:
+    """
+    Returns:
+        list: Studios stored in the database.
+    """
+    return sort_by_name(await aio.fetch_all("studios", client=client))
+
+
+async def get_studio(studio_id: str, client: KitsuClient = default) -> dict:
+    """
+    Args:
+        studio_id (str): ID of claimed studio.
+
+    Returns:
+        dict: Studio corresponding to given id.
+    """
+    return await aio.fetch_one("studios", studio_id, client=client)
+
+
+async def get_studio_by_name(
+    studio_name: str, client: KitsuClient = default
+) -> dict | None:
+    """
+    Args:
+        studio_name (str): Name of claimed studio.
+
+    Returns:
+        dict: Studio corresponding to given name.
+    """
+    return await aio.fetch_first("studios", {"name": studio_name}, client=client)
+
+
+async def update_studio(studio: dict, client: KitsuClient = default) -> dict:
+    """
+    Save given studio data into the API. Metadata are fully replaced by the
+    ones set on given studio.
+
+    Args:
+        studio (dict): The studio to update.
+
+    Returns:
+        dict: Updated studio.
+    """
+    return await aio.put(f"data/studios/{studio['id']}", studio, client=client)
+
+
+async def remove_studio(
+    studio: str | dict, force: bool = False, client: KitsuClient = default
+) -> str:
+    """
+    Remove given studio from database.
+
+    Args:
+        studio (dict / str): Studio to remove.
+        force (bool): Whether to force deletion of the studio.
+    """
+    studio = normalize_model_parameter(studio)
+    path = f"data/studios/{studio['id']}"
+    params = {"force": True} if force else {}
+    return await aio.delete(path, params=params, client=client)
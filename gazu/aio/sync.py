@@ -0,0 +1,913 @@
+# Generated from gazu/sync.py by `python -m gazu.aio.transform`,
+# do not edit.
+"""
+Async version of `gazu.sync`. Functions without async version:
+`push_project_changes`, `push_tasks_comments`, `run_comments_pipeline`.
+"""
+
+from __future__ import annotations
+
+import datetime
+import os
+import tempfile
+
+from .. import aio
+from .. import client as raw
+from ..sync import (
+    BlobStore,
+    IMPORT_BATCH_SIZE,
+    IMPORT_MAX_WORKERS,
+    KitsuClient,
+    PipelineStats,
+    SYNC_EVENT_MODELS,
+    SyncContext,
+    SyncIdMap,
+    TransferLedger,
+    append_json_line,
+    convert_id_list,
+    convert_task,
+    get_files_size,
+    get_id_map_by_id,
+    get_id_map_by_name,
+    get_link_list_diff,
+    get_model_list_diff,
+    get_sync_checkpoint,
+    get_touched_entities,
+    is_changed,
+    link_file,
+    load_sync_checkpoint,
+    normalize_model_parameter,
+    read_json_lines,
+    save_sync_checkpoint,
+    validate_date_format,
+)
+from . import asset as asset_module
+from . import casting as casting_module
+from . import files as files_module
+from . import person as person_module
+from . import project as project_module
+from . import shot as shot_module
+from . import task as task_module
+
+
+default = None
+
+
+__all__ = [
+    "append_json_line",
+    "convert_id_list",
+    "convert_task",
+    "create_comment_with_files",
+    "download_comment_files",
+    "get_events_since",
+    "get_files_size",
+    "get_id_map_by_id",
+    "get_id_map_by_name",
+    "get_last_events",
+    "get_link_list_diff",
+    "get_model_list_diff",
+    "get_sync_asset_type_id_map",
+    "get_sync_checkpoint",
+    "get_sync_department_id_map",
+    "get_sync_person_id_map",
+    "get_sync_project_id_map",
+    "get_sync_task_status_id_map",
+    "get_sync_task_type_id_map",
+    "get_touched_entities",
+    "import_entities",
+    "import_entity_links",
+    "import_tasks",
+    "is_changed",
+    "link_file",
+    "load_sync_checkpoint",
+    "push_assets",
+    "push_entity_links",
+    "push_episodes",
+    "push_project_entities",
+    "push_sequences",
+    "push_shots",
+    "push_task_comment",
+    "push_task_comments",
+    "push_tasks",
+    "read_json_lines",
+    "save_sync_checkpoint",
+]
+
+
+async def get_last_events(
+    limit: int = 20000,
+    project: str | dict | None = None,
+    after: str | None = None,
+    before: str | None = None,
+    only_files: bool = False,
+    name: str | None = None,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Get last events that occurred on the machine.
+
+    Args:
+        limit (int): Number of events to retrieve.
+        project (str / dict): Get only events related to this project.
+        after (str): Get only events occurring after given date.
+        before (str): Get only events occurring before given date.
+        only_files (bool): Get only events related to files.
+
+    Returns:
+        list[dict]: Last events matching criterions.
+    """
+    path = "/data/events/last"
+    params = {"limit": limit, "only_files": only_files}
+    if project is not None:
+        project = normalize_model_parameter(project)
+        params["project_id"] = project["id"]
+    if after is not None:
+        params["after"] = validate_date_format(after)
+    if before is not None:
+        params["before"] = validate_date_format(before)
+    if name is not None:
+        params["name"] = name
+    return await aio.get(path, params=params, client=client)
+
+
+async def import_entities(
+    entities: list[dict],
+    client: KitsuClient = default,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    max_workers: int = IMPORT_MAX_WORKERS,
+    attempts: int = 3,
+) -> list[dict]:
+    """
+    Import entities from another instance to target instance (keep id and audit
+    dates). Entities are sent in batches, see `raw.post_batches`.
+
+    Args:
+        entities (list): Entities to import.
+        batch_size (int): Maximum number of entities per request.
+        max_workers (int): Maximum number of requests running at the same
+            time. Batches are sent one after the other by default, with
+            more workers the order in which they are applied is not
+            guaranteed.
+        attempts (int): Maximum number of attempts per batch.
+
+    Returns:
+        list[dict]: Entities created.
+    """
+    return await aio.post_batches(
+        "import/kitsu/entities",
+        entities,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        attempts=attempts,
+        client=client,
+    )
+
+
+async def import_tasks(
+    tasks: list[dict],
+    client: KitsuClient = default,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    max_workers: int = IMPORT_MAX_WORKERS,
+    attempts: int = 3,
+) -> list[dict]:
+    """
+    Import tasks from another instance to target instance (keep id and audit
+    dates). Tasks are sent in batches, see `raw.post_batches`.
+
+    Args:
+        tasks (list): Tasks to import.
+        batch_size (int): Maximum number of tasks per request.
+        max_workers (int): Maximum number of requests running at the same
+            time. Batches are sent one after the other by default, with
+            more workers the order in which they are applied is not
+            guaranteed.
+        attempts (int): Maximum number of attempts per batch.
+
+    Returns:
+        list[dict]: Tasks created.
+    """
+    return await aio.post_batches(
+        "import/kitsu/tasks",
+        tasks,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        attempts=attempts,
+        client=client,
+    )
+
+
+async def import_entity_links(
+    links: list[dict],
+    client: KitsuClient = default,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    max_workers: int = IMPORT_MAX_WORKERS,
+    attempts: int = 3,
+) -> list[dict]:
+    """
+    Import enitity links from another instance to target instance (keep id and
+    audit dates). Links are sent in batches, see `raw.post_batches`.
+
+    Args:
+        links (list): Entity links to import.
+        batch_size (int): Maximum number of links per request.
+        max_workers (int): Maximum number of requests running at the same
+            time. Batches are sent one after the other by default, with
+            more workers the order in which they are applied is not
+            guaranteed.
+        attempts (int): Maximum number of attempts per batch.
+
+    Returns:
+        dict: Entity links created.
+    """
+    return await aio.post_batches(
+        "import/kitsu/entity-links",
+        links,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        attempts=attempts,
+        client=client,
+    )
+
+
+async def get_sync_department_id_map(
+    source_client: KitsuClient, target_client: KitsuClient
+) -> dict:
+    """
+    Args:
+        source_client (KitsuClient): client to get data from source API
+        target_client (KitsuClient): client to push data to target API
+
+    Returns:
+        dict: A dict matching source departments ids with target department ids
+    """
+    departments_source = await person_module.all_departments(client=source_client)
+    departments_target = await person_module.all_departments(client=target_client)
+    return get_id_map_by_id(departments_source, departments_target)
+
+
+async def get_sync_asset_type_id_map(
+    source_client: KitsuClient, target_client: KitsuClient
+) -> dict:
+    """
+    Args:
+        source_client (KitsuClient): client to get data from source API
+        target_client (KitsuClient): client to push data to target API
+
+    Returns:
+        dict: A dict matching source asset type ids with target asset type ids
+    """
+    asset_types_source = await asset_module.all_asset_types(client=source_client)
+    asset_types_target = await asset_module.all_asset_types(client=target_client)
+    return get_id_map_by_id(asset_types_source, asset_types_target)
+
+
+async def get_sync_project_id_map(
+    source_client: KitsuClient, target_client: KitsuClient
+) -> dict:
+    """
+    Args:
+        source_client (KitsuClient): client to get data from source API
+        target_client (KitsuClient): client to push data to target API
+
+    Returns:
+        dict: A dict matching source project ids with target project ids
+    """
+    projects_source = await project_module.all_projects(client=source_client)
+    projects_target = await project_module.all_projects(client=target_client)
+    return get_id_map_by_id(projects_source, projects_target)
+
+
+async def get_sync_task_type_id_map(
+    source_client: KitsuClient, target_client: KitsuClient
+) -> dict:
+    """
+    Args:
+        source_client (KitsuClient): client to get data from source API
+        target_client (KitsuClient): client to push data to target API
+
+    Returns:
+        dict: A dict matching source task type ids with target task type ids
+    """
+    task_types_source = await task_module.all_task_types(client=source_client)
+    task_types_target = await task_module.all_task_types(client=target_client)
+    return get_id_map_by_id(task_types_source, task_types_target)
+
+
+async def get_sync_task_status_id_map(
+    source_client: KitsuClient, target_client: KitsuClient
+) -> dict:
+    """
+    Args:
+        source_client (KitsuClient): client to get data from source API
+        target_client (KitsuClient): client to push data to target API
+
+    Returns:
+        dict: A dict matching source task status ids with target task status
+              ids
+    """
+    task_statuses_source = await task_module.all_task_statuses(client=source_client)
+    task_statuses_target = await task_module.all_task_statuses(client=target_client)
+    return get_id_map_by_id(task_statuses_source, task_statuses_target)
+
+
+async def get_sync_person_id_map(
+    source_client: KitsuClient, target_client: KitsuClient
+) -> dict:
+    """
+    Args:
+        source_client (KitsuClient): client to get data from source API
+        target_client (KitsuClient): client to push data to target API
+
+    Returns:
+        dict: A dict matching source person ids with target person ids
+    """
+    persons_source = await person_module.all_persons(client=source_client)
+    persons_target = await person_module.all_persons(client=target_client)
+    return get_id_map_by_id(persons_source, persons_target, field="email")
+
+
+async def push_assets(
+    project_source: dict,
+    project_target: dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+    context: SyncContext | None = None,
+) -> list[dict]:
+    """
+    Copy assets from source to target and preserve audit fields (`id`,
+    `created_at`, and `updated_at`).
+
+    Args:
+        project_source (dict): The project to get assets from
+        project_target (dict): The project to push assets to
+        client_source (KitsuClient): client to get data from source API
+        client_target (KitsuClient): client to push data to target API
+        context (SyncContext): ID maps shared by the sync calls of a run.
+
+    Returns:
+        list: Pushed assets
+    """
+    if context is not None:
+        raise TypeError(
+            "context is not supported by async push_assets"
+        )
+    if context is None:
+        asset_types_map = await get_sync_asset_type_id_map(
+            client_source, client_target
+        )
+        task_types_map = await get_sync_task_type_id_map(
+            client_source, client_target
+        )
+    else:
+        asset_types_map = context.get_map("asset_type")
+        task_types_map = context.get_map("task_type")
+    assets = await asset_module.all_assets_for_project(
+        project_source, client=client_source
+    )
+    for asset in assets:
+        asset["entity_type_id"] = asset_types_map[asset["entity_type_id"]]
+        if asset["ready_for"] is not None:
+            asset["ready_for"] = task_types_map[asset["ready_for"]]
+        asset["project_id"] = project_target["id"]
+    return await import_entities(assets, client=client_target)
+
+
+async def push_episodes(
+    project_source: dict,
+    project_target: dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+) -> list[dict]:
+    """
+    Copy episodes from source to target and preserve audit fields (`id`,
+    `created_at`, and `updated_at`)
+
+    Args:
+        project_source (dict): The project to get episodes from
+        project_target (dict): The project to push episodes to
+        client_source (KitsuClient): client to get data from source API
+        client_target (KitsuClient): client to push data to target API
+
+    Returns:
+        list: Pushed episodes
+    """
+    episodes = await shot_module.all_episodes_for_project(
+        project_source, client=client_source
+    )
+    for episode in episodes:
+        episode["project_id"] = project_target["id"]
+    return await import_entities(episodes, client=client_target)
+
+
+async def push_sequences(
+    project_source: dict,
+    project_target: dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+) -> list[dict]:
+    """
+    Copy sequences from source to target and preserve audit fields (`id`,
+    `created_at`, and `updated_at`)
+
+    Args:
+        project_source (dict): The project to get sequences from
+        project_target (dict): The project to push sequences to
+        client_source (KitsuClient): client to get data from source API
+        client_target (KitsuClient): client to push data to target API
+
+    Returns:
+        list: Pushed sequences
+    """
+    sequences = await shot_module.all_sequences_for_project(
+        project_source, client=client_source
+    )
+    for sequence in sequences:
+        sequence["project_id"] = project_target["id"]
+    return await import_entities(sequences, client=client_target)
+
+
+async def push_shots(
+    project_source: dict,
+    project_target: dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+) -> list[dict]:
+    """
+    Copy shots from source to target and preserve audit fields (`id`,
+    `created_at`, and `updated_at`).
+
+    Args:
+        project_source (dict): The project to get shots from
+        project_target (dict): The project to push shots to
+        client_source (KitsuClient): client to get data from source API
+        client_target (KitsuClient): client to push data to target API
+
+    Returns:
+        list: Pushed shots
+    """
+    shots = await shot_module.all_shots_for_project(
+        project_source, client=client_source
+    )
+    for shot in shots:
+        shot["project_id"] = project_target["id"]
+    return await import_entities(shots, client=client_target)
+
+
+async def push_entity_links(
+    project_source: dict,
+    project_target: dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+) -> list[dict]:
+    """
+    Copy entity links (breakdown, concepts) from source to target and preserve
+    audit fields (`id`, `created_at`, and `updated_at`).
+
+    Args:
+        project_source (dict): The project to get assets from
+        project_target (dict): The project to push assets to
+        client_source (KitsuClient): client to get data from source API
+        client_target (KitsuClient): client to push data to target API
+
+    Returns:
+        list: Pushed entity links
+    """
+    links = await casting_module.all_entity_links_for_project(
+        project_source, client=client_source
+    )
+    return await import_entity_links(links, client=client_target)
+
+
+async def push_project_entities(
+    project_source: dict,
+    project_target: dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+    context: SyncContext | None = None,
+) -> dict:
+    """
+    Copy assets, episodes, sequences, shots and entity links from source to
+    target and preserve audit fields (`id`, `created_at`, and `updated_at`).
+
+    Args:
+        project_source (dict): The project to get assets from
+        project_target (dict): The project to push assets to
+        client_source (KitsuClient): client to get data from source API
+        client_target (KitsuClient): client to push data to target API
+        context (SyncContext): ID maps shared by the sync calls of a run.
+
+    Returns:
+        dict: Pushed data
+    """
+    if context is not None:
+        raise TypeError(
+            "context is not supported by async push_project_entities"
+        )
+    assets = await push_assets(
+        project_source,
+        project_target,
+        client_source,
+        client_target,
+        context=context,
+    )
+    episodes = []
+    if project_source["production_type"] == "tvshow":
+        episodes = await push_episodes(
+            project_source, project_target, client_source, client_target
+        )
+    sequences = await push_sequences(
+        project_source, project_target, client_source, client_target
+    )
+    shots = await push_shots(
+        project_source, project_target, client_source, client_target
+    )
+    entity_links = await push_entity_links(
+        project_source, project_target, client_source, client_target
+    )
+    return {
+        "assets": assets,
+        "episodes": episodes,
+        "sequences": sequences,
+        "shots": shots,
+        "entity_links": entity_links,
+    }
+
+
+async def push_tasks(
+    project_source: dict,
+    project_target: dict,
+    default_status: str | dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+    context: SyncContext | None = None,
+) -> list[dict]:
+    """
+    Copy tasks from source to target and preserve audit fields (`id`,
+    `created_at`, and `updated_at`)
+    Attachments and previews are created too.
+
+    Args:
+        project_source (dict): The project to get assets from
+        project_target (dict): The project to push assets to
+        default_status (str / dict): The default status for the pushed tasks
+        client_source (KitsuClient): client to get data from source API
+        client_target (KitsuClient): client to push data to target API
+        context (SyncContext): ID maps shared by the sync calls of a run.
+
+    Returns:
+        list: Pushed entity links
+    """
+    if context is not None:
+        raise TypeError(
+            "context is not supported by async push_tasks"
+        )
+    default_status_id = normalize_model_parameter(default_status)["id"]
+    if context is None:
+        task_type_map = await get_sync_task_type_id_map(client_source, client_target)
+        person_map = await get_sync_person_id_map(client_source, client_target)
+    else:
+        task_type_map = context.get_map("task_type")
+        person_map = context.get_map("person")
+
+    tasks = await task_module.all_tasks_for_project(
+        project_source, client=client_source
+    )
+    for task in tasks:
+        convert_task(
+            task, project_target, default_status_id, task_type_map, person_map
+        )
+    return await import_tasks(tasks, client=client_target)
+
+
+async def push_task_comments(
+    task_status_map: dict,
+    person_map: dict,
+    task: str | dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+    blob_store: BlobStore | None = None,
+    ledger: TransferLedger | None = None,
+) -> list[dict]:
+    """
+    Create a new comment into target api for each comment in source task
+    but preserve only `created_at` field.
+    Attachments and previews are created too.
+
+    Args:
+        task_status_map (dict): A mapping of source TaskStatus IDs to target IDs.
+        person_map (dict): A mapping of source Person IDs to target IDs.
+        task (str / dict): The task to push comments for
+        client_source (KitsuClient): client to get data from source API
+        client_target (KitsuClient): client to push data to target API
+        blob_store (BlobStore): Local store reusing the files already
+            downloaded from the source API.
+        ledger (TransferLedger): Record of the comments and previews
+            already pushed, which are skipped.
+
+    Returns:
+        list: Created comments
+    """
+    comments = await task_module.all_comments_for_task(task, client=client_source)
+    comments.reverse()
+    comments_target = []
+    for comment in comments:
+        comment_target = await push_task_comment(
+            task_status_map,
+            person_map,
+            task,
+            comment,
+            client_source,
+            client_target,
+            blob_store=blob_store,
+            ledger=ledger,
+        )
+        comments_target.append(comment_target)
+    return comments_target
+
+
+async def push_task_comment(
+    task_status_map: dict,
+    person_map: dict,
+    task: str | dict,
+    comment: dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+    author_id: str | None = None,
+    tmp_path: str | None = None,
+    blob_store: BlobStore | None = None,
+    ledger: TransferLedger | None = None,
+) -> dict:
+    """
+    Create a new comment into target api for each comment in source task
+    but preserve only `created_at` field.
+    Attachments and previews are created too.
+
+    Args:
+        task_status_map (dict): A mapping of source TaskStatus IDs to target IDs.
+        person_map (dict): A mapping of source Person IDs to target IDs.
+        task (str / dict): The task to push the comment for.
+        comment (dict): The comment to push.
+        client_source (KitsuClient): client to get data from source API
+        client_target (KitsuClient): client to push data to target API
+        author_id (str): The ID of the Person to set as the comment author.
+        tmp_path (str): The local path on disk to download the attachment files
+            for syncing.
+        blob_store (BlobStore): Local store reusing the files already
+            downloaded from the source API.
+        ledger (TransferLedger): Record of the comments and previews
+            already pushed, which are skipped.
+
+    Returns:
+        dict: The source comment.
+    """
+    if tmp_path is None:
+        tmp_path = tempfile.mkdtemp(prefix="zou_sync_")
+    attachments, previews = await download_comment_files(
+        comment, tmp_path, client_source, blob_store=blob_store, ledger=ledger
+    )
+    await create_comment_with_files(
+        task_status_map,
+        person_map,
+        task,
+        comment,
+        attachments,
+        previews,
+        client_target,
+        author_id=author_id,
+        ledger=ledger,
+    )
+    return comment
+
+
+async def download_comment_files(
+    comment: dict,
+    tmp_path: str,
+    client_source: KitsuClient,
+    blob_store: BlobStore | None = None,
+    ledger: TransferLedger | None = None,
+) -> tuple[list[str], list[dict]]:
+    """
+    Download the attachments and the previews of given source comment.
+    Files found in the blob store are linked from it instead of being
+    downloaded again, and files already pushed according to the ledger are
+    skipped.
+
+    Args:
+        comment (dict): The comment to download files for.
+        tmp_path (str): The local folder where to download the files.
+        client_source (KitsuClient): client to get data from source API
+        blob_store (BlobStore): Local store of the downloaded files.
+        ledger (TransferLedger): Record of the pushed comments and previews.
+
+    Returns:
+        tuple: Paths of the attachments, and previews as dicts with the
+        `id`, `file_path` and `annotations` keys.
+    """
+    attachments = []
+    if ledger is not None and ledger.get("comments", comment["id"]):
+        # Attachments are uploaded along with their comment.
+        attachment_ids = []
+    else:
+        attachment_ids = comment["attachment_files"]
+    for attachment_id in attachment_ids:
+        if isinstance(attachment_id, dict):
+            attachment_id = attachment_id["id"]
+        attachment_file = await files_module.get_attachment_file(
+            attachment_id, client=client_source
+        )
+        file_path = os.path.join(tmp_path, attachment_file["name"])
+        key = "attachment-files/" + attachment_id
+        if blob_store is None or not blob_store.restore(key, file_path):
+            await files_module.download_attachment_file(
+                attachment_file, file_path, client=client_source
+            )
+            if blob_store is not None:
+                blob_store.add(key, file_path)
+        attachments.append(file_path)
+
+    previews = []
+    for preview_file in comment["previews"]:
+        if isinstance(preview_file, str):
+            preview_file_id = preview_file
+        else:
+            preview_file_id = preview_file["id"]
+        if ledger is not None and ledger.get("preview-files", preview_file_id):
+            continue
+        preview_file = await files_module.get_preview_file(
+            preview_file_id, client=client_source
+        )
+        if (
+            preview_file["original_name"] is not None
+            and preview_file["extension"] is not None
+        ):
+            file_path = os.path.join(
+                tmp_path,
+                preview_file["original_name"]
+                + "."
+                + preview_file["extension"],
+            )
+            key = "preview-files/" + preview_file_id
+            if blob_store is None or not blob_store.restore(key, file_path):
+                await files_module.download_preview_file(
+                    preview_file, file_path, client=client_source
+                )
+                if blob_store is not None:
+                    blob_store.add(key, file_path)
+            previews.append(
+                {
+                    "id": preview_file_id,
+                    "file_path": file_path,
+                    "annotations": preview_file["annotations"],
+                }
+            )
+    return attachments, previews
+
+
+async def create_comment_with_files(
+    task_status_map: dict,
+    person_map: dict,
+    task: str | dict,
+    comment: dict,
+    attachments: list[str],
+    previews: list[dict],
+    client_target: KitsuClient,
+    author_id: str | None = None,
+    ledger: TransferLedger | None = None,
+) -> dict:
+    """
+    Create given source comment into target api with its downloaded
+    attachments and previews, which are removed once uploaded. Pushed
+    comments and previews are recorded in the ledger, and a comment the
+    ledger already knows only gets its missing previews.
+
+    Args:
+        task_status_map (dict): A mapping of source TaskStatus IDs to target IDs.
+        person_map (dict): A mapping of source Person IDs to target IDs.
+        task (str / dict): The task to push the comment for.
+        comment (dict): The comment to push.
+        attachments (list): Paths of the attachment files.
+        previews (list): Previews as returned by `download_comment_files`.
+        client_target (KitsuClient): client to push data to target API
+        author_id (str): The ID of the Person to set as the comment author.
+        ledger (TransferLedger): Record of the pushed comments and previews.
+
+    Returns:
+        dict: The created comment.
+    """
+    target_comment_id = None
+    if ledger is not None:
+        target_comment_id = ledger.get("comments", comment["id"])
+    if target_comment_id is not None:
+        comment_target = {"id": target_comment_id}
+    else:
+        task_status = {"id": task_status_map[comment["task_status_id"]]}
+        if author_id is None:
+            author_id = person_map[comment["person_id"]]
+        person = {"id": author_id}
+
+        comment_target = await task_module.add_comment(
+            task,
+            task_status,
+            attachments=attachments,
+            comment=comment["text"],
+            created_at=comment["created_at"],
+            person=person,
+            checklist=comment["checklist"] or [],
+            client=client_target,
+        )
+        if ledger is not None:
+            ledger.record("comments", comment["id"], comment_target["id"])
+
+    for preview in previews:
+        new_preview_file = await task_module.add_preview(
+            task, comment_target, preview["file_path"], client=client_target
+        )
+        await files_module.update_preview(
+            new_preview_file,
+            {"annotations": preview["annotations"]},
+            client=client_target,
+        )
+        if ledger is not None:
+            ledger.record(
+                "preview-files", preview["id"], new_preview_file["id"]
+            )
+        try:
+            os.remove(preview["file_path"])
+        except OSError:
+            pass
+
+    for attachment_path in attachments:
+        try:
+            os.remove(attachment_path)
+        except OSError:
+            pass
+
+    return comment_target
+
+
+async def get_events_since(
+    checkpoint: dict | None,
+    project: str | dict | None = None,
+    limit: int = 1000,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Get the events that occurred since given checkpoint. Events are
+    requested by pages of *limit* events, going back in time until the
+    checkpoint is reached. Pages are bigger when more than *limit* events
+    share the same second.
+
+    Args:
+        checkpoint (dict): Checkpoint returned by `get_sync_checkpoint`. All
+            events are returned when it is None.
+        project (str / dict): Get only events related to this project.
+        limit (int): Number of events to retrieve per request.
+        client (KitsuClient): client to get events from.
+
+    Returns:
+        list[dict]: Events not processed yet, oldest first.
+    """
+    after = None
+    seen_ids = set()
+    if checkpoint is not None:
+        after = checkpoint["created_at"]
+        seen_ids = set(checkpoint["event_ids"])
+    events = {}
+    before = None
+    page_limit = limit
+    while True:
+        page = await get_last_events(
+            limit=page_limit,
+            project=project,
+            after=after,
+            before=before,
+            client=client,
+        )
+        new_events = [event for event in page if event["id"] not in events]
+        for event in new_events:
+            events[event["id"]] = event
+        if len(page) < page_limit:
+            break
+        if new_events:
+            # Dates are filtered to the second: start the next page one
+            # second after the oldest event, already fetched events are
+            # skipped.
+            oldest = min(event["created_at"][:19] for event in page)
+            before = (
+                datetime.datetime.fromisoformat(oldest)
+                + datetime.timedelta(seconds=1)
+            ).isoformat()
+            page_limit = limit
+        else:
+            # The whole page shares the second the previous page started
+            # from: fetch a bigger page from the same date to get past it.
+            page_limit *= 2
+    return sorted(
+        (
+            event
+            for event in events.values()
+            if event["id"] not in seen_ids
+            and (after is None or event["created_at"][:19] >= after)
+        ),
+        key=lambda event: event["created_at"],
+    )
@@ -0,0 +1,661 @@
+"""
+Generate the async domain modules (`gazu.aio.task`, `gazu.aio.asset`...)
+from the source of their sync counterparts, so routes and parameters are
+written once for both flavors. The generated modules are committed: run
+
+    python -m gazu.aio.transform
+
+after changing a sync domain module. With `--check`, nothing is written and
+the command fails if a generated module is out of date (CI runs it).
+
+Each function of a sync domain module is classified:
+
+* functions sending requests, directly or through other domain functions,
+  become coroutines. Calls to the HTTP primitives of `gazu.client` are
+  replaced by awaited calls to the ones of `gazu.aio`, and calls to other
+  request sending functions are awaited too.
+* functions returning `raw.iter_all(...)` return the async iterator of
+  `gazu.aio.iter_all` instead.
+* functions sending no request are imported from the sync module.
+* functions relying on a blocking call that has no async equivalent are
+  left out.
+
+Parameters typed with a sync-only class (like `gazu.sync.SyncContext`)
+are kept in the signature of the async functions, which raise a
+`TypeError` when they are given.
+
+The source of the async functions is the one of the sync functions, edited
+in place, so comments and docstrings are kept. Results of async functions
+are never cached: the `@cache` decorator only applies to the sync
+functions.
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import functools
+import importlib
+import inspect
+import os
+import sys
+import textwrap
+import types
+
+DOMAIN_MODULES = (
+    "asset",
+    "casting",
+    "concept",
+    "context",
+    "edit",
+    "entity",
+    "files",
+    "person",
+    "playlist",
+    "project",
+    "project_template",
+    "scene",
+    "search",
+    "shot",
+    "studio",
+    "sync",
+    "task",
+    "user",
+)
+
+# Helpers of gazu.client that send no request and accept an async client.
+CLIENT_HELPERS = {
+    "build_path_with_params",
+    "get_api_url_from_host",
+    "get_event_host",
+    "get_full_url",
+    "get_host",
+    "url_path_join",
+}
+
+# Blocking helpers and the gazu.aio functions replacing them.
+ASYNC_REPLACEMENTS = {("gazu.helpers", "download_file"): "download_file"}
+
+SYNC = "sync"
+ASYNC = "async"
+ITERATOR = "iterator"
+UNSUPPORTED = "unsupported"
+
+# Classes relying on sync clients, which async functions can't be given.
+SYNC_ONLY_TYPES = {"SyncContext"}
+
+# Name bound to the gazu.aio package in the generated modules.
+AIO_NAME = "aio"
+
+LINE_LENGTH = 79
+
+
+@functools.lru_cache(maxsize=None)
+def get_primitive_statuses() -> dict[str, str]:
+    """
+    Returns:
+        dict: Status of each public function of `gazu.aio`.
+    """
+    import gazu.aio
+
+    statuses = {}
+    for name, value in vars(gazu.aio).items():
+        if inspect.isasyncgenfunction(value):
+            statuses[name] = ITERATOR
+        elif inspect.iscoroutinefunction(value):
+            statuses[name] = ASYNC
+    return statuses
+
+
+@functools.lru_cache(maxsize=None)
+def parse_module(module_name: str) -> tuple[types.ModuleType, dict]:
+    """
+    Returns:
+        tuple: The sync module and the AST of its top level functions.
+    """
+    module = importlib.import_module(module_name)
+    tree = ast.parse(inspect.getsource(module))
+    functions = {
+        node.name: node
+        for node in tree.body
+        if isinstance(node, ast.FunctionDef)
+    }
+    return module, functions
+
+
+def resolve_call(
+    module: types.ModuleType, functions: dict, node: ast.expr
+) -> tuple[str, str] | None:
+    """
+    Returns:
+        tuple: Module name and function name of the function called through
+        given expression, when it can be resolved statically.
+    """
+    if isinstance(node, ast.Name):
+        if node.id in functions:
+            return module.__name__, node.id
+        value = vars(module).get(node.id)
+        if callable(value) and hasattr(value, "__module__"):
+            return value.__module__, getattr(value, "__name__", node.id)
+    elif isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name):
+        value = vars(module).get(node.value.id)
+        if isinstance(value, types.ModuleType):
+            return value.__name__, node.attr
+    return None
+
+
+def get_call_status(target: tuple[str, str] | None, statuses: dict) -> str:
+    if target is None:
+        return SYNC
+    module_name, name = target
+    if module_name == "gazu.client":
+        if name in CLIENT_HELPERS:
+            return SYNC
+        return get_primitive_statuses().get(name, UNSUPPORTED)
+    if target in ASYNC_REPLACEMENTS:
+        return ASYNC
+    return statuses.get(target, SYNC)
+
+
+def get_function_calls(
+    module: types.ModuleType, functions: dict, node: ast.FunctionDef
+) -> list[tuple[tuple[str, str] | None, bool]]:
+    """
+    Returns:
+        list: The functions called by given function, and whether each call
+        is made from a nested scope (nested function, lambda or generator
+        expression) where awaiting is not possible.
+    """
+    calls = []
+
+    def visit(child: ast.AST, nested: bool) -> None:
+        if isinstance(child, ast.Call):
+            calls.append((resolve_call(module, functions, child.func), nested))
+        nested = nested or isinstance(
+            child,
+            (
+                ast.FunctionDef,
+                ast.AsyncFunctionDef,
+                ast.Lambda,
+                ast.GeneratorExp,
+                ast.ClassDef,
+            ),
+        )
+        for grandchild in ast.iter_child_nodes(child):
+            visit(grandchild, nested)
+
+    for child in node.body:
+        visit(child, False)
+    for default in node.args.defaults + node.args.kw_defaults:
+        if default is not None:
+            visit(default, True)
+    return calls
+
+
+def get_function_status(calls: list, statuses: dict) -> str:
+    status = SYNC
+    for target, nested in calls:
+        call_status = get_call_status(target, statuses)
+        if call_status == SYNC:
+            continue
+        if call_status == UNSUPPORTED or nested:
+            return UNSUPPORTED
+        if status not in (SYNC, call_status):
+            return UNSUPPORTED
+        status = call_status
+    return status
+
+
+@functools.lru_cache(maxsize=None)
+def get_function_statuses() -> dict[tuple[str, str], str]:
+    """
+    Classify every function of the domain modules. Statuses are propagated
+    from callee to caller until they don't change anymore.
+
+    Returns:
+        dict: Status of each (module name, function name).
+    """
+    calls = {}
+    for module_name in DOMAIN_MODULES:
+        module, functions = parse_module("gazu." + module_name)
+        for name, node in functions.items():
+            calls[(module.__name__, name)] = [
+                (target, nested)
+                for target, nested in get_function_calls(
+                    module, functions, node
+                )
+                if target is not None
+            ]
+    statuses = {}
+    changed = True
+    while changed:
+        changed = False
+        for key, function_calls in calls.items():
+            status = get_function_status(function_calls, statuses)
+            if statuses.get(key, SYNC) != status:
+                statuses[key] = status
+                changed = True
+    return statuses
+
+
+def is_cache_decorator(module: types.ModuleType, node: ast.expr) -> bool:
+    from gazu.cache import cache
+
+    return isinstance(node, ast.Name) and vars(module).get(node.id) is cache
+
+
+def get_call_edits(
+    module: types.ModuleType,
+    functions: dict,
+    statuses: dict,
+    node: ast.FunctionDef,
+) -> list[tuple[tuple[int, int], tuple[int, int], str]]:
+    """
+    Returns:
+        list: The source edits, as (start, end, text) with positions given
+        as (line, byte offset), awaiting the calls to async functions made
+        by given function and sending the calls to the HTTP primitives of
+        `gazu.client` to the ones of `gazu.aio`. Edits are in visit order,
+        outer calls first.
+    """
+    edits = []
+
+    def visit(child: ast.AST, parent: ast.AST) -> None:
+        if isinstance(child, ast.Call):
+            target = resolve_call(module, functions, child.func)
+            status = get_call_status(target, statuses)
+            if status != SYNC:
+                start = (child.lineno, child.col_offset)
+                end = (child.end_lineno, child.end_col_offset)
+                if status == ASYNC:
+                    # await binds looser than attribute access, subscription
+                    # and calls made on its result.
+                    if (
+                        isinstance(parent, (ast.Attribute, ast.Subscript))
+                        and parent.value is child
+                    ) or (
+                        isinstance(parent, ast.Call) and parent.func is child
+                    ):
+                        edits.append((start, start, "(await "))
+                        edits.append((end, end, ")"))
+                    else:
+                        edits.append((start, start, "await "))
+                if target[0] == "gazu.client" or target in ASYNC_REPLACEMENTS:
+                    func_end = (
+                        child.func.end_lineno,
+                        child.func.end_col_offset,
+                    )
+                    name = ASYNC_REPLACEMENTS.get(target, target[1])
+                    edits.append((start, func_end, f"{AIO_NAME}.{name}"))
+        for grandchild in ast.iter_child_nodes(child):
+            visit(grandchild, child)
+
+    for child in ast.iter_child_nodes(node):
+        visit(child, node)
+    return edits
+
+
+def apply_edits(lines: list[str], edits: list) -> list[str]:
+    """
+    Args:
+        lines (list): Source lines, the first one being line 1.
+        edits (list): Edits as returned by `get_call_edits`, each one on a
+            single line.
+
+    Returns:
+        list: The edited lines.
+    """
+    lines = [line.encode("utf-8") for line in lines]
+    # From the end, so positions stay valid. For edits starting at the same
+    # position, the ones made on inner calls are applied first.
+    ordered = sorted(
+        enumerate(edits), key=lambda item: (item[1][0], item[0]), reverse=True
+    )
+    for _, ((line, start), (end_line, end), text) in ordered:
+        if end_line != line:
+            raise ValueError(f"Edit spanning several lines at line {line}")
+        source = lines[line - 1]
+        lines[line - 1] = source[:start] + text.encode("utf-8") + source[end:]
+    return [line.decode("utf-8") for line in lines]
+
+
+def get_sync_only_parameters(node: ast.FunctionDef) -> list[str]:
+    """
+    Returns:
+        list: Names of the parameters of given function annotated with a
+        sync-only class.
+    """
+    arguments = node.args.posonlyargs + node.args.args + node.args.kwonlyargs
+    return [
+        argument.arg
+        for argument in arguments
+        if argument.annotation is not None
+        and any(
+            isinstance(child, ast.Name) and child.id in SYNC_ONLY_TYPES
+            for child in ast.walk(argument.annotation)
+        )
+    ]
+
+
+def get_sync_only_guard(node: ast.FunctionDef) -> str:
+    """
+    Returns:
+        str: Statements raising a `TypeError` when a sync-only parameter is
+        given to the async version of given function, to insert before its
+        first statement.
+    """
+    indent = " " * node.body[0].col_offset
+    return "".join(
+        f"{indent}if {name} is not None:\n"
+        f"{indent}    raise TypeError(\n"
+        f'{indent}        "{name} is not supported by async {node.name}"\n'
+        f"{indent}    )\n"
+        for name in get_sync_only_parameters(node)
+    )
+
+
+def get_function_source(
+    module: types.ModuleType,
+    functions: dict,
+    statuses: dict,
+    source_lines: list[str],
+    node: ast.FunctionDef,
+    status: str,
+) -> str:
+    """
+    Returns:
+        str: The source of the async version of given function, without its
+        `@cache` decorator.
+    """
+    first_line = min(
+        [node.lineno] + [decorator.lineno for decorator in node.decorator_list]
+    )
+    edits = get_call_edits(module, functions, statuses, node)
+    if status == ASYNC:
+        position = (node.lineno, node.col_offset)
+        edits.insert(0, (position, position, "async "))
+    lines = apply_edits(source_lines, edits)
+    guard = get_sync_only_guard(node)
+    if guard:
+        body = node.body
+        if isinstance(body[0], ast.Expr) and isinstance(
+            body[0].value, ast.Constant
+        ):
+            # After the docstring.
+            lines[body[0].end_lineno - 1] += guard
+        else:
+            lines[body[0].lineno - 2] += guard
+    removed_lines = set()
+    for decorator in node.decorator_list:
+        if is_cache_decorator(module, decorator):
+            removed_lines.update(
+                range(decorator.lineno, decorator.end_lineno + 1)
+            )
+    return "".join(
+        lines[line - 1]
+        for line in range(first_line, node.end_lineno + 1)
+        if line not in removed_lines
+    )
+
+
+def get_used_names(nodes: list[ast.FunctionDef]) -> set[str]:
+    """
+    Returns:
+        set: The names read or written by given functions.
+    """
+    return {
+        child.id
+        for node in nodes
+        for child in ast.walk(node)
+        if isinstance(child, ast.Name)
+    }
+
+
+def get_public_names(tree: ast.Module) -> set[str]:
+    """
+    Returns:
+        set: Public classes and variables defined by given module.
+    """
+    names = set()
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            names.add(node.name)
+        elif isinstance(node, (ast.Assign, ast.AnnAssign)):
+            if isinstance(node, ast.Assign):
+                targets = node.targets
+            else:
+                targets = [node.target]
+            names.update(
+                target.id for target in targets if isinstance(target, ast.Name)
+            )
+    return {name for name in names if not name.startswith("_")}
+
+
+def format_import(source: str, names: list[str]) -> str:
+    line = f"from {source} import {', '.join(names)}"
+    if len(line) <= LINE_LENGTH:
+        return line
+    return "\n".join(
+        [f"from {source} import ("]
+        + [f"    {name}," for name in names]
+        + [")"]
+    )
+
+
+def format_name_import(module_name: str, name: str) -> str:
+    """
+    Returns:
+        str: Import of given module from a `gazu.aio` module, bound to given
+        name. Gazu modules are imported relatively, domain modules from
+        `gazu.aio`.
+    """
+    parts = module_name.split(".")
+    if parts[0] != "gazu":
+        if name == module_name:
+            return f"import {module_name}"
+        return f"import {module_name} as {name}"
+    if len(parts) == 2 and parts[1] in DOMAIN_MODULES:
+        source, module_name = ".", parts[1]
+    else:
+        source, module_name = ".." + ".".join(parts[1:-1]), parts[-1]
+    if name == module_name:
+        return f"from {source} import {module_name}"
+    return f"from {source} import {module_name} as {name}"
+
+
+def get_import_level(line: str) -> int:
+    """
+    Returns:
+        int: Number of leading dots of given `from` import.
+    """
+    source = line.split()[1]
+    return len(source) - len(source.lstrip("."))
+
+
+def get_module_imports(
+    module: types.ModuleType,
+    statuses: dict,
+    names: set[str],
+) -> tuple[list[str], list[str]]:
+    """
+    Sort the names used by the async functions of given sync module by the
+    way they are imported: async domain modules and functions come from
+    `gazu.aio`, the default client has no async equivalent and other names
+    come from the sync module.
+
+    Returns:
+        tuple: Import statements, and assignments.
+    """
+    from gazu.client import default_client
+
+    imports = {"from .. import aio"}
+    assignments = []
+    sync_names = []
+    for name in sorted(names):
+        value = vars(module)[name]
+        if value is default_client:
+            # There is no default async client.
+            assignments.append(f"{name} = None")
+        elif isinstance(value, types.ModuleType):
+            imports.add(format_name_import(value.__name__, name))
+        elif (
+            statuses.get((getattr(value, "__module__", None), name), SYNC)
+            in (ASYNC, ITERATOR)
+            and value.__module__ != module.__name__
+        ):
+            imports.add(format_import("." + value.__module__[5:], [name]))
+        else:
+            sync_names.append(name)
+    if sync_names:
+        imports.add(format_import(".." + module.__name__[5:], sync_names))
+    absolute_imports = sorted(
+        line for line in imports if not line.startswith("from .")
+    )
+    # Relative imports from the top package down.
+    relative_imports = sorted(
+        set(imports) - set(absolute_imports),
+        key=lambda line: (-get_import_level(line), line),
+    )
+    if absolute_imports:
+        absolute_imports.append("")
+    return absolute_imports + relative_imports, assignments
+
+
+def generate_module(module_name: str) -> str:
+    """
+    Args:
+        module_name (str): Name of a sync domain module, like `task`.
+
+    Returns:
+        str: Source of the matching `gazu.aio` module.
+    """
+    module, functions = parse_module("gazu." + module_name)
+    statuses = get_function_statuses()
+    if AIO_NAME in vars(module):
+        raise ValueError(f"{module.__name__} already uses {AIO_NAME}")
+    source = inspect.getsource(module)
+    source_lines = source.splitlines(keepends=True)
+
+    function_statuses = {
+        name: statuses.get((module.__name__, name), SYNC) for name in functions
+    }
+    nodes = [
+        functions[name]
+        for name, status in function_statuses.items()
+        if status in (ASYNC, ITERATOR)
+    ]
+    names = {
+        name
+        for name in get_used_names(nodes)
+        if name in vars(module)
+        and not name.startswith("__")
+        and not is_cache_decorator(module, ast.Name(id=name))
+    }
+    names.update(
+        name
+        for name, status in function_statuses.items()
+        if status == SYNC and not name.startswith("_")
+    )
+    names.update(get_public_names(ast.parse(source)))
+    names.difference_update(
+        name for name, status in function_statuses.items() if status != SYNC
+    )
+    imports, assignments = get_module_imports(module, statuses, names)
+
+    unsupported = get_unsupported_functions(module_name)
+    docstring = f"Async version of `{module.__name__}`."
+    if unsupported:
+        docstring += " Functions without async version: %s." % ", ".join(
+            f"`{name}`" for name in unsupported
+        )
+    public_names = sorted(
+        name
+        for name, status in function_statuses.items()
+        if status != UNSUPPORTED and not name.startswith("_")
+    )
+    parts = [
+        f"# Generated from gazu/{module_name}.py by "
+        "`python -m gazu.aio.transform`,\n# do not edit.\n"
+        '"""\n%s\n"""\n\n' % textwrap.fill(docstring, LINE_LENGTH)
+        + "from __future__ import annotations\n\n"
+        + "\n".join(imports)
+        + "\n"
+    ]
+    if assignments:
+        parts.append("\n".join(assignments) + "\n")
+    parts.append(
+        "__all__ = [\n"
+        + "".join(f'    "{name}",\n' for name in public_names)
+        + "]\n"
+    )
+    for node in nodes:
+        status = function_statuses[node.name]
+        parts.append(
+            get_function_source(
+                module, functions, statuses, source_lines, node, status
+            )
+        )
+    return "\n\n".join(parts)
+
+
+def get_async_module_path(module_name: str) -> str:
+    return os.path.join(os.path.dirname(__file__), module_name + ".py")
+
+
+def get_unsupported_functions(module_name: str) -> list[str]:
+    """
+    Returns:
+        list: Names of the functions of given sync domain module that have no
+        async version.
+    """
+    module_name = "gazu." + module_name.split(".")[-1]
+    return sorted(
+        name
+        for (function_module, name), status in get_function_statuses().items()
+        if function_module == module_name and status == UNSUPPORTED
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Write the generated modules, or check that they are up to date.
+
+    Returns:
+        int: Exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog="python -m gazu.aio.transform",
+        description="Generate the async domain modules of gazu.aio.",
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="fail if a generated module is out of date, without writing",
+    )
+    args = parser.parse_args(argv)
+    outdated = []
+    for module_name in DOMAIN_MODULES:
+        path = get_async_module_path(module_name)
+        source = generate_module(module_name)
+        try:
+            with open(path, encoding="utf-8") as generated_file:
+                current_source = generated_file.read()
+        except FileNotFoundError:
+            current_source = None
+        if current_source == source:
+            continue
+        outdated.append(os.path.relpath(path))
+        if not args.check:
+            with open(path, "w", encoding="utf-8", newline="\n") as file:
+                file.write(source)
+    if args.check and outdated:
+        print(
+            "Outdated async modules, run `python -m gazu.aio.transform`: "
+            + ", ".join(outdated)
+        )
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,8 +1,12 @@
 from __future__ import annotations
 
+from typing import Iterator
 from urllib.parse import urlencode
 
-from .helpers import normalize_model_parameter
+from .helpers import (
+    normalize_model_parameter,
+    normalize_list_of_models_for_links,
+)
 
 from . import client as raw
 from . import project as gazu_project
@@ -51,6 +55,29 @@ def all_assets_for_project(
         return sort_by_name(raw.fetch_all(path, client=client))
 
 
+def iter_assets_for_project(
+    project: str | dict, client: KitsuClient = default
+) -> Iterator[dict]:
+    """
+    Same as `all_assets_for_project` but yield assets while the response is
+    decoded, without holding the whole list in memory. Assets are not
+    sorted.
+
+    Args:
+        project (str / dict): The project dict or the project ID.
+
+    Yields:
+        dict: Assets stored in the database for given project.
+    """
+    project = normalize_model_parameter(project)
+
+    if project is None:
+        return raw.iter_all("assets/all", client=client)
+    else:
+        path = f"projects/{project['id']}/assets"
+        return raw.iter_all(path, client=client)
+
+
 @cache
 def all_assets_for_episode(
     episode: str | dict, client: KitsuClient = default
@@ -151,6 +178,24 @@ def get_asset(asset_id: str, client: KitsuClient = default) -> dict:
     return raw.fetch_one("assets", asset_id, client=client)
 
 
+@cache
+def get_assets(
+    assets: list[str | dict], client: KitsuClient = default
+) -> dict[str, dict]:
+    """
+    Retrieve many assets in a few requests instead of one per asset.
+
+    Args:
+        assets (list): The asset dicts or the asset IDs.
+
+    Returns:
+        dict: Assets by ID. IDs matching no asset are left out.
+    """
+    return raw.fetch_many(
+        "assets", normalize_list_of_models_for_links(assets), client=client
+    )
+
+
 @cache
 def get_asset_url(asset: str | dict, client: KitsuClient = default) -> str:
     """
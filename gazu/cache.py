@@ -1,15 +1,30 @@
 from __future__ import annotations
 
+import base64
 import copy
 import datetime
+import hashlib
 import json
+import os
+import threading
+import time
+import zlib
 
-from functools import wraps
-from typing import Any, Callable
+from collections import OrderedDict
+from functools import lru_cache, wraps
+from types import MappingProxyType
+from typing import Any, Callable, NamedTuple
 from typing_extensions import Literal  # Python 3.7 compatibility.
 
-cache_settings = {"enabled": False}
+cache_settings = {
+    "enabled": False,
+    "immutable": False,
+    "database": None,
+    "reference_index": False,
+}
 cached_functions = []
+# Reference indexed for empty cached lists, which any creation may fill.
+EMPTY_LIST_REF = ""
 
 
 def enable() -> Literal[True]:
@@ -28,6 +43,34 @@ def disable() -> Literal[False]:
     return cache_settings["enabled"]
 
 
+def set_immutable(immutable: bool = True) -> bool:
+    """
+    Make cached functions return read-only values: dicts are returned as
+    mapping proxies and lists as tuples. Values are frozen once when they
+    are stored, so a cache hit returns the stored value as is instead of a
+    deep copy of it. Frozen values can't be modified by the caller and are
+    not JSON serializable as is (see `thaw_value`). With the SQLite store,
+    each hit decodes a new value, which is frozen again: only the deep copy
+    is saved.
+
+    Args:
+        immutable (bool): Whether cached values are returned read-only.
+    """
+    cache_settings["immutable"] = immutable
+    return cache_settings["immutable"]
+
+
+def enable_reference_index() -> None:
+    """
+    Index the IDs referenced by the cached entries, so that invalidations
+    (see `invalidate`) only look at the entries referencing the changed
+    models. Entries cached before are not indexed: they are cleared.
+    """
+    if not cache_settings["reference_index"]:
+        cache_settings["reference_index"] = True
+        clear_all()
+
+
 def clear_all() -> None:
     """
     Clear all cached functions.
@@ -36,84 +79,1157 @@ def clear_all() -> None:
         function.clear_cache()
 
 
-def remove_oldest_entry(memo: dict, maxsize: int) -> Any:
+class SingleFlight(object):
     """
-    Remove the oldest cache entry if there is more value stored than allowed.
+    Coalesce concurrent calls sharing the same key: the first caller runs the
+    function while the others wait for its result (or its exception) instead
+    of running it again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(
+        self, key: Any, function: Callable, *args: Any, **kwargs: Any
+    ) -> tuple[Any, bool]:
+        """
+        Run function for given key, unless a call for the same key is already
+        in flight, in which case its outcome is shared.
+
+        Returns:
+            tuple: The result, and whether it was shared with another caller.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = {"event": threading.Event(), "error": None}
+                self._calls[key] = call
+
+        if not leader:
+            call["event"].wait()
+            if call["error"] is not None:
+                raise call["error"]
+            return call["result"], True
+
+        try:
+            call["result"] = function(*args, **kwargs)
+        except BaseException as exception:
+            call["error"] = exception
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call["event"].set()
+        return call["result"], False
 
-    Params:
-        memo (dict): Cache used for function memoization.
-        maxsize (int): Maximum number of entries for the cache.
+    def __len__(self) -> int:
+        return len(self._calls)
+
+
+def make_cache_key(args: Any, kwargs: Any) -> tuple:
+    """
+    Build a hashable cache key from function call arguments. Dicts, lists and
+    sets are turned into tuples, which is much cheaper than serializing the
+    arguments. The client (the `client` keyword argument, or the default
+    client) is replaced by its identity, so that users sharing a store don't
+    get each other's results.
 
     Returns:
-        Oldest entry for given cache.
+        tuple: generated key
+    """
+    client = kwargs.get("client")
+    if client is None:
+        from . import client as client_module
+
+        client = client_module.default_client
+    kwargs = dict(kwargs, client=get_client_identity(client))
+    return (
+        tuple(freeze_key_value(arg) for arg in args),
+        tuple(
+            sorted(
+                (name, freeze_key_value(value))
+                for name, value in kwargs.items()
+            )
+        ),
+    )
+
+
+class ClientIdentity(NamedTuple):
+    """
+    Part of the cache keys identifying the client of a call.
     """
-    oldest_entry = None
-    if maxsize > 0 and len(memo) > maxsize:
-        oldest_entry_key = list(memo.keys())[0]
-        for entry_key in memo.keys():
-            oldest_date = memo[oldest_entry_key]["date_accessed"]
-            if memo[entry_key]["date_accessed"] < oldest_date:
-                oldest_entry_key = entry_key
-        memo.pop(oldest_entry_key)
-    return oldest_entry
 
+    host: str | None
+    user: str | None
 
-def get_cache_key(args: Any, kwargs: Any) -> str:
+
+def get_client_identity(client: Any) -> ClientIdentity | None:
     """
-    Serialize arguments to get a cache key. It will be used to store function
-    results.
+    Args:
+        client (KitsuClient): A client.
 
     Returns:
-        str: generated key
+        ClientIdentity: The host of given client and the identity of its user
+        (see `get_token_identity`).
     """
-    kwargscopy = kwargs.copy()
-    if "client" in kwargscopy:
-        kwargscopy["client"] = kwargscopy["client"].host
-    if len(args) == 0 and len(kwargscopy) == 0:
-        return ""
-    elif len(args) == 0:
-        return json.dumps(kwargscopy)
-    elif len(kwargscopy.keys()) == 0:
-        return json.dumps(args)
-    else:
-        return json.dumps([args, kwargscopy])
+    if client is None:
+        return None
+    tokens = getattr(client, "tokens", None) or {}
+    return ClientIdentity(
+        getattr(client, "host", None),
+        get_token_identity(tokens.get("access_token")),
+    )
+
+
+@lru_cache(maxsize=64)
+def get_token_identity(token: str | None) -> str | None:
+    """
+    Args:
+        token (str): An access token.
+
+    Returns:
+        str: A hash of the user the token was issued to (the `sub` claim of
+        the JWT), so that refreshed tokens keep the same identity. Tokens
+        that can't be decoded are hashed as a whole.
+    """
+    if not isinstance(token, str) or not token:
+        return None
+    identity = None
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        identity = claims.get("sub") or claims.get("identity")
+    except (AttributeError, IndexError, ValueError):
+        pass
+    if identity is None:
+        identity = token
+    return hashlib.sha256(str(identity).encode("utf-8")).hexdigest()[:16]
+
+
+def freeze_key_value(value: Any) -> Any:
+    """
+    Args:
+        value: A function argument.
+
+    Returns:
+        A hashable equivalent of given value.
+    """
+    if isinstance(value, dict):
+        return (
+            dict,
+            tuple(
+                sorted(
+                    (
+                        (key, freeze_key_value(item))
+                        for key, item in value.items()
+                    ),
+                    key=lambda item: str(item[0]),
+                )
+            ),
+        )
+    elif isinstance(value, (list, tuple)):
+        return tuple(freeze_key_value(item) for item in value)
+    elif isinstance(value, (set, frozenset)):
+        # Sorted so the key representation is stable between processes.
+        return (
+            frozenset,
+            tuple(
+                sorted((freeze_key_value(item) for item in value), key=repr)
+            ),
+        )
+    return value
+
+
+class MemoryCacheStore(object):
+    """
+    In-memory store for cached function results, evicting the least recently
+    used entries first.
+
+    Entries are spread over shards, each one being an ordered dict guarded by
+    its own lock, so threads reading different keys don't wait for each
+    other. Lookups, insertions and evictions are O(1). Stores with a small
+    max size use a single shard, which keeps the eviction order exact.
+
+    Once `enable_reference_index` is called, the IDs referenced by each
+    entry are indexed when it is stored, so that invalidations only look at
+    the entries referencing the changed models.
+    """
+
+    entries_per_shard = 1024
+    max_shards = 16
+
+    def __init__(self, maxsize: int = 300, shards: int | None = None) -> None:
+        self.maxsize = maxsize
+        self._shards = []
+        # Referenced ID -> keys, and key -> (referenced IDs, is a list).
+        self._refs = {}
+        self._key_refs = {}
+        self._refs_lock = threading.Lock()
+        self._build_shards(shards)
+
+    def _build_shards(self, shards: int | None = None) -> None:
+        if shards is None:
+            shards = min(
+                max(self.maxsize // self.entries_per_shard, 1),
+                self.max_shards,
+            )
+        self._shards = [
+            (OrderedDict(), threading.Lock()) for _ in range(shards)
+        ]
+        self._shard_maxsize = 0
+        if self.maxsize > 0:
+            self._shard_maxsize = -(-self.maxsize // shards)
+
+    def _get_shard(self, key: Any) -> tuple[OrderedDict, threading.Lock]:
+        return self._shards[hash(key) % len(self._shards)]
+
+    @property
+    def shards(self) -> int:
+        return len(self._shards)
+
+    def get(self, key: Any) -> dict | None:
+        """
+        Returns:
+            dict: The entry (value and insertion date) stored for given key,
+            or None. The entry is marked as the most recently used.
+        """
+        entries, lock = self._get_shard(key)
+        with lock:
+            entry = entries.get(key)
+            if entry is not None:
+                entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Any, value: Any) -> dict:
+        """
+        Store a value for given key and evict the least recently used entries
+        if the store is full.
+
+        Returns:
+            dict: The stored entry.
+        """
+        entry = {"date_accessed": datetime.datetime.now(), "value": value}
+        refs = None
+        if cache_settings["reference_index"]:
+            refs, is_list = get_entry_refs(key, value)
+        entries, lock = self._get_shard(key)
+        with lock:
+            entries[key] = entry
+            entries.move_to_end(key)
+            if refs is not None:
+                self._index(key, refs, is_list)
+            if self._shard_maxsize:
+                while len(entries) > self._shard_maxsize:
+                    old_key, _ = entries.popitem(last=False)
+                    self._unindex(old_key)
+        return entry
+
+    def freeze(self, key: Any, entry: dict) -> Any:
+        """
+        Freeze the value of an entry got for given key. The frozen value
+        replaces the stored one, under the lock of its shard, so the value
+        of an entry is frozen only once.
+
+        Returns:
+            The frozen value.
+        """
+        _, lock = self._get_shard(key)
+        with lock:
+            if not entry.get("frozen", False):
+                # The flag is set first: a reader seeing the frozen value
+                # also sees the flag, and thaws it instead of copying it.
+                entry["frozen"] = True
+                entry["value"] = freeze_value(entry["value"])
+            return entry["value"]
+
+    def pop(self, key: Any) -> dict | None:
+        """
+        Remove the entry stored for given key.
+
+        Returns:
+            dict: The removed entry, or None.
+        """
+        entries, lock = self._get_shard(key)
+        with lock:
+            entry = entries.pop(key, None)
+            if entry is not None:
+                self._unindex(key)
+            return entry
+
+    def get_referencing_keys(
+        self, ids: set[str], lists_only: bool = False
+    ) -> set:
+        """
+        Args:
+            ids (set): IDs to look for.
+            lists_only (bool): Whether only the keys of cached lists are
+                returned, empty lists included.
+
+        Returns:
+            set: Keys of the entries referencing one of given IDs.
+        """
+        if lists_only:
+            ids = set(ids) | {EMPTY_LIST_REF}
+        keys = set()
+        with self._refs_lock:
+            for ref in ids:
+                keys.update(self._refs.get(ref, ()))
+            if lists_only:
+                keys = {key for key in keys if self._key_refs[key][1]}
+        return keys
+
+    def _index(self, key: Any, refs: set[str], is_list: bool) -> None:
+        with self._refs_lock:
+            self._unindex_locked(key)
+            self._key_refs[key] = (refs, is_list)
+            for ref in refs:
+                self._refs.setdefault(ref, set()).add(key)
+
+    def _unindex(self, key: Any) -> None:
+        with self._refs_lock:
+            self._unindex_locked(key)
+
+    def _unindex_locked(self, key: Any) -> None:
+        refs, _ = self._key_refs.pop(key, ((), False))
+        for ref in refs:
+            keys = self._refs.get(ref)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._refs[ref]
+
+    def items(self) -> list[tuple[Any, dict]]:
+        """
+        Returns:
+            list: A snapshot of the stored (key, entry) pairs.
+        """
+        items = []
+        for entries, lock in self._shards:
+            with lock:
+                items.extend(entries.items())
+        return items
+
+    def clear(self) -> None:
+        for entries, lock in self._shards:
+            with lock:
+                entries.clear()
+        with self._refs_lock:
+            self._refs.clear()
+            self._key_refs.clear()
+
+    def set_max_size(self, maxsize: int) -> None:
+        """
+        Change the maximum number of entries. Entries are spread again over
+        a number of shards matching the new size.
+        """
+        items = self.items()
+        self.maxsize = maxsize
+        self._build_shards()
+        for key, entry in items:
+            entries, _ = self._get_shard(key)
+            entries[key] = entry
+        for entries, _ in self._shards:
+            while self._shard_maxsize and len(entries) > self._shard_maxsize:
+                key, _ = entries.popitem(last=False)
+                self._unindex(key)
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries, _ in self._shards)
+
+
+class ResponseCache(object):
+    """
+    Store the bodies of responses sent with validators (ETag or
+    Last-Modified) so that the next request for the same URL can be made
+    conditional: when the server answers 304 Not Modified, the stored body is
+    served instead of downloading it again.
+
+    The total size of the stored bodies is bounded, least recently used
+    responses are evicted first.
+    """
+
+    def __init__(self, max_bytes: int = 16 * 1024 * 1024) -> None:
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.stats = {"hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_conditional_headers(self, key: Any) -> dict[str, str]:
+        """
+        Returns:
+            dict: The If-None-Match / If-Modified-Since headers to send for
+            given key, empty if no response is stored for it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+        headers = {}
+        if entry is not None:
+            if entry["etag"]:
+                headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def get(self, key: Any) -> dict | None:
+        """
+        Returns:
+            dict: The stored entry (content, encoding and validators) for
+            given key, or None. The entry is marked as the most recently
+            used and counted as a hit.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+            else:
+                self._entries.move_to_end(key)
+                self.stats["hits"] += 1
+            return entry
+
+    def set(
+        self,
+        key: Any,
+        content: bytes,
+        encoding: str | None = None,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ) -> bool:
+        """
+        Store a response body with its validators. Responses without
+        validators or bigger than the whole budget are not stored.
+
+        Returns:
+            bool: Whether the response was stored.
+        """
+        if not etag and not last_modified:
+            self.pop(key)
+            return False
+        size = len(content)
+        with self._lock:
+            old_entry = self._entries.pop(key, None)
+            if old_entry is not None:
+                self.current_bytes -= len(old_entry["content"])
+            if size > self.max_bytes:
+                return False
+            self._entries[key] = {
+                "content": content,
+                "encoding": encoding,
+                "etag": etag,
+                "last_modified": last_modified,
+            }
+            self.current_bytes += size
+            self.stats["stores"] += 1
+            while self.current_bytes > self.max_bytes:
+                _, entry = self._entries.popitem(last=False)
+                self.current_bytes -= len(entry["content"])
+                self.stats["evictions"] += 1
+        return True
+
+    def pop(self, key: Any) -> dict | None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.current_bytes -= len(entry["content"])
+            return entry
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.current_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteCacheDatabase(object):
+    """
+    Cache storage backed by a local SQLite file, shared by all the processes
+    of a host that use the same path. Each cached function reads and writes
+    its own namespace through a `SQLiteCacheStore`.
+
+    Values are stored as zlib-compressed JSON. SQLite file locking makes
+    concurrent access from several processes safe, and the WAL journal lets
+    readers run while another process writes. Each thread gets its own
+    connection.
+    """
+
+    evict_every = 64
+
+    def __init__(
+        self,
+        path: str,
+        max_entries: int = 100000,
+        max_bytes: int | None = None,
+        ttl: int | None = None,
+        timeout: float = 30.0,
+    ) -> None:
+        """
+        Args:
+            path (str): Location of the database file.
+            max_entries (int): Maximum number of entries for all functions.
+            max_bytes (int): Maximum size of the stored values, in bytes.
+            ttl (int): Time to live in seconds of stored values, on top of the
+                expiration time of each function.
+            timeout (float): Seconds to wait for a lock held by another
+                process.
+        """
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.timeout = timeout
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._writes = 0
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self.connect() as connection:
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_entries ("
+                "namespace TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "value BLOB NOT NULL, "
+                "created_at REAL NOT NULL, "
+                "accessed_at REAL NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_entries_accessed_at "
+                "ON cache_entries (accessed_at)"
+            )
+            # IDs referenced by each entry, see `get_referenced_ids`.
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache_refs ("
+                "namespace TEXT NOT NULL, "
+                "key TEXT NOT NULL, "
+                "ref TEXT NOT NULL, "
+                "is_list INTEGER NOT NULL, "
+                "PRIMARY KEY (namespace, key, ref))"
+            )
+            connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_refs_ref "
+                "ON cache_refs (namespace, ref)"
+            )
+            connection.execute(
+                "CREATE TRIGGER IF NOT EXISTS cache_entries_delete_refs "
+                "AFTER DELETE ON cache_entries BEGIN "
+                "DELETE FROM cache_refs "
+                "WHERE namespace = old.namespace AND key = old.key; END"
+            )
+
+    def connect(self):
+        """
+        Returns:
+            sqlite3.Connection: The connection of the current thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            import sqlite3
+
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def close(self) -> None:
+        """
+        Close the connection of the current thread.
+        """
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+    def get_store(self, namespace: str, maxsize: int = 0) -> SQLiteCacheStore:
+        """
+        Args:
+            namespace (str): Name of the cached function.
+            maxsize (int): Maximum number of entries for this namespace.
+
+        Returns:
+            SQLiteCacheStore: A store reading and writing given namespace.
+        """
+        return SQLiteCacheStore(self, namespace, maxsize)
+
+    def evict(self, namespace: str | None = None, maxsize: int = 0) -> None:
+        """
+        Remove expired entries, then the least recently used ones until the
+        size limits are respected.
+        """
+        with self.connect() as connection:
+            if self.ttl:
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE created_at < ?",
+                    (time.time() - self.ttl,),
+                )
+            if namespace is not None and maxsize > 0:
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key IN "
+                    "(SELECT key FROM cache_entries WHERE namespace = ? "
+                    "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (namespace, namespace, maxsize),
+                )
+            if self.max_entries:
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE rowid IN "
+                    "(SELECT rowid FROM cache_entries "
+                    "ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            if self.max_bytes:
+                rows = connection.execute(
+                    "SELECT rowid, length(value) FROM cache_entries "
+                    "ORDER BY accessed_at DESC"
+                ).fetchall()
+                total = 0
+                to_delete = []
+                for rowid, size in rows:
+                    total += size
+                    if total > self.max_bytes:
+                        to_delete.append((rowid,))
+                connection.executemany(
+                    "DELETE FROM cache_entries WHERE rowid = ?", to_delete
+                )
+
+    def count_write(self) -> bool:
+        """
+        Returns:
+            bool: True when enough writes happened to run an eviction.
+        """
+        with self._lock:
+            self._writes += 1
+            return self._writes % self.evict_every == 0
+
+
+class StoredKey(str):
+    """
+    Representation of a cache key as stored in a `SQLiteCacheStore`.
+    """
+
+
+def get_stored_key(key: Any) -> str:
+    """
+    Returns:
+        str: The text stored in database for given cache key.
+    """
+    if isinstance(key, StoredKey):
+        return key
+    return repr(key)
+
+
+class SQLiteCacheStore(object):
+    """
+    Store for the results of a single cached function, in a namespace of a
+    `SQLiteCacheDatabase`. It has the same interface as `MemoryCacheStore`.
+    The IDs referenced by each entry are indexed in the `cache_refs` table
+    once `enable_reference_index` is called.
+    """
+
+    shards = 1
+    # Access dates are refreshed at most once per interval to limit writes.
+    touch_interval = 60
+
+    def __init__(
+        self, database: SQLiteCacheDatabase, namespace: str, maxsize: int = 0
+    ) -> None:
+        self.database = database
+        self.namespace = namespace
+        self.maxsize = maxsize
+
+    def get(self, key: Any) -> dict | None:
+        now = time.time()
+        key = get_stored_key(key)
+        with self.database.connect() as connection:
+            row = connection.execute(
+                "SELECT value, created_at, accessed_at FROM cache_entries "
+                "WHERE namespace = ? AND key = ?",
+                (self.namespace, key),
+            ).fetchone()
+            if row is None:
+                return None
+            value, created_at, accessed_at = row
+            if self.database.ttl and created_at < now - self.database.ttl:
+                connection.execute(
+                    "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                    (self.namespace, key),
+                )
+                return None
+            if accessed_at < now - self.touch_interval:
+                connection.execute(
+                    "UPDATE cache_entries SET accessed_at = ? "
+                    "WHERE namespace = ? AND key = ?",
+                    (now, self.namespace, key),
+                )
+        return {
+            "date_accessed": datetime.datetime.fromtimestamp(created_at),
+            "value": decode_value(value),
+        }
+
+    def set(self, key: Any, value: Any) -> dict:
+        now = time.time()
+        entry = {
+            "date_accessed": datetime.datetime.fromtimestamp(now),
+            "value": value,
+        }
+        try:
+            data = encode_value(value)
+        except (TypeError, ValueError):
+            # Values that can't be serialized are returned but not stored.
+            return entry
+        stored_key = get_stored_key(key)
+        index_refs = cache_settings["reference_index"]
+        with self.database.connect() as connection:
+            if index_refs:
+                connection.execute(
+                    "DELETE FROM cache_refs WHERE namespace = ? AND key = ?",
+                    (self.namespace, stored_key),
+                )
+            connection.execute(
+                "INSERT OR REPLACE INTO cache_entries "
+                "(namespace, key, value, created_at, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, stored_key, data, now, now),
+            )
+            if index_refs:
+                refs, is_list = get_entry_refs(key, value)
+                connection.executemany(
+                    "INSERT INTO cache_refs (namespace, key, ref, is_list) "
+                    "VALUES (?, ?, ?, ?)",
+                    [
+                        (self.namespace, stored_key, ref, is_list)
+                        for ref in refs
+                    ],
+                )
+        if self.database.count_write():
+            self.database.evict(self.namespace, self.maxsize)
+        return entry
+
+    def freeze(self, key: Any, entry: dict) -> Any:
+        """
+        Freeze the value of an entry got for given key. Each `get` decodes
+        a new entry, owned by the caller, so no lock is needed but the value
+        is frozen again on every hit, in a time proportional to its size:
+        immutable mode only saves the deep copy of the value.
+
+        Returns:
+            The frozen value.
+        """
+        entry["value"] = freeze_value(entry["value"])
+        entry["frozen"] = True
+        return entry["value"]
+
+    def pop(self, key: Any) -> dict | None:
+        entry = self.get(key)
+        with self.database.connect() as connection:
+            connection.execute(
+                "DELETE FROM cache_entries WHERE namespace = ? AND key = ?",
+                (self.namespace, get_stored_key(key)),
+            )
+        return entry
 
+    def get_referencing_keys(
+        self, ids: set[str], lists_only: bool = False
+    ) -> set[StoredKey]:
+        """
+        Args:
+            ids (set): IDs to look for.
+            lists_only (bool): Whether only the keys of cached lists are
+                returned, empty lists included.
 
-def insert_value(
-    function: Callable, cache_store: dict, args: Any, kwargs: Any
+        Returns:
+            set: Keys of the entries referencing one of given IDs.
+        """
+        ids = list(ids)
+        if lists_only:
+            ids.append(EMPTY_LIST_REF)
+        keys = set()
+        with self.database.connect() as connection:
+            # Stay below the SQLite limit of bound parameters.
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                query = (
+                    "SELECT DISTINCT key FROM cache_refs "
+                    "WHERE namespace = ? AND ref IN (%s)"
+                    % ", ".join("?" * len(chunk))
+                )
+                if lists_only:
+                    query += " AND is_list = 1"
+                rows = connection.execute(query, [self.namespace] + chunk)
+                keys.update(StoredKey(key) for key, in rows)
+        return keys
+
+    def items(self) -> list[tuple[str, dict]]:
+        """
+        Returns:
+            list: The stored (key, entry) pairs. Keys are the representation
+            of the original cache keys.
+        """
+        with self.database.connect() as connection:
+            rows = connection.execute(
+                "SELECT key, value, created_at FROM cache_entries "
+                "WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchall()
+        return [
+            (
+                StoredKey(key),
+                {
+                    "date_accessed": datetime.datetime.fromtimestamp(created),
+                    "value": decode_value(value),
+                },
+            )
+            for key, value, created in rows
+        ]
+
+    def clear(self) -> None:
+        with self.database.connect() as connection:
+            connection.execute(
+                "DELETE FROM cache_entries WHERE namespace = ?",
+                (self.namespace,),
+            )
+
+    def set_max_size(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self.database.evict(self.namespace, maxsize)
+
+    def __len__(self) -> int:
+        with self.database.connect() as connection:
+            return connection.execute(
+                "SELECT COUNT(*) FROM cache_entries WHERE namespace = ?",
+                (self.namespace,),
+            ).fetchone()[0]
+
+
+def encode_value(value: Any) -> bytes:
+    """
+    Args:
+        value: A value returned by a cached function.
+
+    Returns:
+        bytes: Compact serialization of given value (compressed JSON).
+    """
+    data = json.dumps(value, separators=(",", ":"), default=_encode_default)
+    return zlib.compress(data.encode("utf-8"))
+
+
+def decode_value(data: bytes) -> Any:
+    """
+    Args:
+        data (bytes): A value serialized with `encode_value`.
+
+    Returns:
+        The deserialized value.
+    """
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def _encode_default(value: Any) -> Any:
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def use_persistent_store(
+    path: str,
+    max_entries: int = 100000,
+    max_bytes: int | None = None,
+    ttl: int | None = None,
+) -> SQLiteCacheDatabase:
+    """
+    Store the results of all cached functions in a SQLite file instead of
+    memory. All the processes using the same path share the stored results,
+    so a cache warmed by one process serves the others.
+
+    Args:
+        path (str): Location of the database file.
+        max_entries (int): Maximum number of entries for all functions.
+        max_bytes (int): Maximum size of the stored values, in bytes.
+        ttl (int): Time to live in seconds of stored values.
+
+    Returns:
+        SQLiteCacheDatabase: The database used by the cached functions.
+    """
+    database = SQLiteCacheDatabase(
+        path, max_entries=max_entries, max_bytes=max_bytes, ttl=ttl
+    )
+    cache_settings["database"] = database
+    for function in cached_functions:
+        function.set_cache_store(create_store(function))
+    return database
+
+
+def use_memory_store() -> None:
+    """
+    Store the results of all cached functions in memory (default).
+    """
+    cache_settings["database"] = None
+    for function in cached_functions:
+        function.set_cache_store(create_store(function))
+
+
+def create_store(function: Callable) -> MemoryCacheStore | SQLiteCacheStore:
+    """
+    Args:
+        function (func): A cached function.
+
+    Returns:
+        The store matching current settings for given cached function.
+    """
+    maxsize = function.get_cache_infos()["maxsize"]
+    database = cache_settings["database"]
+    if database is None:
+        return MemoryCacheStore(maxsize)
+    return database.get_store(function.cache_name, maxsize)
+
+
+def invalidate(
+    ids: list[str] | set[str],
+    function_filter: Callable[[Callable], bool] | None = None,
+    lists_only: bool = False,
+) -> int:
+    """
+    Remove, from every cached function, the entries that reference one of
+    given IDs, either in the call arguments or in the cached result (the
+    result itself or one of the records it lists). Entries are found with
+    the reference index when it is enabled (see `enable_reference_index`),
+    by scanning the stores otherwise.
+
+    Args:
+        ids (list): IDs of the changed models.
+        function_filter (func): If set, only the cached functions for which
+            it returns True are considered.
+        lists_only (bool): Whether only cached lists are considered. Empty
+            lists are then removed too.
+
+    Returns:
+        int: Number of removed entries.
+    """
+    ids = set(ids)
+    removed = 0
+    if not ids and not lists_only:
+        return removed
+    for function in list(cached_functions):
+        if function_filter is None or function_filter(function):
+            removed += function.invalidate_cache(ids, lists_only)
+    return removed
+
+
+def invalidate_for_event(event_name: str, data: dict | None) -> int:
+    """
+    Remove the cache entries affected by a Kitsu event, like `task:update`
+    or `shot:new`.
+
+    For updates and deletions (and any other action), the entries that
+    reference the changed model are removed. For creations, the entries of
+    the functions related to the model type that reference one of the IDs of
+    the event (the parent project for instance) are removed, as the new
+    model may belong to them: only cached lists are concerned.
+
+    Args:
+        event_name (str): Name of the event (`model-type:action`).
+        data (dict): Event payload.
+
+    Returns:
+        int: Number of removed entries.
+    """
+    if ":" not in event_name or not isinstance(data, dict):
+        return 0
+    model_type, action = event_name.split(":", 1)
+    model_type = model_type.replace("-", "_")
+    model_id = data.get(f"{model_type}_id") or data.get("id")
+
+    if action == "new":
+        ids = {
+            value
+            for key, value in data.items()
+            if (key == "id" or key.endswith("_id")) and isinstance(value, str)
+        }
+        return invalidate(
+            ids,
+            function_filter=lambda function: f"_{model_type}"
+            in f"_{function.__name__}",
+            lists_only=True,
+        )
+    elif isinstance(model_id, str):
+        return invalidate({model_id})
+    return 0
+
+
+def get_entry_refs(key: Any, value: Any) -> tuple[set[str], bool]:
+    """
+    Returns:
+        tuple: The references to index for a cache entry (see
+        `get_referenced_ids`, `EMPTY_LIST_REF` for empty lists) and whether
+        its value is a list.
+    """
+    refs = get_referenced_ids(key, value)
+    is_list = isinstance(value, (list, tuple))
+    if is_list and not value:
+        refs.add(EMPTY_LIST_REF)
+    return refs, is_list
+
+
+def find_referencing_keys(
+    items: list[tuple[Any, dict]], ids: set[str], lists_only: bool = False
+) -> set:
+    """
+    Scan given store items for the entries referencing one of given IDs,
+    for stores whose references are not indexed.
+
+    Returns:
+        set: Keys of the matching entries, like `get_referencing_keys`.
+    """
+    if lists_only:
+        ids = set(ids) | {EMPTY_LIST_REF}
+    keys = set()
+    for key, entry in items:
+        refs, is_list = get_entry_refs(key, entry["value"])
+        if (is_list or not lists_only) and not refs.isdisjoint(ids):
+            keys.add(key)
+    return keys
+
+
+def get_referenced_ids(key: Any, value: Any) -> set[str]:
+    """
+    Args:
+        key: A cache key.
+        value: The cached value.
+
+    Returns:
+        set: The strings of the key (the call arguments, except the client)
+        and the IDs of the value, read as a model or as a list of models:
+        the `id` and `*_id` fields, and the items of lists of IDs.
+    """
+    refs = set()
+    _add_key_refs(key, refs)
+    if isinstance(value, (dict, MappingProxyType)):
+        _add_model_refs(value, refs)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            if isinstance(item, (dict, MappingProxyType)):
+                _add_model_refs(item, refs)
+    elif isinstance(value, str):
+        refs.add(value)
+    refs.discard(EMPTY_LIST_REF)
+    return refs
+
+
+def _add_key_refs(key: Any, refs: set[str]) -> None:
+    if isinstance(key, str):
+        refs.add(key)
+    elif isinstance(key, (tuple, frozenset)) and not isinstance(
+        key, ClientIdentity
+    ):
+        for item in key:
+            _add_key_refs(item, refs)
+
+
+def _add_model_refs(model: dict, refs: set[str]) -> None:
+    for field, field_value in model.items():
+        if isinstance(field_value, str):
+            if field == "id" or field.endswith("_id"):
+                refs.add(field_value)
+        elif isinstance(field_value, (list, tuple)):
+            refs.update(item for item in field_value if is_id(item))
+
+
+def is_id(value: Any) -> bool:
+    """
+    Returns:
+        bool: True if given value looks like a model ID (an UUID).
+    """
+    return (
+        isinstance(value, str)
+        and len(value) == 36
+        and value[8] == value[13] == value[18] == value[23] == "-"
+    )
+
+
+def freeze_value(value: Any) -> Any:
+    """
+    Args:
+        value: A value returned by a cached function.
+
+    Returns:
+        A read-only equivalent of given value: dicts become mapping proxies,
+        lists become tuples and sets become frozensets.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return MappingProxyType(
+            {key: freeze_value(item) for key, item in value.items()}
+        )
+    elif isinstance(value, (list, tuple)):
+        return tuple(freeze_value(item) for item in value)
+    elif isinstance(value, (set, frozenset)):
+        return frozenset(freeze_value(item) for item in value)
+    return value
+
+
+def thaw_value(value: Any) -> Any:
+    """
+    Args:
+        value: A value frozen by `freeze_value`.
+
+    Returns:
+        A mutable copy of given value, made of dicts and lists.
+    """
+    if isinstance(value, (dict, MappingProxyType)):
+        return {key: thaw_value(item) for key, item in value.items()}
+    elif isinstance(value, (list, tuple)):
+        return [thaw_value(item) for item in value]
+    elif isinstance(value, frozenset):
+        return {thaw_value(item) for item in value}
+    return value
+
+
+def get_entry_value(
+    cache_store: "MemoryCacheStore | SQLiteCacheStore",
+    key: Any,
+    entry: dict,
+    immutable: bool,
 ) -> Any:
     """
-    Serialize function call arguments and store function result in given cache
-    store.
+    Get the value to return for a cache entry. In immutable mode, the value
+    is frozen by the store the first time and then returned as is.
+    Otherwise a copy is returned, so the caller can't alter the cache.
 
     Args:
-        function (func): The function to cache value for.
-        cache_store (dict): The cache which will contain the value to cache.
-        args, kwargs: The arguments for which a cache must be set.
+        cache_store (MemoryCacheStore|SQLiteCacheStore): The store of the
+            entry.
+        key: The cache key of the entry.
+        entry (dict): A cache entry.
+        immutable (bool): Whether the value must be returned read-only.
 
     Returns:
-        The cached value.
+        The value to return to the caller.
     """
-    returned_value = function(*args, **kwargs)
-    key = get_cache_key(args, kwargs)
-    cache_store[key] = {
-        "date_accessed": datetime.datetime.now(),
-        "value": returned_value,
-    }
-    return get_value(cache_store, key)
+    if immutable:
+        return cache_store.freeze(key, entry)
+    # The value is read before the flag, which is set before the value is
+    # replaced by its frozen version.
+    value = entry["value"]
+    if entry.get("frozen", False):
+        return thaw_value(value)
+    else:
+        return copy.deepcopy(value)
 
 
-def get_value(cache_store: dict, key: str) -> Any:
+def is_cache_immutable(state: dict) -> bool:
     """
-    It generates a deep copy of the requested value. It's needed because if a
-    pointer is returned, the value can be changed. Which leads to a modified
-    cache and unexpected results.
+    Args:
+        state: The state describing the cache state.
 
     Returns:
-        Value matching given key inside given cache store
+        True if cached values are returned read-only for given state.
     """
-    value = cache_store[key]["value"]
-    return copy.deepcopy(value)
+    if state.get("immutable") is None:
+        return cache_settings["immutable"]
+    return state["immutable"]
 
 
 def is_cache_enabled(state: dict) -> bool:
@@ -127,23 +1243,28 @@ def is_cache_enabled(state: dict) -> bool:
     return cache_settings["enabled"] and state["enabled"]
 
 
-def is_cache_expired(memo: dict, state: dict, key: str) -> bool:
+def is_entry_expired(entry: dict, expire: int) -> bool:
     """
-    Check if cache is expired (outdated) for given wrapper state and cache key.
-
     Args:
-        memo (dict): The function cache
-        state (dict): The parameters of the cache (enabled, expire, maxsize)
-        key: The key to check
+        entry (dict): A cache entry (value and insertion date).
+        expire (int): Time to live in seconds, 0 meaning no expiration.
 
     Returns:
-        True if cache value is expired.
+        True if given entry is expired.
+    """
+    if expire <= 0:
+        return False
+    date_to_check = entry["date_accessed"] + datetime.timedelta(seconds=expire)
+    return date_to_check < datetime.datetime.now()
+
 
+def get_function_name(function: Callable) -> str:
     """
-    date = memo[key]["date_accessed"]
-    expire = state["expire"]
-    date_to_check = date + datetime.timedelta(seconds=expire)
-    return expire > 0 and date_to_check < datetime.datetime.now()
+    Returns:
+        str: Full name of given function, used as a namespace by stores shared
+        between functions.
+    """
+    return f"{function.__module__}.{function.__qualname__}"
 
 
 def cache(
@@ -159,19 +1280,57 @@ def cache(
         maxsize: Number of value stored in cache (300 by default).
         expire: Time to live in seconds of stored value (disabled by default)
     """
-    cache_store = {}
-    state = {"enabled": True, "expire": expire, "maxsize": maxsize}
+    cache_store = MemoryCacheStore(maxsize)
+    if cache_settings["database"] is not None:
+        cache_store = cache_settings["database"].get_store(
+            get_function_name(function), maxsize
+        )
+    state = {
+        "enabled": True,
+        "expire": expire,
+        "maxsize": maxsize,
+        "immutable": None,
+    }
 
     statistics = {"hits": 0, "misses": 0, "expired_hits": 0}
+    statistics_lock = threading.Lock()
+    in_flight = SingleFlight()
+
+    def load_entry(key: Any, args: Any, kwargs: Any) -> dict:
+        return cache_store.set(key, function(*args, **kwargs))
+
+    def count(statistic: str) -> None:
+        with statistics_lock:
+            statistics[statistic] += 1
 
     def clear_cache() -> None:
         cache_store.clear()
 
+    def invalidate_cache(ids: set[str], lists_only: bool = False) -> int:
+        removed = 0
+        if cache_settings["reference_index"]:
+            keys = cache_store.get_referencing_keys(ids, lists_only)
+        else:
+            keys = find_referencing_keys(cache_store.items(), ids, lists_only)
+        for key in keys:
+            if cache_store.pop(key) is not None:
+                removed += 1
+        return removed
+
+    def set_cache_store(store: MemoryCacheStore | SQLiteCacheStore) -> None:
+        nonlocal cache_store
+        cache_store = store
+
     def get_cache_infos() -> dict:
-        size = {"current_size": len(cache_store)}
+        size = {
+            "current_size": len(cache_store),
+            "shards": cache_store.shards,
+            "store": type(cache_store).__name__,
+        }
         infos = {}
-        for d in [state, statistics, size]:
-            infos.update(d)
+        with statistics_lock:
+            for d in [state, statistics, size]:
+                infos.update(d)
 
         return infos
 
@@ -180,6 +1339,10 @@ def cache(
 
     def set_max_size(maxsize: int) -> None:
         state["maxsize"] = maxsize
+        cache_store.set_max_size(maxsize)
+
+    def set_immutable(immutable: bool | None) -> None:
+        state["immutable"] = immutable
 
     def enable_cache() -> None:
         state["enabled"] = True
@@ -189,30 +1352,33 @@ def cache(
 
     @wraps(function)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
-        if is_cache_enabled(state):
-            key = get_cache_key(args, kwargs)
-
-            if key in cache_store:
-                if is_cache_expired(cache_store, state, key):
-                    statistics["expired_hits"] += 1
-                    return insert_value(function, cache_store, args, kwargs)
-                else:
-                    statistics["hits"] += 1
-                    return get_value(cache_store, key)
+        if not is_cache_enabled(state):
+            return function(*args, **kwargs)
 
-            else:
-                statistics["misses"] += 1
-                returned_value = insert_value(
-                    function, cache_store, args, kwargs
+        key = make_cache_key(args, kwargs)
+        entry = cache_store.get(key)
+        if entry is not None:
+            if not is_entry_expired(entry, state["expire"]):
+                count("hits")
+                return get_entry_value(
+                    cache_store, key, entry, is_cache_immutable(state)
                 )
-                remove_oldest_entry(cache_store, state["maxsize"])
-                return returned_value
-
+            count("expired_hits")
         else:
-            return function(*args, **kwargs)
+            count("misses")
+
+        # Concurrent callers missing the same key share a single call.
+        entry, _ = in_flight.do(key, load_entry, key, args, kwargs)
+        return get_entry_value(
+            cache_store, key, entry, is_cache_immutable(state)
+        )
 
     wrapper.set_cache_expire = set_expire
     wrapper.set_cache_max_size = set_max_size
+    wrapper.set_cache_immutable = set_immutable
+    wrapper.set_cache_store = set_cache_store
+    wrapper.invalidate_cache = invalidate_cache
+    wrapper.cache_name = get_function_name(function)
     wrapper.clear_cache = clear_cache
     wrapper.enable_cache = enable_cache
     wrapper.disable_cache = disable_cache
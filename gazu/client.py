@@ -1,16 +1,35 @@
 from __future__ import annotations
 
+import base64
+import codecs
+import copy
+import datetime
+import gzip
+import hashlib
+import inspect
 import json
 import logging
+import mmap
 import shutil
 import os
-from typing import Any, Callable, cast
-
-from .encoder import CustomJSONEncoder
+import random
+import socket
+import tempfile
+import threading
+import time
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Iterator, cast
+
+from .cache import ResponseCache, SingleFlight
+from . import encoder
+from .middleware import Middleware, get_route, run_middlewares
 
 from .__version__ import __version__
 
 from .exception import (
+    DownloadFileException,
     TooBigFileException,
     NotAuthenticatedException,
     NotAllowedException,
@@ -23,7 +42,11 @@ from .exception import (
 )
 
 
-from urllib.parse import urlencode
+from email.utils import parsedate_to_datetime
+from urllib.parse import quote_plus, urlencode
+
+from requests.adapters import HTTPAdapter, DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+from urllib3.util.request import ACCEPT_ENCODING
 
 logger = logging.getLogger("gazu")
 
@@ -32,6 +55,355 @@ if os.getenv("GAZU_DEBUG", "false").lower() == "true":
     logger.setLevel(logging.DEBUG)
 
 
+class KitsuHTTPAdapter(HTTPAdapter):
+    """
+    HTTP adapter mounted on the client session. On top of the connection pool
+    sizing provided by requests, it applies a default timeout to every request
+    and can enable TCP keep-alive probes on pooled sockets, so idle
+    connections are not silently dropped by firewalls or proxies.
+    """
+
+    def __init__(
+        self,
+        timeout: float | tuple[float, float] | None = None,
+        tcp_keepalive: bool = False,
+        keepalive_idle: int = 60,
+        keepalive_interval: int = 10,
+        keepalive_count: int = 6,
+        **kwargs: Any,
+    ) -> None:
+        self.timeout = timeout
+        self.socket_options = None
+        if tcp_keepalive:
+            self.socket_options = get_keepalive_socket_options(
+                keepalive_idle, keepalive_interval, keepalive_count
+            )
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        if self.socket_options is not None:
+            kwargs["socket_options"] = self.socket_options
+        super().init_poolmanager(*args, **kwargs)
+
+    def send(self, request, timeout=None, **kwargs: Any):
+        if timeout is None:
+            timeout = self.timeout
+        return super().send(request, timeout=timeout, **kwargs)
+
+    def get_pool_stats(self) -> dict:
+        """
+        Returns:
+            dict: Usage of the connection pools opened by this adapter.
+        """
+        pools = []
+        pool_container = self.poolmanager.pools
+        for key in pool_container.keys():
+            pool = pool_container.get(key)
+            if pool is None or pool.pool is None:
+                continue
+            # Free slots of the queue hold either an idle connection or None
+            # (room to open a new one), the others are checked out.
+            free_slots = pool.pool.qsize()
+            pools.append(
+                {
+                    "scheme": pool.scheme,
+                    "host": pool.host,
+                    "port": pool.port,
+                    "maxsize": pool.pool.maxsize,
+                    "in_use": pool.pool.maxsize - free_slots,
+                    "idle": len([conn for conn in pool.pool.queue if conn]),
+                    "connections_created": pool.num_connections,
+                    "requests": pool.num_requests,
+                }
+            )
+        return {
+            "pool_connections": self._pool_connections,
+            "pool_maxsize": self._pool_maxsize,
+            "pool_block": self._pool_block,
+            "num_pools": len(pools),
+            "pools": pools,
+        }
+
+
+def get_keepalive_socket_options(
+    idle: int = 60, interval: int = 10, count: int = 6
+) -> list[tuple[int, int, int]]:
+    """
+    Build socket options enabling TCP keep-alive. Tuning options that are not
+    available on the current platform are left out.
+
+    Args:
+        idle (int): Seconds of inactivity before the first probe.
+        interval (int): Seconds between two probes.
+        count (int): Number of failed probes before dropping the connection.
+
+    Returns:
+        list: Socket options to give to urllib3 connections.
+    """
+    options = [
+        (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    if hasattr(socket, "TCP_KEEPIDLE"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, idle))
+    elif hasattr(socket, "TCP_KEEPALIVE"):
+        # macOS exposes the idle delay under another name.
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPALIVE, idle))
+    if hasattr(socket, "TCP_KEEPINTVL"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, interval))
+    if hasattr(socket, "TCP_KEEPCNT"):
+        options.append((socket.IPPROTO_TCP, socket.TCP_KEEPCNT, count))
+    return options
+
+
+class RetryPolicy(object):
+    """
+    Describe how requests failing for transient reasons (gateway errors,
+    connection resets, timeouts) are retried. Waiting time grows
+    exponentially between attempts, with random jitter so that many clients
+    don't retry at the same time. By default only idempotent methods are
+    retried: a POST may have been processed by the server before the failure.
+
+    Example::
+
+        client = gazu.client.create_client(
+            host, retry_policy=RetryPolicy(max_attempts=5)
+        )
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        jitter: bool = True,
+        status_forcelist: tuple[int, ...] = (502, 503, 504),
+        allowed_methods: tuple[str, ...] = (
+            "GET",
+            "HEAD",
+            "OPTIONS",
+            "PUT",
+            "DELETE",
+        ),
+        respect_retry_after: bool = True,
+    ) -> None:
+        """
+        Args:
+            max_attempts (int): Maximum number of attempts for a request,
+                first one included.
+            backoff_factor (float): Waiting time in seconds before the first
+                retry, doubled for each following one.
+            max_backoff (float): Maximum waiting time between two attempts.
+            jitter (bool): Whether to pick a random waiting time between 0
+                and the computed backoff ("full jitter").
+            status_forcelist (tuple): Status codes to retry.
+            allowed_methods (tuple): HTTP methods that can be retried.
+            respect_retry_after (bool): Whether to wait the delay given by
+                the server through the `Retry-After` header.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.status_forcelist = set(status_forcelist)
+        self.allowed_methods = {method.upper() for method in allowed_methods}
+        self.respect_retry_after = respect_retry_after
+        self.stats = {"retries": 0, "status_retries": 0, "error_retries": 0}
+        self._lock = threading.Lock()
+
+    def is_retryable(
+        self,
+        method: str,
+        attempt: int,
+        status_code: int | None = None,
+        error: Exception | None = None,
+    ) -> bool:
+        """
+        Args:
+            method (str): HTTP method of the request.
+            attempt (int): Number of attempts already made.
+            status_code (int): Status code of the response, if any.
+            error (Exception): Network error raised, if any.
+
+        Returns:
+            bool: True if the request should be sent again.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if method.upper() not in self.allowed_methods:
+            return False
+        if error is not None:
+            return True
+        return status_code in self.status_forcelist
+
+    def get_backoff(
+        self, attempt: int, retry_after: str | None = None
+    ) -> float:
+        """
+        Args:
+            attempt (int): Number of attempts already made.
+            retry_after (str): Value of the `Retry-After` response header.
+
+        Returns:
+            float: Seconds to wait before the next attempt.
+        """
+        if self.respect_retry_after and retry_after:
+            delay = parse_retry_after(retry_after)
+            if delay is not None:
+                return min(delay, self.max_backoff)
+        delay = min(
+            self.backoff_factor * (2 ** (attempt - 1)), self.max_backoff
+        )
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def record_retry(self, status_code: int | None = None) -> None:
+        """
+        Count a retry in the policy statistics.
+        """
+        with self._lock:
+            self.stats["retries"] += 1
+            if status_code is None:
+                self.stats["error_retries"] += 1
+            else:
+                self.stats["status_retries"] += 1
+
+
+def parse_retry_after(value: str) -> float | None:
+    """
+    Args:
+        value (str): `Retry-After` header value, either a number of seconds or
+            an HTTP date.
+
+    Returns:
+        float: Seconds to wait, or None if the value can't be parsed.
+    """
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError, IndexError):
+        return None
+    if date is None:
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=datetime.timezone.utc)
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max((date - now).total_seconds(), 0.0)
+
+
+def get_accept_encoding() -> str:
+    """
+    Returns:
+        str: The content codings the client can decode, for the
+        Accept-Encoding header. Brotli and zstd are listed only when the
+        optional modules decoding them are installed.
+    """
+    return ", ".join(ACCEPT_ENCODING.split(","))
+
+
+def compress_request_body(
+    body: bytes, threshold: int | None
+) -> tuple[bytes, str | None]:
+    """
+    Gzip a request body when it is at least *threshold* bytes long.
+
+    Args:
+        body (bytes): The encoded request body.
+        threshold (int): Minimum size to compress, None to never compress.
+
+    Returns:
+        tuple: The body to send, and its content coding (None when it is
+        sent as is).
+    """
+    if threshold is None or len(body) < threshold:
+        return body, None
+    compressed = gzip.compress(body, compresslevel=6)
+    if len(compressed) >= len(body):
+        return body, None
+    return compressed, "gzip"
+
+
+class TransferStats(object):
+    """
+    Count the bytes exchanged with the server, before and after content
+    coding, to measure what compression saves.
+    """
+
+    def __init__(self) -> None:
+        self.counters = {
+            "requests": 0,
+            "compressed_requests": 0,
+            "request_bytes": 0,
+            "request_bytes_sent": 0,
+            "responses": 0,
+            "compressed_responses": 0,
+            "response_bytes": 0,
+            "response_bytes_received": 0,
+        }
+        self._lock = threading.Lock()
+
+    def count_request(self, size: int, sent_size: int) -> None:
+        with self._lock:
+            self.counters["requests"] += 1
+            self.counters["request_bytes"] += size
+            self.counters["request_bytes_sent"] += sent_size
+            if sent_size != size:
+                self.counters["compressed_requests"] += 1
+
+    def count_response(
+        self, size: int, received_size: int, content_encoding: str | None
+    ) -> None:
+        with self._lock:
+            self.counters["responses"] += 1
+            self.counters["response_bytes"] += size
+            self.counters["response_bytes_received"] += received_size
+            if content_encoding and content_encoding != "identity":
+                self.counters["compressed_responses"] += 1
+
+    def get(self) -> dict:
+        """
+        Returns:
+            dict: The counters, and the bytes saved on requests and
+            responses.
+        """
+        with self._lock:
+            stats = dict(self.counters)
+        stats["request_bytes_saved"] = (
+            stats["request_bytes"] - stats["request_bytes_sent"]
+        )
+        stats["response_bytes_saved"] = (
+            stats["response_bytes"] - stats["response_bytes_received"]
+        )
+        return stats
+
+
+def count_response_bytes(
+    response: requests.Response, client: KitsuClient
+) -> int:
+    """
+    Add the size of a fully read response, as received and once decoded, to
+    the client transfer statistics.
+
+    Returns:
+        int: The number of bytes received.
+    """
+    size = len(response.content)
+    try:
+        received_size = response.raw.tell()
+    except Exception:
+        received_size = 0
+    if not received_size:
+        received_size = int(response.headers.get("Content-Length") or size)
+    client.transfer_stats.count_response(
+        size, received_size, response.headers.get("Content-Encoding")
+    )
+    return received_size
+
+
 class KitsuClient(object):
     def __init__(
         self,
@@ -43,6 +415,21 @@ class KitsuClient(object):
         tokens: dict | None = None,
         access_token: str | None = None,
         refresh_token: str | None = None,
+        max_concurrency: int = 8,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+        timeout: float | tuple[float, float] | None = None,
+        tcp_keepalive: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        coalesce_requests: bool = True,
+        response_cache_size: int = 16 * 1024 * 1024,
+        request_compression_threshold: int | None = None,
+        middlewares: list[Middleware] | None = None,
+        chunked_upload_threshold: int | None = None,
+        upload_part_size: int = 8 * 1024 * 1024,
+        upload_state_dir: str | None = None,
+        download_range_size: int | None = None,
     ) -> None:
         if tokens is None:
             tokens = {"access_token": None, "refresh_token": None}
@@ -53,10 +440,61 @@ class KitsuClient(object):
             self.refresh_token = refresh_token
         self.use_refresh_token = use_refresh_token
         self.callback_not_authenticated = callback_not_authenticated
+        # Caps the number of requests this client runs in parallel, whatever
+        # the number of thread pools issuing them.
+        self.max_concurrency = max_concurrency
+        self.concurrency_limiter = threading.BoundedSemaphore(max_concurrency)
+        self.retry_policy = retry_policy
+        # Identical GET requests sent at the same time by several threads
+        # share a single HTTP round trip.
+        self.coalesce_requests = coalesce_requests
+        self.in_flight_requests = SingleFlight()
+        # Bodies of GET responses sent with an ETag or a Last-Modified
+        # header, so polling the same URL only costs a 304 when nothing
+        # changed. A size of 0 disables conditional requests.
+        self.response_cache = (
+            ResponseCache(response_cache_size) if response_cache_size else None
+        )
 
         self.session = requests.Session()
         self.session.verify = ssl_verify
         self.session.cert = cert
+        # Maximum number of connections kept open toward the same host.
+        self.pool_maxsize = pool_maxsize
+        self.adapter = KitsuHTTPAdapter(
+            timeout=timeout,
+            tcp_keepalive=tcp_keepalive,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        self.session.mount("http://", self.adapter)
+        self.session.mount("https://", self.adapter)
+        self.session.headers["Accept-Encoding"] = get_accept_encoding()
+        # JSON bodies at least this big are sent gzipped. Off by default as
+        # the server (or the proxy in front of it) has to decode them.
+        self.request_compression_threshold = request_compression_threshold
+        self.transfer_stats = TransferStats()
+        # Models whose data route ignores or rejects the `id` list filter,
+        # fetched one by one by fetch_many.
+        self.unsupported_id_filters = set()
+        # Hooks run around every request sent through send_request.
+        self.middlewares = list(middlewares or [])
+        # Files at least this big are uploaded in parts by upload_chunked.
+        # Off by default as the server has to support multipart uploads.
+        self.chunked_upload_threshold = chunked_upload_threshold
+        self.upload_part_size = upload_part_size
+        # Where the IDs of unfinished multipart uploads are kept, so that
+        # uploading the same file again resumes them.
+        self.upload_state_dir = upload_state_dir or os.path.join(
+            tempfile.gettempdir(), "gazu-uploads"
+        )
+        # Files bigger than this are downloaded in ranges fetched in
+        # parallel, when the server supports range requests. None (the
+        # default) downloads files as a single stream.
+        self.download_range_size = download_range_size
+        # Upload routes answering that multipart uploads are not supported.
+        self.unsupported_chunked_uploads = set()
         self.host = host
         self.event_host = host
 
@@ -127,6 +565,41 @@ class KitsuClient(object):
 
         return headers
 
+    def get_pool_stats(self) -> dict:
+        """
+        Get connection pool usage, useful to size the pool when the client is
+        shared between threads.
+
+        Returns:
+            dict: Pool settings and, for each opened pool, the number of
+            connections in use, idle and created, and the requests sent.
+        """
+        return self.adapter.get_pool_stats()
+
+    def get_transfer_stats(self) -> dict:
+        """
+        Get the number of bytes exchanged with the server, before and after
+        compression.
+
+        Returns:
+            dict: Request and response counters and the bytes saved.
+        """
+        return self.transfer_stats.get()
+
+    def add_middleware(self, middleware: Middleware) -> Middleware:
+        """
+        Run the hooks of given middleware around every request of this
+        client, after the ones of the middlewares already added.
+
+        Returns:
+            Middleware: The added middleware.
+        """
+        self.middlewares.append(middleware)
+        return middleware
+
+    def remove_middleware(self, middleware: Middleware) -> None:
+        self.middlewares.remove(middleware)
+
 
 def create_client(
     host: str,
@@ -134,6 +607,12 @@ def create_client(
     cert: str | None = None,
     use_refresh_token: bool = False,
     callback_not_authenticated: Callable | None = None,
+    pool_connections: int = DEFAULT_POOLSIZE,
+    pool_maxsize: int = DEFAULT_POOLSIZE,
+    pool_block: bool = DEFAULT_POOLBLOCK,
+    timeout: float | tuple[float, float] | None = None,
+    tcp_keepalive: bool = False,
+    retry_policy: RetryPolicy | None = None,
     **kwargs: Any,
 ) -> KitsuClient:
     """
@@ -145,6 +624,17 @@ def create_client(
         cert (str): Path to a client certificate.
         use_refresh_token (bool): Whether to automatically refresh tokens.
         callback_not_authenticated (function): Function to call when not authenticated.
+        pool_connections (int): Number of host pools to keep.
+        pool_maxsize (int): Maximum number of connections kept per host. Set
+            it at least to the number of threads sharing the client.
+        pool_block (bool): Whether to wait for a free connection instead of
+            opening (and then discarding) extra ones when the pool is full.
+        timeout (float / tuple): Default timeout in seconds for every
+            request, or a (connect timeout, read timeout) tuple.
+        tcp_keepalive (bool): Whether to enable TCP keep-alive probes on
+            pooled connections.
+        retry_policy (RetryPolicy): How to retry requests failing for
+            transient reasons. Requests are not retried by default.
 
     Returns:
         KitsuClient: The created client.
@@ -155,6 +645,12 @@ def create_client(
         cert=cert,
         use_refresh_token=use_refresh_token,
         callback_not_authenticated=callback_not_authenticated,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        timeout=timeout,
+        tcp_keepalive=tcp_keepalive,
+        retry_policy=retry_policy,
         **kwargs,
     )
 
@@ -284,6 +780,33 @@ def set_event_host(new_host: str, client: KitsuClient = default_client) -> str:
     return client.event_host
 
 
+def get_pool_stats(client: KitsuClient = default_client) -> dict:
+    """
+    Get connection pool usage of the client.
+
+    Args:
+        client (KitsuClient): The client to inspect.
+
+    Returns:
+        dict: Pool settings and usage of each opened pool.
+    """
+    return client.get_pool_stats()
+
+
+def get_transfer_stats(client: KitsuClient = default_client) -> dict:
+    """
+    Get the number of bytes exchanged with the server by the client, before
+    and after compression.
+
+    Args:
+        client (KitsuClient): The client to inspect.
+
+    Returns:
+        dict: Request and response counters and the bytes saved.
+    """
+    return client.get_transfer_stats()
+
+
 def set_tokens(
     new_tokens: dict[str, str], client: KitsuClient = default_client
 ) -> dict[str, str]:
@@ -365,6 +888,161 @@ def build_path_with_params(path: str, params: dict) -> str:
     return path
 
 
+def send_request(
+    method: str,
+    path: str,
+    client: KitsuClient = default_client,
+    headers: dict | None = None,
+    retry_policy: RetryPolicy | None = None,
+    **kwargs: Any,
+) -> requests.Response:
+    """
+    Send a request toward given path for configured host. Authentication
+    headers are added, the status is checked and the request is sent again
+    after a token refresh or, when the client has a retry policy, after a
+    transient failure.
+
+    Args:
+        method (str): The HTTP method to use.
+        path (str): The path to query.
+        client (KitsuClient): The client to use for the request.
+        headers (dict): Extra headers to send.
+        retry_policy (RetryPolicy): Policy to use instead of the client one.
+        kwargs: Extra arguments given to the session request method.
+
+    Returns:
+        requests.Response: The checked response.
+    """
+    url = get_full_url(path, client)
+    policy = retry_policy or client.retry_policy
+    middlewares = client.middlewares
+    attempt = 1
+    while True:
+        request_headers = make_auth_header(client=client)
+        if headers:
+            request_headers.update(headers)
+        request = None
+        if middlewares:
+            request = new_request_infos(
+                method, path, url, request_headers, attempt, kwargs
+            )
+            run_middlewares(middlewares, "before_request", request)
+            start = time.perf_counter()
+        try:
+            response = client.session.request(
+                method, url, headers=request_headers, **kwargs
+            )
+        except (requests.ConnectionError, requests.Timeout) as exception:
+            if request is not None:
+                run_middlewares(middlewares, "on_error", request, exception)
+            if policy is None or not policy.is_retryable(
+                method, attempt, error=exception
+            ):
+                raise
+            delay = policy.get_backoff(attempt)
+            logger.debug(
+                "%s %s failed (%s), retrying in %.2fs",
+                method,
+                path,
+                exception,
+                delay,
+            )
+            policy.record_retry()
+            time.sleep(delay)
+            attempt += 1
+            continue
+
+        received_size = None
+        if not kwargs.get("stream"):
+            received_size = count_response_bytes(response, client)
+        if request is not None:
+            request["duration"] = time.perf_counter() - start
+            request["status_code"] = response.status_code
+            request["bytes_received"] = received_size
+            response.gazu_request = request
+            run_middlewares(middlewares, "after_response", request, response)
+
+        if policy is not None and policy.is_retryable(
+            method, attempt, status_code=response.status_code
+        ):
+            delay = policy.get_backoff(
+                attempt, response.headers.get("Retry-After")
+            )
+            logger.debug(
+                "%s %s returned %s, retrying in %.2fs",
+                method,
+                path,
+                response.status_code,
+                delay,
+            )
+            policy.record_retry(response.status_code)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+            continue
+
+        try:
+            _, retry = check_status(response, path, client=client)
+        except Exception as exception:
+            if request is not None:
+                run_middlewares(middlewares, "on_error", request, exception)
+            raise
+        if not retry:
+            return response
+        response.close()
+
+
+def new_request_infos(
+    method: str,
+    path: str,
+    url: str,
+    headers: dict,
+    attempt: int,
+    kwargs: dict,
+) -> dict:
+    """
+    Returns:
+        dict: The request infos given to the middleware hooks.
+    """
+    body = kwargs.get("data")
+    return {
+        "method": method,
+        "path": path,
+        "url": url,
+        "headers": headers,
+        "attempt": attempt,
+        "bytes_sent": (len(body) if isinstance(body, (bytes, str)) else None),
+    }
+
+
+def read_json(
+    response: requests.Response,
+    client: KitsuClient,
+    content: bytes | None = None,
+) -> Any:
+    """
+    Decode the JSON body of a response, or given content in its place. The
+    decoding time is reported to the client middlewares.
+
+    Returns:
+        The decoded data.
+    """
+    if content is None:
+        content = response.content
+    request = getattr(response, "gazu_request", None)
+    if request is None:
+        return encoder.loads(content)
+    start = time.perf_counter()
+    result = encoder.loads(content)
+    run_middlewares(
+        client.middlewares,
+        "after_decode",
+        request,
+        time.perf_counter() - start,
+    )
+    return result
+
+
 def get(
     path: str,
     json_response: bool = True,
@@ -385,16 +1063,64 @@ def get(
     """
     logger.debug("GET %s", get_full_url(path, client))
     path = build_path_with_params(path, params)
-    retry = True
-    while retry:
-        response = client.session.get(
-            get_full_url(path, client=client),
-            headers=make_auth_header(client=client),
-        )
-        _, retry = check_status(response, path, client=client)
+    if not client.coalesce_requests:
+        return _get(path, json_response, client)
 
+    key = (
+        path,
+        json_response,
+        make_auth_header(client=client).get("Authorization"),
+    )
+    result, shared = client.in_flight_requests.do(
+        key, _get, path, json_response, client
+    )
+    # Callers sharing a response get their own copy of it.
+    return copy.deepcopy(result) if shared else result
+
+
+def _get(path: str, json_response: bool, client: KitsuClient) -> Any:
+    response_cache = client.response_cache
+    if response_cache is None:
+        response = send_request("GET", path, client=client)
+        if json_response:
+            return read_json(response, client)
+        else:
+            return response.text
+
+    key = (path, make_auth_header(client=client).get("Authorization"))
+    response = send_request(
+        "GET",
+        path,
+        client=client,
+        headers=response_cache.get_conditional_headers(key),
+    )
+    if response.status_code == 304:
+        entry = response_cache.get(key)
+        if entry is not None:
+            logger.debug("GET %s not modified, using stored response", path)
+            if json_response:
+                return read_json(response, client, entry["content"])
+            else:
+                return str(
+                    entry["content"],
+                    entry["encoding"] or "utf-8",
+                    errors="replace",
+                )
+        # The stored response was evicted meanwhile.
+        response = send_request("GET", path, client=client)
+
+    if "no-store" in response.headers.get("Cache-Control", ""):
+        response_cache.pop(key)
+    else:
+        response_cache.set(
+            key,
+            response.content,
+            encoding=response.encoding,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
     if json_response:
-        return response.json()
+        return read_json(response, client)
     else:
         return response.text
 
@@ -421,19 +1147,10 @@ def post(path: str, data: Any, client: KitsuClient = default_client) -> Any:
     }
     if not any(field in data for field in sensitive_fields):
         logger.debug("Body: %s", data)
-    retry = True
-    while retry:
-        headers = make_auth_header(client=client)
-        headers["Content-Type"] = "application/json"
-        response = client.session.post(
-            get_full_url(path, client),
-            data=json.dumps(data, cls=CustomJSONEncoder),
-            headers=headers,
-        )
-        _, retry = check_status(response, path, client=client)
+    response = send_json_request("POST", path, data, client)
     try:
-        result = response.json()
-    except json.JSONDecodeError:
+        result = read_json(response, client)
+    except ValueError:
         logger.error("Failed to decode JSON response: %s", response.text)
         raise
     return result
@@ -453,17 +1170,205 @@ def put(path: str, data: dict, client: KitsuClient = default_client) -> Any:
     """
     logger.debug("PUT %s", get_full_url(path, client))
     logger.debug("Body: %s", data)
-    retry = True
-    while retry:
-        headers = make_auth_header(client=client)
-        headers["Content-Type"] = "application/json"
-        response = client.session.put(
-            get_full_url(path, client),
-            data=json.dumps(data, cls=CustomJSONEncoder),
-            headers=headers,
-        )
-        _, retry = check_status(response, path, client=client)
-    return response.json()
+    response = send_json_request("PUT", path, data, client)
+    return read_json(response, client)
+
+
+def send_json_request(
+    method: str, path: str, data: Any, client: KitsuClient
+) -> requests.Response:
+    """
+    Send given data as a JSON body, gzipped when it is bigger than the
+    client compression threshold.
+
+    Returns:
+        requests.Response: The checked response.
+    """
+    body = encoder.dumps(data)
+    headers = {"Content-Type": "application/json"}
+    sent_body, content_encoding = compress_request_body(
+        body, client.request_compression_threshold
+    )
+    if content_encoding is not None:
+        headers["Content-Encoding"] = content_encoding
+    client.transfer_stats.count_request(len(body), len(sent_body))
+    return send_request(
+        method, path, client=client, headers=headers, data=sent_body
+    )
+
+
+class JSONStreamBody(object):
+    """
+    Request body encoding a list to a JSON array while it is sent, in
+    chunked transfer coding, so that the whole document is never held in
+    memory. The body is encoded again each time it is iterated, so requests
+    sent again after a failure or a token refresh send it whole.
+    """
+
+    def __init__(
+        self,
+        items: list,
+        compress: bool = False,
+        transfer_stats: TransferStats | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> None:
+        """
+        Args:
+            items (list): The items to send.
+            compress (bool): Whether to gzip the body on the fly.
+            transfer_stats (TransferStats): Statistics counting the bytes
+                of each sent body.
+            chunk_size (int): Size of the encoded chunks.
+        """
+        self.items = items
+        self.compress = compress
+        self.transfer_stats = transfer_stats
+        self.chunk_size = chunk_size
+
+    def __iter__(self) -> Iterator[bytes]:
+        size = 0
+        sent_size = 0
+        compressor = None
+        if self.compress:
+            compressor = zlib.compressobj(
+                6, zlib.DEFLATED, 16 + zlib.MAX_WBITS
+            )
+        for chunk in encoder.iter_dumps_list(self.items, self.chunk_size):
+            size += len(chunk)
+            if compressor is not None:
+                chunk = compressor.compress(chunk)
+            if chunk:
+                sent_size += len(chunk)
+                yield chunk
+        if compressor is not None:
+            chunk = compressor.flush()
+            sent_size += len(chunk)
+            yield chunk
+        if self.transfer_stats is not None:
+            self.transfer_stats.count_request(size, sent_size)
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self._aiter()
+
+    async def _aiter(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+
+
+def get_json_stream_headers(client: KitsuClient) -> dict:
+    """
+    Returns:
+        dict: Headers of a `JSONStreamBody` sent by given client. Streamed
+        bodies are gzipped whenever the client compresses request bodies,
+        as their size is not known in advance.
+    """
+    headers = {"Content-Type": "application/json"}
+    if client.request_compression_threshold is not None:
+        headers["Content-Encoding"] = "gzip"
+    return headers
+
+
+def post_stream(
+    path: str,
+    items: list,
+    client: KitsuClient = default_client,
+    retry_policy: RetryPolicy | None = None,
+) -> Any:
+    """
+    Run a post request toward given path with given items as a JSON array
+    body, encoded while it is sent (see `JSONStreamBody`).
+
+    Args:
+        path (str): The path to query.
+        items (list): The items to post.
+        client (KitsuClient): The client to use for the request.
+        retry_policy (RetryPolicy): Policy to use instead of the client one.
+
+    Returns:
+        The request result.
+    """
+    logger.debug("POST %s (%s items)", get_full_url(path, client), len(items))
+    headers = get_json_stream_headers(client)
+    body = JSONStreamBody(
+        items,
+        compress="Content-Encoding" in headers,
+        transfer_stats=client.transfer_stats,
+    )
+    response = send_request(
+        "POST",
+        path,
+        client=client,
+        headers=headers,
+        retry_policy=retry_policy,
+        data=body,
+    )
+    return read_json(response, client)
+
+
+def post_batches(
+    path: str,
+    items: list,
+    batch_size: int = 1000,
+    max_workers: int = 1,
+    attempts: int = 3,
+    client: KitsuClient = default_client,
+) -> list:
+    """
+    Post given items in batches of *batch_size* items, each one sent as a
+    streamed JSON array (see `post_stream`). Batches are sent one after the
+    other, unless more workers are given: up to *max_workers* batches are
+    then in flight and the server may apply them in any order, so items of
+    a batch must not depend on items of another one. A batch failing because of the connection, a timeout
+    or a gateway error (the status codes retried by the client retry
+    policy) is sent again after the policy backoff, up to *attempts* times:
+    the route must accept the same batch twice, like the import routes do.
+    Other errors are raised right away.
+
+    Args:
+        path (str): The path to query.
+        items (list): The items to post.
+        batch_size (int): Maximum number of items per request.
+        max_workers (int): Maximum number of requests running at the same
+            time. The order in which batches are applied is not guaranteed
+            with more than one.
+        attempts (int): Maximum number of attempts per batch.
+        client (KitsuClient): The client to use for the requests.
+
+    Returns:
+        list: The concatenated results of the batches, in the order of the
+        items.
+    """
+    batches = [
+        items[index : index + batch_size]
+        for index in range(0, len(items), batch_size)
+    ]
+
+    retry_policy = get_batch_retry_policy(client, attempts)
+
+    def post_batch(batch: list) -> list:
+        with client.concurrency_limiter:
+            return post_stream(
+                path, batch, client=client, retry_policy=retry_policy
+            )
+
+    results = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for result in executor.map(post_batch, batches):
+            results.extend(result)
+    return results
+
+
+def get_batch_retry_policy(client: Any, attempts: int) -> RetryPolicy:
+    """
+    Returns:
+        RetryPolicy: The retry policy of given client (or a default one)
+        allowing POST requests, with *attempts* attempts. Retries are counted
+        in the client policy statistics.
+    """
+    retry_policy = copy.copy(client.retry_policy or RetryPolicy())
+    retry_policy.max_attempts = attempts
+    retry_policy.allowed_methods = retry_policy.allowed_methods | {"POST"}
+    return retry_policy
 
 
 def delete(
@@ -482,13 +1387,7 @@ def delete(
     """
     logger.debug("DELETE %s", get_full_url(path, client))
     path = build_path_with_params(path, params)
-
-    retry = True
-    while retry:
-        response = client.session.delete(
-            get_full_url(path, client), headers=make_auth_header(client=client)
-        )
-        _, retry = check_status(response, path, client=client)
+    response = send_request("DELETE", path, client=client)
     return response.text
 
 
@@ -660,6 +1559,7 @@ def fetch_all(
     client: KitsuClient = default_client,
     paginated: bool = False,
     limit: int | None = None,
+    max_workers: int | None = None,
 ) -> list[dict]:
     """
     Args:
@@ -668,41 +1568,213 @@ def fetch_all(
         client (KitsuClient): The client to use for the request.
         paginated (bool): Will query entries page by page.
         limit (int): Limit the number of entries per page.
+        max_workers (int): Number of pages fetched in parallel once the first
+            page is retrieved (paginated mode only, sequential by default).
 
     Returns:
         list: All entries stored in database for a given model. You can add a
         filter to the model name like this: "tasks?project_id=project-id"
     """
+    if not paginated:
+        return get(url_path_join("data", path), params=params, client=client)
+
+    results = []
+    for page_entries in fetch_pages(
+        path,
+        params=params,
+        client=client,
+        limit=limit,
+        max_workers=max_workers,
+    ):
+        results.extend(page_entries)
+    return results
 
-    if paginated:
-        if not params:
-            params = {}
-        params["page"] = 1
-        if limit is not None:
-            params["limit"] = limit
 
-    url = url_path_join("data", path)
+def fetch_pages(
+    path: str,
+    params: dict | None = None,
+    client: KitsuClient = default_client,
+    limit: int | None = None,
+    max_workers: int | None = None,
+) -> Iterator[list[dict]]:
+    """
+    Query entries page by page and yield the entries of each page, in page
+    order. The first page tells how many pages there are, the following ones
+    are fetched by a pool of *max_workers* threads. Only a window of
+    *max_workers* pages is requested ahead of the consumer, so the first
+    pages can be processed while the next ones are still in flight.
 
-    response = get(url, params=params, client=client)
+    Args:
+        path (str): The path for which we want to retrieve all entries.
+        params (dict): The parameters to pass to the request.
+        client (KitsuClient): The client to use for the request.
+        limit (int): Limit the number of entries per page.
+        max_workers (int): Number of pages fetched in parallel.
 
-    if not paginated:
-        return response
+    Yields:
+        list: Entries of each page.
+    """
+    params = dict(params or {})
+    params["page"] = 1
+    if limit is not None:
+        params["limit"] = limit
 
+    url = url_path_join("data", path)
+    response = get(url, params=params, client=client)
     nb_pages = response.get("nb_pages", 1)
     current_page = response.get("page", 1)
-    results = response.get("data", [])
+    yield response.get("data", [])
 
-    if current_page != nb_pages:
-        for page in range(2, nb_pages + 1):
-            params["page"] = page
-            response = get(
-                url,
-                params=params,
-                client=client,
-            )
-            results.extend(response.get("data", []))
+    if current_page == nb_pages:
+        return
 
-    return results
+    pages = range(2, nb_pages + 1)
+    if not max_workers or max_workers < 2:
+        for page in pages:
+            yield _fetch_page(url, params, page, client)
+        return
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        pages = iter(pages)
+        try:
+            for page in pages:
+                pending.append(
+                    executor.submit(_fetch_page, url, params, page, client)
+                )
+                if len(pending) >= max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _fetch_page(
+    url: str, params: dict, page: int, client: KitsuClient
+) -> list[dict]:
+    """
+    Fetch the entries of a single page while holding a slot of the client
+    concurrency limiter.
+    """
+    params = dict(params, page=page)
+    with client.concurrency_limiter:
+        response = get(url, params=params, client=client)
+    return response.get("data", [])
+
+
+def iter_all(
+    path: str,
+    params: dict | None = None,
+    client: KitsuClient = default_client,
+    paginated: bool = False,
+    limit: int | None = None,
+    max_workers: int | None = None,
+) -> Iterator[dict]:
+    """
+    Iterate over all entries of a route without building the full list in
+    memory. In paginated mode entries are yielded page by page. Otherwise the
+    response body is streamed and the JSON array is decoded incrementally,
+    so only the entries not yet consumed are held in memory.
+
+    Args:
+        path (str): The path for which we want to retrieve all entries.
+        params (dict): The parameters to pass to the request.
+        client (KitsuClient): The client to use for the request.
+        paginated (bool): Will query entries page by page.
+        limit (int): Limit the number of entries per page.
+        max_workers (int): Number of pages fetched in parallel (paginated
+            mode only).
+
+    Yields:
+        dict: Entries stored in database for a given route.
+    """
+    if paginated:
+        for page_entries in fetch_pages(
+            path,
+            params=params,
+            client=client,
+            limit=limit,
+            max_workers=max_workers,
+        ):
+            yield from page_entries
+        return
+
+    path = build_path_with_params(url_path_join("data", path), params)
+    logger.debug("GET %s", get_full_url(path, client))
+    response = send_request("GET", path, client=client, stream=True)
+    with response:
+        yield from _iter_json_array(response.iter_content(65536))
+
+
+def _iter_json_array(chunks: Iterator[bytes]) -> Iterator[Any]:
+    """
+    Decode a JSON array from a stream of byte chunks, yielding its elements
+    one by one. If the body is not an array, the decoded document is yielded
+    as a single element.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    eof = False
+    chunks = iter(chunks)
+
+    def read_more() -> bool:
+        nonlocal buffer, position, eof
+        if eof:
+            return False
+        try:
+            chunk = next(chunks)
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+        except StopIteration:
+            eof = True
+            buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+        position = 0
+        return True
+
+    def skip_blanks(separators: str = "") -> str | None:
+        nonlocal position
+        while True:
+            while (
+                position < len(buffer)
+                and buffer[position] in " \t\r\n" + separators
+            ):
+                position += 1
+            if position < len(buffer):
+                return buffer[position]
+            if not read_more():
+                return None
+
+    first_char = skip_blanks()
+    if first_char is None:
+        return
+    if first_char != "[":
+        while read_more():
+            pass
+        yield json.loads(buffer[position:])
+        return
+
+    position += 1
+    while True:
+        char = skip_blanks(",")
+        if char is None:
+            raise json.JSONDecodeError("Unterminated array", buffer, position)
+        if char == "]":
+            return
+        try:
+            value, end = decoder.raw_decode(buffer, position)
+            # A value touching the end of the buffer (a number for instance)
+            # may continue in the next chunk.
+            complete = end < len(buffer) or eof
+        except json.JSONDecodeError:
+            complete = False
+        if complete:
+            position = end
+            yield value
+        elif not read_more():
+            raise json.JSONDecodeError("Truncated document", buffer, position)
 
 
 def fetch_first(
@@ -745,6 +1817,104 @@ def fetch_one(
     )
 
 
+def fetch_many(
+    model_name: str,
+    ids: list[str],
+    params: dict | None = None,
+    client: KitsuClient = default_client,
+    max_url_length: int = 2048,
+    max_workers: int | None = None,
+) -> dict[str, dict]:
+    """
+    Fetch many model instances in a few requests. IDs are sent as an `id`
+    list filter to the data route, split in as many requests as needed to
+    keep URLs under *max_url_length* characters. If the server doesn't
+    support the filter, instances are fetched one by one, concurrently.
+
+    Args:
+        model_name (str): Model type name.
+        ids (list): Model instance IDs.
+        params (dict): Extra filters to pass to the request.
+        client (KitsuClient): The client to use for the request.
+        max_url_length (int): Maximum length of the request URLs.
+        max_workers (int): Maximum number of requests running at the same
+            time when instances are fetched one by one. Defaults to the
+            client concurrency limit.
+
+    Returns:
+        dict: Model instances by ID. IDs matching no instance are left out.
+    """
+    ids = list(dict.fromkeys(ids))
+    path = url_path_join("data", model_name)
+    results = {}
+    if model_name not in client.unsupported_id_filters:
+        try:
+            for chunk in chunk_ids(path, ids, params, client, max_url_length):
+                chunk_params = dict(
+                    params or {}, id=json.dumps(chunk, separators=(",", ":"))
+                )
+                entries = get(path, params=chunk_params, client=client)
+                entries_by_id = {entry["id"]: entry for entry in entries}
+                if not set(entries_by_id).issubset(chunk):
+                    # The filter was ignored and the whole table returned.
+                    raise ParameterException(path, "id filter not supported")
+                results.update(entries_by_id)
+            return results
+        except ParameterException:
+            logger.debug("No id list filter on %s, fetching one by one", path)
+            client.unsupported_id_filters.add(model_name)
+            results = {}
+
+    def fetch_instance(instance_id: str) -> dict | None:
+        with client.concurrency_limiter:
+            try:
+                return fetch_one(
+                    model_name, instance_id, params=params, client=client
+                )
+            except RouteNotFoundException:
+                return None
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or client.max_concurrency
+    ) as executor:
+        for instance_id, entry in zip(ids, executor.map(fetch_instance, ids)):
+            if entry is not None:
+                results[instance_id] = entry
+    return results
+
+
+def chunk_ids(
+    path: str,
+    ids: list[str],
+    params: dict | None,
+    client: KitsuClient,
+    max_url_length: int,
+) -> Iterator[list[str]]:
+    """
+    Split IDs in lists small enough for the URL of a request to given path,
+    filtered on one of these lists, to stay under *max_url_length*
+    characters.
+    """
+    url_length = len(
+        get_full_url(build_path_with_params(path, params), client)
+    ) + len("&id=" + quote_plus("[]"))
+    separator_length = len(quote_plus(","))
+    chunk = []
+    length = url_length
+    for instance_id in ids:
+        id_length = len(quote_plus(json.dumps(instance_id)))
+        if chunk and length + separator_length + id_length > max_url_length:
+            yield chunk
+            chunk = []
+            length = url_length
+        if chunk:
+            length += separator_length
+        chunk.append(instance_id)
+        length += id_length
+    if chunk:
+        yield chunk
+
+
 def create(
     model_name: str, data: dict, client: KitsuClient = default_client
 ) -> dict:
@@ -785,47 +1955,202 @@ def update(
     )
 
 
-class _ProgressFileWrapper:
-    """Wraps a file object to track read progress via a callback."""
-
-    def __init__(self, file_obj, callback, offset, total):
-        self._file = file_obj
-        self._callback = callback
-        self._offset = offset
-        self._total = total
-
-    def read(self, size=-1):
-        data = self._file.read(size)
-        if data:
-            self._offset += len(data)
-            self._callback(self._offset, self._total)
-        return data
+class MultipartBody(object):
+    """
+    A multipart/form-data request body read straight from the uploaded
+    buffers (bytes, memoryview, mmap...) and files, which are memory mapped,
+    so their content is never copied in memory before being sent. Progress
+    is reported while the body is sent, at most every *progress_interval*
+    seconds.
+    """
 
-    def __getattr__(self, name):
-        return getattr(self._file, name)
+    def __init__(
+        self,
+        fields: dict,
+        files: dict,
+        progress_callback: Callable | None = None,
+        progress_interval: float = 0.1,
+    ) -> None:
+        self.boundary = os.urandom(16).hex()
+        self.content_type = f"multipart/form-data; boundary={self.boundary}"
+        self.progress_callback = progress_callback
+        self.progress_interval = progress_interval
+        self.segments = []
+        # Indexes of the segments holding file contents.
+        self.file_segments = set()
+        self.files_size = 0
+        self._mmaps = []
+        for name, values in fields.items():
+            if isinstance(values, (str, bytes)) or not hasattr(
+                values, "__iter__"
+            ):
+                values = [values]
+            for value in values:
+                if value is None:
+                    continue
+                if not isinstance(value, bytes):
+                    value = str(value).encode("utf-8")
+                self._add_part(name, value)
+        for name, value in files.items():
+            if isinstance(value, tuple):
+                file_name, content, content_type = (value + (None, None))[:3]
+            else:
+                file_name = os.path.basename(getattr(value, "name", name))
+                content, content_type = value, None
+            if isinstance(content, str):
+                content = content.encode("utf-8")
+            view = self._get_view(content)
+            if file_name is not None:
+                self.files_size += len(view)
+                self.file_segments.add(len(self.segments) + 1)
+            self._add_part(name, view, file_name, content_type)
+        self.segments.append(f"--{self.boundary}--\r\n".encode("ascii"))
+        self.size = sum(len(segment) for segment in self.segments)
+        self.seek(0)
+
+    def _get_view(self, content: Any) -> memoryview:
+        if hasattr(content, "getbuffer"):
+            # In memory file, as io.BytesIO.
+            return memoryview(content.getbuffer())[content.tell() :]
+        if hasattr(content, "fileno"):
+            offset = content.tell()
+            try:
+                mapped = mmap.mmap(
+                    content.fileno(), 0, access=mmap.ACCESS_READ
+                )
+            except (OSError, ValueError):
+                # Empty file, or not a regular file.
+                return memoryview(content.read())
+            self._mmaps.append(mapped)
+            return memoryview(mapped)[offset:]
+        if hasattr(content, "read"):
+            return memoryview(content.read())
+        return memoryview(content).cast("B")
+
+    def _add_part(
+        self,
+        name: str,
+        content: bytes | memoryview,
+        file_name: str | None = None,
+        content_type: str | None = None,
+    ) -> None:
+        disposition = f'form-data; name="{name}"'
+        if file_name is not None:
+            disposition += f'; filename="{file_name}"'
+        headers = (
+            f"--{self.boundary}\r\nContent-Disposition: {disposition}\r\n"
+        )
+        if content_type:
+            headers += f"Content-Type: {content_type}\r\n"
+        self.segments.append((headers + "\r\n").encode("utf-8"))
+        self.segments.append(content)
+        self.segments.append(b"\r\n")
+
+    def __len__(self) -> int:
+        return self.size
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        if whence == os.SEEK_CUR:
+            offset += self.position
+        elif whence == os.SEEK_END:
+            offset += self.size
+        self.position = max(0, min(offset, self.size))
+        self.segment_index = 0
+        self.segment_offset = self.position
+        self.files_sent = 0
+        while self.segment_index < len(
+            self.segments
+        ) and self.segment_offset >= len(self.segments[self.segment_index]):
+            if self.segment_index in self.file_segments:
+                self.files_sent += len(self.segments[self.segment_index])
+            self.segment_offset -= len(self.segments[self.segment_index])
+            self.segment_index += 1
+        if self.segment_index in self.file_segments:
+            self.files_sent += self.segment_offset
+        self._last_report = 0.0
+        return self.position
+
+    def read(self, size: int = -1) -> bytes | memoryview:
+        """
+        Returns:
+            memoryview: Up to *size* bytes of the body, as a view on the
+            uploaded buffer when possible. The whole remaining body, as
+            bytes, when no size is given.
+        """
+        if size is None or size < 0:
+            return b"".join(iter(lambda: self.read(1024 * 1024), b""))
+        while self.segment_index < len(self.segments):
+            segment = self.segments[self.segment_index]
+            if self.segment_offset < len(segment):
+                break
+            self.segment_index += 1
+            self.segment_offset = 0
+        else:
+            return b""
+        chunk = memoryview(segment)[
+            self.segment_offset : self.segment_offset + size
+        ]
+        self.segment_offset += len(chunk)
+        self.position += len(chunk)
+        if self.segment_index in self.file_segments:
+            self.files_sent += len(chunk)
+        self._report()
+        return chunk
+
+    def _report(self) -> None:
+        if self.progress_callback is None:
+            return
+        now = time.monotonic()
+        if (
+            self.position < self.size
+            and now - self._last_report < self.progress_interval
+        ):
+            return
+        self._last_report = now
+        self.progress_callback(self.files_sent, self.files_size)
+
+    def close(self) -> None:
+        self.segments = []
+        for mapped in self._mmaps:
+            try:
+                mapped.close()
+            except BufferError:
+                # A view on it is still referenced, it is closed when
+                # garbage collected.
+                pass
+        self._mmaps = []
 
 
 def upload(
     path: str,
-    file_path: str = None,
+    file_path: str | bytes | memoryview | tuple = None,
     data: dict | None = None,
     extra_files: list | None = None,
     files: dict = None,
     client: KitsuClient = default_client,
     progress_callback: Callable | None = None,
+    progress_interval: float = 0.1,
 ) -> Any:
     """
-    Upload file located at *file_path* to given url *path*.
+    Upload file located at *file_path* to given url *path*. Instead of
+    paths, files can be given as buffers (bytes, memoryview, mmap...) or as
+    ``(file_name, buffer)`` tuples, the server relying on the file name
+    extension to process some uploads.
 
     Args:
         path (str): The url path to upload file.
-        file_path (str): The file location on the hard drive.
+        file_path (str): The file location on the hard drive, or its content.
         data (dict): The data to send with the file.
         extra_files (list): List of extra files to upload.
         files (dict): The dictionary of files to upload.
         client (KitsuClient): The client to use for the request.
         progress_callback (Callable): Callback ``(bytes_read, total)``
             invoked during upload. *total* is the sum of all file sizes.
+        progress_interval (float): Minimum time in seconds between two calls
+            of the progress callback.
 
     Returns:
         Any: Response from the API.
@@ -834,37 +2159,52 @@ def upload(
         data = {}
     if extra_files is None:
         extra_files = []
+    if (
+        not files
+        and not extra_files
+        and client.chunked_upload_threshold is not None
+        and isinstance(file_path, (str, os.PathLike))
+        and get_route(path) not in client.unsupported_chunked_uploads
+        and os.path.getsize(file_path) >= client.chunked_upload_threshold
+    ):
+        try:
+            return upload_chunked(
+                path,
+                file_path,
+                data=data,
+                client=client,
+                progress_callback=progress_callback,
+            )
+        except (RouteNotFoundException, MethodNotAllowedException):
+            logger.debug("No multipart upload on %s, sending one part", path)
+            client.unsupported_chunked_uploads.add(get_route(path))
     url = get_full_url(path, client)
-    opened_files = None
-    if not files:
-        files = _build_file_dict(file_path, extra_files)
-        opened_files = files
-    if progress_callback is not None:
-        total = sum(os.fstat(f.fileno()).st_size for f in files.values())
-        offset = 0
-        wrapped = {}
-        for key, f in files.items():
-            wrapper = _ProgressFileWrapper(f, progress_callback, offset, total)
-            wrapped[key] = wrapper
-            offset += os.fstat(f.fileno()).st_size
-        files = wrapped
+    opened_files = []
+    body = None
     try:
+        if not files:
+            files = _build_file_dict(file_path, extra_files, opened_files)
+        body = MultipartBody(data, files, progress_callback, progress_interval)
         retry = True
         while retry:
+            body.seek(0)
             response = client.session.post(
                 url,
-                data=data,
-                headers=make_auth_header(client=client),
-                files=files,
+                data=body,
+                headers=dict(
+                    make_auth_header(client=client),
+                    **{"Content-Type": body.content_type},
+                ),
             )
             _, retry = check_status(response, path, client=client)
     finally:
-        if opened_files:
-            for f in opened_files.values():
-                f.close()
+        if body is not None:
+            body.close()
+        for f in opened_files:
+            f.close()
     try:
-        result = response.json()
-    except json.JSONDecodeError:
+        result = read_json(response, client)
+    except ValueError:
         logger.error("Failed to decode JSON response: %s", response.text)
         raise
 
@@ -875,77 +2215,674 @@ def upload(
     return result
 
 
-def _build_file_dict(file_path: str, extra_files: list[str]) -> dict:
+def _build_file_dict(
+    file_path: Any, extra_files: list, opened_files: list | None = None
+) -> dict:
     """
-    Build a dictionary of files to upload.
+    Build a dictionary of files to upload. Paths are opened, buffers and
+    ``(file_name, buffer)`` tuples are kept as is.
 
     Args:
-        file_path (str): The file location on the hard drive.
+        file_path (str): The file location on the hard drive, or its content.
         extra_files (list): List of extra files to upload.
+        opened_files (list): List filled with the opened files.
 
     Returns:
         dict: The dictionary of files to upload.
     """
-
+    if opened_files is None:
+        opened_files = []
     files = {}
     try:
-        files["file"] = open(file_path, "rb")
-        for i, extra_path in enumerate(extra_files, start=1):
-            files[f"file-{i}"] = open(extra_path, "rb")
+        for i, source in enumerate([file_path] + list(extra_files)):
+            if isinstance(source, (str, os.PathLike)):
+                source = open(source, "rb")
+                opened_files.append(source)
+            files["file" if i == 0 else f"file-{i}"] = source
     except Exception:
-        for f in files.values():
+        for f in opened_files:
             f.close()
         raise
 
     return files
 
 
+def upload_chunked(
+    path: str,
+    file_path: str,
+    data: dict | None = None,
+    part_size: int | None = None,
+    max_workers: int | None = None,
+    part_attempts: int = 3,
+    client: KitsuClient = default_client,
+    progress_callback: Callable | None = None,
+) -> Any:
+    """
+    Upload file located at *file_path* to given url *path* in parts of
+    *part_size* bytes, sent in parallel. Each part is sent with its SHA-256
+    digest and sent again when the server acknowledges another digest. If
+    the upload is interrupted, uploading the same file to the same path
+    again only sends the parts the server didn't acknowledge.
+
+    The server is expected to expose these routes below *path*:
+
+    * ``POST uploads``: start an upload, returns its ``id``.
+    * ``GET uploads/<id>``: returns the acknowledged ``parts``.
+    * ``PUT uploads/<id>/parts/<number>``: store a part, returns its
+      ``number`` and ``checksum``.
+    * ``POST uploads/<id>/complete``: assemble the parts and process the
+      file like a single request upload would.
+
+    Args:
+        path (str): The url path to upload file.
+        file_path (str): The file location on the hard drive.
+        data (dict): The data to send with the file.
+        part_size (int): Size of the parts in bytes. Defaults to the
+            client upload part size.
+        max_workers (int): Maximum number of parts sent at the same time.
+            Defaults to the client concurrency limit.
+        part_attempts (int): Maximum number of attempts to send a part.
+        client (KitsuClient): The client to use for the request.
+        progress_callback (Callable): Callback ``(bytes_sent, total)``
+            invoked each time a part is acknowledged.
+
+    Returns:
+        Any: Response from the API.
+
+    Raises:
+        RouteNotFoundException: when the server doesn't support multipart
+            uploads on given path.
+    """
+    part_size = part_size or client.upload_part_size
+    size = os.path.getsize(file_path)
+    part_count = max(1, -(-size // part_size))
+    uploads_path = url_path_join(path, "uploads")
+    state_path = get_upload_state_path(path, file_path, part_size, client)
+
+    upload_id = None
+    acknowledged = {}
+    if os.path.exists(state_path):
+        with open(state_path) as state_file:
+            upload_id = json.load(state_file)["id"]
+        try:
+            upload = get(url_path_join(uploads_path, upload_id), client=client)
+            acknowledged = {
+                part["number"]: part["checksum"] for part in upload["parts"]
+            }
+        except RouteNotFoundException:
+            # The upload expired on the server side.
+            upload_id = None
+    if upload_id is None:
+        upload_id = post(
+            uploads_path,
+            {
+                "file_name": os.path.basename(file_path),
+                "size": size,
+                "part_size": part_size,
+                "parts": part_count,
+            },
+            client=client,
+        )["id"]
+        os.makedirs(os.path.dirname(state_path), exist_ok=True)
+        with open(state_path, "w") as state_file:
+            json.dump({"id": upload_id}, state_file)
+
+    upload_path = url_path_join(uploads_path, upload_id)
+    lock = threading.Lock()
+    progress = {"sent": 0}
+
+    def report(number: int) -> None:
+        if progress_callback is None:
+            return
+        with lock:
+            progress["sent"] += min(part_size, size - number * part_size)
+            progress_callback(progress["sent"], size)
+
+    for number in acknowledged:
+        report(number)
+
+    def send_part(number: int) -> str:
+        with client.concurrency_limiter:
+            checksum = _upload_part(
+                upload_path,
+                file_path,
+                number,
+                part_size,
+                part_attempts,
+                client,
+            )
+        report(number)
+        return checksum
+
+    missing_parts = [
+        number for number in range(part_count) if number not in acknowledged
+    ]
+    with ThreadPoolExecutor(
+        max_workers=max_workers or client.max_concurrency
+    ) as executor:
+        for number, checksum in zip(
+            missing_parts, executor.map(send_part, missing_parts)
+        ):
+            acknowledged[number] = checksum
+
+    response = send_json_request(
+        "POST",
+        url_path_join(upload_path, "complete"),
+        {
+            "data": data or {},
+            "parts": [
+                {"number": number, "checksum": acknowledged[number]}
+                for number in range(part_count)
+            ],
+        },
+        client,
+    )
+    os.remove(state_path)
+    result = read_json(response, client)
+    result_message = get_message_from_response(response, default_message="")
+    if result_message:
+        raise UploadFailedException(result_message)
+    return result
+
+
+def _upload_part(
+    upload_path: str,
+    file_path: str,
+    number: int,
+    part_size: int,
+    attempts: int,
+    client: KitsuClient,
+) -> str:
+    """
+    Send one part of a multipart upload, and send it again when the
+    connection fails or when the server acknowledges another digest.
+
+    Returns:
+        str: The digest of the part.
+    """
+    with open(file_path, "rb") as source_file:
+        source_file.seek(number * part_size)
+        part = source_file.read(part_size)
+    checksum = "sha256:" + base64.b64encode(
+        hashlib.sha256(part).digest()
+    ).decode("ascii")
+    path = url_path_join(upload_path, "parts", str(number))
+    attempt = 1
+    while True:
+        try:
+            response = send_request(
+                "PUT",
+                path,
+                client=client,
+                headers={
+                    "Content-Type": "application/octet-stream",
+                    "Content-Digest": "sha-256=:%s:" % checksum[7:],
+                },
+                data=part,
+            )
+            received_checksum = read_json(response, client).get("checksum")
+            if received_checksum == checksum:
+                return checksum
+            error = UploadFailedException(
+                f"Part {number} of {file_path} was corrupted during upload."
+            )
+        except (
+            requests.ConnectionError,
+            requests.Timeout,
+            ServerErrorException,
+        ) as exception:
+            error = exception
+        if attempt >= attempts:
+            raise error
+        logger.debug("Part %s of %s failed, sending it again", number, path)
+        attempt += 1
+
+
+def get_upload_state_path(
+    path: str, file_path: str, part_size: int, client: KitsuClient
+) -> str:
+    """
+    Returns:
+        str: Location of the file storing the ID of the multipart upload of
+        given file to given path. Modifying the file changes the location,
+        so the upload starts over.
+    """
+    stat = os.stat(file_path)
+    key = json.dumps(
+        [
+            get_full_url(path, client),
+            os.path.abspath(file_path),
+            stat.st_size,
+            stat.st_mtime_ns,
+            part_size,
+        ]
+    )
+    return os.path.join(
+        client.upload_state_dir,
+        hashlib.sha1(key.encode("utf-8")).hexdigest() + ".json",
+    )
+
+
 def download(
     path: str,
     file_path: str,
     params: dict | None = None,
     client: KitsuClient = default_client,
     progress_callback: Callable | None = None,
+    max_workers: int | None = None,
+    sha256: str | None = None,
 ) -> requests.Response:
     """
     Download file located at *file_path* to given url *path*.
 
+    When the client has a download range size and the server supports
+    range requests, files bigger than that size are downloaded in ranges,
+    fetched in parallel and written into a `.part` file next to
+    *file_path*. If the download is interrupted, downloading the same file
+    again only fetches the missing ranges. The size of the result is
+    checked, and so is its SHA-256 digest when it is given or sent by the
+    server (`Repr-Digest` header).
+
     Args:
         path (str): The url path to download file from.
-        file_path (str): The location to store the file on the hard drive.
+        file_path (str): The location to store the file on the hard drive,
+            or a sink to stream the file into (see `download_to`).
         params (dict): The parameters to pass to the request.
         client (KitsuClient): The client to use for the request.
         progress_callback (Callable): Callback ``(bytes_read, total)``
             invoked during download. *total* is 0 when unknown.
+        max_workers (int): Maximum number of ranges fetched at the same
+            time. Defaults to the client concurrency limit.
+        sha256 (str): Expected hexadecimal SHA-256 digest of the file.
 
     Returns:
         Response: Request response object.
 
+    Raises:
+        DownloadFileException: when the file changed on the server during
+            the download, or when the downloaded file is corrupted.
     """
     path = build_path_with_params(path, params)
-    with client.session.get(
-        get_full_url(path, client),
-        headers=make_auth_header(client=client),
+    if not isinstance(file_path, (str, os.PathLike)):
+        with send_request("GET", path, client=client, stream=True) as response:
+            write_to_sink(response, file_path, progress_callback)
+        return response
+
+    range_size = client.download_range_size
+    if not range_size:
+        with send_request("GET", path, client=client, stream=True) as response:
+            _write_stream(response, file_path, progress_callback)
+            return response
+
+    response = send_request(
+        "GET",
+        path,
+        client=client,
+        headers={
+            "Range": f"bytes=0-{range_size - 1}",
+            "Accept-Encoding": "identity",
+        },
         stream=True,
-    ) as response:
-        with open(file_path, "wb") as target_file:
+    )
+    with response:
+        if response.status_code == 416:
+            # Even the first byte can't be served: the file is empty.
+            return _write_empty_file(response, file_path, path, sha256)
+        total = get_range_total(response)
+        if total == 0:
+            return _write_empty_file(response, file_path, path, sha256)
+        if total is None:
+            # No range support: the whole file is in this response.
+            _write_stream(response, file_path, progress_callback)
+            return response
+
+        validator = response.headers.get("ETag") or response.headers.get(
+            "Last-Modified"
+        )
+        if sha256 is None:
+            sha256 = get_sha256_from_digest(response.headers)
+        range_count = max(1, -(-total // range_size))
+        part_path = file_path + ".part"
+        state_path = part_path + ".json"
+        state = {
+            "size": total,
+            "validator": validator,
+            "range_size": range_size,
+        }
+        done = set()
+        if os.path.exists(part_path) and os.path.exists(state_path):
+            with open(state_path) as state_file:
+                previous_state = json.load(state_file)
+            previous_done = previous_state.pop("done", [])
+            # Without validator, there is no way to know whether the file
+            # changed since the previous attempt.
+            if validator and previous_state == state:
+                done = set(previous_done)
+        lock = threading.Lock()
+        progress = {"read": 0}
+
+        def report(size: int) -> None:
+            if progress_callback is not None:
+                with lock:
+                    progress["read"] += size
+                    progress_callback(progress["read"], total)
+
+        def save_range(index: int) -> None:
+            if range_count > 1:
+                # The range must be on disk before it is marked as done.
+                os.fsync(fd)
+            with lock:
+                done.add(index)
+                if range_count > 1:
+                    with open(state_path + ".tmp", "w") as state_file:
+                        json.dump(dict(state, done=sorted(done)), state_file)
+                    os.replace(state_path + ".tmp", state_path)
+
+        for index in done:
+            report(min(range_size, total - index * range_size))
+
+        # Without O_BINARY, Windows writes the ranges in text mode.
+        fd = os.open(
+            part_path,
+            os.O_RDWR | os.O_CREAT | getattr(os, "O_BINARY", 0),
+            0o644,
+        )
+        try:
+            if not done:
+                _preallocate(fd, total)
+            if 0 not in done:
+                _write_range(fd, response, 0, lock, report)
+                save_range(0)
+        except BaseException:
+            os.close(fd)
+            raise
+
+    def fetch_range(index: int) -> None:
+        start = index * range_size
+        end = min(start + range_size, total) - 1
+        headers = {
+            "Range": f"bytes={start}-{end}",
+            "Accept-Encoding": "identity",
+        }
+        if validator:
+            headers["If-Range"] = validator
+        with client.concurrency_limiter:
+            with send_request(
+                "GET", path, client=client, headers=headers, stream=True
+            ) as range_response:
+                if range_response.status_code != 206:
+                    raise DownloadFileException(
+                        f"File ({path}) changed during the download."
+                    )
+                _write_range(fd, range_response, start, lock, report)
+        save_range(index)
+
+    try:
+        missing_ranges = [
+            index for index in range(1, range_count) if index not in done
+        ]
+        with ThreadPoolExecutor(
+            max_workers=max_workers or client.max_concurrency
+        ) as executor:
+            for _ in executor.map(fetch_range, missing_ranges):
+                pass
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+    try:
+        size = os.path.getsize(part_path)
+        if size != total:
+            raise DownloadFileException(
+                f"File ({path}) is {size} bytes long instead of {total}."
+            )
+        if sha256 is not None and get_file_sha256(part_path) != sha256:
+            raise DownloadFileException(
+                f"File ({path}) doesn't match its SHA-256 digest."
+            )
+    except DownloadFileException:
+        # Start over on the next attempt.
+        os.remove(part_path)
+        raise
+    finally:
+        if os.path.exists(state_path):
+            os.remove(state_path)
+    os.replace(part_path, file_path)
+    return response
+
+
+def download_to(
+    path: str,
+    sink: Any,
+    params: dict | None = None,
+    chunk_size: int = 64 * 1024,
+    client: KitsuClient = default_client,
+    progress_callback: Callable | None = None,
+) -> int:
+    """
+    Stream the file located at given url *path* into *sink*, without
+    holding the whole file in memory nor writing it to disk.
+
+    Example::
+
+        buffer = bytearray(2 * 1024 * 1024)
+        size = gazu.client.download_to(thumbnail_path, buffer)
+        image = buffer[:size]
+
+        ffmpeg = subprocess.Popen(["ffmpeg", "-i", "-", ...], stdin=PIPE)
+        gazu.client.download_to(movie_path, ffmpeg.stdin)
+
+    Args:
+        path (str): The url path to download file from.
+        sink: Where to write the file content: a writable buffer
+            (bytearray, memoryview, mmap) filled from its start, a
+            generator receiving the chunks through `send`, an object with a
+            `write` method, or a function called with each chunk.
+        params (dict): The parameters to pass to the request.
+        chunk_size (int): Maximum size of the chunks given to the sink.
+        client (KitsuClient): The client to use for the request.
+        progress_callback (Callable): Callback ``(bytes_read, total)``
+            invoked during download. *total* is 0 when unknown.
+
+    Returns:
+        int: Number of bytes written into the sink.
+
+    Raises:
+        DownloadFileException: when the file doesn't fit in the buffer.
+    """
+    path = build_path_with_params(path, params)
+    with send_request("GET", path, client=client, stream=True) as response:
+        return write_to_sink(response, sink, progress_callback, chunk_size)
+
+
+class DownloadSink(object):
+    """
+    Write downloaded chunks into a destination given by the caller, see
+    `download_to`.
+    """
+
+    def __init__(self, sink: Any) -> None:
+        self.sink = sink
+        self.size = 0
+        self.buffer = None
+        if isinstance(sink, (bytearray, memoryview, mmap.mmap)):
+            self.buffer = memoryview(sink).cast("B")
+            if self.buffer.readonly:
+                raise TypeError("The download buffer is read-only.")
+        elif inspect.isgenerator(sink):
+            if inspect.getgeneratorstate(sink) == inspect.GEN_CREATED:
+                next(sink)
+        elif not hasattr(sink, "write") and not callable(sink):
+            raise TypeError(f"Can't write downloaded data into {sink!r}.")
+
+    def write(self, chunk: bytes) -> None:
+        if self.buffer is not None:
+            end = self.size + len(chunk)
+            if end > len(self.buffer):
+                raise DownloadFileException(
+                    f"The file doesn't fit in the {len(self.buffer)} bytes "
+                    "buffer."
+                )
+            self.buffer[self.size : end] = chunk
+        elif inspect.isgenerator(self.sink):
+            self.sink.send(chunk)
+        elif hasattr(self.sink, "write"):
+            self.sink.write(chunk)
+        else:
+            self.sink(chunk)
+        self.size += len(chunk)
+
+    def close(self) -> None:
+        if inspect.isgenerator(self.sink):
+            self.sink.close()
+
+
+def write_to_sink(
+    response: requests.Response,
+    sink: Any,
+    progress_callback: Callable | None = None,
+    chunk_size: int = 64 * 1024,
+) -> int:
+    """
+    Returns:
+        int: Number of bytes of the response body written into the sink.
+    """
+    writer = DownloadSink(sink)
+    total = int(response.headers.get("content-length", 0))
+    try:
+        for chunk in response.iter_content(chunk_size):
+            writer.write(chunk)
             if progress_callback is not None:
-                total = int(response.headers.get("content-length", 0))
-                bytes_read = 0
-                for chunk in response.iter_content(8192):
-                    target_file.write(chunk)
-                    bytes_read += len(chunk)
-                    progress_callback(bytes_read, total)
+                progress_callback(writer.size, total)
+    finally:
+        writer.close()
+    return writer.size
+
+
+def _write_stream(
+    response: requests.Response,
+    file_path: str,
+    progress_callback: Callable | None,
+) -> None:
+    with open(file_path, "wb") as target_file:
+        if progress_callback is not None:
+            total = int(response.headers.get("content-length", 0))
+            bytes_read = 0
+            for chunk in response.iter_content(8192):
+                target_file.write(chunk)
+                bytes_read += len(chunk)
+                progress_callback(bytes_read, total)
+        else:
+            shutil.copyfileobj(response.raw, target_file)
+
+
+def _preallocate(fd: int, size: int) -> None:
+    os.ftruncate(fd, 0)
+    try:
+        os.posix_fallocate(fd, 0, size)
+    except (AttributeError, OSError):
+        # Not available on this platform or file system.
+        os.ftruncate(fd, size)
+
+
+def _write_range(
+    fd: int,
+    response: requests.Response,
+    offset: int,
+    lock: threading.Lock,
+    report: Callable[[int], None],
+) -> None:
+    """
+    Write the body of given response in the file at given offset.
+    """
+    for chunk in response.iter_content(1024 * 1024):
+        view = memoryview(chunk)
+        while view:
+            if hasattr(os, "pwrite"):
+                written = os.pwrite(fd, view, offset)
             else:
-                shutil.copyfileobj(response.raw, target_file)
-        return response
+                with lock:
+                    os.lseek(fd, offset, os.SEEK_SET)
+                    written = os.write(fd, view)
+            view = view[written:]
+            offset += written
+        report(len(chunk))
+
+
+def _write_empty_file(
+    response: requests.Response,
+    file_path: str,
+    path: str,
+    sha256: str | None,
+) -> requests.Response:
+    """
+    Create an empty file at *file_path* for a ranged download of an empty
+    file, without writing the body of the response.
+    """
+    if sha256 is None:
+        sha256 = get_sha256_from_digest(response.headers)
+    if sha256 is not None and hashlib.sha256().hexdigest() != sha256:
+        raise DownloadFileException(
+            f"File ({path}) doesn't match its SHA-256 digest."
+        )
+    with open(file_path, "wb"):
+        pass
+    return response
+
+
+def get_range_total(response: requests.Response) -> int | None:
+    """
+    Returns:
+        int: The full size of the file a range response is part of, or None
+        if the response is not a range response.
+    """
+    if response.status_code != 206:
+        return None
+    content_range = response.headers.get("Content-Range", "")
+    unit, _, value = content_range.partition(" ")
+    total = value.rpartition("/")[2]
+    if unit != "bytes" or not total.isdigit():
+        raise DownloadFileException(
+            f"Unexpected Content-Range header: {content_range}"
+        )
+    return int(total)
+
+
+def get_sha256_from_digest(headers: Any) -> str | None:
+    """
+    Returns:
+        str: The hexadecimal SHA-256 digest of the whole file, read from the
+        `Repr-Digest` (RFC 9530) or legacy `Digest` header.
+    """
+    for header, separator in [("Repr-Digest", "="), ("Digest", "=")]:
+        for item in headers.get(header, "").split(","):
+            algorithm, _, value = item.strip().partition(separator)
+            if algorithm.lower() == "sha-256" and value:
+                try:
+                    return base64.b64decode(value.strip(":")).hex()
+                except ValueError:
+                    return None
+    return None
+
+
+def get_file_sha256(file_path: str) -> str:
+    """
+    Returns:
+        str: The hexadecimal SHA-256 digest of given file.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as source_file:
+        for chunk in iter(lambda: source_file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
 
 def get_file_data_from_url(
     url: str, full: bool = False, client: KitsuClient = default_client
 ) -> bytes:
     """
-    Return data found at given url.
+    Return data found at given url. The response is streamed into a
+    growing buffer, see `download_to`.
 
     Args:
         url (str): The url to fetch data from.
@@ -955,8 +2892,10 @@ def get_file_data_from_url(
     Returns:
         bytes: The data found at the given url.
     """
+    data = bytearray()
     if not full:
-        url = get_full_url(url)
+        download_to(url, data.extend, client=client)
+        return bytes(data)
     retry = True
     while retry:
         response = client.session.get(
@@ -965,7 +2904,11 @@ def get_file_data_from_url(
             headers=make_auth_header(client=client),
         )
         _, retry = check_status(response, url, client=client)
-    return response.content
+        if retry:
+            response.close()
+    with response:
+        write_to_sink(response, data.extend)
+    return bytes(data)
 
 
 def import_data(
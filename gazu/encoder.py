@@ -1,7 +1,19 @@
+from __future__ import annotations
+
 import json
 import datetime
 
-from typing import Any
+from typing import Any, Iterable, Iterator
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
 
 
 class CustomJSONEncoder(json.JSONEncoder):
@@ -15,3 +27,133 @@ class CustomJSONEncoder(json.JSONEncoder):
             return obj.isoformat()
 
         return json.JSONEncoder.default(self, obj)
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, datetime.datetime):
+        return obj.isoformat()
+    raise TypeError(
+        "Object of type %s is not JSON serializable" % type(obj).__name__
+    )
+
+
+def _json_dumps(data: Any) -> bytes:
+    return json.dumps(data, cls=CustomJSONEncoder).encode("utf-8")
+
+
+def _orjson_dumps(data: Any) -> bytes:
+    # Dates are serialized natively, in the same ISO format as the one of
+    # CustomJSONEncoder.
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # Types orjson doesn't support (integers over 64 bits, custom
+        # classes handled by a subclassed encoder...).
+        return _json_dumps(data)
+
+
+def _ujson_dumps(data: Any) -> bytes:
+    try:
+        return ujson.dumps(data, ensure_ascii=False, default=_default).encode(
+            "utf-8"
+        )
+    except (TypeError, OverflowError):
+        return _json_dumps(data)
+
+
+json_backends = {"json": (_json_dumps, json.loads)}
+if ujson is not None:
+    json_backends["ujson"] = (_ujson_dumps, ujson.loads)
+if orjson is not None:
+    json_backends["orjson"] = (_orjson_dumps, orjson.loads)
+
+json_settings = {
+    "backend": "orjson" if orjson else "ujson" if ujson else "json"
+}
+
+
+def get_json_backend() -> str:
+    """
+    Returns:
+        str: Name of the module used to encode and decode JSON payloads.
+    """
+    return json_settings["backend"]
+
+
+def set_json_backend(name: str) -> str:
+    """
+    Select the module used to encode and decode JSON payloads. By default,
+    orjson is used when it is installed, then ujson, then the standard
+    library.
+
+    Args:
+        name (str): "orjson", "ujson" or "json".
+
+    Returns:
+        str: The selected backend.
+    """
+    if name not in json_backends:
+        raise ValueError(
+            "JSON backend %s is not available, choose one of: %s"
+            % (name, ", ".join(sorted(json_backends)))
+        )
+    json_settings["backend"] = name
+    return name
+
+
+def dumps(data: Any) -> bytes:
+    """
+    Serialize data to UTF-8 encoded JSON with the selected backend. Dates
+    are written in ISO format.
+
+    Args:
+        data (Any): The data to serialize.
+
+    Returns:
+        bytes: The JSON document.
+    """
+    return json_backends[json_settings["backend"]][0](data)
+
+
+def iter_dumps_list(
+    items: Iterable, chunk_size: int = 64 * 1024
+) -> Iterator[bytes]:
+    """
+    Serialize given items to a JSON array, one item after the other, so that
+    the whole document is never held in memory.
+
+    Args:
+        items (Iterable): The items to serialize.
+        chunk_size (int): Minimum size of the yielded chunks, the last one
+            excepted.
+
+    Returns:
+        Iterator: Chunks of the UTF-8 encoded JSON document.
+    """
+    buffer = bytearray(b"[")
+    for index, item in enumerate(items):
+        if index:
+            buffer += b","
+        buffer += dumps(item)
+        if len(buffer) >= chunk_size:
+            yield bytes(buffer)
+            buffer.clear()
+    buffer += b"]"
+    yield bytes(buffer)
+
+
+def loads(data: bytes | str) -> Any:
+    """
+    Parse a JSON document with the selected backend. Bytes are parsed as is,
+    without decoding them to a string first.
+
+    Args:
+        data (bytes): The JSON document.
+
+    Returns:
+        Any: The parsed data.
+
+    Raises:
+        ValueError: when the document is not valid JSON.
+    """
+    return json_backends[json_settings["backend"]][1](data)
@@ -7,6 +7,7 @@ import signal
 from typing import Any, Callable
 
 from engineio.base_client import signal_handler
+from . import cache
 from .exception import AuthFailedException
 
 from .client import (
@@ -83,10 +84,65 @@ def add_listener(
     """
     Set a listener that reacts to a given event.
     """
+    if getattr(event_client, "gazu_cache_invalidation", False):
+        event_handler = with_cache_invalidation(event_name, event_handler)
     event_client.on(event_name, event_handler, "/events")
     return event_client
 
 
+def add_cache_invalidation(event_client: socketio.Client) -> socketio.Client:
+    """
+    Evict cached results affected by the events received by the client
+    (`task:update`, `asset:update`, `shot:new`...), so cached functions can
+    keep a long expiration time without serving stale data. Listeners set
+    with `add_listener` still run, after the eviction.
+
+    Example::
+
+        event_client = gazu.events.init()
+        gazu.events.add_cache_invalidation(event_client)
+        gazu.events.run_client(event_client)
+    """
+    event_client.gazu_cache_invalidation = True
+    cache.enable_reference_index()
+    handlers = event_client.handlers.get("/events", {})
+    for event_name, handler in list(handlers.items()):
+        if event_name != "*" and not getattr(
+            handler, "invalidates_cache", False
+        ):
+            handlers[event_name] = with_cache_invalidation(event_name, handler)
+    event_client.on("*", invalidate_cache_for_event, "/events")
+    return event_client
+
+
+def invalidate_cache_for_event(event_name: str, data: Any = None) -> int:
+    """
+    Evict cached results affected by given event.
+
+    Returns:
+        int: Number of evicted entries.
+    """
+    removed = cache.invalidate_for_event(event_name, data)
+    if removed:
+        logger.debug("%s: %s cache entries evicted", event_name, removed)
+    return removed
+
+
+def with_cache_invalidation(
+    event_name: str, event_handler: Callable
+) -> Callable:
+    """
+    Wrap an event handler so that the cache is invalidated before it runs.
+    """
+
+    def handler(*args: Any) -> Any:
+        invalidate_cache_for_event(event_name, args[0] if args else None)
+        return event_handler(*args)
+
+    handler.invalidates_cache = True
+    return handler
+
+
 def run_client(event_client: socketio.Client) -> socketio.Client:
     """
     Run event client (it blocks current thread). It listens to all events
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
+import os
+import threading
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Iterator
 from typing_extensions import Literal
+from urllib.parse import urlparse
 
 import requests
 
@@ -8,7 +14,7 @@ from . import client as raw
 
 from .cache import cache
 from .client import KitsuClient
-from .helpers import normalize_model_parameter
+from .helpers import normalize_model_parameter, sanitize_filename
 
 default = raw.default_client
 
@@ -384,6 +390,51 @@ def all_output_files_for_project(
     return raw.fetch_all(path, params, client=client)
 
 
+def iter_output_files_for_project(
+    project: str | dict,
+    output_type: str | dict | None = None,
+    task_type: str | dict | None = None,
+    name: str | None = None,
+    representation: str | None = None,
+    file_status: str | dict | None = None,
+    client: KitsuClient = default,
+) -> Iterator[dict]:
+    """
+    Same as `all_output_files_for_project` but yield output files while the
+    response is decoded, without holding the whole list in memory.
+
+    Args:
+        project (str / dict): The project dict or ID.
+        output_type (str / dict): The output type dict or ID.
+        task_type (str / dict): The task type dict or ID.
+        name (str): The file name
+        representation (str): The file representation
+        file_status (str / dict): The file status
+
+    Yields:
+        dict: Output files for given project and filters.
+    """
+    project = normalize_model_parameter(project)
+    output_type = normalize_model_parameter(output_type)
+    task_type = normalize_model_parameter(task_type)
+    file_status = normalize_model_parameter(file_status)
+    path = f"projects/{project['id']}/output-files"
+
+    params = {}
+    if output_type:
+        params["output_type_id"] = output_type["id"]
+    if task_type:
+        params["task_type_id"] = task_type["id"]
+    if representation:
+        params["representation"] = representation
+    if name:
+        params["name"] = name
+    if file_status:
+        params["file_status_id"] = file_status["id"]
+
+    return raw.iter_all(path, params, client=client)
+
+
 @cache
 def all_softwares(client: KitsuClient = default) -> list[dict]:
     """
@@ -1602,6 +1653,192 @@ def download_preview_lowdef_movie(
     )
 
 
+def get_preview_file_download_url(
+    preview_file: dict, kind: str = "original"
+) -> tuple[str, str]:
+    """
+    Get the URL of given version of a preview file, without any request.
+
+    Args:
+        preview_file (dict): The preview file dict, with its extension.
+        kind (str): "original", "thumbnail" or "lowdef".
+
+    Returns:
+        tuple: The URL and the extension of the file it serves.
+    """
+    preview_id = preview_file["id"]
+    extension = preview_file.get("extension")
+    if kind == "thumbnail":
+        return f"pictures/thumbnails/preview-files/{preview_id}.png", "png"
+    elif kind == "lowdef":
+        if extension == "mp4":
+            return f"movies/lowdef/preview-files/{preview_id}.mp4", "mp4"
+        return f"pictures/previews/preview-files/{preview_id}.png", "png"
+    elif kind == "original":
+        file_type = "movies" if extension == "mp4" else "pictures"
+        return (
+            f"{file_type}/originals/preview-files/{preview_id}.{extension}",
+            extension,
+        )
+    raise ValueError(
+        f"Unknown preview kind {kind}, use original, thumbnail or lowdef."
+    )
+
+
+def download_many(
+    preview_files: list[str | dict],
+    dest_dir: str,
+    kind: Literal["original", "thumbnail", "lowdef"] = "original",
+    file_name: str = "{id}",
+    overwrite: bool = False,
+    max_workers: int | None = None,
+    max_connections_per_host: int | None = None,
+    client: KitsuClient = default,
+    progress_callback: Callable | None = None,
+) -> dict:
+    """
+    Download many preview files at once, with a bounded pool of workers.
+    Each file is written to a `.part` file first, renamed once complete, so
+    an interrupted run leaves no truncated file behind. Files already
+    present in the destination folder are skipped when their size matches
+    the one stored in the preview file, which is only known for originals.
+
+    Args:
+        preview_files (list): The preview file dicts or IDs.
+        dest_dir (str): Folder where to store the files.
+        kind (str): Version to download: "original", "thumbnail" or
+            "lowdef".
+        file_name (str): Template of the file names, without extension,
+            filled with the preview file fields.
+        overwrite (bool): Whether to download files already present.
+        max_workers (int): Maximum number of files downloaded at the same
+            time. Defaults to the client concurrency limit.
+        max_connections_per_host (int): Maximum number of downloads running
+            at the same time toward the same host. Defaults to the size of
+            the client connection pools, so that connections are reused.
+        progress_callback (Callable): Callback ``(bytes_read, total,
+            files_done, files_total)`` invoked during downloads. *total* is
+            the size of the originals, 0 for other kinds.
+
+    Returns:
+        dict: Paths of the "downloaded" and "skipped" files, and the
+        errors raised for the "failed" ones, by preview file ID.
+    """
+    preview_files = [
+        normalize_model_parameter(preview_file)
+        for preview_file in preview_files
+    ]
+    if kind != "thumbnail":
+        missing_ids = [
+            preview_file["id"]
+            for preview_file in preview_files
+            if "extension" not in preview_file
+        ]
+        fetched = raw.fetch_many("preview-files", missing_ids, client=client)
+        preview_files = [
+            fetched.get(preview_file["id"], preview_file)
+            for preview_file in preview_files
+        ]
+    os.makedirs(dest_dir, exist_ok=True)
+    if max_connections_per_host is None:
+        max_connections_per_host = client.pool_maxsize
+    host_limiters = {}
+    results = {"downloaded": {}, "skipped": {}, "failed": {}}
+    lock = threading.Lock()
+    progress = {
+        "read": 0,
+        "total": 0,
+        "files_done": 0,
+        "files_total": len(preview_files),
+    }
+    if kind == "original":
+        progress["total"] = sum(
+            preview_file.get("file_size") or 0
+            for preview_file in preview_files
+        )
+
+    def report(size: int = 0, file_done: bool = False) -> None:
+        with lock:
+            progress["read"] += size
+            progress["files_done"] += int(file_done)
+            if progress_callback is not None:
+                progress_callback(
+                    progress["read"],
+                    progress["total"],
+                    progress["files_done"],
+                    progress["files_total"],
+                )
+
+    def download_preview(preview_file: dict) -> None:
+        try:
+            url, extension = get_preview_file_download_url(preview_file, kind)
+            file_path = os.path.join(
+                dest_dir,
+                sanitize_filename(
+                    f"{file_name.format(**preview_file)}.{extension}"
+                ),
+            )
+            if not overwrite and is_downloaded(file_path, preview_file, kind):
+                with lock:
+                    results["skipped"][preview_file["id"]] = file_path
+                report(os.path.getsize(file_path), file_done=True)
+                return
+
+            host = urlparse(raw.get_full_url(url, client)).netloc
+            with lock:
+                if host not in host_limiters:
+                    host_limiters[host] = threading.BoundedSemaphore(
+                        max_connections_per_host
+                    )
+            file_progress = {"read": 0}
+
+            def report_file(bytes_read: int, total: int) -> None:
+                report(bytes_read - file_progress["read"])
+                file_progress["read"] = bytes_read
+
+            part_path = file_path + ".part"
+            try:
+                with host_limiters[host]:
+                    raw.download(
+                        url,
+                        part_path,
+                        client=client,
+                        progress_callback=report_file,
+                    )
+            except BaseException:
+                # Ranged downloads resume from a part file of their own.
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+                raise
+            os.replace(part_path, file_path)
+            with lock:
+                results["downloaded"][preview_file["id"]] = file_path
+        except Exception as exception:
+            with lock:
+                results["failed"][preview_file["id"]] = exception
+        report(file_done=True)
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers or client.max_concurrency
+    ) as executor:
+        for _ in executor.map(download_preview, preview_files):
+            pass
+    return results
+
+
+def is_downloaded(file_path: str, preview_file: dict, kind: str) -> bool:
+    """
+    Returns:
+        bool: True if given file is a complete download of given version of
+        the preview file: its size matches the known size of the file.
+    """
+    if kind != "original" or not preview_file.get("file_size"):
+        return False
+    if not os.path.isfile(file_path):
+        return False
+    return os.path.getsize(file_path) == preview_file["file_size"]
+
+
 def get_attachment_thumbnail_url(
     attachment_file: str | dict, client: KitsuClient = default
 ) -> str:
@@ -106,41 +106,59 @@ def download_file(
         stream=True,
     ) as response:
         if response.ok:
-            if file_path is None:
-                file_path = tempfile.gettempdir()
+            file_path = get_download_file_path(
+                url, file_path, response.headers.get("Content-Type")
+            )
+            with open(file_path, "wb") as target_file:
+                shutil.copyfileobj(response.raw, target_file)
+            return file_path
+        else:
+            raise DownloadFileException(
+                f"File ({url}) can't be downloaded ({response.status_code} {response.reason})."
+            )
 
-            if os.path.isdir(file_path):
-                file_path = file_path + os.sep
 
-            (dir, filename) = os.path.split(file_path)
+def get_download_file_path(
+    url: str, file_path: str | None = None, content_type: str | None = None
+) -> str:
+    """
+    Get where to store a downloaded file. When *file_path* is a directory or
+    is not given, the file name is taken from the url and its extension is
+    guessed from the content type if needed.
 
-            if not filename:
-                url_parts = urlparse.urlparse(url)
-                filename = url_parts.path.split("/")[-1]
-            if not dir:
-                dir = os.getcwd()
+    Args:
+        url (str): The url the file is downloaded from.
+        file_path (str): The location asked for the file.
+        content_type (str): The content type of the response.
 
-            name, ext = os.path.splitext(filename)
+    Returns:
+        str: The location where to store the file.
+    """
+    if file_path is None:
+        file_path = tempfile.gettempdir()
 
-            if ext == "":
-                if "Content-Type" in response.headers:
-                    guessed_ext = mimetypes.guess_extension(
-                        response.headers["Content-Type"]
-                    )
-                    if guessed_ext is not None:
-                        ext = guessed_ext
+    if os.path.isdir(file_path):
+        file_path = file_path + os.sep
 
-            if name == "":
-                name = "file"
+    (dir, filename) = os.path.split(file_path)
 
-            filename = sanitize_filename(name + ext)
+    if not filename:
+        url_parts = urlparse.urlparse(url)
+        filename = url_parts.path.split("/")[-1]
+    if not dir:
+        dir = os.getcwd()
 
-            file_path = os.path.join(dir, filename)
+    name, ext = os.path.splitext(filename)
 
-            with open(file_path, "wb") as target_file:
-                shutil.copyfileobj(response.raw, target_file)
-            return file_path
-        else:
-            raise DownloadFileException(
-                f"File ({url}) can't be downloaded ({response.status_code} {response.reason})."
-            )
+    if ext == "":
+        if content_type is not None:
+            guessed_ext = mimetypes.guess_extension(content_type)
+            if guessed_ext is not None:
+                ext = guessed_ext
+
+    if name == "":
+        name = "file"
+
+    filename = sanitize_filename(name + ext)
+
+    return os.path.join(dir, filename)
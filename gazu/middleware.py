@@ -0,0 +1,322 @@
+"""
+Hooks run around every request sent by a client, and a middleware
+collecting timing statistics from them.
+
+Usage::
+
+    instrumentation = gazu.middleware.InstrumentationMiddleware()
+    gazu.client.default_client.add_middleware(instrumentation)
+    gazu.asset.all_assets_for_project(project)
+    print(instrumentation.to_prometheus())
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+
+from typing import Any
+
+from . import cache
+
+_UUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}",
+    re.IGNORECASE,
+)
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+
+
+class Middleware(object):
+    """
+    Base class for client middlewares. Each hook receives the request
+    infos, a dict with the following keys: method, path, url, headers,
+    attempt (1 for the first try, incremented on retries), bytes_sent and,
+    once the response is received, status_code, bytes_received and
+    duration (in seconds). Hooks can update the headers before the request
+    is sent, and store their own keys in the dict.
+    """
+
+    def before_request(self, request: dict) -> None:
+        """
+        Called before each attempt to send a request.
+        """
+
+    def after_response(self, request: dict, response: Any) -> None:
+        """
+        Called for each received response, whatever its status.
+        """
+
+    def on_error(self, request: dict, error: Exception) -> None:
+        """
+        Called when an attempt fails: connection errors, timeouts, and
+        error statuses turned into exceptions.
+        """
+
+    def after_decode(self, request: dict, duration: float) -> None:
+        """
+        Called after the JSON body of a response has been decoded.
+        """
+
+
+def run_middlewares(middlewares: list, hook: str, *args: Any) -> None:
+    """
+    Call given hook of every middleware, in the order they were added.
+    """
+    for middleware in middlewares:
+        getattr(middleware, hook)(*args)
+
+
+def get_route(path: str) -> str:
+    """
+    Args:
+        path (str): A request path.
+
+    Returns:
+        str: The path without its query string, IDs being replaced by
+        `:id`, so that requests on the same route are grouped together.
+    """
+    return _UUID_RE.sub(":id", path.split("?", 1)[0]).strip("/")
+
+
+class InstrumentationMiddleware(Middleware):
+    """
+    Record, per HTTP method and route: a latency histogram, the number of
+    requests, errors and retries, the bytes sent and received and the time
+    spent decoding JSON. Hit ratios of the cached functions are added when
+    statistics are exported.
+    """
+
+    def __init__(self, buckets: tuple = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self.routes = {}
+        self._lock = threading.Lock()
+
+    def _get_route_stats(self, request: dict) -> dict:
+        key = (request["method"], get_route(request["path"]))
+        stats = self.routes.get(key)
+        if stats is None:
+            stats = self.routes[key] = {
+                "requests": 0,
+                "errors": 0,
+                "retries": 0,
+                "status_codes": {},
+                "duration_sum": 0.0,
+                "duration_buckets": [0] * (len(self.buckets) + 1),
+                "bytes_sent": 0,
+                "bytes_received": 0,
+                "decodes": 0,
+                "decode_duration_sum": 0.0,
+            }
+        return stats
+
+    def after_response(self, request: dict, response: Any) -> None:
+        duration = request.get("duration", 0.0)
+        bucket = len(self.buckets)
+        for index, bound in enumerate(self.buckets):
+            if duration <= bound:
+                bucket = index
+                break
+        with self._lock:
+            stats = self._get_route_stats(request)
+            stats["requests"] += 1
+            if request["attempt"] > 1:
+                stats["retries"] += 1
+            status_code = request.get("status_code")
+            stats["status_codes"][status_code] = (
+                stats["status_codes"].get(status_code, 0) + 1
+            )
+            stats["duration_sum"] += duration
+            stats["duration_buckets"][bucket] += 1
+            stats["bytes_sent"] += request.get("bytes_sent") or 0
+            stats["bytes_received"] += request.get("bytes_received") or 0
+
+    def on_error(self, request: dict, error: Exception) -> None:
+        with self._lock:
+            stats = self._get_route_stats(request)
+            stats["errors"] += 1
+            if "status_code" not in request and request["attempt"] > 1:
+                # The attempt didn't reach after_response.
+                stats["retries"] += 1
+
+    def after_decode(self, request: dict, duration: float) -> None:
+        with self._lock:
+            stats = self._get_route_stats(request)
+            stats["decodes"] += 1
+            stats["decode_duration_sum"] += duration
+
+    def reset(self) -> None:
+        with self._lock:
+            self.routes = {}
+
+    def get_stats(self) -> dict:
+        """
+        Returns:
+            dict: Statistics by route ("METHOD route" keys), and hit ratios
+            of the cached functions that were called.
+        """
+        routes = {}
+        with self._lock:
+            for (method, route), stats in self.routes.items():
+                stats = dict(
+                    stats,
+                    status_codes=dict(stats["status_codes"]),
+                    duration_buckets=dict(
+                        zip(
+                            self.buckets + (float("inf"),),
+                            stats["duration_buckets"],
+                        )
+                    ),
+                )
+                stats["duration_average"] = (
+                    stats["duration_sum"] / stats["requests"]
+                    if stats["requests"]
+                    else 0.0
+                )
+                routes[f"{method} {route}"] = stats
+        return {"routes": routes, "cache": get_cache_stats()}
+
+    def to_prometheus(self, prefix: str = "gazu") -> str:
+        """
+        Returns:
+            str: The statistics in Prometheus text exposition format.
+        """
+        lines = []
+
+        def add_metric(name, metric_type, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {metric_type}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(
+                    f'{label}="{escape_label(label_value)}"'
+                    for label, label_value in labels
+                )
+                lines.append(
+                    f"{prefix}_{name}{suffix}{{{label_text}}} {value}"
+                )
+
+        with self._lock:
+            routes = sorted(self.routes.items())
+            duration_samples = []
+            counters = {
+                "requests_total": [],
+                "request_errors_total": [],
+                "request_retries_total": [],
+                "request_bytes_sent_total": [],
+                "response_bytes_received_total": [],
+            }
+            decode_samples = []
+            for (method, route), stats in routes:
+                labels = [("method", method), ("route", route)]
+                cumulative = 0
+                for bound, count in zip(
+                    self.buckets + ("+Inf",), stats["duration_buckets"]
+                ):
+                    cumulative += count
+                    duration_samples.append(
+                        ("_bucket", labels + [("le", bound)], cumulative)
+                    )
+                duration_samples.append(
+                    ("_sum", labels, stats["duration_sum"])
+                )
+                duration_samples.append(("_count", labels, stats["requests"]))
+                for status_code, count in sorted(
+                    stats["status_codes"].items(), key=lambda item: str(item)
+                ):
+                    counters["requests_total"].append(
+                        ("", labels + [("status", status_code)], count)
+                    )
+                for name, key in [
+                    ("request_errors_total", "errors"),
+                    ("request_retries_total", "retries"),
+                    ("request_bytes_sent_total", "bytes_sent"),
+                    ("response_bytes_received_total", "bytes_received"),
+                ]:
+                    counters[name].append(("", labels, stats[key]))
+                decode_samples.append(
+                    ("_sum", labels, stats["decode_duration_sum"])
+                )
+                decode_samples.append(("_count", labels, stats["decodes"]))
+
+        add_metric(
+            "request_duration_seconds",
+            "histogram",
+            "Duration of the requests sent to the Kitsu API.",
+            duration_samples,
+        )
+        for name, help_text in [
+            ("requests_total", "Responses received, by status code."),
+            ("request_errors_total", "Failed request attempts."),
+            ("request_retries_total", "Request attempts that were retries."),
+            ("request_bytes_sent_total", "Bytes of request bodies."),
+            ("response_bytes_received_total", "Bytes of response bodies."),
+        ]:
+            add_metric(name, "counter", help_text, counters[name])
+        add_metric(
+            "json_decode_seconds",
+            "summary",
+            "Time spent decoding JSON responses.",
+            decode_samples,
+        )
+
+        cache_stats = get_cache_stats()
+        for name, key, help_text in [
+            ("cache_hits_total", "hits", "Cached function hits."),
+            ("cache_misses_total", "misses", "Cached function misses."),
+            (
+                "cache_expired_hits_total",
+                "expired_hits",
+                "Cached function hits on expired entries.",
+            ),
+        ]:
+            add_metric(
+                name,
+                "counter",
+                help_text,
+                [
+                    ("", [("function", function_name)], stats[key])
+                    for function_name, stats in sorted(cache_stats.items())
+                ],
+            )
+        return "\n".join(lines) + "\n"
+
+
+def escape_label(value: Any) -> str:
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace('"', '\\"')
+        .replace("\n", "\\n")
+    )
+
+
+def get_cache_stats() -> dict:
+    """
+    Returns:
+        dict: Hits, misses and hit ratio of every cached function that was
+        called while the cache was enabled.
+    """
+    stats = {}
+    for function in cache.cached_functions:
+        infos = function.get_cache_infos()
+        calls = infos["hits"] + infos["misses"] + infos["expired_hits"]
+        if calls:
+            stats[function.cache_name] = {
+                "hits": infos["hits"],
+                "misses": infos["misses"],
+                "expired_hits": infos["expired_hits"],
+                "hit_ratio": infos["hits"] / calls,
+            }
+    return stats
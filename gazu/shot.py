@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from typing import Iterator
 from typing_extensions import Literal
 
 import requests
@@ -9,7 +10,10 @@ from . import client as raw
 from .sorting import sort_by_name
 from .cache import cache
 from .client import KitsuClient
-from .helpers import normalize_model_parameter
+from .helpers import (
+    normalize_model_parameter,
+    normalize_list_of_models_for_links,
+)
 
 default = raw.default_client
 
@@ -45,6 +49,23 @@ def all_shots_for_project(
     return sort_by_name(shots)
 
 
+def iter_shots_for_project(
+    project: str | dict, client: KitsuClient = default
+) -> Iterator[dict]:
+    """
+    Same as `all_shots_for_project` but yield shots while the response is
+    decoded, without holding the whole list in memory. Shots are not sorted.
+
+    Args:
+        project (str / dict): The project dict or the project ID.
+
+    Yields:
+        dict: Shots for given project.
+    """
+    project = normalize_model_parameter(project)
+    return raw.iter_all(f"projects/{project['id']}/shots", client=client)
+
+
 @cache
 def all_shots_for_episode(
     episode: str | dict, client: KitsuClient = default
@@ -242,6 +263,24 @@ def get_shot(shot_id: str, client: KitsuClient = default) -> dict:
     return raw.fetch_one("shots", shot_id, client=client)
 
 
+@cache
+def get_shots(
+    shots: list[str | dict], client: KitsuClient = default
+) -> dict[str, dict]:
+    """
+    Retrieve many shots in a few requests instead of one per shot.
+
+    Args:
+        shots (list): The shot dicts or the shot IDs.
+
+    Returns:
+        dict: Shots by ID. IDs matching no shot are left out.
+    """
+    return raw.fetch_many(
+        "shots", normalize_list_of_models_for_links(shots), client=client
+    )
+
+
 @cache
 def get_shot_by_name(
     sequence: str | dict, shot_name: str, client: KitsuClient = default
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import datetime
+import json
 import os
+import queue
+import shutil
 import tempfile
+import threading
+import time
+
+from typing import Callable
 
 from . import client as raw
 from . import asset as asset_module
@@ -17,6 +25,9 @@ from .helpers import normalize_model_parameter, validate_date_format
 
 default = raw.default_client
 
+IMPORT_BATCH_SIZE = 1000
+IMPORT_MAX_WORKERS = 1
+
 
 def get_last_events(
     limit: int = 20000,
@@ -28,13 +39,13 @@ def get_last_events(
     client: KitsuClient = default,
 ) -> list[dict]:
     """
-    Get last events that occured on the machine.
+    Get last events that occurred on the machine.
 
     Args:
         limit (int): Number of events to retrieve.
         project (str / dict): Get only events related to this project.
-        after (str): Get only events occuring after given date.
-        before (str): Get only events occuring before given date.
+        after (str): Get only events occurring after given date.
+        before (str): Get only events occurring before given date.
         only_files (bool): Get only events related to files.
 
     Returns:
@@ -55,51 +66,102 @@ def get_last_events(
 
 
 def import_entities(
-    entities: list[dict], client: KitsuClient = default
+    entities: list[dict],
+    client: KitsuClient = default,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    max_workers: int = IMPORT_MAX_WORKERS,
+    attempts: int = 3,
 ) -> list[dict]:
     """
     Import entities from another instance to target instance (keep id and audit
-    dates).
+    dates). Entities are sent in batches, see `raw.post_batches`.
 
     Args:
         entities (list): Entities to import.
+        batch_size (int): Maximum number of entities per request.
+        max_workers (int): Maximum number of requests running at the same
+            time. Batches are sent one after the other by default, with
+            more workers the order in which they are applied is not
+            guaranteed.
+        attempts (int): Maximum number of attempts per batch.
 
     Returns:
         list[dict]: Entities created.
     """
-    return raw.post("import/kitsu/entities", entities, client=client)
+    return raw.post_batches(
+        "import/kitsu/entities",
+        entities,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        attempts=attempts,
+        client=client,
+    )
 
 
 def import_tasks(
-    tasks: list[dict], client: KitsuClient = default
+    tasks: list[dict],
+    client: KitsuClient = default,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    max_workers: int = IMPORT_MAX_WORKERS,
+    attempts: int = 3,
 ) -> list[dict]:
     """
     Import tasks from another instance to target instance (keep id and audit
-    dates).
+    dates). Tasks are sent in batches, see `raw.post_batches`.
 
     Args:
         tasks (list): Tasks to import.
+        batch_size (int): Maximum number of tasks per request.
+        max_workers (int): Maximum number of requests running at the same
+            time. Batches are sent one after the other by default, with
+            more workers the order in which they are applied is not
+            guaranteed.
+        attempts (int): Maximum number of attempts per batch.
 
     Returns:
         list[dict]: Tasks created.
     """
-    return raw.post("import/kitsu/tasks", tasks, client=client)
+    return raw.post_batches(
+        "import/kitsu/tasks",
+        tasks,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        attempts=attempts,
+        client=client,
+    )
 
 
 def import_entity_links(
-    links: list[dict], client: KitsuClient = default
+    links: list[dict],
+    client: KitsuClient = default,
+    batch_size: int = IMPORT_BATCH_SIZE,
+    max_workers: int = IMPORT_MAX_WORKERS,
+    attempts: int = 3,
 ) -> list[dict]:
     """
     Import enitity links from another instance to target instance (keep id and
-    audit dates).
+    audit dates). Links are sent in batches, see `raw.post_batches`.
 
     Args:
         links (list): Entity links to import.
+        batch_size (int): Maximum number of links per request.
+        max_workers (int): Maximum number of requests running at the same
+            time. Batches are sent one after the other by default, with
+            more workers the order in which they are applied is not
+            guaranteed.
+        attempts (int): Maximum number of attempts per batch.
 
     Returns:
         dict: Entity links created.
     """
-    return raw.post("import/kitsu/entity-links", links, client=client)
+    return raw.post_batches(
+        "import/kitsu/entity-links",
+        links,
+        batch_size=batch_size,
+        max_workers=max_workers,
+        attempts=attempts,
+        client=client,
+    )
 
 
 def get_model_list_diff(
@@ -320,11 +382,166 @@ def get_sync_person_id_map(
     return get_id_map_by_id(persons_source, persons_target, field="email")
 
 
+class SyncContext(object):
+    """
+    ID maps between a source and a target API (departments, asset types,
+    projects, task types, task statuses and persons), shared by the sync
+    calls of a run so that each map is fetched once instead of once per
+    call. Maps are built on first use. Looking up a source ID missing from
+    a map rebuilds it, for instances created since it was built, unless it
+    was built less than `refresh_interval` seconds ago: a burst of missing
+    IDs triggers a single build. `get()` is a plain lookup and never
+    rebuilds.
+
+    The number of builds, the time spent building and the size of each map
+    are recorded in `stats`. Contexts work with sync clients only: the
+    async sync functions build their maps on each call.
+
+    Usage::
+
+        context = gazu.sync.SyncContext(client_source, client_target)
+        for project_source, project_target in projects:
+            gazu.sync.push_project_entities(
+                project_source,
+                project_target,
+                client_source,
+                client_target,
+                context=context,
+            )
+    """
+
+    MAP_NAMES = (
+        "department",
+        "asset_type",
+        "project",
+        "task_type",
+        "task_status",
+        "person",
+    )
+
+    def __init__(
+        self,
+        client_source: KitsuClient,
+        client_target: KitsuClient,
+        refresh_interval: float = 60.0,
+    ) -> None:
+        self.client_source = client_source
+        self.client_target = client_target
+        self.refresh_interval = refresh_interval
+        self._lock = threading.RLock()
+        self._maps = {}
+        self._built_at = {}
+        self.stats = {
+            name: {"builds": 0, "build_time": 0.0, "size": 0}
+            for name in self.MAP_NAMES
+        }
+
+    def build_map(self, name: str) -> dict:
+        builders = {
+            "department": get_sync_department_id_map,
+            "asset_type": get_sync_asset_type_id_map,
+            "project": get_sync_project_id_map,
+            "task_type": get_sync_task_type_id_map,
+            "task_status": get_sync_task_status_id_map,
+            "person": get_sync_person_id_map,
+        }
+        if name not in builders:
+            raise ValueError(
+                "Unknown ID map %s, choose one of: %s"
+                % (name, ", ".join(self.MAP_NAMES))
+            )
+        start = time.perf_counter()
+        id_map = builders[name](self.client_source, self.client_target)
+        stats = self.stats[name]
+        stats["builds"] += 1
+        stats["build_time"] += time.perf_counter() - start
+        stats["size"] = len(id_map)
+        self._built_at[name] = time.monotonic()
+        return id_map
+
+    def get_map(self, name: str) -> SyncIdMap:
+        """
+        Args:
+            name (str): Name of the map, one of `MAP_NAMES`.
+
+        Returns:
+            SyncIdMap: The map matching source IDs with target IDs, built
+            if needed.
+        """
+        with self._lock:
+            if name not in self._maps:
+                self._maps[name] = SyncIdMap(self, name, self.build_map(name))
+            return self._maps[name]
+
+    def refresh(self, name: str | None = None) -> None:
+        """
+        Rebuild given map, or all the built maps when no name is given.
+        Maps are updated in place.
+        """
+        with self._lock:
+            names = list(self._maps) if name is None else [name]
+            for name in names:
+                id_map = self.build_map(name)
+                sync_map = self._maps.get(name)
+                if sync_map is None:
+                    self._maps[name] = SyncIdMap(self, name, id_map)
+                else:
+                    for source_id in set(sync_map) - set(id_map):
+                        del sync_map[source_id]
+                    sync_map.update(id_map)
+
+    def get_missing_id(self, name: str, source_id: str) -> str:
+        """
+        Rebuild given map to find a source ID it doesn't contain. The map
+        is not rebuilt if its last build is less than `refresh_interval`
+        seconds old.
+
+        Raises:
+            KeyError: when the source ID has no match in the target API.
+        """
+        with self._lock:
+            sync_map = self.get_map(name)
+            if source_id not in sync_map:
+                age = time.monotonic() - self._built_at[name]
+                if age < self.refresh_interval:
+                    raise KeyError(source_id)
+                self.refresh(name)
+            if source_id not in sync_map:
+                raise KeyError(source_id)
+            return dict.__getitem__(sync_map, source_id)
+
+    def get_stats(self) -> dict:
+        """
+        Returns:
+            dict: Number of builds, total build time (in seconds) and size of
+            each map.
+        """
+        with self._lock:
+            return {name: dict(stats) for name, stats in self.stats.items()}
+
+
+class SyncIdMap(dict):
+    """
+    Map of source IDs to target IDs of a `SyncContext`, rebuilt from the
+    APIs when a missing source ID is looked up with `[]`. `get()` doesn't
+    rebuild the map.
+    """
+
+    def __init__(self, context: SyncContext, name: str, id_map: dict) -> None:
+        super().__init__(id_map)
+        self.context = context
+        self.name = name
+
+    def __missing__(self, source_id: str) -> str:
+        return self.context.get_missing_id(self.name, source_id)
+
+
 def push_assets(
     project_source: dict,
     project_target: dict,
     client_source: KitsuClient,
     client_target: KitsuClient,
+    context: SyncContext | None = None,
 ) -> list[dict]:
     """
     Copy assets from source to target and preserve audit fields (`id`,
@@ -335,12 +552,21 @@ def push_assets(
         project_target (dict): The project to push assets to
         client_source (KitsuClient): client to get data from source API
         client_target (KitsuClient): client to push data to target API
+        context (SyncContext): ID maps shared by the sync calls of a run.
 
     Returns:
         list: Pushed assets
     """
-    asset_types_map = get_sync_asset_type_id_map(client_source, client_target)
-    task_types_map = get_sync_task_type_id_map(client_source, client_target)
+    if context is None:
+        asset_types_map = get_sync_asset_type_id_map(
+            client_source, client_target
+        )
+        task_types_map = get_sync_task_type_id_map(
+            client_source, client_target
+        )
+    else:
+        asset_types_map = context.get_map("asset_type")
+        task_types_map = context.get_map("task_type")
     assets = asset_module.all_assets_for_project(
         project_source, client=client_source
     )
@@ -463,6 +689,7 @@ def push_project_entities(
     project_target: dict,
     client_source: KitsuClient,
     client_target: KitsuClient,
+    context: SyncContext | None = None,
 ) -> dict:
     """
     Copy assets, episodes, sequences, shots and entity links from source to
@@ -473,12 +700,17 @@ def push_project_entities(
         project_target (dict): The project to push assets to
         client_source (KitsuClient): client to get data from source API
         client_target (KitsuClient): client to push data to target API
+        context (SyncContext): ID maps shared by the sync calls of a run.
 
     Returns:
         dict: Pushed data
     """
     assets = push_assets(
-        project_source, project_target, client_source, client_target
+        project_source,
+        project_target,
+        client_source,
+        client_target,
+        context=context,
     )
     episodes = []
     if project_source["production_type"] == "tvshow":
@@ -509,6 +741,7 @@ def push_tasks(
     default_status: str | dict,
     client_source: KitsuClient,
     client_target: KitsuClient,
+    context: SyncContext | None = None,
 ) -> list[dict]:
     """
     Copy tasks from source to target and preserve audit fields (`id`,
@@ -521,65 +754,499 @@ def push_tasks(
         default_status (str / dict): The default status for the pushed tasks
         client_source (KitsuClient): client to get data from source API
         client_target (KitsuClient): client to push data to target API
+        context (SyncContext): ID maps shared by the sync calls of a run.
 
     Returns:
         list: Pushed entity links
     """
     default_status_id = normalize_model_parameter(default_status)["id"]
-    task_type_map = get_sync_task_type_id_map(client_source, client_target)
-    person_map = get_sync_person_id_map(client_source, client_target)
+    if context is None:
+        task_type_map = get_sync_task_type_id_map(client_source, client_target)
+        person_map = get_sync_person_id_map(client_source, client_target)
+    else:
+        task_type_map = context.get_map("task_type")
+        person_map = context.get_map("person")
 
     tasks = task_module.all_tasks_for_project(
         project_source, client=client_source
     )
     for task in tasks:
-        task["task_type_id"] = task_type_map[task["task_type_id"]]
-        task["task_status_id"] = default_status_id
-        task["assigner_id"] = person_map[task["assigner_id"]]
-        task["project_id"] = project_target["id"]
-
-        task["assignees"] = [
-            person_map[person_id] for person_id in task["assignees"]
-        ]
+        convert_task(
+            task, project_target, default_status_id, task_type_map, person_map
+        )
     return import_tasks(tasks, client=client_target)
 
 
+def convert_task(
+    task: dict,
+    project_target: dict,
+    default_status_id: str,
+    task_type_map: dict,
+    person_map: dict,
+) -> dict:
+    """
+    Replace, in place, the source IDs of given task by the target ones. The
+    task gets the default status: its status history is replayed with its
+    comments.
+
+    Returns:
+        dict: The converted task.
+    """
+    task["task_type_id"] = task_type_map[task["task_type_id"]]
+    task["task_status_id"] = default_status_id
+    task["assigner_id"] = person_map[task["assigner_id"]]
+    task["project_id"] = project_target["id"]
+    task["assignees"] = [
+        person_map[person_id] for person_id in task["assignees"]
+    ]
+    return task
+
+
 def push_tasks_comments(
     project_source: dict,
     client_source: KitsuClient,
     client_target: KitsuClient,
+    max_workers: int = 4,
+    queue_size: int = 64,
+    stats: PipelineStats | None = None,
+    blob_store: BlobStore | None = None,
+    ledger: TransferLedger | None = None,
+    context: SyncContext | None = None,
 ) -> list[dict]:
     """
     Create a new comment into target api for each comment in source project
     but preserve only `created_at` field.
     Attachments and previews are created too.
 
+    Comments are pushed through a pipeline of three stages running at the
+    same time, each with its own pool of workers: fetching the comments of
+    each task from the source API, downloading their attachments and
+    previews, and creating them into the target API. Comments of a task
+    are created in their original order.
+
     Args:
         project_source (dict): The project to get assets from
         client_source (KitsuClient): client to get data from source API
         client_target (KitsuClient): client to push data to target API
+        max_workers (int): Number of workers of each stage.
+        queue_size (int): Maximum number of comments waiting for their
+            download, and of tasks waiting for the upload of their
+            comments. Downloaded files waiting for their upload belong to
+            at most that many tasks, plus the ones held by the workers.
+        stats (PipelineStats): Statistics to fill with the throughput of
+            each stage.
+        blob_store (BlobStore): Local store reusing the files already
+            downloaded from the source API.
+        ledger (TransferLedger): Record of the comments and previews
+            already pushed, which are skipped.
+        context (SyncContext): ID maps shared by the sync calls of a run.
 
     Returns:
         list: Created comments
     """
-    task_status_map = get_sync_task_status_id_map(client_source, client_target)
-    person_map = get_sync_person_id_map(client_source, client_target)
+    if context is None:
+        task_status_map = get_sync_task_status_id_map(
+            client_source, client_target
+        )
+        person_map = get_sync_person_id_map(client_source, client_target)
+    else:
+        task_status_map = context.get_map("task_status")
+        person_map = context.get_map("person")
     tasks = task_module.all_tasks_for_project(
         project_source, client=client_source
     )
-    for task in tasks:
-        push_task_comments(
-            task_status_map, person_map, task, client_source, client_target
-        )
+    if stats is None:
+        stats = PipelineStats()
+    run_comments_pipeline(
+        tasks,
+        task_status_map,
+        person_map,
+        client_source,
+        client_target,
+        max_workers=max_workers,
+        queue_size=queue_size,
+        stats=stats,
+        blob_store=blob_store,
+        ledger=ledger,
+    )
     return tasks
 
 
+class PipelineStats(object):
+    """
+    Throughput of each stage of the comments sync pipeline: items processed,
+    bytes transferred, errors and time spent working. Statistics can be read
+    from another thread while the pipeline runs.
+    """
+
+    STAGES = ("fetch", "download", "upload")
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.start_time = None
+        self.end_time = None
+        self.stages = {
+            stage: {"items": 0, "bytes": 0, "errors": 0, "busy_time": 0.0}
+            for stage in self.STAGES
+        }
+
+    def start(self) -> None:
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    def stop(self) -> None:
+        self.end_time = time.perf_counter()
+
+    def record(
+        self, stage: str, duration: float, items: int = 1, size: int = 0
+    ) -> None:
+        with self._lock:
+            stats = self.stages[stage]
+            stats["items"] += items
+            stats["bytes"] += size
+            stats["busy_time"] += duration
+
+    def record_error(self, stage: str) -> None:
+        with self._lock:
+            self.stages[stage]["errors"] += 1
+
+    def get(self) -> dict:
+        """
+        Returns:
+            dict: Statistics by stage, with items and bytes per second of
+            elapsed time, and the elapsed time in seconds.
+        """
+        if self.start_time is None:
+            elapsed = 0.0
+        else:
+            elapsed = (self.end_time or time.perf_counter()) - self.start_time
+        result = {"elapsed": elapsed}
+        with self._lock:
+            for stage, stats in self.stages.items():
+                result[stage] = dict(
+                    stats,
+                    items_per_second=(
+                        stats["items"] / elapsed if elapsed else 0.0
+                    ),
+                    bytes_per_second=(
+                        stats["bytes"] / elapsed if elapsed else 0.0
+                    ),
+                )
+        return result
+
+
+class _CommentJob(object):
+    """
+    A source comment going through the pipeline. The download stage fills
+    its files and sets `ready`, the upload stage waits for it.
+    """
+
+    def __init__(self, task: dict, comment: dict) -> None:
+        self.task = task
+        self.comment = comment
+        self.tmp_path = None
+        self.attachments = []
+        self.previews = []
+        self.size = 0
+        self.ready = threading.Event()
+
+    def clean(self) -> None:
+        if self.tmp_path is not None:
+            shutil.rmtree(self.tmp_path, ignore_errors=True)
+
+
+def run_comments_pipeline(
+    tasks: list[dict],
+    task_status_map: dict,
+    person_map: dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+    max_workers: int = 4,
+    queue_size: int = 64,
+    stats: PipelineStats | None = None,
+    blob_store: BlobStore | None = None,
+    ledger: TransferLedger | None = None,
+) -> None:
+    """
+    Push the comments of given tasks from the source API to the target API,
+    see `push_tasks_comments`. The first error stops the pipeline and is
+    raised once all workers are done.
+
+    The download queue holds comments and the upload queue holds the
+    comment lists of tasks, both bounded by *queue_size*.
+    """
+    if stats is None:
+        stats = PipelineStats()
+    task_queue = queue.Queue()
+    download_queue = queue.Queue(maxsize=queue_size)
+    upload_queue = queue.Queue(maxsize=queue_size)
+    stop = threading.Event()
+    errors = []
+
+    def fail(stage: str, exception: Exception) -> None:
+        stats.record_error(stage)
+        errors.append(exception)
+        stop.set()
+
+    def fetch() -> None:
+        while True:
+            task = task_queue.get()
+            if task is None or stop.is_set():
+                return
+            start = time.perf_counter()
+            try:
+                comments = task_module.all_comments_for_task(
+                    task, client=client_source
+                )
+            except Exception as exception:
+                fail("fetch", exception)
+                return
+            comments.reverse()
+            stats.record("fetch", time.perf_counter() - start)
+            jobs = [_CommentJob(task, comment) for comment in comments]
+            for job in jobs:
+                download_queue.put(job)
+            upload_queue.put(jobs)
+
+    def download() -> None:
+        while True:
+            job = download_queue.get()
+            if job is None:
+                return
+            if not stop.is_set():
+                start = time.perf_counter()
+                try:
+                    job.tmp_path = tempfile.mkdtemp(prefix="zou_sync_")
+                    job.attachments, job.previews = download_comment_files(
+                        job.comment,
+                        job.tmp_path,
+                        client_source,
+                        blob_store=blob_store,
+                        ledger=ledger,
+                    )
+                    job.size = get_files_size(
+                        job.attachments
+                        + [preview["file_path"] for preview in job.previews]
+                    )
+                    stats.record(
+                        "download", time.perf_counter() - start, size=job.size
+                    )
+                except Exception as exception:
+                    fail("download", exception)
+            job.ready.set()
+
+    def upload() -> None:
+        while True:
+            jobs = upload_queue.get()
+            if jobs is None:
+                return
+            for job in jobs:
+                job.ready.wait()
+                try:
+                    if stop.is_set():
+                        continue
+                    start = time.perf_counter()
+                    create_comment_with_files(
+                        task_status_map,
+                        person_map,
+                        job.task,
+                        job.comment,
+                        job.attachments,
+                        job.previews,
+                        client_target,
+                        ledger=ledger,
+                    )
+                    stats.record(
+                        "upload", time.perf_counter() - start, size=job.size
+                    )
+                except Exception as exception:
+                    fail("upload", exception)
+                finally:
+                    job.clean()
+
+    def start_workers(target: Callable) -> list[threading.Thread]:
+        workers = [
+            threading.Thread(target=target, daemon=True)
+            for _ in range(max_workers)
+        ]
+        for worker in workers:
+            worker.start()
+        return workers
+
+    stats.start()
+    for task in tasks:
+        task_queue.put(task)
+    fetchers = start_workers(fetch)
+    downloaders = start_workers(download)
+    uploaders = start_workers(upload)
+    for _ in fetchers:
+        task_queue.put(None)
+    for worker in fetchers:
+        worker.join()
+    for _ in downloaders:
+        download_queue.put(None)
+    for _ in uploaders:
+        upload_queue.put(None)
+    for worker in downloaders + uploaders:
+        worker.join()
+    stats.stop()
+    if errors:
+        raise errors[0]
+
+
+def get_files_size(file_paths: list[str]) -> int:
+    return sum(
+        os.path.getsize(file_path)
+        for file_path in file_paths
+        if os.path.exists(file_path)
+    )
+
+
+class BlobStore(object):
+    """
+    Local content-addressed store of the files downloaded by the sync. Each
+    file is stored once under its SHA-256 checksum, and an index maps the
+    source files (`preview-files/<id>`, `attachment-files/<id>`) to their
+    checksum, so files shared by several comments or downloaded by an
+    earlier run are not downloaded again. Files are hard linked in and out
+    of the store when the file system allows it, copied otherwise.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.index_path = os.path.join(root, "index.jsonl")
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self.index = {
+            entry["key"]: entry["sha256"]
+            for entry in read_json_lines(self.index_path)
+        }
+
+    def get_blob_path(self, sha256: str) -> str:
+        return os.path.join(self.root, sha256[:2], sha256)
+
+    def restore(self, key: str, file_path: str) -> bool:
+        """
+        Put the stored file of given source file at given path.
+
+        Returns:
+            bool: False if the file is not in the store.
+        """
+        with self._lock:
+            sha256 = self.index.get(key)
+        if sha256 is None or not os.path.exists(self.get_blob_path(sha256)):
+            with self._lock:
+                self.misses += 1
+            return False
+        link_file(self.get_blob_path(sha256), file_path)
+        with self._lock:
+            self.hits += 1
+        return True
+
+    def add(self, key: str, file_path: str) -> str:
+        """
+        Store the file downloaded for given source file.
+
+        Returns:
+            str: The SHA-256 checksum of the file.
+        """
+        sha256 = raw.get_file_sha256(file_path)
+        blob_path = self.get_blob_path(sha256)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            tmp_path = "%s.%s.tmp" % (blob_path, threading.get_ident())
+            link_file(file_path, tmp_path)
+            os.replace(tmp_path, blob_path)
+        with self._lock:
+            if self.index.get(key) != sha256:
+                self.index[key] = sha256
+                append_json_line(
+                    self.index_path, {"key": key, "sha256": sha256}
+                )
+        return sha256
+
+
+class TransferLedger(object):
+    """
+    Record of the source comments and previews already pushed to the target
+    API, with the ID of their copy. Records are appended to a JSON lines
+    file as soon as they are pushed, so an interrupted sync resumes without
+    creating them twice.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self.entries = {}
+        for entry in read_json_lines(path):
+            self.entries.setdefault(entry["kind"], {})[entry["source_id"]] = (
+                entry["target_id"]
+            )
+
+    def get(self, kind: str, source_id: str) -> str | None:
+        """
+        Returns:
+            str: ID of the target copy of given source instance, None if it
+            was not pushed yet.
+        """
+        with self._lock:
+            return self.entries.get(kind, {}).get(source_id)
+
+    def record(self, kind: str, source_id: str, target_id: str) -> None:
+        with self._lock:
+            self.entries.setdefault(kind, {})[source_id] = target_id
+            append_json_line(
+                self.path,
+                {"kind": kind, "source_id": source_id, "target_id": target_id},
+            )
+
+
+def link_file(source_path: str, destination_path: str) -> None:
+    """
+    Hard link given file, or copy it when hard links are not supported.
+    """
+    if os.path.exists(destination_path):
+        os.remove(destination_path)
+    try:
+        os.link(source_path, destination_path)
+    except OSError:
+        shutil.copyfile(source_path, destination_path)
+
+
+def read_json_lines(file_path: str) -> list[dict]:
+    """
+    Returns:
+        list: Entries of given JSON lines file. Lines truncated by an
+        interrupted write are ignored.
+    """
+    if not os.path.exists(file_path):
+        return []
+    entries = []
+    with open(file_path) as json_file:
+        for line in json_file:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue
+    return entries
+
+
+def append_json_line(file_path: str, entry: dict) -> None:
+    directory = os.path.dirname(os.path.abspath(file_path))
+    os.makedirs(directory, exist_ok=True)
+    with open(file_path, "a") as json_file:
+        json_file.write(json.dumps(entry) + "\n")
+
+
 def push_task_comments(
     task_status_map: dict,
     person_map: dict,
     task: str | dict,
     client_source: KitsuClient,
     client_target: KitsuClient,
+    blob_store: BlobStore | None = None,
+    ledger: TransferLedger | None = None,
 ) -> list[dict]:
     """
     Create a new comment into target api for each comment in source task
@@ -592,6 +1259,10 @@ def push_task_comments(
         task (str / dict): The task to push comments for
         client_source (KitsuClient): client to get data from source API
         client_target (KitsuClient): client to push data to target API
+        blob_store (BlobStore): Local store reusing the files already
+            downloaded from the source API.
+        ledger (TransferLedger): Record of the comments and previews
+            already pushed, which are skipped.
 
     Returns:
         list: Created comments
@@ -607,6 +1278,8 @@ def push_task_comments(
             comment,
             client_source,
             client_target,
+            blob_store=blob_store,
+            ledger=ledger,
         )
         comments_target.append(comment_target)
     return comments_target
@@ -621,6 +1294,8 @@ def push_task_comment(
     client_target: KitsuClient,
     author_id: str | None = None,
     tmp_path: str | None = None,
+    blob_store: BlobStore | None = None,
+    ledger: TransferLedger | None = None,
 ) -> dict:
     """
     Create a new comment into target api for each comment in source task
@@ -637,23 +1312,77 @@ def push_task_comment(
         author_id (str): The ID of the Person to set as the comment author.
         tmp_path (str): The local path on disk to download the attachment files
             for syncing.
+        blob_store (BlobStore): Local store reusing the files already
+            downloaded from the source API.
+        ledger (TransferLedger): Record of the comments and previews
+            already pushed, which are skipped.
 
     Returns:
         dict: The source comment.
     """
     if tmp_path is None:
         tmp_path = tempfile.mkdtemp(prefix="zou_sync_")
+    attachments, previews = download_comment_files(
+        comment, tmp_path, client_source, blob_store=blob_store, ledger=ledger
+    )
+    create_comment_with_files(
+        task_status_map,
+        person_map,
+        task,
+        comment,
+        attachments,
+        previews,
+        client_target,
+        author_id=author_id,
+        ledger=ledger,
+    )
+    return comment
+
+
+def download_comment_files(
+    comment: dict,
+    tmp_path: str,
+    client_source: KitsuClient,
+    blob_store: BlobStore | None = None,
+    ledger: TransferLedger | None = None,
+) -> tuple[list[str], list[dict]]:
+    """
+    Download the attachments and the previews of given source comment.
+    Files found in the blob store are linked from it instead of being
+    downloaded again, and files already pushed according to the ledger are
+    skipped.
+
+    Args:
+        comment (dict): The comment to download files for.
+        tmp_path (str): The local folder where to download the files.
+        client_source (KitsuClient): client to get data from source API
+        blob_store (BlobStore): Local store of the downloaded files.
+        ledger (TransferLedger): Record of the pushed comments and previews.
+
+    Returns:
+        tuple: Paths of the attachments, and previews as dicts with the
+        `id`, `file_path` and `annotations` keys.
+    """
     attachments = []
-    for attachment_id in comment["attachment_files"]:
+    if ledger is not None and ledger.get("comments", comment["id"]):
+        # Attachments are uploaded along with their comment.
+        attachment_ids = []
+    else:
+        attachment_ids = comment["attachment_files"]
+    for attachment_id in attachment_ids:
         if isinstance(attachment_id, dict):
             attachment_id = attachment_id["id"]
         attachment_file = files_module.get_attachment_file(
             attachment_id, client=client_source
         )
         file_path = os.path.join(tmp_path, attachment_file["name"])
-        files_module.download_attachment_file(
-            attachment_file, file_path, client=client_source
-        )
+        key = "attachment-files/" + attachment_id
+        if blob_store is None or not blob_store.restore(key, file_path):
+            files_module.download_attachment_file(
+                attachment_file, file_path, client=client_source
+            )
+            if blob_store is not None:
+                blob_store.add(key, file_path)
         attachments.append(file_path)
 
     previews = []
@@ -662,6 +1391,8 @@ def push_task_comment(
             preview_file_id = preview_file
         else:
             preview_file_id = preview_file["id"]
+        if ledger is not None and ledger.get("preview-files", preview_file_id):
+            continue
         preview_file = files_module.get_preview_file(
             preview_file_id, client=client_source
         )
@@ -675,31 +1406,77 @@ def push_task_comment(
                 + "."
                 + preview_file["extension"],
             )
-            files_module.download_preview_file(
-                preview_file, file_path, client=client_source
-            )
+            key = "preview-files/" + preview_file_id
+            if blob_store is None or not blob_store.restore(key, file_path):
+                files_module.download_preview_file(
+                    preview_file, file_path, client=client_source
+                )
+                if blob_store is not None:
+                    blob_store.add(key, file_path)
             previews.append(
                 {
+                    "id": preview_file_id,
                     "file_path": file_path,
                     "annotations": preview_file["annotations"],
                 }
             )
+    return attachments, previews
 
-    task_status = {"id": task_status_map[comment["task_status_id"]]}
-    if author_id is None:
-        author_id = person_map[comment["person_id"]]
-    person = {"id": author_id}
 
-    comment_target = task_module.add_comment(
-        task,
-        task_status,
-        attachments=attachments,
-        comment=comment["text"],
-        created_at=comment["created_at"],
-        person=person,
-        checklist=comment["checklist"] or [],
-        client=client_target,
-    )
+def create_comment_with_files(
+    task_status_map: dict,
+    person_map: dict,
+    task: str | dict,
+    comment: dict,
+    attachments: list[str],
+    previews: list[dict],
+    client_target: KitsuClient,
+    author_id: str | None = None,
+    ledger: TransferLedger | None = None,
+) -> dict:
+    """
+    Create given source comment into target api with its downloaded
+    attachments and previews, which are removed once uploaded. Pushed
+    comments and previews are recorded in the ledger, and a comment the
+    ledger already knows only gets its missing previews.
+
+    Args:
+        task_status_map (dict): A mapping of source TaskStatus IDs to target IDs.
+        person_map (dict): A mapping of source Person IDs to target IDs.
+        task (str / dict): The task to push the comment for.
+        comment (dict): The comment to push.
+        attachments (list): Paths of the attachment files.
+        previews (list): Previews as returned by `download_comment_files`.
+        client_target (KitsuClient): client to push data to target API
+        author_id (str): The ID of the Person to set as the comment author.
+        ledger (TransferLedger): Record of the pushed comments and previews.
+
+    Returns:
+        dict: The created comment.
+    """
+    target_comment_id = None
+    if ledger is not None:
+        target_comment_id = ledger.get("comments", comment["id"])
+    if target_comment_id is not None:
+        comment_target = {"id": target_comment_id}
+    else:
+        task_status = {"id": task_status_map[comment["task_status_id"]]}
+        if author_id is None:
+            author_id = person_map[comment["person_id"]]
+        person = {"id": author_id}
+
+        comment_target = task_module.add_comment(
+            task,
+            task_status,
+            attachments=attachments,
+            comment=comment["text"],
+            created_at=comment["created_at"],
+            person=person,
+            checklist=comment["checklist"] or [],
+            client=client_target,
+        )
+        if ledger is not None:
+            ledger.record("comments", comment["id"], comment_target["id"])
 
     for preview in previews:
         new_preview_file = task_module.add_preview(
@@ -710,6 +1487,10 @@ def push_task_comment(
             {"annotations": preview["annotations"]},
             client=client_target,
         )
+        if ledger is not None:
+            ledger.record(
+                "preview-files", preview["id"], new_preview_file["id"]
+            )
         try:
             os.remove(preview["file_path"])
         except OSError:
@@ -721,7 +1502,7 @@ def push_task_comment(
         except OSError:
             pass
 
-    return comment
+    return comment_target
 
 
 def convert_id_list(ids: list[str], model_map: dict) -> list:
@@ -734,3 +1515,347 @@ def convert_id_list(ids: list[str], model_map: dict) -> list:
         list: Ids converted through given model map.
     """
     return [model_map[id] for id in ids]
+
+
+# Event types replayed by the incremental sync, with their data route.
+SYNC_EVENT_MODELS = {
+    "episode": "episodes",
+    "sequence": "sequences",
+    "asset": "assets",
+    "shot": "shots",
+    "task": "tasks",
+}
+
+
+def load_sync_checkpoint(checkpoint_path: str) -> dict | None:
+    """
+    Args:
+        checkpoint_path (str): Path of the checkpoint file.
+
+    Returns:
+        dict: The checkpoint stored by the last incremental sync, None if
+        there is none yet.
+    """
+    if not os.path.exists(checkpoint_path):
+        return None
+    with open(checkpoint_path) as checkpoint_file:
+        return json.load(checkpoint_file)
+
+
+def save_sync_checkpoint(checkpoint_path: str, checkpoint: dict) -> None:
+    """
+    Write given checkpoint to disk. The file is replaced atomically so an
+    interrupted sync never leaves a truncated checkpoint behind.
+
+    Args:
+        checkpoint_path (str): Path of the checkpoint file.
+        checkpoint (dict): The checkpoint to store.
+    """
+    directory = os.path.dirname(os.path.abspath(checkpoint_path))
+    os.makedirs(directory, exist_ok=True)
+    with open(checkpoint_path + ".tmp", "w") as checkpoint_file:
+        json.dump(checkpoint, checkpoint_file)
+    os.replace(checkpoint_path + ".tmp", checkpoint_path)
+
+
+def get_sync_checkpoint(
+    events: list[dict], checkpoint: dict | None = None
+) -> dict | None:
+    """
+    Args:
+        events (list): Processed events, oldest first.
+        checkpoint (dict): The checkpoint the events were replayed from.
+
+    Returns:
+        dict: A checkpoint pointing after the last given event: its date and
+        ID, and the IDs of all the processed events sharing its second, as
+        the event API filters dates to the second.
+    """
+    if not events:
+        return checkpoint
+    last_event = events[-1]
+    second = last_event["created_at"][:19]
+    event_ids = [
+        event["id"] for event in events if event["created_at"][:19] == second
+    ]
+    if checkpoint is not None and checkpoint["created_at"] == second:
+        event_ids = checkpoint["event_ids"] + event_ids
+    return {
+        "created_at": second,
+        "event_id": last_event["id"],
+        "event_ids": list(dict.fromkeys(event_ids)),
+    }
+
+
+def get_events_since(
+    checkpoint: dict | None,
+    project: str | dict | None = None,
+    limit: int = 1000,
+    client: KitsuClient = default,
+) -> list[dict]:
+    """
+    Get the events that occurred since given checkpoint. Events are
+    requested by pages of *limit* events, going back in time until the
+    checkpoint is reached. Pages are bigger when more than *limit* events
+    share the same second.
+
+    Args:
+        checkpoint (dict): Checkpoint returned by `get_sync_checkpoint`. All
+            events are returned when it is None.
+        project (str / dict): Get only events related to this project.
+        limit (int): Number of events to retrieve per request.
+        client (KitsuClient): client to get events from.
+
+    Returns:
+        list[dict]: Events not processed yet, oldest first.
+    """
+    after = None
+    seen_ids = set()
+    if checkpoint is not None:
+        after = checkpoint["created_at"]
+        seen_ids = set(checkpoint["event_ids"])
+    events = {}
+    before = None
+    page_limit = limit
+    while True:
+        page = get_last_events(
+            limit=page_limit,
+            project=project,
+            after=after,
+            before=before,
+            client=client,
+        )
+        new_events = [event for event in page if event["id"] not in events]
+        for event in new_events:
+            events[event["id"]] = event
+        if len(page) < page_limit:
+            break
+        if new_events:
+            # Dates are filtered to the second: start the next page one
+            # second after the oldest event, already fetched events are
+            # skipped.
+            oldest = min(event["created_at"][:19] for event in page)
+            before = (
+                datetime.datetime.fromisoformat(oldest)
+                + datetime.timedelta(seconds=1)
+            ).isoformat()
+            page_limit = limit
+        else:
+            # The whole page shares the second the previous page started
+            # from: fetch a bigger page from the same date to get past it.
+            page_limit *= 2
+    return sorted(
+        (
+            event
+            for event in events.values()
+            if event["id"] not in seen_ids
+            and (after is None or event["created_at"][:19] >= after)
+        ),
+        key=lambda event: event["created_at"],
+    )
+
+
+def get_touched_entities(events: list[dict]) -> dict:
+    """
+    Args:
+        events (list): Events to replay.
+
+    Returns:
+        dict: IDs of the created or updated instances, by route name
+        (`assets`, `shots`, `tasks`...), the IDs of the new comments under
+        the `comments` key, and the IDs of the entities whose casting
+        changed under the `casting` key. Deletions are ignored.
+    """
+    touched = {model: [] for model in SYNC_EVENT_MODELS.values()}
+    touched["comments"] = []
+    touched["casting"] = []
+    for event in events:
+        event_type, _, action = event["name"].partition(":")
+        data = event.get("data") or {}
+        if event_type == "comment" and action == "new":
+            touched["comments"].append(data["comment_id"])
+        elif action == "casting-update":
+            touched["casting"].append(data.get(event_type + "_id"))
+        elif event_type in SYNC_EVENT_MODELS and action != "delete":
+            touched[SYNC_EVENT_MODELS[event_type]].append(
+                data.get(event_type + "_id")
+            )
+    return {
+        key: [
+            instance_id
+            for instance_id in dict.fromkeys(ids)
+            if instance_id is not None
+        ]
+        for key, ids in touched.items()
+    }
+
+
+def push_project_changes(
+    project_source: dict,
+    project_target: dict,
+    default_status: str | dict,
+    client_source: KitsuClient,
+    client_target: KitsuClient,
+    checkpoint_path: str,
+    limit: int = 1000,
+    blob_store: BlobStore | None = None,
+    ledger: TransferLedger | None = None,
+    context: SyncContext | None = None,
+) -> dict:
+    """
+    Incremental sync of a project: replay the source events that occurred
+    since the checkpoint stored in *checkpoint_path* and push only the
+    entities, tasks, castings and comments they touched. The checkpoint is
+    updated once the changes are pushed, and after each pushed comment, so
+    an interrupted sync starts again where it stopped.
+
+    When there is no checkpoint yet, the whole project is pushed like
+    `push_project_entities`, `push_tasks` and `push_tasks_comments` do, and
+    the checkpoint is set to the last event that occurred before.
+
+    Deletions are not replicated, as with the full sync.
+
+    Args:
+        project_source (dict): The project to get data from
+        project_target (dict): The project to push data to
+        default_status (str / dict): The status of pushed tasks, as with
+            `push_tasks`.
+        client_source (KitsuClient): client to get data from source API
+        client_target (KitsuClient): client to push data to target API
+        checkpoint_path (str): Path of the file storing the checkpoint.
+        limit (int): Number of events to retrieve per request.
+        blob_store (BlobStore): Local store reusing the files already
+            downloaded from the source API.
+        ledger (TransferLedger): Record of the comments and previews
+            already pushed, which are skipped.
+        context (SyncContext): ID maps shared by the sync calls of a run.
+
+    Returns:
+        dict: Pushed data, and the number of replayed events under the
+        `events` key.
+    """
+    if context is None:
+        # This function has no async version, the context is always sync.
+        context = SyncContext(client_source, client_target)
+    checkpoint = load_sync_checkpoint(checkpoint_path)
+    if checkpoint is None:
+        events = get_last_events(
+            limit=1, project=project_source, client=client_source
+        )
+        result = push_project_entities(
+            project_source,
+            project_target,
+            client_source,
+            client_target,
+            context=context,
+        )
+        result["tasks"] = push_tasks(
+            project_source,
+            project_target,
+            default_status,
+            client_source,
+            client_target,
+            context=context,
+        )
+        push_tasks_comments(
+            project_source,
+            client_source,
+            client_target,
+            blob_store=blob_store,
+            ledger=ledger,
+            context=context,
+        )
+        result["events"] = 0
+        save_sync_checkpoint(
+            checkpoint_path,
+            get_sync_checkpoint(events)
+            or {"created_at": None, "event_id": None, "event_ids": []},
+        )
+        return result
+
+    if checkpoint["created_at"] is None:
+        checkpoint = None
+    events = get_events_since(
+        checkpoint, project=project_source, limit=limit, client=client_source
+    )
+    touched = get_touched_entities(events)
+    result = {"events": len(events)}
+    instances = {
+        model: list(
+            raw.fetch_many(
+                model, touched[model], client=client_source
+            ).values()
+        )
+        for model in SYNC_EVENT_MODELS.values()
+    }
+    # Maps are only built when the changes need them.
+    if instances["assets"]:
+        asset_types_map = context.get_map("asset_type")
+    if instances["assets"] or instances["tasks"]:
+        task_types_map = context.get_map("task_type")
+    if instances["tasks"] or touched["comments"]:
+        task_status_map = context.get_map("task_status")
+        person_map = context.get_map("person")
+
+    for model in ("episodes", "sequences", "assets", "shots"):
+        entities = instances[model]
+        for entity in entities:
+            if model == "assets":
+                entity["entity_type_id"] = asset_types_map[
+                    entity["entity_type_id"]
+                ]
+                if entity["ready_for"] is not None:
+                    entity["ready_for"] = task_types_map[entity["ready_for"]]
+            entity["project_id"] = project_target["id"]
+        result[model] = (
+            import_entities(entities, client=client_target) if entities else []
+        )
+
+    tasks = instances["tasks"]
+    default_status_id = normalize_model_parameter(default_status)["id"]
+    for task in tasks:
+        convert_task(
+            task,
+            project_target,
+            default_status_id,
+            task_types_map,
+            person_map,
+        )
+    result["tasks"] = (
+        import_tasks(tasks, client=client_target) if tasks else []
+    )
+
+    result["entity_links"] = []
+    if touched["casting"]:
+        result["entity_links"] = push_entity_links(
+            project_source, project_target, client_source, client_target
+        )
+
+    result["comments"] = []
+    for index, event in enumerate(events):
+        if event["name"] != "comment:new":
+            continue
+        comment = task_module.get_comment(
+            event["data"]["comment_id"], client=client_source
+        )
+        result["comments"].append(
+            push_task_comment(
+                task_status_map,
+                person_map,
+                {"id": comment["object_id"]},
+                comment,
+                client_source,
+                client_target,
+                blob_store=blob_store,
+                ledger=ledger,
+            )
+        )
+        save_sync_checkpoint(
+            checkpoint_path,
+            get_sync_checkpoint(events[: index + 1], checkpoint),
+        )
+    if events:
+        save_sync_checkpoint(
+            checkpoint_path, get_sync_checkpoint(events, checkpoint)
+        )
+    return result
@@ -3,6 +3,8 @@ from __future__ import annotations
 import json
 import string
 
+from typing import Iterator
+
 import requests
 
 from gazu.exception import (
@@ -724,6 +726,26 @@ def get_task(task_id: str | dict, client: KitsuClient = default) -> dict:
     return raw.get(f"data/tasks/{task_id['id']}/full", client=client)
 
 
+@cache
+def get_tasks(
+    tasks: list[str | dict], client: KitsuClient = default
+) -> dict[str, dict]:
+    """
+    Retrieve many tasks in a few requests instead of one per task. Unlike
+    `get_task`, tasks are returned as stored, without the extra details of
+    their entity and project.
+
+    Args:
+        tasks (list): The task dicts or the task IDs.
+
+    Returns:
+        dict: Tasks by ID. IDs matching no task are left out.
+    """
+    return raw.fetch_many(
+        "tasks", normalize_list_of_models_for_links(tasks), client=client
+    )
+
+
 def new_task(
     entity: str | dict,
     task_type: str | dict,
@@ -956,7 +978,8 @@ def add_comment(
         comment (str): Comment text
         person (str / dict): Comment author
         checklist (list): Comment checklist, e.g [{"text": "Item 1", "checked": false}]
-        attachments (list[file_path]): Attachments file paths
+        attachments (list[file_path]): Attachments file paths, or their
+            content as ``(file_name, buffer)`` tuples.
         created_at (str): Comment date
         links (list): List of URL links to add to the comment
         for_client (bool): When True, make the comment visible to clients
@@ -1161,7 +1184,9 @@ def add_preview(
     Args:
         task (str / dict): The task dict or the task ID.
         comment (str / dict): The comment or the comment ID.
-        preview_file_path (str): Path of the file to upload as preview.
+        preview_file_path (str): Path of the file to upload as preview, or
+            its content as a ``(file_name, buffer)`` tuple (bytes,
+            memoryview, mmap...).
         preview_file_url (str): Url to download the preview file if no path is
         given.
         normalize_movie (bool): Normalize the movie or not.
@@ -1674,6 +1699,36 @@ def all_tasks_for_project(
     return raw.get(path, params=params, client=client)
 
 
+def iter_tasks_for_project(
+    project: str | dict,
+    task_type: str | dict | None = None,
+    episode: str | dict | None = None,
+    client: KitsuClient = default,
+) -> Iterator[dict]:
+    """
+    Same as `all_tasks_for_project` but yield tasks while the response is
+    decoded, without holding the whole list in memory.
+
+    Args:
+        project (str / dict): The project (or its ID) to get tasks from.
+        task_type (str / dict): The task type (or its ID) to filter tasks.
+        episode (str / dict): The episode (or its ID) to filter tasks.
+
+    Yields:
+        dict: Tasks related to given project.
+    """
+    project = normalize_model_parameter(project)
+    path = f"projects/{project['id']}/tasks"
+    params = {}
+    if task_type is not None:
+        task_type = normalize_model_parameter(task_type)
+        params["task_type_id"] = task_type["id"]
+    if episode is not None:
+        episode = normalize_model_parameter(episode)
+        params["episode_id"] = episode["id"]
+    return raw.iter_all(path, params, client=client)
+
+
 def update_comment(comment: dict, client: KitsuClient = default) -> dict:
     """
     Save given comment data into the API. Metadata are fully replaced by the ones
@@ -1783,6 +1838,23 @@ def all_comments_for_project(
     return raw.fetch_all(f"projects/{project['id']}/comments", client=client)
 
 
+def iter_comments_for_project(
+    project: str | dict, client: KitsuClient = default
+) -> Iterator[dict]:
+    """
+    Same as `all_comments_for_project` but yield comments while the response
+    is decoded, without holding the whole list in memory.
+
+    Args:
+        project (str / dict): The project dict or id.
+
+    Yields:
+        dict: Comments for the project.
+    """
+    project = normalize_model_parameter(project)
+    return raw.iter_all(f"projects/{project['id']}/comments", client=client)
+
+
 @cache
 def all_notifications_for_project(
     project: str | dict, client: KitsuClient = default
@@ -0,0 +1,225 @@
+import inspect
+import os
+import sys
+import tempfile
+import unittest
+
+try:
+    from aiohttp import web
+
+    import gazu.aio
+    import gazu.aio.asset
+    import gazu.aio.files
+    import gazu.aio.shot
+    import gazu.aio.sync
+    import gazu.aio.task
+    from gazu.aio import transform
+except ImportError:
+    web = None
+
+from utils import fakeid
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class AsyncDomainModulesTestCase(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.requests = []
+        app = web.Application()
+        app.router.add_route("*", "/{tail:.*}", self.handle)
+        self.runner = web.AppRunner(app)
+        await self.runner.setup()
+        site = web.TCPSite(self.runner, "127.0.0.1", 0)
+        await site.start()
+        port = self.runner.addresses[0][1]
+        self.client = gazu.aio.AsyncKitsuClient(f"http://127.0.0.1:{port}/api")
+
+    async def asyncTearDown(self):
+        await self.client.session.close()
+        await self.runner.cleanup()
+
+    async def handle(self, request):
+        self.requests.append(request)
+        path = request.path
+        if path == "/api/data/projects/%s/tasks" % fakeid("project-1"):
+            return web.json_response([{"id": fakeid("task-1")}])
+        if path == "/api/data/episodes/%s" % fakeid("episode-1"):
+            return web.json_response({"id": fakeid("episode-1")})
+        if path == "/api/data/shots":
+            return web.json_response(
+                [{"id": fakeid("shot-1")}, {"id": fakeid("shot-2")}]
+            )
+        if path == "/api/data/preview-files/%s" % fakeid("preview-1"):
+            return web.json_response(
+                {"id": fakeid("preview-1"), "extension": "png"}
+            )
+        if path in ("/api/import/kitsu/tasks", "/api/import/kitsu/entities"):
+            return web.json_response(await request.json())
+        if path == "/api/data/asset-types":
+            return web.json_response([{"id": "type-1", "name": "Props"}])
+        if path == "/api/data/task-types":
+            return web.json_response([{"id": "tt-1", "name": "Modeling"}])
+        if path == "/api/data/projects/%s/assets" % fakeid("project-1"):
+            return web.json_response(
+                [
+                    {
+                        "id": fakeid("asset-1"),
+                        "name": "Chair",
+                        "entity_type_id": "type-1",
+                        "ready_for": "tt-1",
+                        "project_id": fakeid("project-1"),
+                    }
+                ]
+            )
+        if path.startswith("/api/pictures/originals/preview-files/"):
+            return web.Response(body=b"picture", content_type="image/png")
+        return web.json_response({"message": "not found"}, status=404)
+
+    def test_unsupported_functions(self):
+        # Functions running their requests in a thread pool.
+        unsupported = {
+            "files": ["download_many"],
+            "sync": [
+                "push_project_changes",
+                "push_tasks_comments",
+                "run_comments_pipeline",
+            ],
+        }
+        for module_name in transform.DOMAIN_MODULES:
+            self.assertEqual(
+                transform.get_unsupported_functions(module_name),
+                unsupported.get(module_name, []),
+            )
+        self.assertFalse(hasattr(gazu.aio.files, "download_many"))
+
+    @unittest.skipIf(sys.version_info < (3, 8), "needs AST end positions")
+    def test_generated_modules_are_up_to_date(self):
+        for module_name in transform.DOMAIN_MODULES:
+            path = transform.get_async_module_path(module_name)
+            with open(path, encoding="utf-8") as generated_file:
+                self.assertEqual(
+                    generated_file.read(),
+                    transform.generate_module(module_name),
+                    "%s is out of date, run `python -m gazu.aio.transform`"
+                    % path,
+                )
+
+    def test_mirrored_functions(self):
+        self.assertTrue(
+            inspect.iscoroutinefunction(gazu.aio.task.all_tasks_for_project)
+        )
+        self.assertTrue(inspect.iscoroutinefunction(gazu.aio.task.add_preview))
+        self.assertFalse(
+            inspect.iscoroutinefunction(gazu.aio.task.iter_tasks_for_project)
+        )
+        self.assertIn("all_tasks_for_project", gazu.aio.task.__all__)
+        self.assertEqual(
+            gazu.aio.task.all_tasks_for_project.__doc__,
+            gazu.task.all_tasks_for_project.__doc__,
+        )
+        # Functions sending no request are the sync ones.
+        self.assertIs(gazu.aio.task.get_task_url, gazu.task.get_task_url)
+
+    async def test_request_function(self):
+        tasks = await gazu.aio.task.all_tasks_for_project(
+            fakeid("project-1"), client=self.client
+        )
+        self.assertEqual(tasks, [{"id": fakeid("task-1")}])
+
+    async def test_results_are_not_cached(self):
+        gazu.cache.enable()
+        try:
+            for _ in range(2):
+                await gazu.aio.task.all_tasks_for_project(
+                    fakeid("project-1"), client=self.client
+                )
+        finally:
+            gazu.cache.disable()
+        self.assertEqual(len(self.requests), 2)
+
+    async def test_cross_module_call(self):
+        episode = await gazu.aio.asset.get_episode_from_asset(
+            {"parent_id": fakeid("episode-1")}, client=self.client
+        )
+        self.assertEqual(episode, {"id": fakeid("episode-1")})
+
+    async def test_iterator(self):
+        iterator = gazu.aio.task.iter_tasks_for_project(
+            fakeid("project-1"), client=self.client
+        )
+        self.assertTrue(inspect.isasyncgen(iterator))
+        tasks = [task async for task in iterator]
+        self.assertEqual(tasks, [{"id": fakeid("task-1")}])
+
+    async def test_fetch_many(self):
+        shots = await gazu.aio.shot.get_shots(
+            [fakeid("shot-1"), fakeid("shot-2")], client=self.client
+        )
+        self.assertEqual(sorted(shots), [fakeid("shot-1"), fakeid("shot-2")])
+
+    async def test_download_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "preview.png")
+            await gazu.aio.files.download_preview_file(
+                fakeid("preview-1"), file_path, client=self.client
+            )
+            with open(file_path, "rb") as preview_file:
+                self.assertEqual(preview_file.read(), b"picture")
+
+    async def test_download_to_buffer(self):
+        buffer = bytearray(100)
+        await gazu.aio.files.download_preview_file_cover(
+            fakeid("preview-1"), buffer, client=self.client
+        )
+        self.assertEqual(bytes(buffer[:7]), b"picture")
+        size = await gazu.aio.download_to(
+            "pictures/originals/preview-files/%s.png" % fakeid("preview-1"),
+            buffer,
+            client=self.client,
+        )
+        self.assertEqual(size, 7)
+
+    async def test_import_in_batches(self):
+        tasks = [{"id": fakeid("task-%s" % index)} for index in range(5)]
+        result = await gazu.aio.sync.import_tasks(
+            tasks, batch_size=2, client=self.client
+        )
+        self.assertEqual(result, tasks)
+        self.assertEqual(
+            [await request.json() for request in self.requests],
+            [tasks[:2], tasks[2:4], tasks[4:]],
+        )
+
+    async def test_push_function(self):
+        assets = await gazu.aio.sync.push_assets(
+            {"id": fakeid("project-1")},
+            {"id": fakeid("project-2")},
+            self.client,
+            self.client,
+        )
+        self.assertEqual(
+            assets,
+            [
+                {
+                    "id": fakeid("asset-1"),
+                    "name": "Chair",
+                    "entity_type_id": "type-1",
+                    "ready_for": "tt-1",
+                    "project_id": fakeid("project-2"),
+                }
+            ],
+        )
+        self.assertEqual(
+            [request.path for request in self.requests][-1],
+            "/api/import/kitsu/entities",
+        )
+
+        # ID maps of a sync context are built with sync clients.
+        context = gazu.sync.SyncContext(self.client, self.client)
+        with self.assertRaises(TypeError):
+            await gazu.aio.sync.push_assets(
+                {"id": fakeid("project-1")},
+                {"id": fakeid("project-2")},
+                self.client,
+                self.client,
+                context=context,
+            )
@@ -121,6 +121,19 @@ class CastingTestCase(unittest.TestCase):
             asset = gazu.asset.get_asset("asset-01")
             self.assertEqual(asset["name"], "Asset 01")
 
+    def test_get_assets(self):
+        ids = [fakeid("asset-01"), fakeid("asset-02")]
+        with requests_mock.mock() as mock:
+            mock_route(
+                mock,
+                "GET",
+                "data/assets?id=" + json.dumps(ids, separators=(",", ":")),
+                text=[{"id": ids[0], "name": "Asset 01"}],
+            )
+            assets = gazu.asset.get_assets([ids[0], {"id": ids[1]}])
+            self.assertEqual(list(assets), [ids[0]])
+            self.assertEqual(assets[ids[0]]["name"], "Asset 01")
+
     def test_get_asset_by_name(self):
         with requests_mock.mock() as mock:
             mock.get(
@@ -1,11 +1,18 @@
 import unittest
 import requests_mock
+import base64
 import json
+import os
+import tempfile
 import time
+from unittest.mock import patch
 
 import gazu.client
+import gazu.task
 import gazu.project
 
+from utils import fakeid, mock_route
+
 
 class CacheTestCase(unittest.TestCase):
     def test_enable_disable(self):
@@ -76,11 +83,14 @@ class CacheTestCase(unittest.TestCase):
             self.assertEqual(mock_2.call_count, 1)
             self.assertEqual(mock_1.call_count, 1)
 
+            # project-02 is the least recently used entry, it gets evicted.
             gazu.project.get_project("project-3")
             gazu.project.get_project("project-3")
             gazu.project.get_project("project-01")
             self.assertEqual(mock_3.call_count, 1)
-            self.assertEqual(mock_1.call_count, 2)
+            self.assertEqual(mock_1.call_count, 1)
+            gazu.project.get_project("project-02")
+            self.assertEqual(mock_2.call_count, 2)
             gazu.cache.disable()
 
     def test_cache_infos(self):
@@ -133,41 +143,432 @@ class CacheTestCase(unittest.TestCase):
             self.assertEqual(infos["current_size"], 0)
             gazu.cache.disable()
 
-    def test_get_cache_key(self):
-        key = gazu.cache.get_cache_key((), {})
-        self.assertEqual(key, "")
+    def test_evict_oldest_entry(self):
+        store = gazu.cache.MemoryCacheStore(maxsize=2)
+        for key in ["key1", "key2", "key3"]:
+            store.set(key, key)
+        self.assertIsNone(store.get("key1"))
+        self.assertIsNotNone(store.get("key2"))
+        self.assertIsNotNone(store.get("key3"))
 
-        key = gazu.cache.get_cache_key(("arg1", "arg2"), {})
-        self.assertEqual(key, '["arg1", "arg2"]')
+    def test_make_cache_key(self):
+        identity = gazu.cache.get_client_identity(gazu.client.default_client)
+        self.assertEqual(
+            gazu.cache.make_cache_key((), {}),
+            ((), (("client", identity),)),
+        )
+        key = gazu.cache.make_cache_key(
+            ({"id": "project-01", "tags": ["a"]},), {"relations": True}
+        )
+        self.assertEqual(hash(key), hash(key))
+        self.assertEqual(
+            key,
+            gazu.cache.make_cache_key(
+                ({"tags": ["a"], "id": "project-01"},), {"relations": True}
+            ),
+        )
+        self.assertNotEqual(
+            key,
+            gazu.cache.make_cache_key(("project-01",), {"relations": True}),
+        )
+        key = gazu.cache.make_cache_key(
+            (), {"client": gazu.client.default_client}
+        )
+        self.assertEqual(key, gazu.cache.make_cache_key((), {}))
 
-        key = gazu.cache.get_cache_key((), {"a": 1, "b": 2})
-        self.assertIn('"a": 1', key)
+    def test_make_cache_key_identity(self):
+        def make_token(user_id, issued_at):
+            payload = json.dumps({"sub": user_id, "iat": issued_at})
+            payload = base64.urlsafe_b64encode(payload.encode("utf-8"))
+            return "header.%s.signature" % payload.decode("ascii").rstrip("=")
 
-        key = gazu.cache.get_cache_key(("arg1",), {"a": 1})
-        self.assertIn("arg1", key)
-        self.assertIn('"a": 1', key)
+        host = gazu.client.get_host()
+        user_1 = gazu.client.create_client(host)
+        user_1.access_token = make_token("person-1", 1)
+        refreshed_user_1 = gazu.client.create_client(host)
+        refreshed_user_1.access_token = make_token("person-1", 2)
+        user_2 = gazu.client.create_client(host)
+        user_2.access_token = make_token("person-2", 1)
+        other_host = gazu.client.create_client("http://other.host/api")
+        other_host.access_token = make_token("person-1", 1)
 
-    def test_remove_oldest_entry(self):
-        import datetime
+        def get_key(client):
+            return gazu.cache.make_cache_key(
+                ("project-01",), {"client": client}
+            )
+
+        self.assertEqual(get_key(user_1), get_key(refreshed_user_1))
+        self.assertNotEqual(get_key(user_1), get_key(user_2))
+        self.assertNotEqual(get_key(user_1), get_key(other_host))
+        self.assertNotIn("person-1", repr(get_key(user_1)))
+
+        # Tokens that are not JWTs are hashed as a whole.
+        user_1.access_token = "opaque-token"
+        user_2.access_token = "other-opaque-token"
+        self.assertNotEqual(get_key(user_1), get_key(user_2))
+        self.assertIsNone(gazu.cache.get_token_identity(None))
+
+    def test_memory_cache_store(self):
+        store = gazu.cache.MemoryCacheStore(maxsize=3)
+        self.assertEqual(store.shards, 1)
+        for key in ["a", "b", "c"]:
+            store.set(key, key.upper())
+        self.assertEqual(store.get("a")["value"], "A")
+        store.set("d", "D")
+        self.assertIsNone(store.get("b"))
+        self.assertEqual(len(store), 3)
+        self.assertEqual(store.pop("c")["value"], "C")
+        self.assertEqual(sorted(key for key, _ in store.items()), ["a", "d"])
+
+        store.set_max_size(20000)
+        self.assertEqual(store.shards, 16)
+        self.assertEqual(store.get("d")["value"], "D")
+        for i in range(30000):
+            store.set(i, i)
+        self.assertLessEqual(len(store), 20000)
+        store.clear()
+        self.assertEqual(len(store), 0)
+
+    def test_concurrent_statistics(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        @gazu.cache.cache
+        def double(value):
+            return value * 2
+
+        gazu.cache.enable()
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(double, [i % 10 for i in range(2000)]))
+        gazu.cache.disable()
+        self.assertEqual(results[:10], [i * 2 for i in range(10)])
+        infos = double.get_cache_infos()
+        self.assertEqual(
+            infos["hits"] + infos["misses"] + infos["expired_hits"], 2000
+        )
+        self.assertEqual(infos["current_size"], 10)
+
+    def test_single_flight(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        calls = []
+
+        @gazu.cache.cache
+        def slow_double(value):
+            calls.append(value)
+            time.sleep(0.2)
+            return value * 2
+
+        gazu.cache.enable()
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(slow_double, [3] * 4))
+        gazu.cache.disable()
+        self.assertEqual(results, [6] * 4)
+        self.assertEqual(calls, [3])
+
+        flight = gazu.cache.SingleFlight()
+        self.assertEqual(flight.do("key", lambda: 1), (1, False))
+        self.assertEqual(len(flight), 0)
+
+    def test_immutable(self):
+        with requests_mock.mock() as mock:
+            mock.get(
+                gazu.client.get_full_url("data/projects/project-11"),
+                text=json.dumps(
+                    {"name": "Project 11", "id": "project-11", "tags": ["a"]}
+                ),
+            )
+            gazu.cache.enable()
+            gazu.cache.set_immutable(True)
+            project = gazu.project.get_project("project-11")
+            self.assertIs(project, gazu.project.get_project("project-11"))
+            self.assertEqual(project["tags"], ("a",))
+            with self.assertRaises(TypeError):
+                project["name"] = "Renamed"
+
+            gazu.cache.set_immutable(False)
+            project = gazu.project.get_project("project-11")
+            self.assertEqual(project["tags"], ["a"])
+            project["name"] = "Renamed"
+            self.assertEqual(
+                gazu.project.get_project("project-11")["name"], "Project 11"
+            )
+
+            gazu.project.get_project.set_cache_immutable(True)
+            self.assertIs(
+                gazu.project.get_project("project-11"),
+                gazu.project.get_project("project-11"),
+            )
+            gazu.project.get_project.set_cache_immutable(None)
+            gazu.cache.disable()
+
+    def test_store_freeze(self):
+        store = gazu.cache.MemoryCacheStore()
+        entry = store.set("key", {"tags": ["a"]})
+        frozen = store.freeze("key", entry)
+        self.assertEqual(frozen["tags"], ("a",))
+        self.assertIs(store.freeze("key", store.get("key")), frozen)
+        self.assertEqual(
+            gazu.cache.get_entry_value(store, "key", entry, False),
+            {"tags": ["a"]},
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            database = gazu.cache.SQLiteCacheDatabase(
+                os.path.join(tmp_dir, "gazu.db")
+            )
+            store = database.get_store("namespace")
+            store.set("key", {"tags": ["a"]})
+            frozen = store.freeze("key", store.get("key"))
+            self.assertEqual(frozen["tags"], ("a",))
+            with self.assertRaises(TypeError):
+                frozen["tags"] = []
+            self.assertEqual(store.get("key")["value"], {"tags": ["a"]})
+            database.close()
+
+    def test_freeze_value(self):
+        value = [{"id": "1", "tags": ["a", {"b": 1}]}]
+        frozen = gazu.cache.freeze_value(value)
+        self.assertIsInstance(frozen, tuple)
+        self.assertEqual(frozen[0]["tags"][1]["b"], 1)
+        with self.assertRaises(TypeError):
+            frozen[0]["id"] = "2"
+        self.assertEqual(gazu.cache.thaw_value(frozen), value)
+
+    def test_persistent_store(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, "cache", "gazu.db")
+            with requests_mock.mock() as mock:
+                mock_project = mock.get(
+                    gazu.client.get_full_url("data/projects/project-12"),
+                    text=json.dumps(
+                        {"name": "Project 12", "id": "project-12"}
+                    ),
+                )
+                gazu.cache.enable()
+                database = gazu.cache.use_persistent_store(path)
+                gazu.project.get_project("project-12")
+                gazu.project.get_project("project-12")
+                self.assertEqual(mock_project.call_count, 1)
+                infos = gazu.project.get_project.get_cache_infos()
+                self.assertEqual(infos["store"], "SQLiteCacheStore")
+                self.assertEqual(infos["current_size"], 1)
 
-        memo = {
-            "key1": {
-                "date_accessed": datetime.datetime(2020, 1, 1),
-                "value": 1,
-            },
-            "key2": {
-                "date_accessed": datetime.datetime(2020, 1, 2),
-                "value": 2,
-            },
-            "key3": {
-                "date_accessed": datetime.datetime(2020, 1, 3),
-                "value": 3,
-            },
-        }
-        gazu.cache.remove_oldest_entry(memo, 2)
-        self.assertNotIn("key1", memo)
-        self.assertIn("key2", memo)
-        self.assertIn("key3", memo)
+                # Another process opening the same file gets the value.
+                other_database = gazu.cache.SQLiteCacheDatabase(path)
+                store = other_database.get_store(
+                    gazu.project.get_project.cache_name
+                )
+                key = gazu.cache.make_cache_key(("project-12",), {})
+                self.assertEqual(store.get(key)["value"]["name"], "Project 12")
+                other_database.close()
+
+                gazu.cache.clear_all()
+                gazu.project.get_project("project-12")
+                self.assertEqual(mock_project.call_count, 2)
+
+                gazu.cache.use_memory_store()
+                infos = gazu.project.get_project.get_cache_infos()
+                self.assertEqual(infos["store"], "MemoryCacheStore")
+                gazu.cache.disable()
+                database.close()
+
+    def test_sqlite_store_limits(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            database = gazu.cache.SQLiteCacheDatabase(
+                os.path.join(tmp_dir, "gazu.db"), max_entries=3
+            )
+            store = database.get_store("test", maxsize=10)
+            for i in range(5):
+                store.set(("key", i), {"id": i})
+            self.assertEqual(len(store), 5)
+            database.evict()
+            self.assertEqual(len(store), 3)
+            store.set_max_size(2)
+            self.assertEqual(len(store), 2)
+            self.assertEqual(store.pop(("key", 4))["value"], {"id": 4})
+            self.assertIsNone(store.get(("key", 4)))
+
+            database.ttl = 60
+            store.set("old", [1, 2])
+            with database.connect() as connection:
+                connection.execute(
+                    "UPDATE cache_entries SET created_at = 0 WHERE key = ?",
+                    (repr("old"),),
+                )
+            self.assertIsNone(store.get("old"))
+            store.clear()
+            self.assertEqual(store.items(), [])
+            database.close()
+
+    def test_referencing_keys(self):
+        person_id = fakeid("person-01")
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            database = gazu.cache.SQLiteCacheDatabase(
+                os.path.join(tmp_dir, "gazu.db")
+            )
+            stores = [
+                gazu.cache.MemoryCacheStore(maxsize=3),
+                database.get_store("test", maxsize=3),
+            ]
+            for store in stores:
+                # Nothing is indexed until the index is enabled.
+                store.set(("task-00",), {"id": "task-00"})
+                self.assertEqual(
+                    store.get_referencing_keys({"task-00"}), set()
+                )
+                store.clear()
+
+            gazu.cache.enable_reference_index()
+            self.addCleanup(
+                gazu.cache.cache_settings.update, reference_index=False
+            )
+            for store in stores:
+                store.set(("task-01",), {"id": "task-01", "name": "A"})
+                store.set(
+                    ("shot-01",),
+                    [{"id": "task-01", "assignees": [person_id]}],
+                )
+                store.set(("shot-02",), [])
+                # Only IDs are indexed.
+                self.assertEqual(store.get_referencing_keys({"A"}), set())
+                self.assertEqual(
+                    len(store.get_referencing_keys({"task-01"})), 2
+                )
+                self.assertEqual(
+                    len(store.get_referencing_keys({person_id})), 1
+                )
+                self.assertEqual(
+                    len(store.get_referencing_keys(set(), lists_only=True)), 1
+                )
+                self.assertEqual(
+                    len(
+                        store.get_referencing_keys(
+                            {"task-01"}, lists_only=True
+                        )
+                    ),
+                    2,
+                )
+
+                # Replaced and removed entries leave the index.
+                store.set(("shot-01",), [{"id": "task-02"}])
+                self.assertEqual(
+                    store.get_referencing_keys({person_id}), set()
+                )
+                key = list(store.get_referencing_keys({"task-01"}))[0]
+                store.pop(key)
+                self.assertEqual(
+                    store.get_referencing_keys({"task-01"}), set()
+                )
+                store.set_max_size(1)
+                self.assertEqual(
+                    len(store.get_referencing_keys({"shot-01", "shot-02"})),
+                    len(store),
+                )
+                store.clear()
+                self.assertEqual(
+                    store.get_referencing_keys({"task-02"}), set()
+                )
+            database.close()
+
+    def test_encode_value(self):
+        value = [{"id": "1", "data": {"a": None}}]
+        data = gazu.cache.encode_value(value)
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(gazu.cache.decode_value(data), value)
+        frozen = gazu.cache.freeze_value({"id": "1"})
+        self.assertEqual(
+            gazu.cache.decode_value(gazu.cache.encode_value(frozen)),
+            {"id": "1"},
+        )
+
+    def test_invalidate_for_event(self):
+        with requests_mock.mock() as mock:
+            mock_route(
+                mock,
+                "GET",
+                f"data/tasks/{fakeid('task-01')}/full",
+                text={
+                    "id": fakeid("task-01"),
+                    "project_id": fakeid("project-01"),
+                },
+            )
+            mock_route(
+                mock,
+                "GET",
+                f"data/tasks/{fakeid('task-02')}/full",
+                text={
+                    "id": fakeid("task-02"),
+                    "project_id": fakeid("project-01"),
+                },
+            )
+            mock_shot_tasks = mock.get(
+                gazu.client.get_full_url(
+                    f"data/shots/{fakeid('shot-01')}/tasks"
+                ),
+                text=json.dumps(
+                    [
+                        {
+                            "id": fakeid("task-01"),
+                            "name": "A",
+                            "project_id": fakeid("project-01"),
+                        }
+                    ]
+                ),
+            )
+            gazu.cache.enable()
+            gazu.task.get_task(fakeid("task-01"))
+            gazu.task.get_task(fakeid("task-02"))
+            gazu.task.all_tasks_for_shot(fakeid("shot-01"))
+            removed = gazu.cache.invalidate_for_event(
+                "task:update",
+                {
+                    "task_id": fakeid("task-01"),
+                    "project_id": fakeid("project-01"),
+                },
+            )
+            self.assertEqual(removed, 2)
+            self.assertEqual(
+                gazu.task.get_task.get_cache_infos()["current_size"], 1
+            )
+            gazu.task.all_tasks_for_shot(fakeid("shot-01"))
+            self.assertEqual(mock_shot_tasks.call_count, 2)
+
+            removed = gazu.cache.invalidate_for_event(
+                "task:new",
+                {
+                    "task_id": fakeid("task-03"),
+                    "project_id": fakeid("project-01"),
+                },
+            )
+            self.assertEqual(removed, 1)
+            self.assertEqual(gazu.cache.invalidate_for_event("ping", {}), 0)
+            gazu.cache.clear_all()
+            gazu.cache.disable()
+
+    def test_events_cache_invalidation(self):
+        import socketio
+        import gazu.events
+
+        received = []
+        event_client = socketio.Client()
+        gazu.events.add_listener(event_client, "asset:update", received.append)
+        gazu.events.add_cache_invalidation(event_client)
+        self.addCleanup(
+            gazu.cache.cache_settings.update, reference_index=False
+        )
+        self.assertTrue(gazu.cache.cache_settings["reference_index"])
+        with patch("gazu.cache.invalidate_for_event") as invalidate:
+            event_client._trigger_event(
+                "asset:update", "/events", {"asset_id": "asset-01"}
+            )
+            invalidate.assert_called_with(
+                "asset:update", {"asset_id": "asset-01"}
+            )
+            self.assertEqual(received, [{"asset_id": "asset-01"}])
+            event_client._trigger_event(
+                "shot:new", "/events", {"shot_id": "shot-01"}
+            )
+            invalidate.assert_called_with("shot:new", {"shot_id": "shot-01"})
 
     def test_is_cache_enabled(self):
         gazu.cache.cache_settings["enabled"] = True
@@ -177,19 +578,13 @@ class CacheTestCase(unittest.TestCase):
         gazu.cache.cache_settings["enabled"] = False
         self.assertFalse(gazu.cache.is_cache_enabled({"enabled": True}))
 
-    def test_is_cache_expired(self):
+    def test_is_entry_expired(self):
         import datetime
 
-        memo = {
-            "key1": {"date_accessed": datetime.datetime.now(), "value": 1},
-        }
-        state = {"expire": 3600}
-        self.assertFalse(gazu.cache.is_cache_expired(memo, state, "key1"))
-
-        memo["key1"][
-            "date_accessed"
-        ] = datetime.datetime.now() - datetime.timedelta(seconds=7200)
-        self.assertTrue(gazu.cache.is_cache_expired(memo, state, "key1"))
+        store = gazu.cache.MemoryCacheStore()
+        entry = store.set("key1", 1)
+        self.assertFalse(gazu.cache.is_entry_expired(entry, 3600))
 
-        state["expire"] = 0
-        self.assertFalse(gazu.cache.is_cache_expired(memo, state, "key1"))
+        entry["date_accessed"] -= datetime.timedelta(seconds=7200)
+        self.assertTrue(gazu.cache.is_entry_expired(store.get("key1"), 3600))
+        self.assertFalse(gazu.cache.is_entry_expired(entry, 0))
@@ -1,15 +1,20 @@
 import datetime
 import json
 import random
+import socket
 import string
+import time
 
 import unittest
+import requests
 import requests_mock
+from unittest.mock import patch
 import gazu
 from gazu.__version__ import __version__
 
 from gazu import client as raw
 from gazu.exception import (
+    DownloadFileException,
     RouteNotFoundException,
     AuthFailedException,
     MethodNotAllowedException,
@@ -20,7 +25,7 @@ from gazu.exception import (
     ValidationException,
 )
 
-from utils import add_verify_file_callback, mock_route
+from utils import add_verify_file_callback, fakeid, mock_route
 
 
 class ClientTestCase(unittest.TestCase):
@@ -195,6 +200,94 @@ class BaseFuncTestCase(ClientTestCase):
                 raw.fetch_all("persons"), [{"first_name": "John"}]
             )
 
+    def test_fetch_all_paginated(self):
+        with requests_mock.mock() as mock:
+            for page in range(1, 4):
+                mock_route(
+                    mock,
+                    "GET",
+                    "data/persons?page=%s&limit=2" % page,
+                    text={
+                        "data": [
+                            {"first_name": "John %s" % page},
+                            {"first_name": "Jane %s" % page},
+                        ],
+                        "nb_pages": 3,
+                        "page": page,
+                    },
+                )
+            expected = [
+                {"first_name": name % page}
+                for page in range(1, 4)
+                for name in ["John %s", "Jane %s"]
+            ]
+            self.assertEqual(
+                raw.fetch_all("persons", paginated=True, limit=2), expected
+            )
+            self.assertEqual(
+                raw.fetch_all(
+                    "persons", paginated=True, limit=2, max_workers=3
+                ),
+                expected,
+            )
+
+    def test_fetch_pages(self):
+        with requests_mock.mock() as mock:
+            for page in range(1, 6):
+                mock_route(
+                    mock,
+                    "GET",
+                    "data/tasks?page=%s" % page,
+                    text={
+                        "data": [{"id": "task-%s" % page}],
+                        "nb_pages": 5,
+                        "page": page,
+                    },
+                )
+            params = {"project_id": "project-01"}
+            pages = list(raw.fetch_pages("tasks", params, max_workers=2))
+            self.assertEqual(
+                pages, [[{"id": "task-%s" % page}] for page in range(1, 6)]
+            )
+            self.assertEqual(params, {"project_id": "project-01"})
+            self.assertEqual(mock.call_count, 5)
+
+    def test_iter_all(self):
+        persons = [
+            {"id": "person-%s" % i, "name": "é %s" % i} for i in range(50)
+        ]
+        body = json.dumps(persons).encode("utf-8")
+        with requests_mock.mock() as mock:
+            mock_route(mock, "GET", "data/persons", content=body)
+            self.assertEqual(list(raw.iter_all("persons")), persons)
+
+            mock_route(
+                mock,
+                "GET",
+                "data/tasks?page=1",
+                text={"data": [{"id": "task-1"}], "nb_pages": 2, "page": 1},
+            )
+            mock_route(
+                mock,
+                "GET",
+                "data/tasks?page=2",
+                text={"data": [{"id": "task-2"}], "nb_pages": 2, "page": 2},
+            )
+            self.assertEqual(
+                list(raw.iter_all("tasks", paginated=True)),
+                [{"id": "task-1"}, {"id": "task-2"}],
+            )
+
+    def test_iter_json_array(self):
+        values = [{"id": 1, "list": [1, 2, None]}, 12345, "text", True]
+        body = json.dumps(values).encode("utf-8")
+        chunks = [body[i : i + 3] for i in range(0, len(body), 3)]
+        self.assertEqual(list(raw._iter_json_array(chunks)), values)
+        self.assertEqual(list(raw._iter_json_array([b"[]"])), [])
+        self.assertEqual(list(raw._iter_json_array([b'{"a": 1}'])), [{"a": 1}])
+        with self.assertRaises(json.JSONDecodeError):
+            list(raw._iter_json_array([b'[{"a": 1}, {"b"']))
+
     def test_fetch_first(self):
         with requests_mock.mock() as mock:
             mock_route(
@@ -239,6 +332,158 @@ class BaseFuncTestCase(ClientTestCase):
                 {"id": "person-01", "first_name": "John"},
             )
 
+    def test_fetch_many(self):
+        ids = [fakeid("shot-%02d" % i) for i in range(60)]
+        requested = []
+
+        def filter_shots(request, context):
+            chunk = json.loads(request.qs["id"][0])
+            requested.append(chunk)
+            self.assertLessEqual(len(request.url), 1024)
+            return json.dumps(
+                [{"id": shot_id} for shot_id in chunk if shot_id != ids[5]]
+            )
+
+        client = raw.create_client("http://gazu-many/api")
+        with requests_mock.mock() as mock:
+            mock.get(
+                raw.get_full_url("data/shots", client=client),
+                text=filter_shots,
+            )
+            shots = raw.fetch_many(
+                "shots", ids + ids[:3], client=client, max_url_length=1024
+            )
+            self.assertGreater(len(requested), 1)
+            self.assertEqual(sum(len(chunk) for chunk in requested), 60)
+            self.assertEqual(len(shots), 59)
+            self.assertNotIn(ids[5], shots)
+            self.assertEqual(shots[ids[0]], {"id": ids[0]})
+            self.assertEqual(raw.fetch_many("shots", [], client=client), {})
+
+    def test_fetch_many_fallback(self):
+        ids = [fakeid("asset-%02d" % i) for i in range(5)]
+        client = raw.create_client("http://gazu-many/api")
+        with requests_mock.mock() as mock:
+            mock_list = mock.get(
+                raw.get_full_url("data/assets", client=client),
+                text=json.dumps([{"id": fakeid("other")}]),
+            )
+            for asset_id in ids[:4]:
+                mock.get(
+                    raw.get_full_url("data/assets/" + asset_id, client=client),
+                    text=json.dumps({"id": asset_id}),
+                )
+            mock.get(
+                raw.get_full_url("data/assets/" + ids[4], client=client),
+                status_code=404,
+            )
+            assets = raw.fetch_many("assets", ids, client=client)
+            self.assertEqual(sorted(assets), sorted(ids[:4]))
+            self.assertIn("assets", client.unsupported_id_filters)
+            raw.fetch_many("assets", ids, client=client)
+            self.assertEqual(mock_list.call_count, 1)
+
+            mock.get(
+                raw.get_full_url("data/tasks", client=client),
+                status_code=400,
+                text=json.dumps({"message": "Wrong filter"}),
+            )
+            mock.get(
+                raw.get_full_url("data/tasks/" + ids[0], client=client),
+                text=json.dumps({"id": ids[0]}),
+            )
+            self.assertEqual(
+                raw.fetch_many("tasks", ids[:1], client=client),
+                {ids[0]: {"id": ids[0]}},
+            )
+
+    def test_post_batches(self):
+        import gzip
+
+        items = [{"id": fakeid("task-%03d" % i)} for i in range(250)]
+        received = []
+        failures = {"count": 0, "status_code": 503}
+
+        def import_batch(request, context):
+            body = b"".join(request.body)
+            self.assertEqual(request.headers["Transfer-Encoding"], "chunked")
+            if request.headers.get("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            batch = json.loads(body)
+            if batch[0] == items[100] and (
+                not failures["count"] or failures["status_code"] == 500
+            ):
+                failures["count"] += 1
+                context.status_code = failures["status_code"]
+                return json.dumps({"message": "Import failed"})
+            received.append(batch)
+            return json.dumps(batch)
+
+        for threshold in (None, 1024):
+            received.clear()
+            failures["count"] = 0
+            policy = raw.RetryPolicy(backoff_factor=0)
+            client = raw.create_client(
+                "http://gazu-batches/api",
+                request_compression_threshold=threshold,
+                retry_policy=policy,
+            )
+            with requests_mock.mock() as mock:
+                mock.post(
+                    raw.get_full_url("import/kitsu/tasks", client=client),
+                    text=import_batch,
+                )
+                result = raw.post_batches(
+                    "import/kitsu/tasks",
+                    items,
+                    batch_size=100,
+                    max_workers=3,
+                    client=client,
+                )
+                self.assertEqual(result, items)
+                self.assertEqual(
+                    sorted(len(batch) for batch in received), [50, 100, 100]
+                )
+                self.assertEqual(failures["count"], 1)
+                self.assertEqual(policy.stats["status_retries"], 1)
+                self.assertNotIn("POST", policy.allowed_methods)
+
+                # Errors other than gateway errors are not retried.
+                failures["count"] = 0
+                failures["status_code"] = 500
+                with self.assertRaises(ServerErrorException):
+                    raw.post_batches(
+                        "import/kitsu/tasks",
+                        items[100:200],
+                        batch_size=100,
+                        client=client,
+                    )
+                self.assertEqual(failures["count"], 1)
+                failures["status_code"] = 503
+            stats = raw.get_transfer_stats(client)
+            self.assertGreater(stats["request_bytes"], 0)
+            if threshold is not None:
+                self.assertGreater(stats["request_bytes_saved"], 0)
+
+        self.assertEqual(
+            json.loads(
+                b"".join(gazu.encoder.iter_dumps_list(items, chunk_size=10))
+            ),
+            items,
+        )
+
+        # Batches are sent one after the other by default.
+        received.clear()
+        failures["count"] = 1
+        with requests_mock.mock() as mock:
+            mock.post(
+                raw.get_full_url("import/kitsu/tasks"), text=import_batch
+            )
+            raw.post_batches("import/kitsu/tasks", items, batch_size=100)
+            self.assertEqual(
+                received, [items[:100], items[100:200], items[200:]]
+            )
+
     def test_create(self):
         with requests_mock.mock() as mock:
             mock_route(
@@ -583,3 +828,725 @@ class BaseFuncTestCase(ClientTestCase):
                 text="test",
             )
             self.assertEqual(raw.get_file_data_from_url("test_url"), b"test")
+
+        client = raw.create_client("http://gazu-data/api")
+        with requests_mock.mock() as mock:
+            mock.get("http://gazu-data/api/test_url", content=b"other")
+            mock.get("http://gazu-data/files/test_url", content=b"full")
+            self.assertEqual(
+                raw.get_file_data_from_url("test_url", client=client),
+                b"other",
+            )
+            self.assertEqual(
+                raw.get_file_data_from_url(
+                    "http://gazu-data/files/test_url", full=True, client=client
+                ),
+                b"full",
+            )
+
+    def test_download_to(self):
+        import io
+
+        content = bytes(range(256)) * 40
+        with requests_mock.mock() as mock:
+            mock_route(mock, "GET", "thumbnails/1.png", content=content)
+            mock_route(
+                mock, "GET", "thumbnails/2.png", status_code=404, text="{}"
+            )
+
+            buffer = bytearray(20000)
+            size = raw.download_to("thumbnails/1.png", buffer, chunk_size=1000)
+            self.assertEqual(buffer[:size], content)
+
+            with self.assertRaises(DownloadFileException):
+                raw.download_to("thumbnails/1.png", bytearray(100))
+            with self.assertRaises(TypeError):
+                raw.download_to("thumbnails/1.png", memoryview(content))
+
+            chunks = []
+
+            def consume():
+                try:
+                    while True:
+                        chunks.append((yield))
+                finally:
+                    chunks.append(None)
+
+            raw.download_to("thumbnails/1.png", consume(), chunk_size=4096)
+            self.assertEqual(
+                [len(chunk or b"") for chunk in chunks], [4096, 4096, 2048, 0]
+            )
+
+            calls = []
+            raw.download_to("thumbnails/1.png", calls.append)
+            self.assertEqual(b"".join(calls), content)
+
+            writable = io.BytesIO()
+            response = raw.download("thumbnails/1.png", writable)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(writable.getvalue(), content)
+
+            with self.assertRaises(RouteNotFoundException):
+                raw.download_to("thumbnails/2.png", io.BytesIO())
+
+    def test_create_client_pool_options(self):
+        client = raw.create_client(
+            "http://gazu-server/api",
+            pool_connections=2,
+            pool_maxsize=32,
+            pool_block=True,
+            timeout=(3.05, 60),
+            tcp_keepalive=True,
+        )
+        adapter = client.session.get_adapter("https://gazu-server/api")
+        self.assertIs(adapter, client.adapter)
+        self.assertEqual(adapter.timeout, (3.05, 60))
+        self.assertIn(
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+            adapter.poolmanager.connection_pool_kw["socket_options"],
+        )
+        stats = raw.get_pool_stats(client=client)
+        self.assertEqual(stats["pool_maxsize"], 32)
+        self.assertEqual(client.pool_maxsize, 32)
+        self.assertTrue(stats["pool_block"])
+        self.assertEqual(stats["pools"], [])
+
+        adapter.poolmanager.connection_from_url("http://gazu-server/api")
+        stats = client.get_pool_stats()
+        self.assertEqual(stats["num_pools"], 1)
+        self.assertEqual(stats["pools"][0]["maxsize"], 32)
+        self.assertEqual(stats["pools"][0]["in_use"], 0)
+
+    def test_adapter_default_timeout(self):
+        client = raw.create_client("http://gazu-server/api", timeout=12)
+        with patch("requests.adapters.HTTPAdapter.send") as send:
+            client.adapter.send("request")
+            self.assertEqual(send.call_args[1]["timeout"], 12)
+            client.adapter.send("request", timeout=1)
+            self.assertEqual(send.call_args[1]["timeout"], 1)
+
+    def test_retry_policy(self):
+        policy = raw.RetryPolicy(max_attempts=3, backoff_factor=0)
+        client = raw.create_client(raw.get_host(), retry_policy=policy)
+        with requests_mock.mock() as mock:
+            mock_get = mock.get(
+                raw.get_full_url("data/persons", client=client),
+                [
+                    {"status_code": 503, "text": ""},
+                    {"exc": requests.exceptions.ConnectionError},
+                    {"status_code": 200, "text": json.dumps([{"id": "1"}])},
+                ],
+            )
+            self.assertEqual(
+                raw.get("data/persons", client=client), [{"id": "1"}]
+            )
+            self.assertEqual(mock_get.call_count, 3)
+            self.assertEqual(
+                policy.stats,
+                {"retries": 2, "status_retries": 1, "error_retries": 1},
+            )
+
+            mock_get = mock.get(
+                raw.get_full_url("data/projects", client=client),
+                status_code=502,
+                text="",
+            )
+            with self.assertRaises(ServerErrorException):
+                raw.get("data/projects", client=client)
+            self.assertEqual(mock_get.call_count, 3)
+
+            mock_post = mock.post(
+                raw.get_full_url("data/projects", client=client),
+                status_code=502,
+                text="",
+            )
+            with self.assertRaises(ServerErrorException):
+                raw.post("data/projects", {}, client=client)
+            self.assertEqual(mock_post.call_count, 1)
+
+    def test_get_coalescing(self):
+        from concurrent.futures import ThreadPoolExecutor
+
+        client = raw.create_client("http://gazu-coalesce/api")
+
+        def slow_response(request, context):
+            time.sleep(0.2)
+            return json.dumps([{"name": "Agent 327"}])
+
+        with requests_mock.mock() as mock:
+            mock_get = mock.get(
+                raw.get_full_url("data/projects", client=client),
+                text=slow_response,
+            )
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                results = list(
+                    executor.map(
+                        lambda _: raw.get("data/projects", client=client),
+                        range(4),
+                    )
+                )
+            self.assertEqual(mock_get.call_count, 1)
+            self.assertEqual(results[0], [{"name": "Agent 327"}])
+            self.assertIsNot(results[0], results[1])
+            self.assertEqual(len(client.in_flight_requests), 0)
+
+            client.coalesce_requests = False
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                list(
+                    executor.map(
+                        lambda _: raw.get("data/projects", client=client),
+                        range(4),
+                    )
+                )
+            self.assertEqual(mock_get.call_count, 5)
+
+    def test_conditional_requests(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        state = {"body": b'[{"name": "Agent 327"}]', "requests": []}
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                state["requests"].append(dict(self.headers))
+                etag = '"%s"' % len(state["body"])
+                last_modified = "Wed, 21 Oct 2015 07:28:00 GMT"
+                if self.path.endswith("etag"):
+                    not_modified = self.headers.get("If-None-Match") == etag
+                else:
+                    not_modified = (
+                        self.headers.get("If-Modified-Since") == last_modified
+                    )
+                if not_modified:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                if self.path.endswith("etag"):
+                    self.send_header("ETag", etag)
+                else:
+                    self.send_header("Last-Modified", last_modified)
+                self.send_header("Content-Length", str(len(state["body"])))
+                self.end_headers()
+                self.wfile.write(state["body"])
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = raw.create_client(
+                "http://127.0.0.1:%s/api" % server.server_port
+            )
+            for path in ["data/etag", "data/modified"]:
+                state["requests"] = []
+                first = raw.get(path, client=client)
+                second = raw.get(path, client=client)
+                self.assertEqual(first, [{"name": "Agent 327"}])
+                self.assertEqual(second, first)
+                self.assertEqual(len(state["requests"]), 2)
+                self.assertTrue(
+                    "If-None-Match" in state["requests"][1]
+                    or "If-Modified-Since" in state["requests"][1]
+                )
+            self.assertEqual(client.response_cache.stats["hits"], 2)
+
+            state["body"] = b'[{"name": "Agent 327"}, {"name": "Spring"}]'
+            self.assertEqual(len(raw.get("data/etag", client=client)), 2)
+            self.assertEqual(
+                raw.get("data/etag", json_response=False, client=client),
+                state["body"].decode(),
+            )
+            self.assertEqual(client.response_cache.stats["hits"], 3)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def test_compression(self):
+        import gzip
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        payload = [
+            {"name": "Task %s" % i, "status": "wip"} for i in range(500)
+        ]
+        received = {}
+
+        class Handler(BaseHTTPRequestHandler):
+            def send_json(self, data):
+                body = json.dumps(data).encode()
+                if "gzip" in self.headers.get("Accept-Encoding", ""):
+                    body = gzip.compress(body)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Encoding", "gzip")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                received["accept_encoding"] = self.headers["Accept-Encoding"]
+                self.send_json(payload)
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                received["content_encoding"] = self.headers.get(
+                    "Content-Encoding"
+                )
+                received["size"] = len(body)
+                if received["content_encoding"] == "gzip":
+                    body = gzip.decompress(body)
+                self.send_json({"count": len(json.loads(body))})
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            client = raw.create_client(
+                "http://127.0.0.1:%s/api" % server.server_port,
+                request_compression_threshold=1024,
+            )
+            self.assertEqual(raw.get("data/tasks", client=client), payload)
+            self.assertIn("gzip", received["accept_encoding"])
+
+            self.assertEqual(
+                raw.post("import/tasks", payload, client=client),
+                {"count": 500},
+            )
+            self.assertEqual(received["content_encoding"], "gzip")
+            self.assertEqual(
+                raw.post("data/tasks", [], client=client), {"count": 0}
+            )
+            self.assertIsNone(received["content_encoding"])
+
+            stats = raw.get_transfer_stats(client)
+            self.assertEqual(stats["requests"], 2)
+            self.assertEqual(stats["compressed_requests"], 1)
+            self.assertEqual(stats["responses"], 3)
+            self.assertEqual(stats["compressed_responses"], 3)
+            self.assertGreater(stats["request_bytes_saved"], 0)
+            self.assertGreater(stats["response_bytes_saved"], 0)
+            self.assertEqual(
+                stats["response_bytes"],
+                len(json.dumps(payload))
+                + len(json.dumps({"count": 500}))
+                + len(json.dumps({"count": 0})),
+            )
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        self.assertEqual(
+            raw.compress_request_body(b"abc", None), (b"abc", None)
+        )
+        self.assertEqual(raw.compress_request_body(b"abc", 1), (b"abc", None))
+
+    def test_response_cache_budget(self):
+        response_cache = gazu.cache.ResponseCache(max_bytes=10)
+        self.assertFalse(response_cache.set("a", b"1234"))
+        self.assertTrue(response_cache.set("a", b"1234", etag='"a"'))
+        self.assertTrue(response_cache.set("b", b"1234", etag='"b"'))
+        self.assertEqual(
+            response_cache.get_conditional_headers("a"),
+            {"If-None-Match": '"a"'},
+        )
+        response_cache.get("a")
+        self.assertTrue(response_cache.set("c", b"1234", etag='"c"'))
+        self.assertIsNone(response_cache.get("b"))
+        self.assertEqual(response_cache.current_bytes, 8)
+        self.assertFalse(response_cache.set("d", b"12345678901", etag='"d"'))
+        self.assertEqual(len(response_cache), 2)
+        self.assertEqual(response_cache.get_conditional_headers("d"), {})
+
+    def test_retry_policy_backoff(self):
+        policy = raw.RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        self.assertEqual(policy.get_backoff(1), 1)
+        self.assertEqual(policy.get_backoff(3), 4)
+        self.assertEqual(policy.get_backoff(10), 5)
+        self.assertEqual(policy.get_backoff(1, retry_after="2"), 2)
+        self.assertEqual(policy.get_backoff(1, retry_after="120"), 5)
+        self.assertEqual(
+            policy.get_backoff(1, retry_after="Wed, 21 Oct 2015 07:28:00 GMT"),
+            0,
+        )
+        policy.jitter = True
+        self.assertLessEqual(policy.get_backoff(2), 2)
+        self.assertFalse(policy.is_retryable("POST", 1, status_code=503))
+        self.assertTrue(policy.is_retryable("PUT", 1, status_code=504))
+        self.assertFalse(policy.is_retryable("GET", 1, status_code=500))
+        self.assertFalse(policy.is_retryable("GET", 3, status_code=503))
+        self.assertIsNone(raw.parse_retry_after("soon"))
+
+    def test_chunked_upload(self):
+        import base64
+        import hashlib
+        import os
+        import re
+        import tempfile
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        content = os.urandom(10 * 1024 + 100)
+        state = {
+            "uploads": {},
+            "puts": [],
+            "failures": {"drop": {2}, "corrupt": {4}, "error": {7}},
+            "completed": None,
+            "bad_digests": 0,
+        }
+        lock = threading.Lock()
+        upload_route = "/api/pictures/preview-files/%s/uploads" % fakeid(
+            "preview-1"
+        )
+
+        class Handler(BaseHTTPRequestHandler):
+            def send_json(self, data, status=200):
+                body = json.dumps(data).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def read_body(self):
+                return self.rfile.read(int(self.headers["Content-Length"]))
+
+            def do_GET(self):
+                upload = state["uploads"][self.path.split("/")[-1]]
+                self.send_json(
+                    {
+                        "parts": [
+                            {"number": number, "checksum": checksum}
+                            for number, (_, checksum) in upload.items()
+                        ]
+                    }
+                )
+
+            def do_POST(self):
+                body = json.loads(self.read_body())
+                if self.path == upload_route:
+                    upload_id = "upload-%s" % len(state["uploads"])
+                    state["uploads"][upload_id] = {}
+                    self.send_json({"id": upload_id})
+                elif self.path.endswith("/complete"):
+                    upload = state["uploads"][self.path.split("/")[-2]]
+                    state["completed"] = (
+                        b"".join(
+                            upload[number][0] for number in sorted(upload)
+                        ),
+                        body,
+                    )
+                    self.send_json({"id": fakeid("preview-1")})
+                else:
+                    self.send_json({"message": "not found"}, status=404)
+
+            def do_PUT(self):
+                match = re.search(r"uploads/([^/]+)/parts/(\d+)$", self.path)
+                number = int(match.group(2))
+                part = self.read_body()
+                digest = base64.b64encode(hashlib.sha256(part).digest())
+                with lock:
+                    if self.headers["Content-Digest"] != "sha-256=:%s:" % (
+                        digest.decode()
+                    ):
+                        state["bad_digests"] += 1
+                    state["puts"].append(number)
+                    failures = state["failures"]
+                    if number in failures["drop"]:
+                        failures["drop"].remove(number)
+                        self.close_connection = True
+                        self.connection.shutdown(socket.SHUT_RDWR)
+                        return
+                    if number in failures["error"]:
+                        self.send_json({"message": "error"}, status=500)
+                        return
+                    if number in failures["corrupt"]:
+                        failures["corrupt"].remove(number)
+                        part = part[:-1]
+                checksum = (
+                    "sha256:"
+                    + base64.b64encode(hashlib.sha256(part).digest()).decode()
+                )
+                state["uploads"][match.group(1)][number] = (part, checksum)
+                self.send_json({"number": number, "checksum": checksum})
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "movie.mp4")
+            with open(file_path, "wb") as movie_file:
+                movie_file.write(content)
+            try:
+                client = raw.create_client(
+                    "http://127.0.0.1:%s/api" % server.server_port,
+                    chunked_upload_threshold=4096,
+                    upload_part_size=1024,
+                    upload_state_dir=os.path.join(directory, "state"),
+                )
+                path = "pictures/preview-files/%s" % fakeid("preview-1")
+                with self.assertRaises(ServerErrorException):
+                    raw.upload(path, file_path, client=client)
+                self.assertEqual(state["puts"].count(7), 3)
+                self.assertEqual(state["puts"].count(2), 2)
+                self.assertEqual(state["puts"].count(4), 2)
+                self.assertEqual(len(os.listdir(client.upload_state_dir)), 1)
+
+                state["failures"]["error"] = set()
+                state["puts"] = []
+                progress = []
+                result = raw.upload(
+                    path,
+                    file_path,
+                    data={"revision": 2},
+                    client=client,
+                    progress_callback=lambda sent, total: progress.append(
+                        (sent, total)
+                    ),
+                )
+                self.assertEqual(result, {"id": fakeid("preview-1")})
+                self.assertEqual(state["puts"], [7])
+                self.assertEqual(len(state["uploads"]), 1)
+                assembled, body = state["completed"]
+                self.assertEqual(assembled, content)
+                self.assertEqual(body["data"], {"revision": 2})
+                self.assertEqual(len(body["parts"]), 11)
+                self.assertEqual(progress[-1], (len(content), len(content)))
+                self.assertEqual(os.listdir(client.upload_state_dir), [])
+                self.assertEqual(state["bad_digests"], 0)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+    def test_chunked_upload_fallback(self):
+        client = raw.create_client(
+            "http://gazu-chunks/api", chunked_upload_threshold=1
+        )
+        with requests_mock.Mocker() as mock:
+            mock.post(
+                "http://gazu-chunks/api/data/new-file/uploads",
+                status_code=404,
+                text="{}",
+            )
+            mock.post(
+                "http://gazu-chunks/api/data/new-file",
+                text=json.dumps({"id": fakeid("file-1")}),
+            )
+            for _ in range(2):
+                self.assertEqual(
+                    raw.upload(
+                        "data/new-file",
+                        "./tests/fixtures/v1.png",
+                        client=client,
+                    ),
+                    {"id": fakeid("file-1")},
+                )
+            self.assertEqual(mock.call_count, 3)
+
+    def test_ranged_download(self):
+        import base64
+        import hashlib
+        import os
+        import tempfile
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        content = os.urandom(10 * 1024 + 100)
+        state = {"ranges": [], "failing": {5}, "digest": content}
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                digest = base64.b64encode(
+                    hashlib.sha256(state["digest"]).digest()
+                ).decode()
+                range_header = self.headers.get("Range")
+                if self.path.endswith("no-ranges") or range_header is None:
+                    self.send_response(200)
+                    self.send_header("Content-Length", str(len(content)))
+                    self.end_headers()
+                    self.wfile.write(content)
+                    return
+                if self.path.endswith("empty"):
+                    body = b"Requested range not satisfiable"
+                    self.send_response(416)
+                    self.send_header("Content-Range", "bytes */0")
+                    self.send_header("Content-Length", str(len(body)))
+                    self.end_headers()
+                    self.wfile.write(body)
+                    return
+                start, end = range_header[len("bytes=") :].split("-")
+                start, end = int(start), min(int(end), len(content) - 1)
+                state["ranges"].append(start // 1024)
+                if start // 1024 in state["failing"]:
+                    self.send_response(500)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(206)
+                self.send_header("ETag", '"v1"')
+                self.send_header("Repr-Digest", "sha-256=:%s:" % digest)
+                self.send_header(
+                    "Content-Range",
+                    "bytes %s-%s/%s" % (start, end, len(content)),
+                )
+                self.send_header("Content-Length", str(end - start + 1))
+                self.end_headers()
+                self.wfile.write(content[start : end + 1])
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = os.path.join(directory, "movie.mp4")
+            try:
+                client = raw.create_client(
+                    "http://127.0.0.1:%s/api" % server.server_port,
+                    download_range_size=1024,
+                )
+                with self.assertRaises(ServerErrorException):
+                    raw.download("movies/1", file_path, client=client)
+                self.assertFalse(os.path.exists(file_path))
+                self.assertTrue(os.path.exists(file_path + ".part.json"))
+                self.assertEqual(sorted(state["ranges"]), list(range(11)))
+
+                state["failing"] = set()
+                state["ranges"] = []
+                progress = []
+                raw.download(
+                    "movies/1",
+                    file_path,
+                    client=client,
+                    progress_callback=lambda read, total: progress.append(
+                        (read, total)
+                    ),
+                )
+                self.assertEqual(state["ranges"], [0, 5])
+                with open(file_path, "rb") as movie_file:
+                    self.assertEqual(movie_file.read(), content)
+                self.assertEqual(progress[-1], (len(content), len(content)))
+                self.assertEqual(os.listdir(directory), ["movie.mp4"])
+
+                state["digest"] = b"another file"
+                with self.assertRaises(DownloadFileException):
+                    raw.download("movies/1", file_path, client=client)
+                self.assertEqual(os.listdir(directory), ["movie.mp4"])
+
+                os.remove(file_path)
+                state["ranges"] = []
+                raw.download("movies/no-ranges", file_path, client=client)
+                with open(file_path, "rb") as movie_file:
+                    self.assertEqual(movie_file.read(), content)
+                self.assertEqual(state["ranges"], [])
+
+                raw.download("movies/empty", file_path, client=client)
+                self.assertEqual(os.path.getsize(file_path), 0)
+            finally:
+                server.shutdown()
+                server.server_close()
+
+    def test_upload_buffers(self):
+        import mmap
+        import os
+        import tempfile
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        import multipart
+
+        received = {}
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                received["content_length"] = int(
+                    self.headers["Content-Length"]
+                )
+                parser = multipart.MultipartParser(
+                    self.rfile,
+                    multipart.parse_options_header(
+                        self.headers["Content-Type"]
+                    )[1]["boundary"],
+                    content_length=received["content_length"],
+                )
+                received["parts"] = {
+                    part.name: (part.filename, part.raw)
+                    for part in parser.parts()
+                }
+                body = json.dumps({"id": fakeid("preview-1")}).encode()
+                self.send_response(201)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        frame = os.urandom(300 * 1024)
+        try:
+            client = raw.create_client(
+                "http://127.0.0.1:%s/api" % server.server_port
+            )
+            with tempfile.TemporaryFile() as mapped_file:
+                mapped_file.write(b"mapped content")
+                mapped_file.flush()
+                with mmap.mmap(
+                    mapped_file.fileno(), 0, access=mmap.ACCESS_READ
+                ) as mapped:
+                    progress = []
+                    result = raw.upload(
+                        "pictures/preview-files/%s" % fakeid("preview-1"),
+                        ("frame.png", memoryview(frame)),
+                        data={"revision": 2},
+                        extra_files=[("mapped.txt", mapped), b"raw bytes"],
+                        client=client,
+                        progress_callback=lambda sent, total: progress.append(
+                            (sent, total)
+                        ),
+                        progress_interval=3600,
+                    )
+            self.assertEqual(result, {"id": fakeid("preview-1")})
+            self.assertEqual(
+                received["parts"],
+                {
+                    "revision": (None, b"2"),
+                    "file": ("frame.png", frame),
+                    "file-1": ("mapped.txt", b"mapped content"),
+                    "file-2": ("file-2", b"raw bytes"),
+                },
+            )
+            total = len(frame) + len(b"mapped content") + len(b"raw bytes")
+            self.assertLessEqual(len(progress), 2)
+            self.assertEqual(progress[-1], (total, total))
+
+            with open("./tests/fixtures/v1.png", "rb") as test_file:
+                content = test_file.read()
+            raw.upload(
+                "pictures/preview-files/%s" % fakeid("preview-1"),
+                "./tests/fixtures/v1.png",
+                client=client,
+            )
+            self.assertEqual(received["parts"], {"file": ("v1.png", content)})
+        finally:
+            server.shutdown()
+            server.server_close()
+
+        body = raw.MultipartBody({}, {"file": ("a.txt", b"abc")})
+        self.assertIsInstance(body.read(8192), memoryview)
+        self.assertEqual(body.seek(0), 0)
+        self.assertEqual(len(body.read()), len(body))
+        self.assertEqual(body.read(), b"")
@@ -0,0 +1,58 @@
+import datetime
+import json
+import unittest
+
+import requests_mock
+
+import gazu.client
+from gazu import encoder
+
+
+class EncoderTestCase(unittest.TestCase):
+    def setUp(self):
+        self.backend = encoder.get_json_backend()
+
+    def tearDown(self):
+        encoder.json_settings["backend"] = self.backend
+
+    def test_backends(self):
+        data = {
+            "name": "Agent 327",
+            "date": datetime.datetime(2024, 5, 1, 10, 30, 0, 1500),
+            "tags": ["é", 1, 2.5, None, True],
+        }
+        expected = json.loads(json.dumps(data, cls=encoder.CustomJSONEncoder))
+        for backend in encoder.json_backends:
+            encoder.set_json_backend(backend)
+            self.assertEqual(encoder.get_json_backend(), backend)
+            document = encoder.dumps(data)
+            self.assertIsInstance(document, bytes)
+            self.assertEqual(json.loads(document), expected)
+            self.assertEqual(encoder.loads(document), expected)
+            self.assertEqual(encoder.loads(document.decode()), expected)
+            self.assertEqual(json.loads(encoder.dumps(2**70)), 2**70)
+            with self.assertRaises(ValueError):
+                encoder.loads(b'{"name": ')
+
+    def test_set_json_backend(self):
+        with self.assertRaises(ValueError):
+            encoder.set_json_backend("simplejson")
+        self.assertEqual(encoder.set_json_backend("json"), "json")
+
+    def test_client_codec(self):
+        for backend in encoder.json_backends:
+            encoder.set_json_backend(backend)
+            with requests_mock.mock() as mock:
+                mock.post(
+                    gazu.client.get_full_url("data/tasks"),
+                    text='{"id": "task-01"}',
+                )
+                result = gazu.client.post(
+                    "data/tasks",
+                    {"due_date": datetime.datetime(2024, 5, 1)},
+                )
+                self.assertEqual(result, {"id": "task-01"})
+                self.assertEqual(
+                    mock.last_request.json(),
+                    {"due_date": "2024-05-01T00:00:00"},
+                )
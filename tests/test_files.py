@@ -598,6 +598,23 @@ class FilesTestCase(unittest.TestCase):
             )
             self.assertEqual(output_files[0]["name"], "main")
 
+    def test_iter_output_files_for_project(self):
+        with requests_mock.mock() as mock:
+            base_path = "projects/project-01/output-files"
+            path = gazu.client.url_path_join("data", base_path)
+            params = {"output_type_id": "output-type-1"}
+
+            mock.get(
+                gazu.client.get_full_url(
+                    gazu.client.build_path_with_params(path, params)
+                ),
+                text=json.dumps([{"id": "output-file-01", "name": "main"}]),
+            )
+            output_files = gazu.files.iter_output_files_for_project(
+                {"id": "project-01"}, output_type={"id": "output-type-1"}
+            )
+            self.assertEqual(next(output_files)["name"], "main")
+
     def test_update_modification_date(self):
         with requests_mock.mock() as mock:
             path = "/actions/working-files/working-file-01/modified"
@@ -792,6 +809,95 @@ class FilesTestCase(unittest.TestCase):
             )["file_tree"]
             self.assertEqual(file_tree["name"], "standard file tree")
 
+    def test_download_many(self):
+        import tempfile
+
+        previews = [
+            {"id": fakeid("preview-1"), "extension": "png", "file_size": 3},
+            fakeid("preview-2"),
+            {"id": fakeid("preview-3"), "extension": "png", "file_size": 5},
+            {"id": fakeid("preview-4"), "extension": "png"},
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            with open(
+                os.path.join(directory, fakeid("preview-3") + ".png"), "wb"
+            ) as existing_file:
+                existing_file.write(b"12345")
+            # Left by an interrupted run, without known size.
+            with open(
+                os.path.join(directory, fakeid("preview-2") + ".mp4"), "wb"
+            ) as truncated_file:
+                truncated_file.write(b"mov")
+            with requests_mock.mock() as mock:
+                mock.get(
+                    gazu.client.get_full_url("data/preview-files"),
+                    text=json.dumps(
+                        [{"id": fakeid("preview-2"), "extension": "mp4"}]
+                    ),
+                )
+                mock.get(
+                    gazu.client.get_full_url(
+                        "pictures/originals/preview-files/%s.png"
+                        % fakeid("preview-1")
+                    ),
+                    content=b"png",
+                )
+                mock.get(
+                    gazu.client.get_full_url(
+                        "movies/originals/preview-files/%s.mp4"
+                        % fakeid("preview-2")
+                    ),
+                    content=b"movie",
+                )
+                mock.get(
+                    gazu.client.get_full_url(
+                        "pictures/originals/preview-files/%s.png"
+                        % fakeid("preview-4")
+                    ),
+                    status_code=404,
+                    text="{}",
+                )
+                progress = []
+                results = gazu.files.download_many(
+                    previews,
+                    directory,
+                    max_workers=2,
+                    progress_callback=lambda *args: progress.append(args),
+                )
+            self.assertEqual(
+                results["downloaded"],
+                {
+                    fakeid("preview-1"): os.path.join(
+                        directory, fakeid("preview-1") + ".png"
+                    ),
+                    fakeid("preview-2"): os.path.join(
+                        directory, fakeid("preview-2") + ".mp4"
+                    ),
+                },
+            )
+            self.assertEqual(list(results["skipped"]), [fakeid("preview-3")])
+            self.assertEqual(list(results["failed"]), [fakeid("preview-4")])
+            with open(results["downloaded"][fakeid("preview-2")], "rb") as f:
+                self.assertEqual(f.read(), b"movie")
+            self.assertEqual(progress[-1], (13, 8, 4, 4))
+            self.assertFalse(
+                [name for name in os.listdir(directory) if ".part" in name]
+            )
+
+        self.assertEqual(
+            gazu.files.get_preview_file_download_url(
+                {"id": fakeid("preview-1"), "extension": "mp4"}, "lowdef"
+            ),
+            (
+                "movies/lowdef/preview-files/%s.mp4" % fakeid("preview-1"),
+                "mp4",
+            ),
+        )
+        with self.assertRaises(ValueError):
+            gazu.files.get_preview_file_download_url(
+                {"id": fakeid("preview-1")}, "cover"
+            )
+
     def test_download_preview_file(self):
         with open("./tests/fixtures/v1.png", "rb") as thumbnail_file:
             with requests_mock.mock() as mock:
@@ -0,0 +1,142 @@
+import json
+import unittest
+
+import requests_mock
+
+import gazu.cache
+import gazu.client
+import gazu.project
+from gazu.exception import RouteNotFoundException
+from gazu.middleware import (
+    InstrumentationMiddleware,
+    Middleware,
+    get_route,
+)
+
+from utils import fakeid
+
+
+class RecordingMiddleware(Middleware):
+    def __init__(self):
+        self.calls = []
+
+    def before_request(self, request):
+        request["headers"]["X-Trace"] = "trace-01"
+        self.calls.append(("before_request", request["path"]))
+
+    def after_response(self, request, response):
+        self.calls.append(("after_response", request["status_code"]))
+
+    def on_error(self, request, error):
+        self.calls.append(("on_error", type(error).__name__))
+
+
+class MiddlewareTestCase(unittest.TestCase):
+    def setUp(self):
+        self.client = gazu.client.create_client("http://gazu-hooks/api")
+
+    def test_get_route(self):
+        self.assertEqual(
+            get_route("data/tasks/%s/full?relations=true" % fakeid("t")),
+            "data/tasks/:id/full",
+        )
+
+    def test_hooks(self):
+        middleware = self.client.add_middleware(RecordingMiddleware())
+        with requests_mock.mock() as mock:
+            mock_get = mock.get(
+                gazu.client.get_full_url("data/projects", self.client),
+                text=json.dumps([]),
+            )
+            mock.get(
+                gazu.client.get_full_url("data/missing", self.client),
+                status_code=404,
+            )
+            gazu.client.get("data/projects", client=self.client)
+            self.assertEqual(
+                mock_get.last_request.headers["X-Trace"], "trace-01"
+            )
+            with self.assertRaises(RouteNotFoundException):
+                gazu.client.get("data/missing", client=self.client)
+        self.assertEqual(
+            middleware.calls,
+            [
+                ("before_request", "data/projects"),
+                ("after_response", 200),
+                ("before_request", "data/missing"),
+                ("after_response", 404),
+                ("on_error", "RouteNotFoundException"),
+            ],
+        )
+        self.client.remove_middleware(middleware)
+        self.assertEqual(self.client.middlewares, [])
+
+    def test_instrumentation(self):
+        instrumentation = InstrumentationMiddleware()
+        self.client.add_middleware(instrumentation)
+        self.client.retry_policy = gazu.client.RetryPolicy(
+            backoff_factor=0, jitter=False
+        )
+        project_ids = [fakeid("project-01"), fakeid("project-02")]
+        with requests_mock.mock() as mock:
+            for project_id in project_ids:
+                mock.get(
+                    gazu.client.get_full_url(
+                        "data/projects/" + project_id, self.client
+                    ),
+                    [
+                        {"status_code": 503, "text": ""},
+                        {"text": json.dumps({"id": project_id})},
+                    ],
+                )
+            mock.post(
+                gazu.client.get_full_url("data/projects", self.client),
+                text=json.dumps({"id": project_ids[0]}),
+            )
+            hits = gazu.project.get_project.get_cache_infos()["hits"]
+            gazu.cache.enable()
+            try:
+                for project_id in project_ids + project_ids:
+                    gazu.project.get_project(project_id, client=self.client)
+            finally:
+                gazu.cache.disable()
+                gazu.project.get_project.clear_cache()
+            gazu.client.post(
+                "data/projects", {"name": "Agent 327"}, client=self.client
+            )
+
+        stats = instrumentation.get_stats()
+        route = stats["routes"]["GET data/projects/:id"]
+        self.assertEqual(route["requests"], 4)
+        self.assertEqual(route["retries"], 2)
+        self.assertEqual(route["status_codes"], {503: 2, 200: 2})
+        self.assertEqual(route["decodes"], 2)
+        self.assertEqual(sum(route["duration_buckets"].values()), 4)
+        post_route = stats["routes"]["POST data/projects"]
+        self.assertEqual(
+            post_route["bytes_sent"], len(b'{"name":"Agent 327"}')
+        )
+        self.assertGreater(post_route["bytes_received"], 0)
+        cache_stats = stats["cache"]["gazu.project.get_project"]
+        self.assertEqual(cache_stats["hits"], hits + 2)
+        self.assertGreater(cache_stats["hit_ratio"], 0)
+
+        text = instrumentation.to_prometheus()
+        self.assertIn("# TYPE gazu_request_duration_seconds histogram", text)
+        self.assertIn(
+            'gazu_request_duration_seconds_bucket{method="GET",'
+            'route="data/projects/:id",le="+Inf"} 4',
+            text,
+        )
+        self.assertIn(
+            'gazu_requests_total{method="GET",route="data/projects/:id",'
+            'status="503"} 2',
+            text,
+        )
+        self.assertIn(
+            'gazu_cache_hits_total{function="gazu.project.get_project"} %s'
+            % (hits + 2),
+            text,
+        )
+        instrumentation.reset()
+        self.assertEqual(instrumentation.get_stats()["routes"], {})
@@ -200,6 +200,19 @@ class ShotTestCase(unittest.TestCase):
             )
             self.assertEqual(gazu.shot.get_shot("shot-01")["name"], "Shot 01")
 
+    def test_get_shots(self):
+        ids = [fakeid("shot-01"), fakeid("shot-02")]
+        with requests_mock.mock() as mock:
+            mock_route(
+                mock,
+                "GET",
+                "data/shots?id=" + json.dumps(ids, separators=(",", ":")),
+                text=[{"id": ids[0], "name": "Shot 01"}],
+            )
+            shots = gazu.shot.get_shots([ids[0], {"id": ids[1]}])
+            self.assertEqual(list(shots), [ids[0]])
+            self.assertEqual(shots[ids[0]]["name"], "Shot 01")
+
     def test_get_shot_by_name(self):
         with requests_mock.mock() as mock:
             mock_route(
@@ -1,9 +1,10 @@
 import unittest
 import json
 import requests_mock
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, ANY, MagicMock
 import os
 import tempfile
+import time
 
 import gazu.asset
 import gazu.client
@@ -381,7 +382,7 @@ class SyncestCase(unittest.TestCase):
         )
         mock_import.assert_called_once()
 
-    @patch("gazu.sync.push_task_comments")
+    @patch("gazu.sync.run_comments_pipeline")
     @patch("gazu.sync.get_sync_person_id_map")
     @patch("gazu.sync.get_sync_task_status_id_map")
     @patch("gazu.task.all_tasks_for_project")
@@ -396,6 +397,77 @@ class SyncestCase(unittest.TestCase):
             {"id": fakeid("src")}, MagicMock(), MagicMock()
         )
         mock_push.assert_called_once()
+        self.assertEqual(
+            mock_push.call_args[0][0], [{"id": fakeid("task-1")}]
+        )
+
+    @patch("gazu.sync.create_comment_with_files")
+    @patch("gazu.sync.download_comment_files")
+    @patch("gazu.task.all_comments_for_task")
+    def test_comments_pipeline(
+        self, mock_all_comments, mock_download, mock_create
+    ):
+        tasks = [{"id": fakeid("task-%s" % index)} for index in range(5)]
+        mock_all_comments.side_effect = lambda task, client: [
+            {"id": "%s-%s" % (task["id"], index)} for index in range(4)
+        ]
+
+        def download(comment, tmp_path, client, **kwargs):
+            # Make later comments ready first.
+            time.sleep(0.004 - int(comment["id"][-1]) * 0.001)
+            file_path = os.path.join(tmp_path, "attachment.txt")
+            with open(file_path, "wb") as attachment:
+                attachment.write(b"data")
+            return [file_path], []
+
+        created = []
+        mock_download.side_effect = download
+        mock_create.side_effect = (
+            lambda status_map, person_map, task, comment, *args, **kwargs: (
+                created.append(comment["id"])
+            )
+        )
+
+        stats = gazu.sync.PipelineStats()
+        gazu.sync.run_comments_pipeline(
+            tasks,
+            {},
+            {},
+            MagicMock(),
+            MagicMock(),
+            max_workers=3,
+            queue_size=2,
+            stats=stats,
+        )
+        self.assertEqual(len(created), 20)
+        for task in tasks:
+            self.assertEqual(
+                [
+                    comment_id
+                    for comment_id in created
+                    if comment_id.startswith(task["id"])
+                ],
+                ["%s-%s" % (task["id"], index) for index in range(3, -1, -1)],
+            )
+        results = stats.get()
+        self.assertEqual(results["fetch"]["items"], 5)
+        self.assertEqual(results["download"]["items"], 20)
+        self.assertEqual(results["download"]["bytes"], 80)
+        self.assertEqual(results["upload"]["items"], 20)
+        self.assertGreater(results["upload"]["items_per_second"], 0)
+
+        mock_create.side_effect = Exception("Upload failed")
+        with self.assertRaises(Exception):
+            gazu.sync.run_comments_pipeline(
+                tasks,
+                {},
+                {},
+                MagicMock(),
+                MagicMock(),
+                max_workers=1,
+                stats=stats,
+            )
+        self.assertEqual(stats.get()["upload"]["errors"], 1)
 
     @patch("gazu.sync.push_task_comment")
     @patch("gazu.task.all_comments_for_task")
@@ -434,3 +506,384 @@ class SyncestCase(unittest.TestCase):
             MagicMock(),
         )
         mock_add_comment.assert_called_once()
+
+    @patch("gazu.sync.get_last_events")
+    def test_get_events_since(self, mock_last_events):
+        events = [
+            {"id": "e%s" % index, "created_at": "2024-01-01T10:00:0%s" % index}
+            for index in range(5)
+        ]
+        pages = [
+            list(reversed(events[2:])),
+            list(reversed(events[:3])),
+            events[:1],
+        ]
+        mock_last_events.side_effect = lambda **kwargs: pages.pop(0)
+
+        checkpoint = {
+            "created_at": "2024-01-01T10:00:00",
+            "event_id": "e0",
+            "event_ids": ["e0"],
+        }
+        result = gazu.sync.get_events_since(checkpoint, limit=3)
+        self.assertEqual(
+            [event["id"] for event in result], ["e1", "e2", "e3", "e4"]
+        )
+        self.assertEqual(
+            [call[1]["before"] for call in mock_last_events.call_args_list],
+            [None, "2024-01-01T10:00:03", "2024-01-01T10:00:01"],
+        )
+        kwargs = mock_last_events.call_args[1]
+        self.assertEqual(kwargs["after"], "2024-01-01T10:00:00")
+
+        self.assertEqual(
+            gazu.sync.get_sync_checkpoint(result, checkpoint),
+            {
+                "created_at": "2024-01-01T10:00:04",
+                "event_id": "e4",
+                "event_ids": ["e4"],
+            },
+        )
+        self.assertEqual(
+            gazu.sync.get_sync_checkpoint(
+                [{"id": "e5", "created_at": "2024-01-01T10:00:00.5"}],
+                checkpoint,
+            )["event_ids"],
+            ["e0", "e5"],
+        )
+
+    @patch("gazu.sync.get_last_events")
+    def test_get_events_since_same_second(self, mock_last_events):
+        # More events than the page size share the same second.
+        events = [
+            {"id": "e%s" % index, "created_at": "2024-01-01T10:00:05"}
+            for index in range(1, 4)
+        ]
+        events.insert(0, {"id": "e0", "created_at": "2024-01-01T10:00:01"})
+        pages = [
+            [events[3], events[2]],
+            [events[3], events[2]],
+            [events[3], events[2], events[1], events[0]],
+            [events[0]],
+        ]
+        mock_last_events.side_effect = lambda **kwargs: pages.pop(0)
+
+        result = gazu.sync.get_events_since(None, limit=2)
+        self.assertEqual(
+            sorted(event["id"] for event in result), ["e0", "e1", "e2", "e3"]
+        )
+        self.assertEqual(
+            [
+                (call[1]["limit"], call[1]["before"])
+                for call in mock_last_events.call_args_list
+            ],
+            [
+                (2, None),
+                (2, "2024-01-01T10:00:06"),
+                (4, "2024-01-01T10:00:06"),
+                (2, "2024-01-01T10:00:02"),
+            ],
+        )
+
+    def test_get_touched_entities(self):
+        events = [
+            {"name": "asset:new", "data": {"asset_id": "a1"}},
+            {"name": "asset:update", "data": {"asset_id": "a1"}},
+            {"name": "shot:delete", "data": {"shot_id": "s1"}},
+            {"name": "shot:casting-update", "data": {"shot_id": "s2"}},
+            {"name": "task:status-changed", "data": {"task_id": "t1"}},
+            {"name": "comment:new", "data": {"comment_id": "c1"}},
+            {"name": "preview-file:add-file", "data": {}},
+        ]
+        touched = gazu.sync.get_touched_entities(events)
+        self.assertEqual(touched["assets"], ["a1"])
+        self.assertEqual(touched["shots"], [])
+        self.assertEqual(touched["casting"], ["s2"])
+        self.assertEqual(touched["tasks"], ["t1"])
+        self.assertEqual(touched["comments"], ["c1"])
+
+    @patch("gazu.sync.push_task_comment")
+    @patch("gazu.task.get_comment")
+    @patch("gazu.sync.push_entity_links")
+    @patch("gazu.sync.import_tasks")
+    @patch("gazu.sync.import_entities")
+    @patch("gazu.client.fetch_many")
+    @patch("gazu.sync.get_sync_person_id_map")
+    @patch("gazu.sync.get_sync_task_status_id_map")
+    @patch("gazu.sync.get_sync_task_type_id_map")
+    @patch("gazu.sync.push_tasks_comments")
+    @patch("gazu.sync.push_tasks")
+    @patch("gazu.sync.push_project_entities")
+    @patch("gazu.sync.get_last_events")
+    def test_push_project_changes(
+        self,
+        mock_last_events,
+        mock_push_entities,
+        mock_push_tasks,
+        mock_push_comments,
+        mock_task_type_map,
+        mock_status_map,
+        mock_person_map,
+        mock_fetch_many,
+        mock_import_entities,
+        mock_import_tasks,
+        mock_push_links,
+        mock_get_comment,
+        mock_push_comment,
+    ):
+        project_source = {"id": fakeid("src")}
+        project_target = {"id": fakeid("tgt")}
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_path = os.path.join(directory, "sync", "checkpoint")
+
+            def push_changes():
+                return gazu.sync.push_project_changes(
+                    project_source,
+                    project_target,
+                    {"id": fakeid("todo")},
+                    MagicMock(),
+                    MagicMock(),
+                    checkpoint_path,
+                )
+
+            # First run: full sync.
+            mock_push_entities.return_value = {}
+            mock_last_events.return_value = [
+                {"id": "e0", "created_at": "2024-01-01T10:00:00.100"}
+            ]
+            push_changes()
+            mock_push_entities.assert_called_once()
+            mock_push_tasks.assert_called_once()
+            mock_push_comments.assert_called_once()
+            self.assertEqual(
+                gazu.sync.load_sync_checkpoint(checkpoint_path)["event_id"],
+                "e0",
+            )
+
+            # Next runs: only the events since the checkpoint.
+            mock_last_events.return_value = [
+                {
+                    "id": "e2",
+                    "name": "comment:new",
+                    "created_at": "2024-01-01T10:00:02",
+                    "data": {"comment_id": "c1"},
+                },
+                {
+                    "id": "e1",
+                    "name": "task:update",
+                    "created_at": "2024-01-01T10:00:01",
+                    "data": {"task_id": "t1"},
+                },
+                {
+                    "id": "e0",
+                    "name": "task:update",
+                    "created_at": "2024-01-01T10:00:00.100",
+                    "data": {"task_id": "t0"},
+                },
+            ]
+            mock_fetch_many.side_effect = lambda model, ids, client: {
+                instance_id: {
+                    "id": instance_id,
+                    "task_type_id": "tt",
+                    "task_status_id": "s",
+                    "assigner_id": "p",
+                    "assignees": ["p"],
+                }
+                for instance_id in ids
+            }
+            mock_task_type_map.return_value = {"tt": "tt-target"}
+            # As with push_tasks, tasks get the default status.
+            mock_status_map.return_value = {"s": "s-target"}
+            mock_person_map.return_value = {"p": "p-target"}
+            mock_get_comment.return_value = {"id": "c1", "object_id": "t1"}
+            result = push_changes()
+            self.assertEqual(result["events"], 2)
+            mock_import_entities.assert_not_called()
+            mock_push_links.assert_not_called()
+            mock_import_tasks.assert_called_once_with(
+                [
+                    {
+                        "id": "t1",
+                        "task_type_id": "tt-target",
+                        "task_status_id": fakeid("todo"),
+                        "assigner_id": "p-target",
+                        "assignees": ["p-target"],
+                        "project_id": fakeid("tgt"),
+                    }
+                ],
+                client=ANY,
+            )
+            self.assertEqual(mock_push_comment.call_args[0][2], {"id": "t1"})
+            self.assertEqual(
+                gazu.sync.load_sync_checkpoint(checkpoint_path),
+                {
+                    "created_at": "2024-01-01T10:00:02",
+                    "event_id": "e2",
+                    "event_ids": ["e2"],
+                },
+            )
+
+            mock_last_events.return_value = []
+            self.assertEqual(push_changes()["events"], 0)
+            mock_push_entities.assert_called_once()
+
+    @patch("gazu.files.update_preview")
+    @patch("gazu.task.add_preview")
+    @patch("gazu.task.add_comment")
+    @patch("gazu.files.download_preview_file")
+    @patch("gazu.files.get_preview_file")
+    @patch("gazu.files.download_attachment_file")
+    @patch("gazu.files.get_attachment_file")
+    def test_push_task_comment_dedupe(
+        self,
+        mock_get_attachment,
+        mock_download_attachment,
+        mock_get_preview,
+        mock_download_preview,
+        mock_add_comment,
+        mock_add_preview,
+        mock_update_preview,
+    ):
+        def write_file(model, file_path, client):
+            with open(file_path, "w") as downloaded_file:
+                downloaded_file.write("content of %s" % model["id"])
+
+        mock_get_attachment.side_effect = lambda id, client: {
+            "id": id,
+            "name": "notes.txt",
+        }
+        mock_get_preview.side_effect = lambda id, client: {
+            "id": id,
+            "original_name": "preview",
+            "extension": "png",
+            "annotations": [],
+        }
+        mock_download_attachment.side_effect = write_file
+        mock_download_preview.side_effect = write_file
+        mock_add_comment.side_effect = lambda task, status, **kwargs: {
+            "id": "target-%s" % kwargs["comment"]
+        }
+        uploaded = []
+
+        def add_preview(task, comment, file_path, client):
+            with open(file_path) as preview_file:
+                uploaded.append(preview_file.read())
+            return {"id": "target-preview"}
+
+        mock_add_preview.side_effect = add_preview
+
+        def make_comment(index, previews):
+            return {
+                "id": "c%s" % index,
+                "task_status_id": "status",
+                "person_id": "person",
+                "text": "comment-%s" % index,
+                "created_at": "2024-01-01T10:00:00",
+                "checklist": [],
+                "attachment_files": ["shared-attachment"],
+                "previews": previews,
+            }
+
+        with tempfile.TemporaryDirectory() as directory:
+            ledger_path = os.path.join(directory, "ledger.jsonl")
+
+            def push(comment, blob_store, ledger):
+                gazu.sync.push_task_comment(
+                    {"status": "target-status"},
+                    {"person": "target-person"},
+                    {"id": fakeid("task")},
+                    comment,
+                    MagicMock(),
+                    MagicMock(),
+                    tmp_path=tempfile.mkdtemp(dir=directory),
+                    blob_store=blob_store,
+                    ledger=ledger,
+                )
+
+            blob_store = gazu.sync.BlobStore(os.path.join(directory, "blobs"))
+            ledger = gazu.sync.TransferLedger(ledger_path)
+            push(make_comment(1, ["p1"]), blob_store, ledger)
+            push(make_comment(2, []), blob_store, ledger)
+            self.assertEqual(mock_download_attachment.call_count, 1)
+            self.assertEqual(mock_add_comment.call_count, 2)
+            self.assertEqual((blob_store.hits, blob_store.misses), (1, 2))
+            self.assertEqual(uploaded, ["content of p1"])
+
+            # A repeat sync downloads and uploads nothing.
+            blob_store = gazu.sync.BlobStore(os.path.join(directory, "blobs"))
+            ledger = gazu.sync.TransferLedger(ledger_path)
+            self.assertEqual(ledger.get("comments", "c1"), "target-comment-1")
+            push(make_comment(1, ["p1"]), blob_store, ledger)
+            self.assertEqual(mock_add_comment.call_count, 2)
+            self.assertEqual(mock_get_preview.call_count, 1)
+
+            # Previews missing from an already pushed comment are added.
+            push(make_comment(2, ["p2"]), blob_store, ledger)
+            self.assertEqual(mock_add_comment.call_count, 2)
+            self.assertEqual(mock_download_attachment.call_count, 1)
+            self.assertEqual(uploaded, ["content of p1", "content of p2"])
+            self.assertEqual(
+                ledger.get("preview-files", "p2"), "target-preview"
+            )
+
+    @patch("gazu.sync.import_tasks")
+    @patch("gazu.task.all_tasks_for_project")
+    @patch("gazu.sync.get_sync_task_type_id_map")
+    @patch("gazu.sync.get_sync_person_id_map")
+    def test_sync_context(
+        self, mock_person_map, mock_task_type_map, mock_all_tasks, mock_import
+    ):
+        mock_person_map.side_effect = [
+            {"p1": "target-p1"},
+            {"p1": "target-p1", "p2": "target-p2"},
+            {"p1": "target-p1", "p2": "target-p2"},
+        ]
+        mock_task_type_map.return_value = {"tt": "target-tt"}
+        mock_all_tasks.side_effect = lambda project, client: [
+            {
+                "task_type_id": "tt",
+                "assigner_id": "p1",
+                "assignees": ["p1"],
+            }
+        ]
+        context = gazu.sync.SyncContext(
+            MagicMock(), MagicMock(), refresh_interval=0
+        )
+        for index in range(3):
+            gazu.sync.push_tasks(
+                {"id": fakeid("src-%s" % index)},
+                {"id": fakeid("tgt-%s" % index)},
+                {"id": fakeid("todo")},
+                MagicMock(),
+                MagicMock(),
+                context=context,
+            )
+        self.assertEqual(mock_import.call_count, 3)
+        self.assertEqual(mock_person_map.call_count, 1)
+        self.assertEqual(mock_task_type_map.call_count, 1)
+
+        # A missing ID rebuilds the map, get() doesn't.
+        person_map = context.get_map("person")
+        self.assertEqual(person_map["p2"], "target-p2")
+        self.assertEqual(mock_person_map.call_count, 2)
+        self.assertIsNone(person_map.get("p3"))
+        self.assertEqual(mock_person_map.call_count, 2)
+        with self.assertRaises(KeyError):
+            person_map["p3"]
+        self.assertEqual(mock_person_map.call_count, 3)
+
+        # No rebuild within the refresh interval.
+        context.refresh_interval = 60
+        for _ in range(3):
+            with self.assertRaises(KeyError):
+                person_map["p3"]
+        self.assertEqual(mock_person_map.call_count, 3)
+
+        stats = context.get_stats()
+        self.assertEqual(stats["person"]["builds"], 3)
+        self.assertEqual(stats["person"]["size"], 2)
+        self.assertEqual(stats["task_type"]["builds"], 1)
+        self.assertGreaterEqual(stats["task_type"]["build_time"], 0)
+        self.assertEqual(stats["department"]["builds"], 0)
+        with self.assertRaises(ValueError):
+            context.get_map("unknown")
@@ -231,6 +231,19 @@ class TaskTestCase(unittest.TestCase):
             task = gazu.task.get_task(fakeid("task-01"))
             self.assertEqual(task["id"], fakeid("task-01"))
 
+    def test_get_tasks(self):
+        ids = [fakeid("task-01"), fakeid("task-02")]
+        with requests_mock.mock() as mock:
+            mock_route(
+                mock,
+                "GET",
+                "data/tasks?id=" + json.dumps(ids, separators=(",", ":")),
+                text=[{"id": ids[0], "name": "Task 01"}],
+            )
+            tasks = gazu.task.get_tasks([ids[0], {"id": ids[1]}])
+            self.assertEqual(list(tasks), [ids[0]])
+            self.assertEqual(tasks[ids[0]]["name"], "Task 01")
+
     def test_start_task(self):
         with requests_mock.mock() as mock:
             result = {
@@ -579,6 +592,22 @@ class TaskTestCase(unittest.TestCase):
             tasks = gazu.task.all_tasks_for_project(project)
             self.assertEqual(tasks[0]["id"], fakeid("task-1"))
 
+    def test_iter_tasks_for_project(self):
+        tasks = [{"id": fakeid("task-1")}, {"id": fakeid("task-2")}]
+        path = f"data/projects/{fakeid('project-01')}/tasks"
+        with requests_mock.mock() as mock:
+            mock_route(
+                mock,
+                "GET",
+                path + f"?task_type_id={fakeid('task-type-1')}",
+                text=tasks,
+            )
+            iterator = gazu.task.iter_tasks_for_project(
+                fakeid("project-01"), task_type=fakeid("task-type-1")
+            )
+            self.assertEqual(next(iterator)["id"], fakeid("task-1"))
+            self.assertEqual(list(iterator), [{"id": fakeid("task-2")}])
+
     def test_all_task_types_for_scene(self):
         with requests_mock.mock() as mock:
             mock_route(
@@ -1228,6 +1257,20 @@ class TaskTestCase(unittest.TestCase):
             comments = gazu.task.all_comments_for_project(fakeid("project-1"))
             self.assertEqual(len(comments), 2)
 
+    def test_iter_comments_for_project(self):
+        with requests_mock.mock() as mock:
+            mock_route(
+                mock,
+                "GET",
+                f"data/projects/{fakeid('project-1')}/comments",
+                text=[
+                    {"id": fakeid("comment-1")},
+                    {"id": fakeid("comment-2")},
+                ],
+            )
+            comments = gazu.task.iter_comments_for_project(fakeid("project-1"))
+            self.assertEqual(len(list(comments)), 2)
+
     def test_all_notifications_for_project(self):
         with requests_mock.mock() as mock:
             mock_route(
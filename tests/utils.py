@@ -36,7 +36,13 @@ def mock_route(mock, request_type, path="", **kwargs):
 def add_verify_file_callback(mock, dict_assert={}, url=None):
     def verify_file_callback(request):
         if url is None or url == request.url:
-            body_file = io.BytesIO(request.body)
+            body = request.body
+            if hasattr(body, "read"):
+                # Streamed body.
+                body.seek(0)
+                body = body.read()
+                request.body.seek(0)
+            body_file = io.BytesIO(body)
 
             if sys.version_info >= (3, 8):
                 import multipart